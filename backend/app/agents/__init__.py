@@ -1,7 +1,22 @@
 """
 Agents package - LangGraph based resume coaching chat
 """
-from app.agents.graph import create_resume_coach_graph, run_resume_coach
+from app.agents.graph import (
+    astream_resume_coach,
+    close_resume_coach_graph,
+    create_resume_coach_graph,
+    get_resume_coach_graph,
+    init_resume_coach_graph,
+    run_resume_coach,
+)
 from app.agents.state import ResumeCoachState
 
-__all__ = ["create_resume_coach_graph", "run_resume_coach", "ResumeCoachState"]
+__all__ = [
+    "create_resume_coach_graph",
+    "init_resume_coach_graph",
+    "close_resume_coach_graph",
+    "get_resume_coach_graph",
+    "run_resume_coach",
+    "astream_resume_coach",
+    "ResumeCoachState",
+]
@@ -1,9 +1,24 @@
 """
 LangGraph Workflow - 이력서 코칭 대화 그래프
 """
-from math import e
-from langgraph.graph import StateGraph, END
-from sqlalchemy.orm import Session
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
+from langgraph.graph import StateGraph, START, END
+from langgraph.graph.state import CompiledStateGraph
+from langgraph.types import StateSnapshot
+from psycopg.rows import dict_row
+from psycopg_pool import AsyncConnectionPool
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.fair_share import UserQuotaExceeded, llm_user
+from app.core.llm import ChatModelPool, get_llm_pool
+from app.core.rate_limit import LLMRateLimitExceeded
+from app.core.metrics import CHECKPOINT_DURATION, db_metrics, observe_node
 
 from app.agents.state import ResumeCoachState
 from app.agents.nodes import (
@@ -12,47 +27,161 @@ from app.agents.nodes import (
     select_question_node,
     generate_response_node,
     completion_node,
-    should_continue
+    route_turn
 )
 
-from langgraph.checkpoint.postgres import PostgresSaver
+from app.database.config import DATABASE_URL, track_queries
+from app.services.resume_cache import resume_cache_stats
+
+
+def _bind_context(node, *, db: bool = False, llm: bool = False, pass_config: bool = False):
+    """
+    호출마다 config["configurable"]로 전달된 DB 세션 / LLM 풀을 노드 인자로 연결
+
+    그래프는 앱 시작 시 한 번만 컴파일되므로 요청별 객체는 컴파일 시점이 아니라 실행 시점에 주입합니다.
+    노드 실행 시간 / 예외 / LLM 토큰 / DB 작업은 노드 이름으로, LLM 호출 순서 / 할당량은 state의 user_id로 처리합니다.
+    """
+    name = node.__name__.removesuffix("_node")
+
+    async def run(state: ResumeCoachState, config: RunnableConfig) -> dict:
+        configurable = config.get("configurable", {})
+        kwargs = {}
+        if db:
+            kwargs["db"] = configurable["db"]
+        if llm:
+            kwargs["llm"] = configurable.get("llm") or get_llm_pool()
+        if pass_config:
+            kwargs["config"] = config
+        with track_queries() as queries, observe_node(name), llm_user(state.get("user_id")):
+            try:
+                return await node(state, **kwargs)
+            finally:
+                db_metrics.record("node", name, queries)
+
+    return run
+
 
-from app.database.config import DATABASE_URL
+class TimedPostgresSaver(AsyncPostgresSaver):
+    """체크포인트 조회/저장 시간을 CHECKPOINT_DURATION에 기록하는 AsyncPostgresSaver"""
 
-def create_resume_coach_graph(db: Session):
+    async def aget_tuple(self, config):
+        started = time.perf_counter()
+        try:
+            return await super().aget_tuple(config)
+        finally:
+            CHECKPOINT_DURATION.observe(time.perf_counter() - started, operation="get_tuple")
+
+    async def aput(self, config, checkpoint, metadata, new_versions):
+        started = time.perf_counter()
+        try:
+            return await super().aput(config, checkpoint, metadata, new_versions)
+        finally:
+            CHECKPOINT_DURATION.observe(time.perf_counter() - started, operation="put")
+
+    async def aput_writes(self, config, writes, task_id, task_path=""):
+        started = time.perf_counter()
+        try:
+            return await super().aput_writes(config, writes, task_id, task_path)
+        finally:
+            CHECKPOINT_DURATION.observe(time.perf_counter() - started, operation="put_writes")
+
+
+def create_resume_coach_graph(checkpointer: Optional[BaseCheckpointSaver] = None) -> CompiledStateGraph:
     """
-    이력서 코칭 대화 그래프 생성
+    이력서 코칭 대화 그래프 생성 및 컴파일
 
     Args:
-        db: SQLAlchemy 세션
+        checkpointer: 대화 상태 저장소 (예: AsyncPostgresSaver)
 
     Returns:
-        Compiled LangGraph
+        Compiled LangGraph (실행 시 config["configurable"]에 thread_id, db, llm 전달)
     """
-    
-    try:
-        with PostgresSaver.from_conn_string(DATABASE_URL) as checkpointer:
-            # checkpointer.setup()
-            # StateGraph 생성
-            builder = StateGraph(ResumeCoachState)
-            
-            
+    # StateGraph 생성
+    builder = StateGraph(ResumeCoachState)
+
+    # 노드 등록 (DB 세션과 LLM 풀은 실행 시 config로 주입)
+    builder.add_node("load_resume", _bind_context(load_resume_node, db=True))
+    builder.add_node("update_resume", _bind_context(update_resume_node, db=True, llm=True))
+    builder.add_node("select_question", _bind_context(select_question_node))
+    builder.add_node("generate_response", _bind_context(generate_response_node, llm=True, pass_config=True))
+    builder.add_node("completion", _bind_context(completion_node, llm=True, pass_config=True))
+
+    # 엣지 정의
+    # load_resume → select_question (답변 기록 + 다음 질문) → [update_resume ∥ generate_response | completion] → END
+    builder.add_edge(START, "load_resume")
+    builder.add_edge("load_resume", "select_question")
+    builder.add_conditional_edges(
+        "select_question",
+        route_turn,
+        ["update_resume", "generate_response", "completion"]
+    )
+    builder.add_edge("update_resume", END)
+    builder.add_edge("generate_response", END)
+    builder.add_edge("completion", END)
+
+    # 그래프 컴파일
+    return builder.compile(checkpointer=checkpointer)
 
 
-            # 그래프 컴파일
-            return builder.compile(checkpointer=checkpointer)
-    except Exception as e:
-        print(e)
-        raise e
-        
-        
+# 프로세스 전역 그래프와 체크포인터 커넥션 풀 (lifespan에서 생성/정리)
+_resume_coach_graph: Optional[CompiledStateGraph] = None
+_checkpoint_pool: Optional[AsyncConnectionPool] = None
+
+
+async def init_resume_coach_graph() -> CompiledStateGraph:
+    """
+    AsyncPostgresSaver(psycopg_pool 커넥션 풀)로 그래프를 한 번 컴파일 (앱 시작 시 호출)
+
+    Returns:
+        CompiledStateGraph: 전역 그래프
+    """
+    global _resume_coach_graph, _checkpoint_pool
+    if _resume_coach_graph is None:
+        _checkpoint_pool = AsyncConnectionPool(
+            DATABASE_URL,
+            min_size=settings.checkpoint_pool_min_size,
+            max_size=settings.checkpoint_pool_max_size,
+            kwargs={"autocommit": True, "prepare_threshold": 0, "row_factory": dict_row},
+            open=False,
+        )
+        await _checkpoint_pool.open()
+
+        checkpointer = TimedPostgresSaver(_checkpoint_pool)  # type: ignore[arg-type]
+        await checkpointer.setup()
+        _resume_coach_graph = create_resume_coach_graph(checkpointer)
+    return _resume_coach_graph
+
+
+async def close_resume_coach_graph():
+    """
+    체크포인터 커넥션 풀 정리 (앱 종료 시 호출)
+    """
+    global _resume_coach_graph, _checkpoint_pool
+    if _checkpoint_pool is not None:
+        await _checkpoint_pool.close()
+    _resume_coach_graph = None
+    _checkpoint_pool = None
+
+
+async def get_resume_coach_graph() -> CompiledStateGraph:
+    """
+    전역 그래프 조회 (FastAPI Dependency)
+
+    lifespan 밖(스크립트, 테스트)에서 호출되면 그래프를 지연 생성합니다.
+
+    Returns:
+        CompiledStateGraph: 전역 그래프
+    """
+    return await init_resume_coach_graph()
 
 
 async def run_resume_coach(
     session_id: str,
     user_id: str,
     user_answer: str,
-    db: Session
+    db: AsyncSession,
+    llm: Optional[ChatModelPool] = None,
+    graph: Optional[CompiledStateGraph] = None
 ) -> dict:
     """
     이력서 코칭 대화 실행
@@ -62,6 +191,8 @@ async def run_resume_coach(
         user_id: 사용자 ID
         user_answer: 사용자 답변
         db: SQLAlchemy 세션
+        llm: 공유 Chat Model 풀 (기본값: 전역 풀)
+        graph: 컴파일된 그래프 (기본값: 전역 그래프)
 
     Returns:
         dict: {
@@ -71,30 +202,134 @@ async def run_resume_coach(
             "current_question_index": int  # 현재 질문 인덱스
         }
     """
-    # 초기 상태 생성 (PostgresSaver가 상태를 자동 관리)
-    initial_state: ResumeCoachState = {
-        "session_id": session_id,
+    # 그래프 실행 (thread_id로 세션 관리, DB 세션/LLM 풀은 호출마다 전달)
+    graph = graph or await get_resume_coach_graph()
+    config = _run_config(session_id, db, llm)
+    snapshot = await graph.aget_state(config)
+    with track_queries() as queries:
+        async with _rollback_on_limit(graph, snapshot):
+            result = await graph.ainvoke(_graph_input(snapshot, config, user_id, user_answer), config)
+    resume_cache_stats.record_turn(queries.count)
+
+    # 결과 반환
+    return _chat_result(result)
+
+
+# 응답 토큰을 사용자에게 스트리밍하는 노드
+STREAMED_NODES = {"generate_response", "completion"}
+
+
+async def astream_resume_coach(
+    session_id: str,
+    user_id: str,
+    user_answer: str,
+    db: AsyncSession,
+    llm: Optional[ChatModelPool] = None,
+    graph: Optional[CompiledStateGraph] = None
+) -> AsyncIterator[dict]:
+    """
+    이력서 코칭 대화 실행 (스트리밍)
+
+    LangGraph stream_mode ["updates", "messages", "values"]로 실행하여
+    노드 진행 이벤트와 응답 생성 노드의 토큰을 생성되는 즉시 전달합니다.
+
+    Args:
+        session_id: 세션 ID
+        user_id: 사용자 ID
+        user_answer: 사용자 답변
+        db: SQLAlchemy 세션
+        llm: 공유 Chat Model 풀 (기본값: 전역 풀)
+        graph: 컴파일된 그래프 (기본값: 전역 그래프)
+
+    Yields:
+        dict: {"event": "node", "data": {"node": str}}
+              {"event": "token", "data": {"node": str, "content": str}} (미리 생성된 문구는 한 번에 전체)
+              {"event": "done", "data": run_resume_coach와 같은 결과} (마지막 이벤트)
+    """
+    graph = graph or await get_resume_coach_graph()
+    config = _run_config(session_id, db, llm)
+    snapshot = await graph.aget_state(config)
+    final_state: dict = {}
+    streamed: set = set()
+
+    with track_queries() as queries:
+        async with _rollback_on_limit(graph, snapshot):
+            async for mode, chunk in graph.astream(
+                _graph_input(snapshot, config, user_id, user_answer),
+                config,
+                stream_mode=["updates", "messages", "values"],
+            ):
+                if mode == "updates":
+                    for node, update in chunk.items():
+                        # 미리 생성된 질문 문구처럼 LLM 없이 만든 응답은 한 번에 토큰으로 전달
+                        response = (update or {}).get("response")
+                        if node in STREAMED_NODES and node not in streamed and response:
+                            yield {"event": "token", "data": {"node": node, "content": response}}
+                        yield {"event": "node", "data": {"node": node}}
+                elif mode == "messages":
+                    message, metadata = chunk
+                    node = metadata.get("langgraph_node")
+                    if node in STREAMED_NODES and isinstance(message.content, str) and message.content:
+                        streamed.add(node)
+                        yield {"event": "token", "data": {"node": node, "content": message.content}}
+                else:
+                    final_state = chunk
+    resume_cache_stats.record_turn(queries.count)
+
+    yield {"event": "done", "data": _chat_result(final_state)}
+
+
+@asynccontextmanager
+async def _rollback_on_limit(graph: CompiledStateGraph, snapshot: StateSnapshot):
+    """
+    할당량 / rate limit으로 턴이 실패하면 체크포인트를 턴 시작 전 상태로 되돌림
+
+    select_question이 진행 카운터를 올린 단계는 이미 체크포인트에 저장되므로,
+    되돌리지 않으면 Retry-After 뒤 같은 답변으로 재시도할 때 질문 하나를 건너뜁니다.
+    """
+    try:
+        yield
+    except (UserQuotaExceeded, LLMRateLimitExceeded):
+        if snapshot.values:
+            # 직전 턴 체크포인트에서 분기해 최신 상태로 저장 (다음 노드 없음)
+            await graph.aupdate_state(snapshot.config, None, as_node="generate_response")
+        else:
+            # 첫 턴이면 스레드를 지워 다음 요청이 초기 상태부터 다시 시작
+            await graph.checkpointer.adelete_thread(snapshot.config["configurable"]["thread_id"])
+        raise
+
+
+def _run_config(session_id: str, db: AsyncSession, llm: Optional[ChatModelPool]) -> RunnableConfig:
+    return {"configurable": {"thread_id": session_id, "db": db, "llm": llm}}
+
+
+def _graph_input(snapshot: StateSnapshot, config: RunnableConfig, user_id: str, user_answer: str) -> dict:
+    # 이어지는 대화는 답변만 전달 (체크포인트에 저장된 진행 상태를 덮어쓰지 않음)
+    if snapshot.values:
+        return {"user_id": user_id, "user_answer": user_answer}
+
+    # 첫 턴은 초기 상태 생성
+    return {
+        "thread_id": config["configurable"]["thread_id"],
         "user_id": user_id,
         "user_answer": user_answer,
+        "resume_id": None,
         "current_resume_data": None,
         "current_analysis": None,
         "improvement_questions": [],
         "current_question_index": 0,
         "current_question": None,
+        "answered_question": None,
         "answered_count": 0,
         "is_completed": False,
         "response": None
     }
 
-    # 그래프 생성 및 실행 (thread_id로 세션 관리)
-    graph = create_resume_coach_graph(db)
-    config = {"configurable": {"thread_id": session_id}}
-    result = await graph.ainvoke(initial_state, config)
 
-    # 결과 반환
+def _chat_result(state: dict) -> dict:
     return {
-        "response": result.get("response", ""),
-        "is_completed": result.get("is_completed", False),
-        "answered_count": result.get("answered_count", 0),
-        "current_question_index": result.get("current_question_index", 0)
+        "response": state.get("response", ""),
+        "is_completed": state.get("is_completed", False),
+        "answered_count": state.get("answered_count", 0),
+        "current_question_index": state.get("current_question_index", 0)
     }
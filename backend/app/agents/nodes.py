@@ -2,141 +2,223 @@
 LangGraph Nodes - 이력서 코칭 대화 노드들
 """
 import json
-from sqlalchemy.orm import Session
-from langchain.chat_models import init_chat_model
+from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
 from langchain.messages import SystemMessage
+from langchain_core.runnables import RunnableConfig
+
+from app.core.config import settings
+from app.core.fair_share import UserQuotaExceeded
+from app.core.llm import ChatModelPool, get_llm_pool
+from app.core.rate_limit import LLMRateLimitExceeded
+from app.core.structured_output import agenerate_structured
 
 from app.agents.state import ResumeCoachState
 from app.agents.prompts import (
     RESUME_UPDATE_PROMPT,
+    RESUME_PATCH_PROMPT,
     QUESTION_RESPONSE_PROMPT,
     COMPLETION_MESSAGE_PROMPT
 )
 from app.repositories import ResumeRepository
-from app.models.schemas import ResumeExtraction
+from app.models.schemas import ResumeExtraction, ResumePatch
+from app.services.llm_cache import CachePolicy
+from app.services.resume_cache import get_resume_cache
+from app.services.resume_patch import apply_resume_patch, select_patch_target
 
 
-async def load_resume_node(state: ResumeCoachState, db: Session) -> ResumeCoachState:
+async def load_resume_node(state: ResumeCoachState, db: AsyncSession) -> dict:
     """
-    이력서 데이터를 DB에서 로드
+    이력서 데이터를 로드 (프로세스 내 캐시 → 없으면 DB)
     """
     resume_repo = ResumeRepository(db)
 
     # 최근 이력서 데이터 로드
-    recent_resume = resume_repo.get_recent_resume_by_user_id(state["user_id"])
-
-    if recent_resume:
-        state["current_resume_data"] = recent_resume.data
-        state["current_analysis"] = recent_resume.analysis
+    recent_resume = await get_resume_cache().get_or_load(
+        state["user_id"], lambda: resume_repo.get_recent_resume_by_user_id(state["user_id"])
+    )
 
-        # improvement_questions 추출
-        if recent_resume.analysis:
-            state["improvement_questions"] = recent_resume.analysis.get("improvement_questions", [])
-        else:
-            state["improvement_questions"] = []
-    else:
+    if not recent_resume:
         raise ValueError(f"사용자 {state['user_id']}의 이력서를 찾을 수 없습니다.")
 
-    return state
+    return {
+        "resume_id": recent_resume.resume_id,
+        "current_resume_data": recent_resume.data,
+        "current_analysis": recent_resume.analysis,
+        # improvement_questions 추출
+        "improvement_questions": (recent_resume.analysis or {}).get("improvement_questions", []),
+    }
 
 
-async def update_resume_node(state: ResumeCoachState, db: Session) -> ResumeCoachState:
+async def update_resume_node(
+    state: ResumeCoachState,
+    db: AsyncSession,
+    llm: Optional[ChatModelPool] = None
+) -> dict:
     """
     사용자 답변을 기반으로 이력서 업데이트
-    (기존 이력서 데이터 + 질문 + 답변) → LLM → 업데이트된 이력서
+
+    - patch 모드: 질문 대상 프로젝트(또는 기술 스택)만 LLM에 보내고, 돌아온 패치를 검증 후 로컬에서 적용
+    - 대상을 특정할 수 없거나 패치가 실패하면 전체 이력서를 다시 생성하는 기존 방식으로 처리
+
+    다음 질문 응답 생성과 같은 단계에서 병렬로 실행되므로 current_resume_data만 반환합니다.
     """
     user_answer = state.get("user_answer")
-    current_question = state.get("current_question")
+    answered_question = state.get("answered_question")
 
-    if not user_answer or not current_question:
+    if not user_answer or not answered_question:
         # 답변이 없으면 업데이트 스킵
-        return state
+        return {}
 
     try:
-        # 기존 이력서 데이터
-        resume_json = json.dumps(state["current_resume_data"], ensure_ascii=False, indent=2)
-
-        # LLM으로 업데이트
-        model = init_chat_model("gpt-4o-mini", temperature=0.3)
+        llm = llm or get_llm_pool()
+
+        updated_resume_data = None
+        if settings.resume_update_mode == "patch":
+            try:
+                updated_resume_data = await _patch_resume(
+                    llm, state["current_resume_data"], answered_question, user_answer
+                )
+            except (UserQuotaExceeded, LLMRateLimitExceeded):
+                raise
+            except Exception as e:
+                print(f"⚠️ Resume patch failed, falling back to full update: {e}")
+
+        if updated_resume_data is None:
+            updated_resume_data = await _rewrite_resume(
+                llm, state["current_resume_data"], answered_question, user_answer
+            )
+
+        # DB에 저장 (load_resume에서 찾은 이력서, 변경분은 resume_versions에 patch로 기록)
+        await ResumeRepository(db).update_data(state["resume_id"], updated_resume_data)
 
-        system_prompt = RESUME_UPDATE_PROMPT.format(
-            resume_data=resume_json,
-            question=current_question.get("question", ""),
-            answer=user_answer
-        )
-
-        response = model.invoke([SystemMessage(content=system_prompt)])
-        json_content = response.content
-
-        # JSON 파싱
-        if not isinstance(json_content, str):
-            raise ValueError(f"LLM 응답이 문자열이 아닙니다: {type(json_content)}")
-
-        # 마크다운 코드블록 제거
-        if json_content.startswith("```"):
-            json_content = json_content.split("```")[1]
-            if json_content.startswith("json"):
-                json_content = json_content[4:].strip()
-
-        # Pydantic 객체로 검증
-        updated_resume = ResumeExtraction.model_validate_json(json_content)
+        print(f"✅ Resume updated with answer to question {state['current_question_index'] - 1}, total answered: {state['answered_count']}")
 
-        # 상태 업데이트
-        state["current_resume_data"] = updated_resume.model_dump()
+        return {"current_resume_data": updated_resume_data}
 
-        # DB에 저장
-        resume_repo = ResumeRepository(db)
-        recent_resume = resume_repo.get_recent_resume_by_user_id(state["user_id"])
+    except (UserQuotaExceeded, LLMRateLimitExceeded):
+        # 할당량 / rate limit은 라우터가 429 / 503(Retry-After)로 응답하도록 그대로 전달
+        raise
+    except Exception:
+        print("⚠️ Resume update failed")
+        # 업데이트 실패해도 대화는 계속 진행
+        return {}
 
-        if recent_resume:
-            recent_resume.data = state["current_resume_data"]  # type: ignore
-            resume_repo.update(resume_id=recent_resume.id, resume_data=recent_resume)
 
-        # 카운터 증가 (답변 후)
-        state["answered_count"] += 1
-        state["current_question_index"] += 1
+async def _patch_resume(
+    llm: ChatModelPool,
+    resume_data: dict,
+    question: dict,
+    answer: str
+) -> Optional[dict]:
+    """
+    질문 대상(프로젝트 / 기술 스택)만 보내 패치를 받고 로컬에서 적용
 
-        print(f"✅ Resume updated with answer to question {state['current_question_index'] - 1}, total answered: {state['answered_count']}")
+    Returns:
+        Optional[dict]: 업데이트된 이력서 (대상을 특정할 수 없으면 None)
+    """
+    target = select_patch_target(resume_data, question)
+    if target is None:
+        return None
+
+    system_prompt = RESUME_PATCH_PROMPT.format(
+        target_data=json.dumps(target, ensure_ascii=False),
+        question=question.get("question", ""),
+        answer=answer
+    )
+    # 답변마다 프롬프트가 달라 재사용되지 않으므로 캐시하지 않음
+    patch = await agenerate_structured(
+        llm, [SystemMessage(content=system_prompt)], ResumePatch, temperature=0.3, cache=CachePolicy.NEVER
+    )
+
+    project_id = target["project"]["id"] if "project" in target else None
+    return apply_resume_patch(resume_data, patch, project_id=project_id)
+
+
+async def _rewrite_resume(
+    llm: ChatModelPool,
+    resume_data: dict,
+    question: dict,
+    answer: str
+) -> dict:
+    """
+    (기존 이력서 데이터 전체 + 질문 + 답변) → LLM → 업데이트된 이력서 전체
 
-    except Exception:
-        print("⚠️ Resume update failed")
-        # 업데이트 실패해도 대화는 계속 진행
+    Returns:
+        dict: 업데이트된 이력서
+    """
+    system_prompt = RESUME_UPDATE_PROMPT.format(
+        resume_data=json.dumps(resume_data, ensure_ascii=False),
+        question=question.get("question", ""),
+        answer=answer
+    )
 
-    return state
+    # 스트리밍 JSON 파싱 후 Pydantic 객체로 검증 (깨진 응답은 생성 도중 즉시 실패)
+    updated_resume = await agenerate_structured(
+        llm, [SystemMessage(content=system_prompt)], ResumeExtraction, temperature=0.3, cache=CachePolicy.NEVER
+    )
+    return updated_resume.model_dump(mode="json")
 
 
-async def select_question_node(state: ResumeCoachState) -> ResumeCoachState:
+async def select_question_node(state: ResumeCoachState) -> dict:
     """
-    다음 질문 선택
+    직전 질문에 대한 답변을 기록하고 다음 질문 선택
+
+    진행 카운터는 이력서 업데이트 결과와 무관하므로 여기서 올리고,
+    이력서 업데이트와 다음 질문 응답 생성은 이후 같은 단계에서 병렬로 실행됩니다 (route_turn).
     """
     improvement_questions = state.get("improvement_questions", [])
     current_index = state.get("current_question_index", 0)
+    answered_count = state.get("answered_count", 0)
+
+    # 이번 턴의 답변이 가리키는 질문 (update_resume에서 사용)
+    answered_question = None
+    if state.get("user_answer") and state.get("current_question"):
+        answered_question = state["current_question"]
+        answered_count += 1
+        current_index += 1
 
     # 질문이 남아있고, 5개 미만이면 다음 질문 선택
-    if current_index < len(improvement_questions) and state["answered_count"] < 5:
-        state["current_question"] = improvement_questions[current_index]
-        state["is_completed"] = False
+    if current_index < len(improvement_questions) and answered_count < 5:
+        current_question = improvement_questions[current_index]
+        is_completed = False
     else:
         # 질문이 없거나 5개 완료
-        state["current_question"] = None
-        state["is_completed"] = True
-
-    return state
-
-
-async def generate_response_node(state: ResumeCoachState) -> ResumeCoachState:
+        current_question = None
+        is_completed = True
+
+    return {
+        "answered_question": answered_question,
+        "answered_count": answered_count,
+        "current_question_index": current_index,
+        "current_question": current_question,
+        "is_completed": is_completed,
+    }
+
+
+async def generate_response_node(
+    state: ResumeCoachState,
+    config: RunnableConfig,
+    llm: Optional[ChatModelPool] = None
+) -> dict:
     """
     자연스러운 응답 생성
+
+    분석 직후 미리 만든 질문 문구(phrasing)가 있으면 LLM 호출 없이 그대로 보내고,
+    없으면(이전 분석 결과, 일괄 생성 실패) 이 턴에서 생성합니다.
     """
     current_question = state.get("current_question")
 
     if not current_question:
         # 질문이 없으면 완료 메시지
-        return state
+        return {}
+
+    if current_question.get("phrasing"):
+        return {"response": current_question["phrasing"]}
 
     try:
         # LLM으로 자연스러운 응답 생성
-        model = init_chat_model("gpt-4o-mini", temperature=0.7)
+        llm = llm or get_llm_pool()
 
         system_prompt = QUESTION_RESPONSE_PROMPT.format(
             category=current_question.get("category", ""),
@@ -144,18 +226,27 @@ async def generate_response_node(state: ResumeCoachState) -> ResumeCoachState:
             purpose=current_question.get("purpose", "")
         )
 
-        response = model.invoke([SystemMessage(content=system_prompt)])
+        # config를 넘겨야 stream_mode="messages"로 토큰이 스트리밍됨 (매번 샘플링하므로 캐시하지 않음)
+        response = await llm.ainvoke(
+            [SystemMessage(content=system_prompt)], temperature=0.7, config=config,
+            cache=CachePolicy.NEVER
+        )
 
-        state["response"] = response.content # type: ignore
+        return {"response": response.content}
 
+    except (UserQuotaExceeded, LLMRateLimitExceeded):
+        # 할당량 / rate limit은 라우터가 429 / 503(Retry-After)로 응답하도록 그대로 전달
+        raise
     except Exception:
         # 응답 생성 실패하면 질문 그대로 사용
-        state["response"] = current_question.get("question", "")
-
-    return state
+        return {"response": current_question.get("question", "")}
 
 
-async def completion_node(state: ResumeCoachState) -> ResumeCoachState:
+async def completion_node(
+    state: ResumeCoachState,
+    config: RunnableConfig,
+    llm: Optional[ChatModelPool] = None
+) -> dict:
     """
     대화 완료 메시지 생성
     """
@@ -172,32 +263,41 @@ async def completion_node(state: ResumeCoachState) -> ResumeCoachState:
 
     try:
         # LLM으로 완료 메시지 생성
-        model = init_chat_model("gpt-4o-mini", temperature=0.7)
+        llm = llm or get_llm_pool()
 
         system_prompt = COMPLETION_MESSAGE_PROMPT.format(
             completion_reason=completion_reason
         )
 
-        response = model.invoke([SystemMessage(content=system_prompt)])
-
-        state["response"] = response.content # type: ignore
+        # config를 넘겨야 stream_mode="messages"로 토큰이 스트리밍됨 (매번 샘플링하므로 캐시하지 않음)
+        response = await llm.ainvoke(
+            [SystemMessage(content=system_prompt)], temperature=0.7, config=config,
+            cache=CachePolicy.NEVER
+        )
+        message = response.content
 
+    except (UserQuotaExceeded, LLMRateLimitExceeded):
+        # 할당량 / rate limit은 라우터가 429 / 503(Retry-After)로 응답하도록 그대로 전달
+        raise
     except Exception:
         # 응답 생성 실패하면 기본 메시지
-        state["response"] = f"감사합니다! {completion_reason}. 업데이트된 이력서를 확인해보세요."
-
-    state["is_completed"] = True
+        message = f"감사합니다! {completion_reason}. 업데이트된 이력서를 확인해보세요."
 
-    return state
+    return {"response": message, "is_completed": True}
 
 
-def should_continue(state: ResumeCoachState) -> str:
+def route_turn(state: ResumeCoachState) -> List[str]:
     """
-    대화 계속 여부 결정 (라우팅 함수)
+    select_question 이후 같은 단계에서 병렬로 실행할 노드 (fan-out 라우팅 함수)
+
+    이력서 업데이트와 응답 생성은 서로의 결과를 쓰지 않으므로 동시에 실행하고, 턴 지연은 두 LLM 호출 중 긴 쪽이 됩니다.
+    두 노드는 서로 다른 키만 반환하므로 병합 결과는 완료 순서와 무관합니다.
     """
-    # 5개 질문 완료 또는 질문이 없으면 종료
-    if state["is_completed"]:
-        return "complete"
+    # 5개 질문 완료 또는 질문이 없으면 완료 메시지
+    targets = ["completion" if state["is_completed"] else "generate_response"]
+
+    # 이번 턴에 답변한 질문이 있으면 이력서 업데이트도 함께 실행
+    if state.get("answered_question"):
+        targets.insert(0, "update_resume")
 
-    # 계속 진행
-    return "continue"
+    return targets
@@ -34,6 +34,35 @@ RESUME_UPDATE_PROMPT = """
 """
 
 
+RESUME_PATCH_PROMPT = """
+당신은 이력서 패치 전문가입니다. 질문 대상이 된 이력서 부분과 사용자의 답변을 보고, 바뀌어야 할 내용만 패치로 출력하세요.
+
+<대상 이력서 부분 (JSON)>
+{target_data}
+</대상 이력서 부분>
+
+<질문>
+{question}
+</질문>
+
+<사용자 답변>
+{answer}
+</사용자 답변>
+
+<패치 규칙>
+1. 답변에서 새로 알게 된 내용만 채우고, 나머지 필드는 null 또는 빈 배열로 둡니다.
+2. situation, task, role은 답변이 더 구체적인 내용을 줄 때만 새 값으로 채웁니다.
+3. add_actions, add_results, add_tech_stack에는 대상 프로젝트에 아직 없는 항목만 넣습니다.
+4. 정량적 성과는 숫자를 포함해 add_results에 넣습니다.
+5. add_skills에는 skills 목록에 아직 없는 기술만 정규화된 이름과 카테고리로 넣습니다.
+6. 대상에 project가 없으면 add_skills만 채웁니다.
+7. 답변이 불명확하면 모든 필드를 비워 둡니다.
+
+<출력 형식>
+{{"situation": null, "task": null, "role": null, "add_actions": [], "add_results": [], "add_tech_stack": [], "add_skills": []}} 구조의 JSON만 출력하세요.
+"""
+
+
 QUESTION_RESPONSE_PROMPT = """
 당신은 친근한 이력서 코치입니다. 사용자에게 다음 질문을 자연스럽게 전달하세요.
 
@@ -21,6 +21,7 @@ class ResumeCoachState(TypedDict):
     user_answer: Optional[str]  # 사용자의 현재 답변
 
     # 이력서 데이터
+    resume_id: Optional[int]  # load_resume에서 찾은 최근 이력서 ID (업데이트 시 PK로 조회)
     current_resume_data: Optional[dict]  # ResumeExtraction의 dict 형태
     current_analysis: Optional[dict]  # ResumeAnalysis의 dict 형태
 
@@ -28,6 +29,7 @@ class ResumeCoachState(TypedDict):
     improvement_questions: List[dict]  # ImprovementQuestion의 dict 리스트
     current_question_index: int
     current_question: Optional[dict]  # 현재 질문 (ImprovementQuestion)
+    answered_question: Optional[dict]  # 이번 턴의 user_answer가 답한 질문 (update_resume에서 사용)
 
     # 진행 상태
     answered_count: int
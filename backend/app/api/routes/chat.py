@@ -1,9 +1,16 @@
 from fastapi import APIRouter, HTTPException, Depends
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
-from app.agents import run_resume_coach
+from app.core.llm import ChatModelPool, get_llm_pool
+from app.core.fair_share import UserQuotaExceeded
+from app.core.rate_limit import LLMRateLimitExceeded
+from app.agents import astream_resume_coach, get_resume_coach_graph, run_resume_coach
+from langgraph.graph.state import CompiledStateGraph
+import json
+import math
 
 router = APIRouter()
 
@@ -22,13 +29,20 @@ class ChatResponse(BaseModel):
 
 
 @router.post("/message", response_model=ChatResponse)
-async def send_message(chat: ChatMessage, db: Session = Depends(get_db)):
+async def send_message(
+    chat: ChatMessage,
+    db: AsyncSession = Depends(get_db),
+    llm: ChatModelPool = Depends(get_llm_pool),
+    graph: CompiledStateGraph = Depends(get_resume_coach_graph)
+):
     """
     Agent와 대화 (꼬리질문에 답변)
 
     Args:
         chat: 채팅 메시지 (session_id, user_id, message)
         db: DB 세션
+        llm: 공유 Chat Model 풀
+        graph: 앱 시작 시 컴파일된 코칭 그래프
 
     Returns:
         ChatResponse: {
@@ -39,12 +53,18 @@ async def send_message(chat: ChatMessage, db: Session = Depends(get_db)):
         }
     """
     try:
+        # 토큰 할당량을 다 쓴 사용자는 그래프 실행 전에 거절
+        if llm.scheduler is not None:
+            llm.scheduler.check_quota(chat.user_id)
+
         # LangGraph 대화 실행
         result = await run_resume_coach(
             session_id=chat.session_id,
             user_id=chat.user_id,
             user_answer=chat.message,
-            db=db
+            db=db,
+            llm=llm,
+            graph=graph
         )
 
         return ChatResponse(
@@ -56,44 +76,100 @@ async def send_message(chat: ChatMessage, db: Session = Depends(get_db)):
 
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    except UserQuotaExceeded as e:
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": str(math.ceil(e.retry_after))})
+    except LLMRateLimitExceeded as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(math.ceil(e.retry_after))})
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"메시지 처리 중 오류: {str(e)}")
 
 
+@router.post("/message/stream")
+async def stream_message(
+    chat: ChatMessage,
+    db: AsyncSession = Depends(get_db),
+    llm: ChatModelPool = Depends(get_llm_pool),
+    graph: CompiledStateGraph = Depends(get_resume_coach_graph)
+):
+    """
+    Agent와 대화 (Server-Sent Events 스트리밍)
+
+    이벤트 순서:
+        node: 노드 실행 완료 ({"node": 노드명})
+        token: 응답 토큰 ({"node": "generate_response" | "completion", "content": 토큰})
+        done: 최종 ChatResponse (마지막 이벤트)
+        error: 처리 중 오류 ({"status_code": 400 | 429 | 500 | 503, "detail": 메시지, 429 / 503이면 "retry_after": 초})
+    """
+
+    async def event_stream():
+        try:
+            if llm.scheduler is not None:
+                llm.scheduler.check_quota(chat.user_id)
+
+            async for event in astream_resume_coach(
+                session_id=chat.session_id,
+                user_id=chat.user_id,
+                user_answer=chat.message,
+                db=db,
+                llm=llm,
+                graph=graph
+            ):
+                data = event["data"]
+                if event["event"] == "done":
+                    data = ChatResponse(**data).model_dump()
+                yield _sse(event["event"], data)
+
+        except ValueError as e:
+            yield _sse("error", {"status_code": 400, "detail": str(e)})
+        except UserQuotaExceeded as e:
+            yield _sse("error", {"status_code": 429, "detail": str(e), "retry_after": math.ceil(e.retry_after)})
+        except LLMRateLimitExceeded as e:
+            yield _sse("error", {"status_code": 503, "detail": str(e), "retry_after": math.ceil(e.retry_after)})
+        except Exception as e:
+            yield _sse("error", {"status_code": 500, "detail": f"메시지 처리 중 오류: {str(e)}"})
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
 @router.get("/status/{session_id}")
-async def get_chat_status(session_id: str, db: Session = Depends(get_db)):
+async def get_chat_status(
+    session_id: str,
+    graph: CompiledStateGraph = Depends(get_resume_coach_graph)
+):
     """
-    현재 대화 상태 조회 (PostgresSaver를 통해 조회)
+    현재 대화 상태 조회 (AsyncPostgresSaver 체크포인트에서 조회)
 
     Args:
         session_id: 세션 ID
-        db: DB 세션
+        graph: 앱 시작 시 컴파일된 코칭 그래프
 
     Returns:
         dict: 대화 상태 정보
     """
     try:
-        from langgraph.checkpoint.postgres import PostgresSaver
-        from database.config import DATABASE_URL
-
-        # PostgresSaver를 통해 상태 조회
-        with PostgresSaver.from_conn_string(DATABASE_URL) as checkpointer:
-            config = {"configurable": {"thread_id": session_id}}
-            checkpoint = checkpointer.get(config)
-
-            if not checkpoint:
-                raise HTTPException(status_code=404, detail="세션을 찾을 수 없습니다.")
-
-            # 체크포인트에서 상태 추출
-            state = checkpoint["channel_values"]
-
-            return {
-                "session_id": session_id,
-                "user_id": state.get("user_id", ""),
-                "is_completed": state.get("is_completed", False),
-                "answered_count": state.get("answered_count", 0),
-                "current_question_index": state.get("current_question_index", 0)
-            }
+        snapshot = await graph.aget_state({"configurable": {"thread_id": session_id}})
+
+        if not snapshot.values:
+            raise HTTPException(status_code=404, detail="세션을 찾을 수 없습니다.")
+
+        # 체크포인트에서 상태 추출
+        state = snapshot.values
+
+        return {
+            "session_id": session_id,
+            "user_id": state.get("user_id", ""),
+            "is_completed": state.get("is_completed", False),
+            "answered_count": state.get("answered_count", 0),
+            "current_question_index": state.get("current_question_index", 0)
+        }
 
     except HTTPException:
         raise
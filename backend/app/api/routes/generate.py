@@ -1,44 +1,152 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Depends
 from fastapi.responses import FileResponse
 from pydantic import BaseModel
-from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.background import BackgroundTask
+from langgraph.graph.state import CompiledStateGraph
+from typing import List, Optional
 import uuid
+import math
 import os
 import tempfile
 
-router = APIRouter()
+from app.agents import get_resume_coach_graph
+from app.core.fair_share import UserQuotaExceeded
+from app.core.llm import ChatModelPool, get_llm_pool
+from app.core.rate_limit import LLMRateLimitExceeded
+from app.database import get_db
+from app.models.schemas import JDPosting
+from app.services.generated_resumes import generated_resumes
+from app.services.user_resume_service import UserResumeService
 
-# 생성된 이력서를 임시 저장할 딕셔너리
-generated_resumes = {}
+router = APIRouter()
 
 
 class GenerateRequest(BaseModel):
     session_id: str
     jd_text: str
+    top_k: Optional[int] = None  # 프롬프트에 넣을 JD 관련 프로젝트 수 (기본값: settings.generate_top_k_projects)
+
+
+class BatchGenerateRequest(BaseModel):
+    session_id: str
+    jds: List[JDPosting]
+    top_m: Optional[int] = None  # 이력서까지 생성할 상위 JD 수 (기본값: settings.generate_batch_top_m, 0이면 순위만)
+    top_k: Optional[int] = None
 
 
 @router.post("/")
-async def generate_resume(request: GenerateRequest):
+async def generate_resume(
+    request: GenerateRequest,
+    db: AsyncSession = Depends(get_db),
+    llm: ChatModelPool = Depends(get_llm_pool),
+    graph: CompiledStateGraph = Depends(get_resume_coach_graph)
+):
     """
     JD 기반 맞춤형 이력서 생성
+
+    세션의 사용자 이력서에서 JD와 관련도가 높은 프로젝트 top-k만 골라 LLM으로 이력서를 작성합니다.
+
+    Returns:
+        dict: {job_id, session_id, user_id, resume_id, markdown, matches}
     """
     try:
-        # TODO: 구현 필요
-        return
+        user_id = await _session_user_id(graph, request.session_id)
+
+        service = UserResumeService(db, llm=llm)
+        result = await service.generate_resume(user_id, request.jd_text, top_k=request.top_k)
 
+        job_id = str(uuid.uuid4())
+        generated_resumes.put(job_id, {"session_id": request.session_id, "user_id": user_id, **result.model_dump()})
+
+        return {"job_id": job_id, "session_id": request.session_id, "user_id": user_id, **result.model_dump()}
+
+    except HTTPException:
+        raise
+    except UserQuotaExceeded as e:
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": str(math.ceil(e.retry_after))})
+    except LLMRateLimitExceeded as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(math.ceil(e.retry_after))})
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"이력서 생성 중 오류: {str(e)}")
 
 
+@router.post("/batch")
+async def generate_resume_batch(
+    request: BatchGenerateRequest,
+    db: AsyncSession = Depends(get_db),
+    llm: ChatModelPool = Depends(get_llm_pool),
+    graph: CompiledStateGraph = Depends(get_resume_coach_graph)
+):
+    """
+    JD 여러 개 적합도 비교 + 상위 JD 맞춤 이력서 생성
+
+    모든 JD를 세션 사용자 이력서와 한 번에 스코어링해 적합도 순으로 반환하고,
+    상위 top_m개는 이력서까지 생성합니다 (각 결과의 job_id로 미리보기 / 다운로드).
+
+    Returns:
+        dict: {session_id, user_id, resume_id, results: [{rank, index, title, matches, job_id, error}]}
+    """
+    try:
+        user_id = await _session_user_id(graph, request.session_id)
+
+        service = UserResumeService(db, llm=llm)
+        report = await service.generate_resume_batch(user_id, request.jds, top_m=request.top_m, top_k=request.top_k)
+
+        results = []
+        for fit in report.fits:
+            job_id = None
+            if fit.markdown is not None:
+                job_id = str(uuid.uuid4())
+                generated_resumes.put(job_id, {
+                    "session_id": request.session_id,
+                    "user_id": user_id,
+                    "resume_id": report.resume_id,
+                    "markdown": fit.markdown,
+                    "matches": fit.matches.model_dump(),
+                })
+            results.append({
+                "rank": fit.rank,
+                "index": fit.index,
+                "title": fit.title,
+                "matches": fit.matches.model_dump(),
+                "job_id": job_id,
+                "error": fit.error,
+            })
+
+        return {"session_id": request.session_id, "user_id": user_id, "resume_id": report.resume_id, "results": results}
+
+    except HTTPException:
+        raise
+    except UserQuotaExceeded as e:
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": str(math.ceil(e.retry_after))})
+    except LLMRateLimitExceeded as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(math.ceil(e.retry_after))})
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"배치 이력서 생성 중 오류: {str(e)}")
+
+
 @router.get("/download/{job_id}")
 async def download_resume(job_id: str):
     """
-    생성된 이력서 다운로드
+    생성된 이력서 다운로드 (마크다운 파일)
     """
-    # TODO: 구현 필요
-    return 
+    generated = _get_generated(job_id)
+
+    fd, path = tempfile.mkstemp(suffix=".md")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(generated["markdown"])
+
+    return FileResponse(
+        path,
+        media_type="text/markdown; charset=utf-8",
+        filename=f"resume-{job_id}.md",
+        background=BackgroundTask(os.remove, path),
+    )
 
 
 @router.get("/preview/{job_id}")
@@ -46,5 +154,21 @@ async def preview_resume(job_id: str):
     """
     생성된 이력서 마크다운 미리보기
     """
-    # TODO: 구현 필요
-    return
+    generated = _get_generated(job_id)
+    return {"job_id": job_id, "markdown": generated["markdown"], "matches": generated["matches"]}
+
+
+async def _session_user_id(graph: CompiledStateGraph, session_id: str) -> str:
+    # 코칭 대화 체크포인트에서 세션의 사용자 ID 조회
+    snapshot = await graph.aget_state({"configurable": {"thread_id": session_id}})
+    user_id = (snapshot.values or {}).get("user_id")
+    if not user_id:
+        raise HTTPException(status_code=404, detail="세션을 찾을 수 없습니다.")
+    return user_id
+
+
+def _get_generated(job_id: str) -> dict:
+    generated = generated_resumes.get(job_id)
+    if generated is None:
+        raise HTTPException(status_code=404, detail=f"생성된 이력서 {job_id}를 찾을 수 없습니다 (보관 시간이 지났을 수 있습니다).")
+    return generated
@@ -1,6 +1,12 @@
-from fastapi import APIRouter, HTTPException
+from datetime import datetime
+from fastapi import APIRouter, HTTPException, Depends, Query
 from pydantic import BaseModel
-from typing import Dict, Any
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Dict, Any, List, Optional
+
+from app.database import get_db
+from app.models.schemas import SkillCategory
+from app.repositories import ResumeRepository, ResumeVersionRepository
 
 router = APIRouter()
 
@@ -10,6 +16,135 @@ class KnowledgeUpdate(BaseModel):
     knowledge_base: Dict[str, Any]
 
 
+class ResumeSearchItem(BaseModel):
+    resume_id: int
+    user_id: Optional[str]
+    name: Optional[str]
+    title: Optional[str]
+    skills: List[str]
+    created_at: datetime
+
+
+class ResumeSearchResponse(BaseModel):
+    results: List[ResumeSearchItem]
+    count: int
+
+
+class ResumeVersionItem(BaseModel):
+    version: int
+    operations: int
+    is_snapshot: bool
+    created_at: datetime
+
+
+class ResumeVersionData(BaseModel):
+    resume_id: int
+    version: int
+    data: Dict[str, Any]
+
+
+@router.get("/search", response_model=ResumeSearchResponse)
+async def search_resumes(
+    skill: Optional[str] = Query(default=None, description="기술명 (예: Kafka)"),
+    category: Optional[SkillCategory] = Query(default=None, description="기술 카테고리"),
+    tech_stack: Optional[str] = Query(default=None, description="프로젝트 기술 스택 (예: Kafka)"),
+    limit: int = Query(default=20, ge=1, le=100),
+    offset: int = Query(default=0, ge=0),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    기술 / 기술 카테고리 / 프로젝트 기술 스택으로 이력서 검색 (최신순)
+
+    Args:
+        skill: 기술명 (정규화된 이름과 정확히 일치)
+        category: 기술 카테고리
+        tech_stack: 프로젝트 기술 스택
+        limit: 최대 결과 수
+        offset: 건너뛸 결과 수
+        db: DB 세션
+
+    Returns:
+        ResumeSearchResponse: {
+            results: [{resume_id, user_id, name, title, skills, created_at}],
+            count: 결과 수
+        }
+    """
+    if not (skill or category or tech_stack):
+        raise HTTPException(status_code=400, detail="skill, category, tech_stack 중 하나 이상을 지정하세요.")
+
+    try:
+        resumes = await ResumeRepository(db).search(
+            skill=skill,
+            category=category.value if category else None,
+            tech_stack=tech_stack,
+            limit=limit,
+            offset=offset
+        )
+
+        results = [
+            ResumeSearchItem(
+                resume_id=resume.id,
+                user_id=resume.user_id,
+                name=(resume.data.get("person") or {}).get("name"),
+                title=(resume.data.get("person") or {}).get("title"),
+                skills=[item["name"] for item in resume.data.get("skills", [])],
+                created_at=resume.created_at
+            )
+            for resume in resumes
+        ]
+        return ResumeSearchResponse(results=results, count=len(results))
+
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"이력서 검색 중 오류: {str(e)}")
+
+
+@router.get("/resumes/{resume_id}/versions", response_model=List[ResumeVersionItem])
+async def list_resume_versions(resume_id: int, db: AsyncSession = Depends(get_db)):
+    """
+    이력서 버전 목록 조회 (오래된 순)
+
+    Args:
+        resume_id: 이력서 ID
+        db: DB 세션
+
+    Returns:
+        List[ResumeVersionItem]: [{version, operations (patch 연산 수), is_snapshot, created_at}]
+    """
+    versions = await ResumeVersionRepository(db).list_versions(resume_id)
+    if not versions:
+        raise HTTPException(status_code=404, detail=f"이력서 {resume_id}의 버전 이력이 없습니다.")
+
+    return [
+        ResumeVersionItem(
+            version=entry.version,
+            operations=len(entry.patch or []),
+            is_snapshot=entry.snapshot is not None,
+            created_at=entry.created_at
+        )
+        for entry in versions
+    ]
+
+
+@router.get("/resumes/{resume_id}/versions/{version}", response_model=ResumeVersionData)
+async def get_resume_version(resume_id: int, version: int, db: AsyncSession = Depends(get_db)):
+    """
+    특정 버전의 이력서 데이터 조회 (가까운 스냅샷 + patch 적용으로 복원)
+
+    Args:
+        resume_id: 이력서 ID
+        version: 버전 번호
+        db: DB 세션
+
+    Returns:
+        ResumeVersionData: {resume_id, version, data}
+    """
+    data = await ResumeVersionRepository(db).get_data(resume_id, version)
+    if data is None:
+        raise HTTPException(status_code=404, detail=f"이력서 {resume_id}의 버전 {version}을 찾을 수 없습니다.")
+
+    return ResumeVersionData(resume_id=resume_id, version=version, data=data)
+
+
 # @router.get("/{session_id}")
 # async def get_knowledge_base(session_id: str):
 #     """
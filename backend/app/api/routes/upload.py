@@ -1,20 +1,29 @@
-from fastapi import APIRouter, UploadFile, File, HTTPException, Depends
-from typing import List
-from sqlalchemy.orm import Session
-from app.services.user_resume_service import UserResumeService
+from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Depends, status
+from fastapi.responses import StreamingResponse
+from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.fair_share import UserQuotaExceeded
 from app.database import get_db
-import uuid
+from app.repositories import UploadJobRepository
+from app.services.upload_jobs import UploadJobQueue, get_upload_job_queue, job_snapshot
+import json
+import math
 
 router = APIRouter()
 
 
-@router.post("/resume")
+@router.post("/resume", status_code=status.HTTP_202_ACCEPTED)
 async def upload_resume(
     files: List[UploadFile] = File(...),
-    db: Session = Depends(get_db)
+    user_id: Optional[str] = Form(None),
+    db: AsyncSession = Depends(get_db),
+    queue: UploadJobQueue = Depends(get_upload_job_queue)
 ):
     """
     이력서 PDF 업로드 및 분석 시작 (여러 파일 지원)
+
+    PDF 파싱 → 추출 → 저장 → 분석은 백그라운드 작업으로 처리되며,
+    진행 상황은 /jobs/{job_id} (polling) 또는 /jobs/{job_id}/events (SSE)로 확인합니다.
     """
     try:
         # 파일 검증
@@ -31,41 +40,73 @@ async def upload_resume(
 
 
         # PDF 파일들을 bytes로 읽기
-        pdf_contents = [await file.read() for file in files]
-
-        # UserResumeService 인스턴스 생성
-        user_resume_service = UserResumeService(db)
-
-        # 임시 user_id (추후 인증 구현 시 실제 user_id 사용)
-        user_id = "1"
-
-        # 세션 ID 생성
-        session_id = f"session-{uuid.uuid4()}"
-
-        # 이력서 처리 및 저장
-        is_done = await user_resume_service.create_user_resume(
-            pdf_contents=pdf_contents,
-            user_id=user_id
-        )
+        pdf_files = [(file.filename, await file.read()) for file in files]
 
-        if not is_done:
-            raise HTTPException(status_code=500, detail="이력서 처리 실패")
+        # 임시 user_id (추후 인증 구현 시 실제 user_id 사용, 부하 테스트는 가상 사용자별 ID 전달)
+        user_id = user_id or "1"
 
+        # 토큰 할당량을 다 쓴 사용자는 작업 등록 전에 거절
+        if queue.llm.scheduler is not None:
+            queue.llm.scheduler.check_quota(user_id)
 
-        analyze_resume = await user_resume_service.analyze_resume(user_id=user_id)
-        first_question = analyze_resume.overall_summary
-
+        # 작업 등록 (세션 ID는 작업 생성 시 발급)
+        job = await queue.submit(db, files=pdf_files, user_id=user_id)
 
         return {
-            "session_id": session_id,
+            "job_id": job.id,
+            "session_id": job.session_id,
             "user_id": user_id,
-            "first_question": first_question,
+            "status": job.status,
             "files_processed": len(files),
             "filenames": [file.filename for file in files]
         }
 
+    except HTTPException:
+        raise
+    except UserQuotaExceeded as e:
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": str(math.ceil(e.retry_after))})
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"업로드 처리 중 오류: {str(e)}")
 
+
+@router.get("/jobs/{job_id}")
+async def get_upload_job(job_id: str, db: AsyncSession = Depends(get_db)):
+    """
+    업로드 작업 상태 조회
+
+    Returns:
+        dict: {job_id, session_id, user_id, status, stage, attempts, result, error, updated_at}
+    """
+    job = await UploadJobRepository(db).get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+
+    return job_snapshot(job)
+
+
+@router.get("/jobs/{job_id}/events")
+async def stream_upload_job_events(
+    job_id: str,
+    db: AsyncSession = Depends(get_db),
+    queue: UploadJobQueue = Depends(get_upload_job_queue)
+):
+    """
+    업로드 작업 단계 전환 이벤트 (Server-Sent Events)
+
+    현재 상태를 먼저 보내고, 단계가 바뀔 때마다 이벤트를 보낸 뒤 종료 상태에서 스트림을 닫습니다.
+    """
+    if not await UploadJobRepository(db).get(job_id):
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+
+    async def event_stream():
+        async for event in queue.events(job_id):
+            payload = json.dumps(event["data"], ensure_ascii=False)
+            yield f"event: {event['event']}\ndata: {payload}\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -2,7 +2,7 @@
 Application configuration
 """
 import os
-from typing import Optional
+from typing import Dict, Optional
 from pydantic_settings import BaseSettings
 
 
@@ -12,6 +12,85 @@ class Settings(BaseSettings):
     # LLM API Keys
     openai_api_key: str
     openai_model: str = "gpt-4o-mini"
+    openai_base_url: Optional[str] = None  # OpenAI 호환 서버 주소 (로컬 stub 등)
+
+    # Database (SQLAlchemy async engine)
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
+    db_pool_recycle: int = 1800  # 초
+    db_pool_timeout: float = 30.0
+    db_echo: bool = False  # SQL 문 로그 출력 (부하 상황에서는 끄고 db_metrics로 확인)
+    db_repeated_query_threshold: int = 5  # 한 요청 / 노드에서 같은 SQL이 이 횟수 이상 실행되면 N+1 의심으로 기록
+
+    # LLM Client Pool
+    llm_max_connections: int = 100
+    llm_max_keepalive_connections: int = 20
+    llm_keepalive_expiry: float = 30.0
+    llm_timeout: float = 60.0
+    llm_structured_streaming: bool = True  # 네이티브 structured output 스트리밍 파싱
+
+    # PDF Extraction
+    pdf_extraction_max_workers: int = 4
+
+    # Resume Extraction
+    extraction_mode: str = "auto"  # single | chunked | auto (텍스트가 한 청크를 넘으면 chunked)
+    extraction_chunk_chars: int = 12000
+    extraction_chunk_concurrency: int = 8
+
+    # Resume Coach
+    resume_update_mode: str = "patch"  # patch (질문 대상만 부분 업데이트) | full (전체 이력서 재생성)
+    resume_snapshot_interval: int = 10  # resume_versions 전체 스냅샷 주기 (버전 수)
+    question_phrasing_enabled: bool = True  # 분석 직후 개선 질문의 대화형 문구를 일괄 생성 (채팅 턴 LLM 호출 생략)
+    checkpoint_pool_min_size: int = 1  # LangGraph AsyncPostgresSaver 커넥션 풀
+    checkpoint_pool_max_size: int = 10
+
+    # Upload Job Pipeline
+    upload_job_workers: int = 2
+    upload_job_lease_seconds: int = 300
+    upload_job_max_attempts: int = 3
+
+    # Extraction Cache
+    extraction_cache_enabled: bool = True
+    extraction_cache_max_entries: int = 1000
+    extraction_cache_ttl_seconds: int = 60 * 60 * 24 * 30  # 30일
+
+    # LLM Response Cache (호출 지점별 정책: temperature_zero | never)
+    llm_cache_enabled: bool = True
+    llm_cache_max_entries: int = 5000
+
+    # Resume Cache (채팅 턴마다 읽는 최근 이력서)
+    resume_cache_enabled: bool = True
+    resume_cache_max_entries: int = 1000
+    resume_cache_ttl_seconds: float = 300.0
+    resume_cache_invalidation: str = "local"  # local (단일 워커) | postgres (LISTEN/NOTIFY로 워커 간 전파)
+
+    # LLM Rate Limit (분당 요청 / 토큰 버킷, 429 응답 시 AIMD로 속도 조절)
+    llm_rate_limit_enabled: bool = True
+    llm_rate_limit_rpm: int = 500
+    llm_rate_limit_tpm: int = 200000
+    llm_rate_limit_backend: str = "local"  # local (워커별 버킷) | postgres (모든 워커가 한 버킷 공유)
+    llm_rate_limit_max_retries: int = 3  # 429 응답 재시도 횟수
+    llm_rate_limit_completion_tokens: int = 1000  # 호출 전 토큰 예약 시 가정하는 응답 토큰 수
+
+    # LLM Fair Share (사용자별 가중 공정 큐, 워커 프로세스 단위)
+    llm_fair_share_enabled: bool = True
+    llm_max_concurrency: int = 32  # 워커당 동시 LLM 호출 수
+    llm_user_max_concurrency: int = 4  # 사용자당 동시 LLM 호출 수
+    llm_user_token_quota: int = 1000000  # 사용자당 기간별 토큰 할당량 (0이면 무제한)
+    llm_user_quota_window_seconds: int = 3600
+    llm_user_weights: Dict[str, float] = {}  # 사용자별 가중치 (JSON, 기본 1.0)
+
+    # Embeddings (JD ↔ 이력서 프로젝트 / 기술 / 경력 매칭, pgvector)
+    embedding_model: str = "hashing"  # hashing (로컬 해싱 임베딩, 추가 패키지 없음) | sentence-transformers 모델명
+    embedding_dimensions: int = 384  # 컬럼 차원 - 바꾸면 resume_embeddings 테이블을 다시 만들어야 함
+    generate_top_k_projects: int = 3  # 생성 프롬프트에 넣을 JD 관련 프로젝트 수
+    generate_top_k_skills: int = 15
+    resume_index_cache_max_entries: int = 256  # 프로세스 내 이력서 항목 임베딩 행렬 LRU 캐시 크기
+    generate_batch_max_jds: int = 50  # 배치 생성 요청당 최대 JD 수
+    generate_batch_top_m: int = 3  # 배치 생성에서 이력서까지 생성할 상위 JD 수
+    generate_batch_concurrency: int = 4  # 배치 생성의 동시 LLM 생성 수
+    generated_resume_max_entries: int = 1000  # 미리보기 / 다운로드용으로 보관할 생성 이력서 수 (LRU)
+    generated_resume_ttl_seconds: float = 60 * 60  # 생성 이력서 보관 시간 (1시간)
 
     # LangSmith (Optional)
     LANGSMITH_TRACING: bool = False
@@ -21,6 +100,7 @@ class Settings(BaseSettings):
     DATABASE_URL: Optional[str] = None
 
     # FastAPI
+    debug: bool = False  # 응답 헤더에 요청별 DB 계측 값(X-DB-*) 노출
     api_host: str = "0.0.0.0"
     api_port: int = 8000
 
@@ -0,0 +1,329 @@
+"""
+Fair Share Scheduler - 사용자별 가중 공정 큐(WFQ) + 동시 LLM 호출 한도 + 기간별 토큰 할당량
+"""
+import asyncio
+import functools
+import inspect
+import itertools
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import AsyncIterator, Deque, Dict, Generic, Iterator, List, Optional, Sequence, Tuple, TypeVar
+
+from langchain_core.messages import BaseMessage
+
+from app.core.config import settings
+from app.core.metrics import LLM_SCHEDULER_WAIT, LLM_USER_QUOTA_EXCEEDED
+from app.core.rate_limit import current_priority, estimate_tokens
+
+ANONYMOUS_USER = "anonymous"
+
+# 현재 작업의 LLM 호출을 귀속시킬 사용자 (그래프 노드 / 업로드 작업 / 서비스 메서드에서 설정)
+_llm_user: ContextVar[str] = ContextVar("llm_user", default=ANONYMOUS_USER)
+
+
+@contextmanager
+def llm_user(user_id: Optional[str]) -> Iterator[None]:
+    """블록 안에서 실행되는 LLM 호출의 사용자 지정 (None이면 바깥 값 유지)"""
+    if not user_id:
+        yield
+        return
+    token = _llm_user.set(str(user_id))
+    try:
+        yield
+    finally:
+        _llm_user.reset(token)
+
+
+def current_user() -> str:
+    """현재 작업의 LLM 호출 사용자 (없으면 "anonymous")"""
+    return _llm_user.get()
+
+
+def llm_user_scope(func):
+    """
+    메서드의 user_id 인자를 안에서 실행되는 LLM 호출의 사용자로 지정하는 데코레이터
+
+    Args:
+        func: user_id 인자를 받는 비동기 함수
+    """
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        user_id = signature.bind_partial(*args, **kwargs).arguments.get("user_id")
+        with llm_user(user_id):
+            return await func(*args, **kwargs)
+    return wrapper
+
+
+class UserQuotaExceeded(Exception):
+    """사용자가 기간별 토큰 할당량을 모두 사용했을 때 발생 (API에서는 429 + Retry-After)"""
+
+    def __init__(self, user_id: str, retry_after: float):
+        super().__init__(f"사용자 {user_id}의 LLM 토큰 할당량을 초과했습니다. {retry_after:.0f}초 후 다시 시도하세요.")
+        self.user_id = user_id
+        self.retry_after = retry_after
+
+
+@dataclass
+class _Waiter:
+    priority: int
+    start: float  # 가상 시작 시각
+    finish: float  # 가상 종료 시각 (작을수록 먼저)
+    sequence: int
+    user: str
+
+    @property
+    def order(self):
+        return self.priority, self.finish, self.sequence
+
+
+class _UserState:
+    """사용자별 실행 중 호출 수 / 마지막 가상 종료 시각 / 할당량 기간 사용량"""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.waiting = 0
+        self.last_finish = 0.0
+        self.window_started = 0.0
+        self.window_tokens = 0
+
+
+class FairShareScheduler:
+    """
+    워커 프로세스의 LLM 호출 슬롯을 사용자별로 공정하게 나누는 스케줄러
+
+    - 슬롯(max_concurrency)이 모자라면 대기 호출 중 (우선순위, 가상 종료 시각)이 가장 작은 호출이 먼저 실행됩니다.
+      가상 종료 시각 = max(현재 가상 시각, 사용자의 직전 종료 시각) + 예상 토큰 / 가중치 (start-time fair queuing)
+      이므로 호출을 몰아서 보낸 사용자는 자기 호출끼리 줄을 서고, 다른 사용자의 호출이 사이사이 끼어듭니다.
+    - 사용자당 동시 실행 호출 수는 user_max_concurrency를 넘지 않습니다 (다른 사용자 호출은 계속 진행).
+    - 사용자별 quota_window 기간 동안 실제 사용 토큰이 token_quota를 넘으면 UserQuotaExceeded를 발생시킵니다.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = None,
+        user_max_concurrency: Optional[int] = None,
+        token_quota: Optional[int] = None,
+        quota_window: Optional[float] = None,
+        weights: Optional[Dict[str, float]] = None,
+        completion_tokens: Optional[int] = None,
+    ):
+        """
+        초기화
+
+        Args:
+            max_concurrency: 워커당 동시 LLM 호출 수 (기본값: settings.llm_max_concurrency)
+            user_max_concurrency: 사용자당 동시 LLM 호출 수 (기본값: settings.llm_user_max_concurrency)
+            token_quota: 사용자당 기간별 토큰 할당량, 0이면 무제한 (기본값: settings.llm_user_token_quota)
+            quota_window: 할당량 기간 (초, 기본값: settings.llm_user_quota_window_seconds)
+            weights: 사용자별 가중치 (기본값: settings.llm_user_weights, 없는 사용자는 1.0)
+            completion_tokens: 예상 토큰 계산 시 가정하는 응답 토큰 수
+        """
+        self.max_concurrency = max_concurrency or settings.llm_max_concurrency
+        self.user_max_concurrency = user_max_concurrency or settings.llm_user_max_concurrency
+        self.token_quota = settings.llm_user_token_quota if token_quota is None else token_quota
+        self.quota_window = quota_window or settings.llm_user_quota_window_seconds
+        self.weights = settings.llm_user_weights if weights is None else weights
+        self.completion_tokens = (
+            settings.llm_rate_limit_completion_tokens if completion_tokens is None else completion_tokens
+        )
+
+        self._condition = asyncio.Condition()
+        self._waiters: List[_Waiter] = []
+        self._users: Dict[str, _UserState] = {}
+        self._sequence = itertools.count()
+        self._virtual_time = 0.0
+        self._in_flight = 0
+
+    def weight(self, user_id: str) -> float:
+        return max(float(self.weights.get(user_id, 1.0)), 0.01)
+
+    def check_quota(self, user_id: Optional[str] = None):
+        """
+        사용자의 기간별 토큰 할당량 확인
+
+        Args:
+            user_id: 사용자 ID (기본값: 현재 LLM 호출 사용자)
+
+        Raises:
+            UserQuotaExceeded: 이번 기간의 할당량을 모두 사용한 경우
+        """
+        user = str(user_id) if user_id else current_user()
+        state = self._users.get(user)
+        if not self.token_quota or state is None:
+            return
+        self._roll_window(state)
+        if state.window_tokens >= self.token_quota:
+            LLM_USER_QUOTA_EXCEEDED.inc(priority=current_priority().name.lower())
+            raise UserQuotaExceeded(user, state.window_started + self.quota_window - time.time())
+
+    @asynccontextmanager
+    async def slot(self, messages: Sequence[BaseMessage]) -> AsyncIterator[None]:
+        """
+        현재 사용자의 차례가 올 때까지 기다린 뒤 LLM 호출 슬롯 점유
+
+        Args:
+            messages: 전달할 메시지 리스트 (예상 토큰 = 가상 시각 증가량)
+
+        Raises:
+            UserQuotaExceeded: 사용자의 할당량을 모두 사용한 경우
+        """
+        user = current_user()
+        self.check_quota(user)
+        priority = current_priority()
+        state = self._users.setdefault(user, _UserState())
+        cost = estimate_tokens(messages, self.completion_tokens) / self.weight(user)
+        start = max(self._virtual_time, state.last_finish)
+        waiter = _Waiter(int(priority), start, start + cost, next(self._sequence), user)
+        state.last_finish = waiter.finish
+        started = time.perf_counter()
+
+        state.waiting += 1  # 잠금을 기다리는 동안 사용자 상태가 정리되지 않도록 먼저 표시
+        try:
+            async with self._condition:
+                self._waiters.append(waiter)
+                try:
+                    while self._next() is not waiter:
+                        await self._condition.wait()
+                except BaseException:
+                    # 차례가 온 뒤 취소되었을 수 있으므로 다른 대기 호출을 깨움
+                    self._condition.notify_all()
+                    raise
+                finally:
+                    self._waiters.remove(waiter)
+                state.in_flight += 1
+                self._in_flight += 1
+                self._virtual_time = max(self._virtual_time, waiter.start)
+        finally:
+            state.waiting -= 1
+
+        LLM_SCHEDULER_WAIT.observe(time.perf_counter() - started, priority=priority.name.lower())
+        try:
+            yield
+        finally:
+            async with self._condition:
+                state.in_flight -= 1
+                self._in_flight -= 1
+                self._forget_idle(user)
+                self._condition.notify_all()
+
+    def record(self, usage: Optional[dict]):
+        """
+        현재 사용자의 할당량 기간 사용량에 실제 토큰 수 추가
+
+        Args:
+            usage: LangChain usage_metadata
+        """
+        tokens = (usage or {}).get("total_tokens")
+        if not isinstance(tokens, int) or not self.token_quota:
+            return
+        state = self._users.setdefault(current_user(), _UserState())
+        self._roll_window(state)
+        state.window_tokens += tokens
+
+    def snapshot(self) -> dict:
+        """사용자별 실행 중 / 대기 중 호출 수와 이번 기간 토큰 사용량"""
+        return {
+            "in_flight": self._in_flight,
+            "waiting": len(self._waiters),
+            "users": {
+                user: {
+                    "in_flight": state.in_flight,
+                    "waiting": state.waiting,
+                    "window_tokens": state.window_tokens,
+                    "weight": self.weight(user),
+                }
+                for user, state in self._users.items()
+            },
+        }
+
+    def _next(self) -> Optional[_Waiter]:
+        # 슬롯이 남아 있으면 사용자 한도에 걸리지 않은 대기 호출 중 순서가 가장 앞선 호출
+        if self._in_flight >= self.max_concurrency:
+            return None
+        eligible = [w for w in self._waiters if self._users[w.user].in_flight < self.user_max_concurrency]
+        return min(eligible, key=lambda w: w.order, default=None)
+
+    def _roll_window(self, state: _UserState):
+        now = time.time()
+        if now - state.window_started >= self.quota_window:
+            state.window_started = now
+            state.window_tokens = 0
+
+    def _forget_idle(self, user: str):
+        # 실행 / 대기 중인 호출이 없고 할당량 기간도 끝난 사용자 상태 정리 (메모리 상한)
+        state = self._users.get(user)
+        if state is None or state.in_flight or state.waiting:
+            return
+        if state.last_finish <= self._virtual_time and (
+            not state.window_tokens or time.time() - state.window_started >= self.quota_window
+        ):
+            del self._users[user]
+
+
+T = TypeVar("T")
+
+
+class UserRoundRobinQueue(Generic[T]):
+    """
+    사용자별 대기열을 번갈아 꺼내는 비동기 큐 (asyncio.Queue의 put_nowait / get 대체)
+
+    한 사용자가 작업을 연달아 넣어도 다른 사용자의 작업은 그 뒤가 아니라
+    다음 차례에 꺼내집니다.
+    """
+
+    def __init__(self):
+        self._pending: "OrderedDict[str, Deque[T]]" = OrderedDict()
+        self._available = asyncio.Semaphore(0)
+        self._unfinished = 0
+        self._finished = asyncio.Event()
+        self._finished.set()
+
+    def put_nowait(self, user_id: Optional[str], item: T):
+        self._pending.setdefault(user_id or ANONYMOUS_USER, deque()).append(item)
+        self._unfinished += 1
+        self._finished.clear()
+        self._available.release()
+
+    async def get(self) -> Tuple[str, T]:
+        """
+        다음 차례 사용자의 가장 오래된 항목 (없으면 들어올 때까지 대기)
+
+        Returns:
+            Tuple[str, T]: (사용자 ID, 항목)
+        """
+        await self._available.acquire()
+        user, items = next(iter(self._pending.items()))
+        item = items.popleft()
+        # 꺼낸 사용자는 맨 뒤로 (남은 항목이 없으면 제거)
+        del self._pending[user]
+        if items:
+            self._pending[user] = items
+        return user, item
+
+    def task_done(self):
+        """꺼낸 항목 처리 완료 (asyncio.Queue.task_done과 같음)"""
+        self._unfinished -= 1
+        if self._unfinished <= 0:
+            self._finished.set()
+
+    async def join(self):
+        """모든 항목이 처리될 때까지 대기 (asyncio.Queue.join과 같음)"""
+        await self._finished.wait()
+
+    def qsize(self) -> int:
+        return sum(len(items) for items in self._pending.values())
+
+
+def create_fair_share_scheduler() -> Optional[FairShareScheduler]:
+    """
+    설정에 따라 Fair Share Scheduler 생성 (비활성화면 None)
+
+    Returns:
+        FairShareScheduler or None
+    """
+    return FairShareScheduler() if settings.llm_fair_share_enabled else None
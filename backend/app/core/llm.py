@@ -0,0 +1,340 @@
+"""
+LLM Client Pool - 프로세스 전역 비동기 Chat Model 풀
+"""
+import time
+from contextlib import nullcontext
+from typing import Any, AsyncContextManager, AsyncIterator, Callable, Dict, Optional, Sequence, Tuple
+
+import httpx
+from openai import RateLimitError
+from langchain.chat_models import init_chat_model
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.runnables import RunnableConfig
+
+from app.core.config import settings
+from app.core.fair_share import FairShareScheduler, create_fair_share_scheduler
+from app.core.metrics import record_llm_call
+from app.core.rate_limit import LLMRateLimiter, LLMRateLimitExceeded, create_rate_limiter, retry_after_seconds
+from app.services.llm_cache import CachePolicy, LLMResponseCache
+
+
+class ChatModelPool:
+    """
+    프로세스 전역에서 공유하는 비동기 Chat Model 풀
+
+    - keep-alive 커넥션을 유지하는 httpx.AsyncClient 하나를 모든 모델이 공유합니다.
+    - (모델명, temperature) 조합마다 Chat Model 인스턴스를 한 번만 생성합니다.
+    - 호출은 항상 ainvoke로 수행되어 이벤트 루프를 막지 않습니다.
+    - response_cache가 있으면 호출 지점의 CachePolicy에 따라 같은 프롬프트의 응답을 재사용합니다.
+    - 실제 LLM 호출의 시간과 토큰 사용량은 현재 그래프 노드 / 서비스 단계 이름으로 기록됩니다.
+    - rate_limiter가 있으면 호출 전 요청 / 토큰 버킷을 기다리고, 429 응답은 AIMD로 반영해 재시도합니다.
+    - scheduler가 있으면 그보다 먼저 사용자별 공정 큐에서 호출 슬롯을 받고, 실제 토큰 사용량을 사용자 할당량에 기록합니다.
+    """
+
+    def __init__(
+        self,
+        model_name: Optional[str] = None,
+        base_url: Optional[str] = None,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None,
+        timeout: Optional[float] = None,
+        response_cache: Optional[LLMResponseCache] = None,
+        rate_limiter: Optional[LLMRateLimiter] = None,
+        scheduler: Optional[FairShareScheduler] = None,
+    ):
+        """
+        초기화
+
+        Args:
+            model_name: 기본 모델명 (기본값: settings.openai_model)
+            base_url: OpenAI 호환 API 주소 (기본값: settings.openai_base_url)
+            max_connections: 최대 동시 HTTP 커넥션 수
+            max_keepalive_connections: 유지할 keep-alive 커넥션 수
+            keepalive_expiry: keep-alive 커넥션 유지 시간 (초)
+            timeout: 요청 타임아웃 (초)
+            response_cache: LLM 응답 캐시 (없으면 항상 LLM 호출)
+            rate_limiter: 전역 LLM Rate Limiter (없으면 제한 없이 호출, 429는 OpenAI 클라이언트가 재시도)
+            scheduler: 사용자별 Fair Share Scheduler (없으면 사용자 구분 없이 호출)
+        """
+        self.model_name = model_name or settings.openai_model
+        self.base_url = base_url or settings.openai_base_url
+
+        self._http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_connections or settings.llm_max_connections,
+                max_keepalive_connections=max_keepalive_connections or settings.llm_max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry or settings.llm_keepalive_expiry,
+            ),
+            timeout=timeout or settings.llm_timeout,
+        )
+        self._models: Dict[Tuple[str, float], BaseChatModel] = {}
+        self.response_cache = response_cache
+        self.rate_limiter = rate_limiter
+        self.scheduler = scheduler
+
+    def get(self, temperature: float = 0.3, model_name: Optional[str] = None) -> BaseChatModel:
+        """
+        (모델명, temperature)에 해당하는 Chat Model 반환 (없으면 생성 후 캐싱)
+
+        Args:
+            temperature: 샘플링 온도
+            model_name: 모델명 (기본값: 풀의 기본 모델)
+
+        Returns:
+            BaseChatModel: 공유 HTTP 클라이언트를 사용하는 Chat Model
+        """
+        key = (model_name or self.model_name, temperature)
+        model = self._models.get(key)
+
+        if model is None:
+            model = init_chat_model(
+                key[0],
+                model_provider="openai",
+                temperature=temperature,
+                base_url=self.base_url,
+                http_async_client=self._http_client,
+                stream_usage=True,  # 스트리밍 호출도 마지막 조각에 토큰 사용량 포함
+                # Rate Limiter가 429를 직접 받아 AIMD로 반영하도록 클라이언트 자체 재시도는 끔
+                **({"max_retries": 0} if self.rate_limiter is not None else {}),
+            )
+            self._models[key] = model
+
+        return model
+
+    async def ainvoke(
+        self,
+        messages: Sequence[BaseMessage],
+        temperature: float = 0.3,
+        model_name: Optional[str] = None,
+        config: Optional[RunnableConfig] = None,
+        cache: CachePolicy = CachePolicy.NEVER,
+        prompt_version: Optional[str] = None,
+        validate: Optional[Callable[[str], Any]] = None,
+    ) -> AIMessage:
+        """
+        Chat Model 비동기 호출
+
+        Args:
+            messages: 전달할 메시지 리스트
+            temperature: 샘플링 온도
+            model_name: 모델명 (기본값: 풀의 기본 모델)
+            config: LangGraph 노드의 RunnableConfig (전달하면 그래프 스트리밍에 토큰이 흘러감)
+            cache: 호출 지점의 응답 캐시 정책
+            prompt_version: 프롬프트 이름@버전 (캐시 키에 포함, 없으면 캐시하지 않음)
+            validate: 응답 검증 함수 (예외 없이 통과한 응답만 저장/재사용)
+
+        Returns:
+            AIMessage: LLM 응답 (캐시 hit이면 저장된 텍스트)
+        """
+        model_name = model_name or self.model_name
+        key = self._cache_key(cache, model_name, temperature, prompt_version, messages)
+        cached = await self._cached_response(key, validate)
+        if cached is not None:
+            return AIMessage(content=cached)
+
+        model = self.get(temperature=temperature, model_name=model_name)
+        async with self._slot(messages):
+            attempt = 0
+            while True:
+                reserved = await self._acquire(messages)
+                started = time.perf_counter()
+                response = None
+                try:
+                    response = await model.ainvoke(list(messages), config=config)
+                except RateLimitError as e:
+                    attempt += 1
+                    await self._back_off(e, attempt)
+                    continue
+                finally:
+                    record_llm_call(time.perf_counter() - started, getattr(response, "usage_metadata", None))
+                await self._complete(reserved, response.usage_metadata)
+                break
+
+        if isinstance(response.content, str):
+            await self._store_response(key, model_name, temperature, prompt_version, response.content, validate)
+        return response  # type: ignore[return-value]
+
+    async def astream(
+        self,
+        messages: Sequence[BaseMessage],
+        temperature: float = 0.3,
+        model_name: Optional[str] = None,
+        response_format: Optional[Any] = None,
+        cache: CachePolicy = CachePolicy.NEVER,
+        prompt_version: Optional[str] = None,
+        validate: Optional[Callable[[str], Any]] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Chat Model 스트리밍 호출 (텍스트 조각 단위)
+
+        Args:
+            messages: 전달할 메시지 리스트
+            temperature: 샘플링 온도
+            model_name: 모델명 (기본값: 풀의 기본 모델)
+            response_format: 네이티브 structured output 스키마 (Pydantic 모델)
+            cache: 호출 지점의 응답 캐시 정책
+            prompt_version: 프롬프트 이름@버전 (캐시 키에 포함, 없으면 캐시하지 않음)
+            validate: 응답 검증 함수 (예외 없이 통과한 응답만 저장/재사용)
+
+        Yields:
+            str: 생성된 텍스트 조각 (캐시 hit이면 전체 응답 한 조각)
+        """
+        model_name = model_name or self.model_name
+        key = self._cache_key(cache, model_name, temperature, prompt_version, messages, response_format)
+        cached = await self._cached_response(key, validate)
+        if cached is not None:
+            yield cached
+            return
+
+        model = self.get(temperature=temperature, model_name=model_name)
+        runnable = model.bind(response_format=response_format) if response_format is not None else model
+
+        async with self._slot(messages):
+            attempt = 0
+            while True:
+                reserved = await self._acquire(messages)
+                chunks = []
+                usage: Dict[str, int] = {}
+                started = time.perf_counter()
+                try:
+                    async for chunk in runnable.astream(list(messages)):
+                        for name, count in (getattr(chunk, "usage_metadata", None) or {}).items():
+                            if isinstance(count, int):
+                                usage[name] = usage.get(name, 0) + count
+                        if isinstance(chunk.content, str) and chunk.content:
+                            chunks.append(chunk.content)
+                            yield chunk.content
+                except RateLimitError as e:
+                    # 이미 내보낸 조각이 있으면 다시 시작할 수 없음
+                    if chunks:
+                        raise
+                    attempt += 1
+                    await self._back_off(e, attempt)
+                    continue
+                finally:
+                    record_llm_call(time.perf_counter() - started, usage)
+                await self._complete(reserved, usage)
+                break
+
+        # 끝까지 받은 응답만 저장 (호출자가 도중에 중단하면 저장하지 않음)
+        await self._store_response(key, model_name, temperature, prompt_version, "".join(chunks), validate)
+
+    def _slot(self, messages: Sequence[BaseMessage]) -> AsyncContextManager[None]:
+        if self.scheduler is None:
+            return nullcontext()
+        return self.scheduler.slot(messages)
+
+    async def _acquire(self, messages: Sequence[BaseMessage]) -> int:
+        if self.rate_limiter is None:
+            return 0
+        return await self.rate_limiter.acquire(messages)
+
+    async def _complete(self, reserved: int, usage: Optional[dict]):
+        if self.scheduler is not None:
+            self.scheduler.record(usage)
+        if self.rate_limiter is not None:
+            await self.rate_limiter.complete(reserved, usage)
+
+    async def _back_off(self, error: RateLimitError, attempt: int):
+        # 429 응답: 버킷에 반영 후 재시도 (Rate Limiter가 없거나 재시도 횟수를 넘기면 예외)
+        if self.rate_limiter is None:
+            raise error
+        retry_after = retry_after_seconds(error)
+        await self.rate_limiter.rate_limited(retry_after)
+        if attempt > settings.llm_rate_limit_max_retries:
+            raise LLMRateLimitExceeded(retry_after) from error
+
+    def _cache_key(
+        self,
+        cache: CachePolicy,
+        model_name: str,
+        temperature: float,
+        prompt_version: Optional[str],
+        messages: Sequence[BaseMessage],
+        response_format: Optional[Any] = None,
+    ) -> Optional[str]:
+        if self.response_cache is None:
+            return None
+        return self.response_cache.key_for(cache, model_name, temperature, prompt_version, messages, response_format)
+
+    async def _cached_response(self, key: Optional[str], validate: Optional[Callable[[str], Any]]) -> Optional[str]:
+        if key is None or self.response_cache is None:
+            return None
+        cached = await self.response_cache.get(key)
+        if cached is not None and validate is not None:
+            try:
+                validate(cached)
+            except Exception:
+                # 스키마가 바뀌어 더 이상 유효하지 않은 응답 - 새로 생성해 덮어씀
+                return None
+        return cached
+
+    async def _store_response(
+        self,
+        key: Optional[str],
+        model_name: str,
+        temperature: float,
+        prompt_version: Optional[str],
+        content: str,
+        validate: Optional[Callable[[str], Any]],
+    ):
+        if key is None or self.response_cache is None or prompt_version is None:
+            return
+        if validate is not None:
+            try:
+                validate(content)
+            except Exception:
+                return
+        await self.response_cache.put(key, model_name, temperature, prompt_version, content)
+
+    async def aclose(self):
+        """
+        공유 HTTP 커넥션 정리
+        """
+        self._models.clear()
+        await self._http_client.aclose()
+
+
+# 프로세스 전역 풀 (lifespan에서 생성/정리)
+_llm_pool: Optional[ChatModelPool] = None
+
+
+def init_llm_pool() -> ChatModelPool:
+    """
+    전역 Chat Model 풀 생성 (앱 시작 시 호출)
+
+    Returns:
+        ChatModelPool: 생성된 풀
+    """
+    global _llm_pool
+    if _llm_pool is None:
+        _llm_pool = ChatModelPool(
+            response_cache=LLMResponseCache() if settings.llm_cache_enabled else None,
+            rate_limiter=create_rate_limiter(),
+            scheduler=create_fair_share_scheduler(),
+        )
+    return _llm_pool
+
+
+async def close_llm_pool():
+    """
+    전역 Chat Model 풀 정리 (앱 종료 시 호출)
+    """
+    global _llm_pool
+    if _llm_pool is not None:
+        await _llm_pool.aclose()
+        _llm_pool = None
+
+
+def get_llm_pool() -> ChatModelPool:
+    """
+    전역 Chat Model 풀 조회 (FastAPI Dependency)
+
+    lifespan 밖(스크립트, 테스트)에서 호출되면 풀을 지연 생성합니다.
+
+    Returns:
+        ChatModelPool: 전역 풀
+    """
+    return init_llm_pool()
@@ -0,0 +1,358 @@
+"""
+Metrics - 요청 / 그래프 노드 / 서비스 단계별 지연, LLM 토큰, 오류, DB 계측 (Prometheus 텍스트 형식으로 노출)
+"""
+import functools
+import math
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.database.config import QueryStats, track_queries
+
+# 초 단위 지연 버킷 (DB 노드의 수 ms부터 LLM 구조화 출력의 수십 초까지)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+class Counter:
+    """레이블별 누적 카운터 (Prometheus counter)"""
+
+    type = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str]):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1, **labels: str):
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        self.values[key] = self.values.get(key, 0) + amount
+
+    def get(self, **labels: str) -> float:
+        return self.values.get(tuple(str(labels[name]) for name in self.labelnames), 0)
+
+    def reset(self):
+        self.values.clear()
+
+    def samples(self) -> Iterator[Tuple[str, Dict[str, str], float]]:
+        for key, value in sorted(self.values.items()):
+            yield self.name, dict(zip(self.labelnames, key)), value
+
+
+class Gauge(Counter):
+    """레이블별 현재 값 (Prometheus gauge)"""
+
+    type = "gauge"
+
+    def set(self, value: float, **labels: str):
+        self.values[tuple(str(labels[name]) for name in self.labelnames)] = value
+
+
+class Histogram:
+    """레이블별 누적 버킷 히스토그램 (Prometheus histogram)"""
+
+    type = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str], buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        self.values: Dict[Tuple[str, ...], Tuple[List[int], List[float]]] = {}  # (버킷별 개수, [합계])
+
+    def observe(self, value: float, **labels: str):
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        counts, total = self.values.setdefault(key, ([0] * (len(self.buckets) + 1), [0.0]))
+        for idx, bound in enumerate(self.buckets):
+            if value <= bound:
+                counts[idx] += 1
+                break
+        else:
+            counts[-1] += 1
+        total[0] += value
+
+    def count(self, **labels: str) -> int:
+        counts, _ = self.values.get(tuple(str(labels[name]) for name in self.labelnames), ([0], [0.0]))
+        return sum(counts)
+
+    def reset(self):
+        self.values.clear()
+
+    def samples(self) -> Iterator[Tuple[str, Dict[str, str], float]]:
+        for key, (counts, total) in sorted(self.values.items()):
+            labels = dict(zip(self.labelnames, key))
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), counts):
+                cumulative += count
+                yield f"{self.name}_bucket", {**labels, "le": "+Inf" if bound == math.inf else repr(bound)}, cumulative
+            yield f"{self.name}_sum", labels, total[0]
+            yield f"{self.name}_count", labels, cumulative
+
+
+
+class DBScopeMetrics:
+    """같은 라우트 / 노드에서 실행된 DB 작업 누적값"""
+
+    def __init__(self):
+        self.calls = 0
+        self.queries = 0
+        self.duration = 0.0  # 초
+        self.rows = 0
+        self.max_queries = 0
+        self.repeated = 0  # 같은 SQL 반복(N+1 의심)이 발견된 호출 수
+
+    def record(self, stats: QueryStats, repeated: bool):
+        self.calls += 1
+        self.queries += stats.count
+        self.duration += stats.duration
+        self.rows += stats.rows
+        self.max_queries = max(self.max_queries, stats.count)
+        self.repeated += int(repeated)
+
+    def snapshot(self) -> dict:
+        return {
+            "calls": self.calls,
+            "queries": self.queries,
+            "queries_per_call": round(self.queries / self.calls, 2) if self.calls else 0.0,
+            "max_queries": self.max_queries,
+            "db_time_ms": round(self.duration * 1000, 1),
+            "db_time_ms_per_call": round(self.duration * 1000 / self.calls, 2) if self.calls else 0.0,
+            "rows": self.rows,
+            "repeated_query_calls": self.repeated,
+        }
+
+
+class DBMetrics:
+    """
+    프로세스 단위 DB 계측 (kind: "request" - "GET /api/chat/...", "node" - LangGraph 노드 이름)
+    """
+
+    def __init__(self):
+        self.scopes: Dict[Tuple[str, str], DBScopeMetrics] = {}
+
+    def record(self, kind: str, name: str, stats: QueryStats):
+        """
+        한 요청 / 노드 실행의 DB 집계 기록 (같은 SQL이 반복되면 경고 로그)
+
+        Args:
+            kind: "request" | "node"
+            name: 라우트 또는 노드 이름
+            stats: track_queries 집계
+        """
+        repeated = stats.repeated()
+        if repeated:
+            statement, count = repeated[0]
+            print(f"⚠️ Repeated query in {kind} '{name}': {count}x {' '.join(statement.split())[:200]}")
+        self.scopes.setdefault((kind, name), DBScopeMetrics()).record(stats, bool(repeated))
+
+    def reset(self):
+        self.scopes.clear()
+
+    def snapshot(self) -> dict:
+        result: Dict[str, dict] = {"requests": {}, "nodes": {}}
+        for (kind, name), metrics in sorted(self.scopes.items()):
+            result[f"{kind}s"][name] = metrics.snapshot()
+        return result
+
+
+# 프로세스 전역 집계
+db_metrics = DBMetrics()
+
+
+def db_headers(stats: QueryStats) -> Dict[str, str]:
+    """
+    디버그 응답 헤더로 노출할 DB 집계
+
+    Args:
+        stats: track_queries 집계
+
+    Returns:
+        Dict[str, str]: X-DB-* 헤더
+    """
+    return {
+        "X-DB-Query-Count": str(stats.count),
+        "X-DB-Time-Ms": f"{stats.duration * 1000:.1f}",
+        "X-DB-Rows": str(stats.rows),
+        "X-DB-Repeated-Queries": str(len(stats.repeated())),
+    }
+
+
+# HTTP 요청 / 그래프 노드 / 서비스 단계 / LLM 호출 지표 (프로세스 단위)
+REQUEST_DURATION = Histogram("http_request_duration_seconds", "HTTP 요청 처리 시간", ["method", "route"])
+REQUESTS = Counter("http_requests_total", "HTTP 요청 수", ["method", "route", "status"])
+NODE_DURATION = Histogram("resume_coach_node_duration_seconds", "코칭 그래프 노드 실행 시간", ["node"])
+NODE_ERRORS = Counter("resume_coach_node_errors_total", "코칭 그래프 노드 예외 수", ["node"])
+CHECKPOINT_DURATION = Histogram("resume_coach_checkpoint_duration_seconds", "체크포인터 조회/저장 시간", ["operation"])
+STAGE_DURATION = Histogram("resume_service_stage_duration_seconds", "UserResumeService 단계 실행 시간", ["stage"])
+STAGE_ERRORS = Counter("resume_service_stage_errors_total", "UserResumeService 단계 예외 수", ["stage"])
+LLM_DURATION = Histogram("llm_request_duration_seconds", "LLM 호출 시간 (캐시 hit 제외)", ["scope"])
+LLM_TOKENS = Counter("llm_tokens_total", "LLM 토큰 사용량", ["scope", "type"])
+LLM_RATE_LIMIT_WAIT = Histogram("llm_rate_limit_wait_seconds", "LLM 호출 전 요청 / 토큰 버킷 대기 시간", ["priority"])
+LLM_RATE_LIMITED = Counter("llm_rate_limited_total", "LLM API의 429 응답 수", ["scope"])
+LLM_SCHEDULER_WAIT = Histogram("llm_scheduler_wait_seconds", "사용자별 공정 큐에서 LLM 호출 슬롯 대기 시간", ["priority"])
+LLM_USER_QUOTA_EXCEEDED = Counter("llm_user_quota_exceeded_total", "사용자 토큰 할당량 초과로 거절된 요청 / LLM 호출 수", ["priority"])
+LLM_RATE_FACTOR = Gauge("llm_rate_limit_factor", "AIMD 리필 배율 (1.0 = 설정된 한도 전체)", [])
+
+METRICS = [
+    REQUEST_DURATION, REQUESTS,
+    NODE_DURATION, NODE_ERRORS, CHECKPOINT_DURATION,
+    STAGE_DURATION, STAGE_ERRORS,
+    LLM_DURATION, LLM_TOKENS,
+    LLM_RATE_LIMIT_WAIT, LLM_RATE_LIMITED, LLM_RATE_FACTOR,
+    LLM_SCHEDULER_WAIT, LLM_USER_QUOTA_EXCEEDED,
+]
+
+# LLM 토큰 / 호출 시간을 귀속시킬 현재 노드 또는 서비스 단계 이름
+_metric_scope: ContextVar[str] = ContextVar("metric_scope", default="other")
+
+
+def current_scope() -> str:
+    """현재 실행 중인 그래프 노드 / 서비스 단계 이름 (없으면 "other")"""
+    return _metric_scope.get()
+
+
+@contextmanager
+def _observe(duration: Histogram, errors: Counter, label: str, name: str) -> Iterator[None]:
+    token = _metric_scope.set(name)
+    started = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        errors.inc(**{label: name})
+        raise
+    finally:
+        duration.observe(time.perf_counter() - started, **{label: name})
+        _metric_scope.reset(token)
+
+
+def observe_node(node: str):
+    """그래프 노드 실행 시간 / 예외 기록 (블록 안의 LLM 호출은 이 노드로 집계)"""
+    return _observe(NODE_DURATION, NODE_ERRORS, "node", node)
+
+
+def observe_stage(stage: str):
+    """
+    UserResumeService 단계 실행 시간 / 예외 기록 데코레이터 (메서드 안의 LLM 호출은 이 단계로 집계)
+
+    Args:
+        stage: 단계 이름
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            with _observe(STAGE_DURATION, STAGE_ERRORS, "stage", stage):
+                return await func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def record_llm_call(duration: float, usage: Optional[dict]):
+    """
+    LLM 호출 한 번의 시간 / 토큰 사용량을 현재 노드 또는 단계에 기록
+
+    Args:
+        duration: 호출 시간 (초)
+        usage: LangChain usage_metadata (input_tokens, output_tokens)
+    """
+    scope = current_scope()
+    LLM_DURATION.observe(duration, scope=scope)
+    if usage:
+        LLM_TOKENS.inc(usage.get("input_tokens", 0), scope=scope, type="prompt")
+        LLM_TOKENS.inc(usage.get("output_tokens", 0), scope=scope, type="completion")
+
+
+def reset_metrics():
+    """모든 지표 초기화 (테스트 / 벤치마크용)"""
+    for metric in METRICS:
+        metric.reset()
+    db_metrics.reset()
+
+
+def render_metrics() -> str:
+    """
+    전체 지표를 Prometheus 텍스트 형식(0.0.4)으로 렌더링
+
+    Returns:
+        str: /metrics 응답 본문
+    """
+    lines: List[str] = []
+    for metric in METRICS + _db_counters():
+        lines.append(f"# HELP {metric.name} {metric.documentation}")
+        lines.append(f"# TYPE {metric.name} {metric.type}")
+        for name, labels, value in metric.samples():
+            label_text = ",".join(f'{key}="{_escape(value_)}"' for key, value_ in labels.items())
+            lines.append(f"{name}{{{label_text}}} {_format(value)}" if labels else f"{name} {_format(value)}")
+    return "\n".join(lines) + "\n"
+
+
+def _db_counters() -> List[Counter]:
+    # db_metrics 누적값을 요청(라우트) / 노드 레이블의 카운터로 변환
+    counters = [
+        Counter("db_queries_total", "실행된 SQL 문 수", ["kind", "name"]),
+        Counter("db_query_duration_seconds_total", "SQL 실행 시간 합계", ["kind", "name"]),
+        Counter("db_rows_total", "드라이버 rowcount 합계", ["kind", "name"]),
+        Counter("db_repeated_query_scopes_total", "같은 SQL 반복(N+1 의심)이 발견된 요청 / 노드 실행 수", ["kind", "name"]),
+    ]
+    for (kind, name), metrics in db_metrics.scopes.items():
+        for counter, value in zip(counters, [metrics.queries, metrics.duration, metrics.rows, metrics.repeated]):
+            counter.inc(value, kind=kind, name=name)
+    return counters
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class MetricsMiddleware:
+    """
+    요청마다 지연 / 상태 코드 / 실행된 SQL 문을 라우트 단위로 기록하는 ASGI 미들웨어
+
+    - 스트리밍 응답은 본문을 다 보낸 뒤 기록 (헤더에는 헤더 전송 시점까지의 값)
+    - settings.debug이면 X-DB-* 응답 헤더 추가
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500  # 응답을 시작하기 전에 예외가 나면 500으로 기록
+        started = time.perf_counter()
+        with track_queries() as stats:
+            async def send_with_metrics(message: Message):
+                nonlocal status
+                if message["type"] == "http.response.start":
+                    status = message["status"]
+                    if settings.debug:
+                        headers = list(message.get("headers", []))
+                        headers += [(key.lower().encode(), value.encode()) for key, value in db_headers(stats).items()]
+                        message = {**message, "headers": headers}
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_metrics)
+            finally:
+                route = _route_name(scope)
+                REQUEST_DURATION.observe(time.perf_counter() - started, method=scope["method"], route=route)
+                REQUESTS.inc(method=scope["method"], route=route, status=str(status))
+                db_metrics.record("request", f"{scope['method']} {route}", stats)
+
+
+def _route_name(scope: Scope) -> str:
+    # 경로 파라미터별로 나뉘지 않도록 파라미터 값을 {이름}으로 되돌린 템플릿 사용 (매칭되지 않은 요청은 하나로 묶음)
+    # include_router의 prefix가 빠진 route.path 대신 실제 요청 경로에서 만듦
+    if scope.get("route") is None and scope.get("endpoint") is None:
+        return "unmatched"
+    params = {str(value): name for name, value in scope.get("path_params", {}).items()}
+    return "/".join(f"{{{params[segment]}}}" if segment in params else segment for segment in scope["path"].split("/"))
@@ -1,3 +1,6 @@
+# 프롬프트 내용을 바꾸면 버전을 올려 추출 캐시를 무효화합니다.
+SIMPLE_EXTRACTION_PROMPT_VERSION = "v1"
+
 SIMPLE_EXTRACTION_PROMPT = """
 당신은 이력서를 JSON으로 변환하는 전문가입니다.
 
@@ -100,6 +103,9 @@ score = (situation ? 0.25 : 0) + (task ? 0.25 : 0) + (actions ? 0.25 : 0) + (res
 """
 
 
+# 분석 프롬프트를 바꾸면 버전을 올려 LLM 응답 캐시를 무효화합니다.
+RESUME_ANALYSIS_PROMPT_VERSION = "resume_analysis@v1"
+
 RESUME_ANALYSIS_PROMPT = """
 당신은 이력서 컨설턴트입니다. 제공된 구조화된 이력서 데이터를 분석하고, 부족한 부분을 찾아 개선 질문을 생성하세요.
 
@@ -170,4 +176,75 @@ RESUME_ANALYSIS_PROMPT = """
 }}
 
 이제 위 이력서 데이터를 분석해서 JSON으로 출력하세요.
-"""
\ No newline at end of file
+"""
+
+QUESTION_PHRASING_PROMPT = """
+당신은 친근한 이력서 코치입니다. 이력서 분석으로 만든 개선 질문들을 채팅에서 사용자에게 보낼 자연스러운 메시지로 바꾸세요.
+
+<개선 질문 목록 (JSON)>
+{questions}
+</개선 질문 목록>
+
+<응답 규칙>
+1. 질문마다 메시지 하나를 작성하고, 입력의 index를 그대로 사용합니다.
+2. 친근하고 격려하는 톤으로 작성합니다.
+3. 질문의 목적을 간단히 설명합니다 (1문장).
+4. 구체적인 예시를 포함하면 좋습니다.
+5. 사용자가 답변하기 쉽도록 유도합니다.
+6. 각 메시지는 다른 메시지를 참조하지 않고 단독으로 읽혀야 합니다 (대화 중 한 번에 하나씩 보냅니다).
+
+<예시>
+입력:
+[{{"index": 0, "category": "STAR-결과", "question": "RAG 시스템 도입 후 측정 가능한 성과가 있었나요?", "purpose": "프로젝트의 임팩트를 정량적으로 표현하기 위함"}}]
+
+출력:
+{{
+  "phrasings": [
+    {{
+      "index": 0,
+      "message": "좋습니다! 이제 RAG 시스템 프로젝트의 성과에 대해 더 알아보고 싶어요. 정량적인 성과가 있으면 이력서가 훨씬 더 임팩트 있게 보이거든요.\\n\\n**RAG 시스템 도입 후 측정 가능한 성과가 있었나요?**\\n예를 들어 \\"응답 시간 30% 단축\\", \\"정확도 85%에서 95%로 향상\\" 같은 구체적인 수치가 있다면 알려주세요!"
+    }}
+  ]
+}}
+
+이제 위 질문 목록의 메시지를 JSON으로 출력하세요.
+"""
+
+RESUME_GENERATION_PROMPT_VERSION = "resume_generation@v1"
+
+RESUME_GENERATION_PROMPT = """
+당신은 채용 공고(JD)에 맞춰 이력서를 다듬는 전문 커리어 컨설턴트입니다.
+아래 이력서 정보만 사용해 JD에 맞춘 한국어 이력서를 마크다운으로 작성하세요.
+
+<채용 공고>
+{jd_text}
+</채용 공고>
+
+<지원자 정보 (JSON)>
+{person}
+</지원자 정보>
+
+<JD 관련도 순 프로젝트 (JSON)>
+{projects}
+</JD 관련도 순 프로젝트>
+
+<JD 관련도 순 기술>
+{skills}
+</JD 관련도 순 기술>
+
+<경력 (JSON, JD 관련도 순)>
+{careers}
+</경력>
+
+<학력 (JSON)>
+{education}
+</학력>
+
+<작성 규칙>
+1. 입력에 없는 경험, 수치, 기술을 만들어내지 않습니다.
+2. 프로젝트는 주어진 순서대로 모두 포함하고, 각 프로젝트를 STAR(상황 / 과제 / 행동 / 성과) 흐름의 불릿 3~5개로 작성합니다.
+3. JD의 요구 역량과 겹치는 행동과 성과를 먼저 배치하고 JD의 용어를 자연스럽게 사용합니다.
+4. 정량적 성과가 있으면 반드시 숫자를 유지합니다.
+5. 섹션 순서: # 이름 / 직무 한 줄 요약 → ## 핵심 역량 → ## 프로젝트 → ## 경력 → ## 학력
+6. 마크다운 본문만 출력합니다 (코드 블록으로 감싸지 않음).
+"""
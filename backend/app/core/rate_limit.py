@@ -0,0 +1,349 @@
+"""
+LLM Rate Limiter - 분당 요청 / 토큰 버킷 + 429 응답 AIMD 조절 + 채팅 턴 우선 대기열
+"""
+import asyncio
+import heapq
+import itertools
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Any, Iterator, List, Optional, Protocol, Sequence, Tuple
+
+from langchain_core.messages import BaseMessage
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.core.metrics import LLM_RATE_FACTOR, LLM_RATE_LIMIT_WAIT, LLM_RATE_LIMITED, current_scope
+from app.database.config import SessionLocal
+from app.repositories.llm_rate_limit_repository import LLMRateLimitRepository
+
+DECREASE_FACTOR = 0.5  # 429 응답마다 리필 속도를 절반으로
+INCREASE_STEP = 0.01  # 성공한 호출마다 리필 배율을 조금씩 회복
+MIN_RATE_FACTOR = 0.05
+DEFAULT_RETRY_AFTER = 1.0  # Retry-After 헤더가 없을 때 대기 시간 (초)
+MAX_WAIT_SLICE = 1.0  # 버킷 대기 중 다시 확인하는 최대 간격 (다른 워커 / 우선순위 변화 반영)
+
+
+class Priority(IntEnum):
+    """LLM 호출 우선순위 (값이 작을수록 먼저 버킷을 받음)"""
+    INTERACTIVE = 0  # 사용자가 기다리는 채팅 턴
+    BACKGROUND = 1  # 업로드 작업의 추출 / 분석
+
+
+# 현재 작업의 LLM 호출 우선순위 (기본값: 채팅 턴, 업로드 작업 워커는 BACKGROUND로 설정)
+_llm_priority: ContextVar[Priority] = ContextVar("llm_priority", default=Priority.INTERACTIVE)
+
+
+@contextmanager
+def llm_priority(priority: Priority) -> Iterator[None]:
+    """블록 안에서 실행되는 LLM 호출의 우선순위 지정"""
+    token = _llm_priority.set(priority)
+    try:
+        yield
+    finally:
+        _llm_priority.reset(token)
+
+
+def current_priority() -> Priority:
+    """현재 작업의 LLM 호출 우선순위"""
+    return _llm_priority.get()
+
+
+def estimate_tokens(messages: Sequence[BaseMessage], completion_tokens: int) -> int:
+    """
+    호출 전에 예약할 토큰 수 (문자 수 / 4 + 예상 응답 토큰)
+
+    Args:
+        messages: 전달할 메시지 리스트
+        completion_tokens: 예상 응답 토큰 수
+
+    Returns:
+        int: 예상 토큰 수
+    """
+    return sum(len(str(message.content)) for message in messages) // 4 + completion_tokens
+
+
+class LLMRateLimitExceeded(Exception):
+    """429 응답이 재시도 횟수를 넘겨 계속될 때 발생"""
+
+    def __init__(self, retry_after: float):
+        super().__init__(f"LLM API rate limit exceeded (retry after {retry_after:.1f}s)")
+        self.retry_after = retry_after
+
+
+def retry_after_seconds(error: Exception) -> float:
+    """
+    openai.RateLimitError의 응답 헤더에서 재시도 대기 시간 추출
+
+    Args:
+        error: 429 예외
+
+    Returns:
+        float: 대기 시간 (초, 헤더가 없으면 DEFAULT_RETRY_AFTER)
+    """
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    for name, scale in (("retry-after-ms", 0.001), ("retry-after", 1.0)):
+        try:
+            return max(float(headers[name]) * scale, 0.0)
+        except (KeyError, TypeError, ValueError):
+            continue
+    return DEFAULT_RETRY_AFTER
+
+
+@dataclass
+class BucketState:
+    """요청 / 토큰 버킷 상태 (LLMRateLimitBucket 행과 같은 필드)"""
+    requests: float
+    tokens: float
+    rate_factor: float
+    paused_until: float
+    updated_at: float
+
+
+# 아래 함수는 BucketState와 LLMRateLimitBucket 행 모두에 사용 (같은 속성 이름)
+def _refill(bucket: Any, now: float, rpm: int, tpm: int):
+    elapsed = max(now - bucket.updated_at, 0.0)
+    bucket.requests = min(float(rpm), bucket.requests + elapsed * rpm * bucket.rate_factor / 60)
+    bucket.tokens = min(float(tpm), bucket.tokens + elapsed * tpm * bucket.rate_factor / 60)
+    bucket.updated_at = now
+
+
+def _consume(bucket: Any, now: float, rpm: int, tpm: int, tokens: int) -> float:
+    # 차감했으면 0, 아니면 필요한 만큼 리필될 때까지의 대기 시간 (초)
+    _refill(bucket, now, rpm, tpm)
+    if bucket.paused_until > now:
+        return bucket.paused_until - now
+    tokens = min(tokens, tpm)  # 한도보다 큰 요청이 영원히 기다리지 않도록
+    if bucket.requests >= 1 and bucket.tokens >= tokens:
+        bucket.requests -= 1
+        bucket.tokens -= tokens
+        return 0.0
+    request_wait = max(1 - bucket.requests, 0.0) * 60 / (rpm * bucket.rate_factor)
+    token_wait = max(tokens - bucket.tokens, 0.0) * 60 / (tpm * bucket.rate_factor)
+    return max(request_wait, token_wait)
+
+
+def _settle(bucket: Any, tpm: int, tokens: int, success: bool):
+    # 예약한 토큰 수와 실제 사용량의 차이 반영 + 성공 시 리필 배율 회복 (additive increase)
+    bucket.tokens = min(float(tpm), bucket.tokens - tokens)
+    if success:
+        bucket.rate_factor = min(1.0, bucket.rate_factor + INCREASE_STEP)
+
+
+def _decrease(bucket: Any, now: float, retry_after: float):
+    # 429 응답: 리필 배율 절반 (multiplicative decrease) + Retry-After 동안 새 호출 중단
+    bucket.rate_factor = max(MIN_RATE_FACTOR, bucket.rate_factor * DECREASE_FACTOR)
+    bucket.paused_until = max(bucket.paused_until, now + retry_after)
+
+
+class BucketStore(Protocol):
+    """
+    요청 / 토큰 버킷 저장소
+
+    consume은 버킷에서 요청 1개와 토큰을 차감하고, 부족하면 기다려야 할 시간을 돌려줍니다.
+    """
+
+    rate_factor: float
+
+    async def consume(self, tokens: int) -> float: ...
+
+    async def settle(self, tokens: int, success: bool) -> None: ...
+
+    async def rate_limited(self, retry_after: float) -> None: ...
+
+
+class LocalBucketStore:
+    """프로세스 내 버킷 (워커마다 한도를 따로 가짐 - 워커 수로 나눈 한도를 설정)"""
+
+    def __init__(self, rpm: int, tpm: int):
+        self.rpm = rpm
+        self.tpm = tpm
+        self.state = BucketState(requests=rpm, tokens=tpm, rate_factor=1.0, paused_until=0.0, updated_at=time.time())
+
+    @property
+    def rate_factor(self) -> float:
+        return self.state.rate_factor
+
+    async def consume(self, tokens: int) -> float:
+        return _consume(self.state, time.time(), self.rpm, self.tpm, tokens)
+
+    async def settle(self, tokens: int, success: bool) -> None:
+        _refill(self.state, time.time(), self.rpm, self.tpm)
+        _settle(self.state, self.tpm, tokens, success)
+
+    async def rate_limited(self, retry_after: float) -> None:
+        _decrease(self.state, time.time(), retry_after)
+
+
+class PostgresBucketStore:
+    """
+    Postgres 행 하나를 모든 워커가 공유하는 버킷
+
+    SELECT ... FOR UPDATE로 행을 잠근 트랜잭션 안에서 리필 / 차감하므로
+    워커 수와 관계없이 설정한 한도가 전체 합계로 지켜집니다.
+    DB 오류 시에는 LLM 호출을 막지 않고 통과시킵니다.
+    """
+
+    def __init__(
+        self,
+        rpm: int,
+        tpm: int,
+        name: str = "openai",
+        session_factory: async_sessionmaker[AsyncSession] = SessionLocal,
+    ):
+        self.rpm = rpm
+        self.tpm = tpm
+        self.name = name
+        self.session_factory = session_factory
+        self.rate_factor = 1.0  # 마지막으로 읽은 값
+
+    async def consume(self, tokens: int) -> float:
+        try:
+            async with self.session_factory() as db:
+                bucket = await LLMRateLimitRepository(db).lock(self.name, self.rpm, self.tpm, time.time())
+                wait = _consume(bucket, time.time(), self.rpm, self.tpm, tokens)
+                self.rate_factor = bucket.rate_factor
+                await db.commit()
+                return wait
+        except Exception as e:
+            print(f"⚠️ LLM rate limit bucket unavailable, allowing call: {e}")
+            return 0.0
+
+    async def settle(self, tokens: int, success: bool) -> None:
+        if tokens == 0 and (not success or self.rate_factor >= 1.0):
+            return
+        try:
+            async with self.session_factory() as db:
+                bucket = await LLMRateLimitRepository(db).lock(self.name, self.rpm, self.tpm, time.time())
+                _refill(bucket, time.time(), self.rpm, self.tpm)
+                _settle(bucket, self.tpm, tokens, success)
+                self.rate_factor = bucket.rate_factor
+                await db.commit()
+        except Exception as e:
+            print(f"⚠️ LLM rate limit settle failed: {e}")
+
+    async def rate_limited(self, retry_after: float) -> None:
+        try:
+            async with self.session_factory() as db:
+                bucket = await LLMRateLimitRepository(db).lock(self.name, self.rpm, self.tpm, time.time())
+                _refill(bucket, time.time(), self.rpm, self.tpm)
+                _decrease(bucket, time.time(), retry_after)
+                self.rate_factor = bucket.rate_factor
+                await db.commit()
+        except Exception as e:
+            print(f"⚠️ LLM rate limit backoff failed: {e}")
+
+
+class LLMRateLimiter:
+    """
+    LLM 호출 전 요청 / 토큰 버킷을 기다리는 전역 Rate Limiter
+
+    - 대기 중인 호출은 (우선순위, 도착 순서)의 힙에 쌓이고, 맨 앞 호출만 버킷에서 차감을 시도합니다.
+      따라서 채팅 턴은 먼저 와서 기다리던 업로드 분석 호출보다 앞서 버킷을 받습니다.
+    - 호출 전에는 프롬프트 길이 / 4 + 예상 응답 토큰을 예약하고, 끝나면 실제 사용량으로 정산합니다.
+    - 429 응답은 리필 배율을 절반으로 줄이고 Retry-After 동안 모든 호출을 멈춥니다 (AIMD).
+    """
+
+    def __init__(self, store: BucketStore, completion_tokens: Optional[int] = None):
+        """
+        초기화
+
+        Args:
+            store: 요청 / 토큰 버킷 저장소
+            completion_tokens: 예약 시 가정하는 응답 토큰 수 (기본값: settings.llm_rate_limit_completion_tokens)
+        """
+        self.store = store
+        self.completion_tokens = (
+            settings.llm_rate_limit_completion_tokens if completion_tokens is None else completion_tokens
+        )
+        self._condition = asyncio.Condition()
+        self._waiters: List[Tuple[int, int]] = []
+        self._sequence = itertools.count()
+        LLM_RATE_FACTOR.set(store.rate_factor)
+
+    def estimate_tokens(self, messages: Sequence[BaseMessage]) -> int:
+        """호출 전에 예약할 토큰 수 (문자 수 / 4 + 예상 응답 토큰)"""
+        return estimate_tokens(messages, self.completion_tokens)
+
+    async def acquire(self, messages: Sequence[BaseMessage]) -> int:
+        """
+        버킷에서 요청 1개와 예상 토큰을 받을 때까지 대기
+
+        Args:
+            messages: 전달할 메시지 리스트 (토큰 예약량 계산)
+
+        Returns:
+            int: 예약한 토큰 수 (complete에 그대로 전달)
+        """
+        tokens = self.estimate_tokens(messages)
+        priority = current_priority()
+        entry = (int(priority), next(self._sequence))
+        started = time.perf_counter()
+
+        async with self._condition:
+            heapq.heappush(self._waiters, entry)
+            try:
+                while True:
+                    timeout = None  # 맨 앞이 아니면 앞선 호출이 끝날 때까지 대기
+                    if self._waiters[0] == entry:
+                        wait = await self.store.consume(tokens)
+                        if wait <= 0:
+                            heapq.heappop(self._waiters)
+                            break
+                        timeout = min(wait, MAX_WAIT_SLICE)
+                    try:
+                        await asyncio.wait_for(self._condition.wait(), timeout=timeout)
+                    except asyncio.TimeoutError:
+                        pass
+            except BaseException:
+                self._waiters.remove(entry)
+                heapq.heapify(self._waiters)
+                raise
+            finally:
+                self._condition.notify_all()
+
+        LLM_RATE_LIMIT_WAIT.observe(time.perf_counter() - started, priority=priority.name.lower())
+        return tokens
+
+    async def complete(self, reserved: int, usage: Optional[dict]):
+        """
+        성공한 호출의 실제 토큰 사용량으로 예약량 정산
+
+        Args:
+            reserved: acquire가 돌려준 예약 토큰 수
+            usage: LangChain usage_metadata (없으면 예약량 그대로 유지)
+        """
+        actual = (usage or {}).get("total_tokens")
+        await self.store.settle(actual - reserved if isinstance(actual, int) else 0, success=True)
+        LLM_RATE_FACTOR.set(self.store.rate_factor)
+
+    async def rate_limited(self, retry_after: float):
+        """
+        429 응답 반영 (리필 배율 감소 + Retry-After 동안 중단)
+
+        Args:
+            retry_after: 응답 헤더의 재시도 대기 시간 (초)
+        """
+        LLM_RATE_LIMITED.inc(scope=current_scope())
+        await self.store.rate_limited(retry_after)
+        LLM_RATE_FACTOR.set(self.store.rate_factor)
+        print(f"⚠️ LLM rate limited (429) - rate factor {self.store.rate_factor:.2f}, retry after {retry_after:.1f}s")
+
+
+def create_rate_limiter() -> Optional[LLMRateLimiter]:
+    """
+    설정에 따라 Rate Limiter 생성 (비활성화면 None)
+
+    Returns:
+        LLMRateLimiter or None
+    """
+    if not settings.llm_rate_limit_enabled:
+        return None
+    store: BucketStore
+    if settings.llm_rate_limit_backend == "postgres":
+        store = PostgresBucketStore(settings.llm_rate_limit_rpm, settings.llm_rate_limit_tpm)
+    else:
+        store = LocalBucketStore(settings.llm_rate_limit_rpm, settings.llm_rate_limit_tpm)
+    return LLMRateLimiter(store)
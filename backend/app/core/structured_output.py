@@ -0,0 +1,365 @@
+"""
+Structured Output - LLM JSON 응답 파싱 (일괄 / 스트리밍)
+"""
+import json
+from typing import Annotated, Any, Callable, Dict, Generic, List, Optional, Sequence, Type, TypeVar, get_args
+
+from langchain_core.messages import BaseMessage
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from app.core.config import settings
+from app.services.llm_cache import CachePolicy
+
+T = TypeVar("T", bound=BaseModel)
+
+# 스트리밍 이벤트 콜백: {"type": "field" | "item", "field": str, "index"?: int, "value": Any}
+StructuredEventCallback = Callable[[dict], None]
+
+_FENCE = "```json"
+
+
+class MalformedOutputError(ValueError):
+    """LLM 출력이 기대한 JSON 구조가 아닐 때 발생"""
+
+
+def strip_json_fences(content: str) -> str:
+    """
+    마크다운 코드블록(```json ... ```) 제거
+
+    Args:
+        content: LLM 응답 문자열
+
+    Returns:
+        str: JSON 본문
+    """
+    content = content.strip()
+    if content.startswith("```"):
+        content = content.split("```")[1]
+        if content.startswith("json"):
+            content = content[4:]
+    return content.strip()
+
+
+def parse_structured_output(content: Any, schema: Type[T]) -> T:
+    """
+    LLM 응답 전체를 Pydantic 객체로 변환
+
+    Args:
+        content: LLM 응답 content
+        schema: 변환할 Pydantic 모델
+
+    Returns:
+        T: 검증된 Pydantic 객체
+    """
+    # 타입 체크: 문자열이 아니면 에러
+    if not isinstance(content, str):
+        raise ValueError(f"LLM 응답이 문자열이 아닙니다: {type(content)}")
+
+    return schema.model_validate_json(strip_json_fences(content))
+
+
+class StreamingJsonParser(Generic[T]):
+    """
+    토큰 단위로 들어오는 JSON 객체를 점진적으로 파싱하는 파서
+
+    - 최상위 필드 값이 닫히는 즉시 해당 필드를 스키마로 검증해 "field" 이벤트를 만듭니다.
+    - 최상위 배열 필드는 원소가 닫힐 때마다 "item" 이벤트를 만듭니다.
+    - 문법이 깨지거나 검증에 실패하면 나머지 생성을 기다리지 않고 즉시 MalformedOutputError를 던집니다.
+
+    각 문자는 한 번만 스캔하고, 완성된 값의 구간만 json.loads 하므로 전체 비용은 O(n)입니다.
+    """
+
+    def __init__(self, schema: Type[T]):
+        """
+        초기화
+
+        Args:
+            schema: 최종 결과 Pydantic 모델
+        """
+        self.schema = schema
+        self.fields: Dict[str, Any] = {}
+
+        self._text = ""
+        self._pos = 0
+        self._stack: List[str] = []
+        self._prefix = ""
+        self._started = False
+        self._finished = False
+
+        self._in_string = False
+        self._escape = False
+
+        self._expect_key = False
+        self._key_start: Optional[int] = None
+        self._current_key: Optional[str] = None
+        self._awaiting_value = False
+        self._value_start: Optional[int] = None
+
+        self._awaiting_item = False
+        self._item_start: Optional[int] = None
+        self._item_index = 0
+
+        self._adapters: Dict[str, TypeAdapter] = {}
+        self._item_adapters: Dict[str, Optional[TypeAdapter]] = {}
+
+    @property
+    def finished(self) -> bool:
+        return self._finished
+
+    def feed(self, chunk: str) -> List[dict]:
+        """
+        새로 도착한 텍스트 조각 처리
+
+        Args:
+            chunk: 스트리밍으로 받은 텍스트 조각
+
+        Returns:
+            List[dict]: 이번 조각으로 완성된 필드/원소 이벤트
+        """
+        self._text += chunk
+        events: List[dict] = []
+        text = self._text
+
+        for i in range(self._pos, len(text)):
+            ch = text[i]
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                    if self._key_start is not None:
+                        self._current_key = json.loads(text[self._key_start:i + 1])
+                        self._key_start = None
+                continue
+
+            if ch.isspace():
+                continue
+
+            if not self._started:
+                self._consume_prefix(ch)
+                continue
+
+            if self._finished:
+                # 닫힌 뒤에는 코드블록 종료(```)만 허용
+                if ch != "`":
+                    raise MalformedOutputError(f"JSON 객체 뒤에 예상치 못한 문자가 있습니다: {text[i:i + 20]!r}")
+                continue
+
+            depth = len(self._stack)
+
+            # 값/원소 시작 위치 기록
+            if depth == 1 and self._awaiting_value:
+                self._value_start = i
+                self._awaiting_value = False
+            if depth == 2 and self._stack[-1] == "[" and self._awaiting_item and ch != "]":
+                self._item_start = i
+                self._awaiting_item = False
+
+            if ch == '"':
+                self._in_string = True
+                if depth == 1 and self._expect_key:
+                    self._key_start = i
+                    self._expect_key = False
+            elif ch in "{[":
+                self._stack.append(ch)
+                if len(self._stack) == 2 and ch == "[" and self._value_start == i:
+                    self._awaiting_item = True
+                    self._item_index = 0
+            elif ch in "}]":
+                if not self._stack or (self._stack[-1] == "{") != (ch == "}"):
+                    raise MalformedOutputError(f"괄호 짝이 맞지 않습니다 (위치 {i})")
+                if depth == 2 and ch == "]" and self._item_start is not None:
+                    events.append(self._complete_item(text[self._item_start:i]))
+                    self._item_start = None
+                self._stack.pop()
+                if not self._stack:
+                    if self._value_start is not None:
+                        events.append(self._complete_field(text[self._value_start:i]))
+                    self._finished = True
+            elif ch == ",":
+                if depth == 1:
+                    if self._value_start is None:
+                        raise MalformedOutputError(f"값이 없는 필드입니다 (위치 {i})")
+                    events.append(self._complete_field(text[self._value_start:i]))
+                    self._value_start = None
+                    self._expect_key = True
+                elif depth == 2 and self._stack[-1] == "[":
+                    if self._item_start is None:
+                        raise MalformedOutputError(f"비어 있는 배열 원소입니다 (위치 {i})")
+                    events.append(self._complete_item(text[self._item_start:i]))
+                    self._item_start = None
+                    self._awaiting_item = True
+            elif ch == ":":
+                if depth == 1:
+                    if self._current_key is None or self._value_start is not None:
+                        raise MalformedOutputError(f"키 없이 ':'가 나왔습니다 (위치 {i})")
+                    self._awaiting_value = True
+            elif depth == 1 and (self._expect_key or self._current_key is None):
+                raise MalformedOutputError(f"객체 키는 문자열이어야 합니다 (위치 {i})")
+
+        self._pos = len(text)
+        return events
+
+    def finish(self) -> T:
+        """
+        스트림 종료 후 최종 검증
+
+        Returns:
+            T: 검증된 Pydantic 객체
+        """
+        if not self._finished:
+            raise MalformedOutputError("JSON 객체가 닫히기 전에 응답이 끝났습니다.")
+
+        try:
+            return self.schema.model_validate(self.fields)
+        except ValidationError as e:
+            raise MalformedOutputError(f"스키마 검증 실패: {e}") from e
+
+    def _consume_prefix(self, ch: str):
+        if ch == "{":
+            self._started = True
+            self._stack.append("{")
+            self._expect_key = True
+            return
+
+        # 객체 시작 전에는 ```json 코드블록 시작만 허용
+        self._prefix += ch
+        if not _FENCE.startswith(self._prefix):
+            raise MalformedOutputError(f"JSON 객체로 시작하지 않습니다: {self._prefix[:20]!r}")
+
+    def _complete_field(self, raw: str) -> dict:
+        key = self._current_key
+        assert key is not None
+        value = self._loads(raw)
+
+        adapter = self._field_adapter(key)
+        if adapter is not None:
+            try:
+                adapter.validate_python(value)
+            except ValidationError as e:
+                raise MalformedOutputError(f"'{key}' 필드 검증 실패: {e}") from e
+
+        self.fields[key] = value
+        self._current_key = None
+        return {"type": "field", "field": key, "value": value}
+
+    def _complete_item(self, raw: str) -> dict:
+        key = self._current_key
+        assert key is not None
+        value = self._loads(raw)
+
+        adapter = self._item_adapter(key)
+        if adapter is not None:
+            try:
+                adapter.validate_python(value)
+            except ValidationError as e:
+                raise MalformedOutputError(f"'{key}[{self._item_index}]' 원소 검증 실패: {e}") from e
+
+        event = {"type": "item", "field": key, "index": self._item_index, "value": value}
+        self._item_index += 1
+        return event
+
+    @staticmethod
+    def _loads(raw: str) -> Any:
+        try:
+            return json.loads(raw)
+        except json.JSONDecodeError as e:
+            raise MalformedOutputError(f"잘못된 JSON 값입니다: {raw[:40]!r}") from e
+
+    def _field_adapter(self, key: str) -> Optional[TypeAdapter]:
+        field = self.schema.model_fields.get(key)
+        if field is None:
+            return None
+        if key not in self._adapters:
+            annotation = Annotated[(field.annotation, *field.metadata)] if field.metadata else field.annotation
+            self._adapters[key] = TypeAdapter(annotation)
+        return self._adapters[key]
+
+    def _item_adapter(self, key: str) -> Optional[TypeAdapter]:
+        if key not in self._item_adapters:
+            field = self.schema.model_fields.get(key)
+            args = get_args(field.annotation) if field is not None else ()
+            self._item_adapters[key] = TypeAdapter(args[0]) if len(args) == 1 else None
+        return self._item_adapters[key]
+
+
+async def astream_structured(
+    llm,
+    messages: Sequence[BaseMessage],
+    schema: Type[T],
+    temperature: float = 0.3,
+    on_event: Optional[StructuredEventCallback] = None,
+    cache: CachePolicy = CachePolicy.NEVER,
+    prompt_version: Optional[str] = None,
+) -> T:
+    """
+    네이티브 structured output으로 스트리밍 호출하며 JSON을 점진적으로 파싱
+
+    Args:
+        llm: ChatModelPool
+        messages: 전달할 메시지 리스트
+        schema: 응답 Pydantic 모델 (response_format으로 전달)
+        temperature: 샘플링 온도
+        on_event: 필드/원소가 완성될 때마다 호출되는 콜백
+        cache: 응답 캐시 정책
+        prompt_version: 프롬프트 이름@버전 (캐시 키)
+
+    Returns:
+        T: 검증된 Pydantic 객체
+    """
+    parser = StreamingJsonParser(schema)
+
+    async for delta in llm.astream(
+        messages, temperature=temperature, response_format=schema,
+        cache=cache, prompt_version=prompt_version, validate=lambda content: parse_structured_output(content, schema)
+    ):
+        for event in parser.feed(delta):
+            if on_event is not None:
+                on_event(event)
+
+    return parser.finish()
+
+
+async def agenerate_structured(
+    llm,
+    messages: Sequence[BaseMessage],
+    schema: Type[T],
+    temperature: float = 0.3,
+    on_event: Optional[StructuredEventCallback] = None,
+    stream: Optional[bool] = None,
+    cache: CachePolicy = CachePolicy.NEVER,
+    prompt_version: Optional[str] = None,
+) -> T:
+    """
+    LLM 호출 후 Pydantic 객체로 변환 (스트리밍 / 일괄 모드 선택)
+
+    Args:
+        llm: ChatModelPool
+        messages: 전달할 메시지 리스트
+        schema: 응답 Pydantic 모델
+        temperature: 샘플링 온도
+        on_event: 스트리밍 모드에서 필드/원소가 완성될 때마다 호출되는 콜백
+        stream: 스트리밍 여부 (기본값: settings.llm_structured_streaming)
+        cache: 응답 캐시 정책 (ChatModelPool에 response_cache가 있을 때)
+        prompt_version: 프롬프트 이름@버전 (캐시 키)
+
+    Returns:
+        T: 검증된 Pydantic 객체
+    """
+    if stream is None:
+        stream = settings.llm_structured_streaming
+
+    if stream:
+        return await astream_structured(
+            llm, messages, schema, temperature=temperature, on_event=on_event,
+            cache=cache, prompt_version=prompt_version
+        )
+
+    response = await llm.ainvoke(
+        messages, temperature=temperature,
+        cache=cache, prompt_version=prompt_version, validate=lambda content: parse_structured_output(content, schema)
+    )
+    return parse_structured_output(response.content, schema)
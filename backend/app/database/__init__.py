@@ -1,7 +1,10 @@
 """
 Database package
 """
-from app.database.config import engine, SessionLocal, get_db, init_db
-from app.database.models import Base, Resume
+from app.database.config import engine, SessionLocal, get_db, init_db, close_db
+from app.database.models import Base, Resume, ResumeVersion, ExtractionCacheEntry, UploadJob, UploadJobFile
 
-__all__ = ["engine", "SessionLocal", "get_db", "init_db", "Base", "Resume"]
+__all__ = [
+    "engine", "SessionLocal", "get_db", "init_db", "close_db",
+    "Base", "Resume", "ResumeVersion", "ExtractionCacheEntry", "UploadJob", "UploadJobFile",
+]
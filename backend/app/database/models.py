@@ -2,27 +2,236 @@
 SQLAlchemy Database Models
 """
 
-from sqlalchemy import JSON, DateTime, String
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy import JSON, DateTime, Float, ForeignKey, Index, Integer, LargeBinary, String, Text, UniqueConstraint
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql.base import ischema_names
+from sqlalchemy.orm import DeclarativeBase, relationship
 from sqlalchemy.orm import Mapped
 from sqlalchemy.orm import mapped_column
 from sqlalchemy.sql import func
+from sqlalchemy.types import UserDefinedType
 from datetime import datetime
 
+from app.core.config import settings
+
 class Base(DeclarativeBase):
     pass
 
 
+# Postgres에서는 JSONB (GIN 인덱스 + @> 포함 검색), 그 외(SQLite 테스트)는 JSON. None은 SQL NULL로 저장
+JSONDocument = JSON(none_as_null=True).with_variant(JSONB(none_as_null=True), "postgresql")
+
+
+class Vector(UserDefinedType):
+    """pgvector vector(n) 컬럼 (드라이버와는 '[0.1,0.2,...]' 텍스트로 주고받음)"""
+
+    cache_ok = True
+
+    def __init__(self, dimensions: int):
+        self.dimensions = dimensions
+
+    def get_col_spec(self, **kw):
+        return f"VECTOR({self.dimensions})"
+
+    def bind_processor(self, dialect):
+        def process(value):
+            if value is None:
+                return None
+            return "[" + ",".join(repr(float(x)) for x in value) + "]"
+        return process
+
+    def result_processor(self, dialect, coltype):
+        def process(value):
+            if value is None or not isinstance(value, str):
+                return value
+            body = value.strip("[]")
+            return [float(x) for x in body.split(",")] if body else []
+        return process
+
+
+# 테이블 조회(inspect) 시 vector 컬럼 타입 인식
+ischema_names["vector"] = Vector
+
+# Postgres에서는 pgvector (HNSW 인덱스 + <=> 코사인 거리 검색), 그 외(SQLite 테스트)는 float 리스트 JSON
+EmbeddingVector = JSON().with_variant(Vector(settings.embedding_dimensions), "postgresql")
+
+
 class Resume(Base):
     __tablename__ = "resumes"
+    # INSERT/UPDATE의 RETURNING으로 created_at/updated_at을 받아 commit 후 refresh 조회가 필요 없음
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True, autoincrement=True)
-    user_id: Mapped[str | None] = mapped_column(String, index=True, nullable=True, comment="사용자 ID (추후 인증 구현 시 사용)")
-    data: Mapped[dict] = mapped_column(JSON, nullable=False, comment="ResumeExtraction Pydantic 모델의 JSON")
-    analysis: Mapped[dict | None] = mapped_column(JSON,ensure_ascii=False ,nullable=True, comment="ResumeAnalysis Pydantic 모델의 JSON")
+    user_id: Mapped[str | None] = mapped_column(String, nullable=True, comment="사용자 ID (추후 인증 구현 시 사용)")
+    data: Mapped[dict] = mapped_column(JSONDocument, nullable=False, comment="ResumeExtraction Pydantic 모델의 JSON")
+    analysis: Mapped[dict | None] = mapped_column(JSONDocument, nullable=True, comment="ResumeAnalysis Pydantic 모델의 JSON")
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
 
 
     def __repr__(self):
         return f"<Resume(id={self.id}, user_id={self.user_id}, created_at={self.created_at})>"
+
+
+# 사용자별 최신 이력서 조회 (user_id 조건 + 최신순 정렬을 인덱스 한 번 탐색으로 처리, user_id 단독 조회도 겸함)
+Index("ix_resumes_user_id_created_at", Resume.user_id, Resume.created_at.desc(), Resume.id.desc())
+
+# 기술/카테고리/기술 스택 포함 검색 (data @> '{"skills": [{"name": "Kafka"}]}' 형태의 조건)
+Index(
+    "ix_resumes_data_gin", Resume.data, postgresql_using="gin", postgresql_ops={"data": "jsonb_path_ops"}
+).ddl_if(dialect="postgresql")
+Index(
+    "ix_resumes_analysis_gin", Resume.analysis, postgresql_using="gin", postgresql_ops={"analysis": "jsonb_path_ops"}
+).ddl_if(dialect="postgresql")
+
+
+class ResumeVersion(Base):
+    """
+    이력서 변경 이력 (append-only)
+
+    버전마다 직전 버전 대비 RFC 6902 JSON Patch를 저장하고, N 버전마다 전체 스냅샷을 함께 저장합니다.
+    현재 버전은 Resume.data에 그대로 유지되므로 일반 조회는 이 테이블을 읽지 않습니다.
+    """
+    __tablename__ = "resume_versions"
+    __table_args__ = (UniqueConstraint("resume_id", "version", name="uq_resume_versions_resume_id_version"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    resume_id: Mapped[int] = mapped_column(ForeignKey("resumes.id", ondelete="CASCADE"), nullable=False)
+    version: Mapped[int] = mapped_column(Integer, nullable=False, comment="1부터 증가")
+    patch: Mapped[list | None] = mapped_column(JSONDocument, nullable=True, comment="직전 버전 → 이 버전 RFC 6902 patch (버전 1은 없음)")
+    snapshot: Mapped[dict | None] = mapped_column(JSONDocument, nullable=True, comment="이 버전의 전체 데이터 (N 버전마다)")
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    def __repr__(self):
+        return f"<ResumeVersion(resume_id={self.resume_id}, version={self.version}, snapshot={self.snapshot is not None})>"
+
+
+class ExtractionCacheEntry(Base):
+    """
+    이력서 추출 결과 캐시 (정규화된 PDF 텍스트 + 프롬프트 버전 + 모델명 해시 기준)
+    """
+    __tablename__ = "extraction_cache"
+
+    key: Mapped[str] = mapped_column(String(64), primary_key=True, comment="sha256(정규화 텍스트 | 프롬프트 버전 | 모델명)")
+    model_name: Mapped[str] = mapped_column(String, nullable=False)
+    prompt_version: Mapped[str] = mapped_column(String, nullable=False)
+    data: Mapped[dict] = mapped_column(JSON, nullable=False, comment="검증된 ResumeExtraction JSON")
+    hit_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    last_accessed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), index=True, nullable=False)
+
+    def __repr__(self):
+        return f"<ExtractionCacheEntry(key={self.key[:12]}, model={self.model_name}, hits={self.hit_count})>"
+
+
+class ResumeEmbedding(Base):
+    """
+    이력서 항목(프로젝트 / 기술 / 경력)별 임베딩 (JD 매칭용)
+
+    content_hash(모델명 + 임베딩한 텍스트)가 그대로인 항목은 이력서가 수정되어도 다시 임베딩하지 않습니다.
+    """
+    __tablename__ = "resume_embeddings"
+    __table_args__ = (UniqueConstraint("resume_id", "kind", "item_key", name="uq_resume_embeddings_item"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    resume_id: Mapped[int] = mapped_column(ForeignKey("resumes.id", ondelete="CASCADE"), nullable=False)
+    user_id: Mapped[str | None] = mapped_column(String, nullable=True, index=True)
+    kind: Mapped[str] = mapped_column(String, nullable=False, comment="project | skill | career")
+    item_key: Mapped[str] = mapped_column(String, nullable=False, comment="프로젝트 ID / 기술명 / career_<순번>")
+    content: Mapped[str] = mapped_column(Text, nullable=False, comment="임베딩한 텍스트")
+    content_hash: Mapped[str] = mapped_column(String(64), nullable=False, comment="sha256(모델명 | 텍스트)")
+    embedding: Mapped[list] = mapped_column(EmbeddingVector, nullable=False, comment="L2 정규화된 임베딩")
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    def __repr__(self):
+        return f"<ResumeEmbedding(resume_id={self.resume_id}, kind={self.kind}, key={self.item_key})>"
+
+
+# 전체 사용자 대상 근사 최근접 검색 (ORDER BY embedding <=> :query LIMIT k)
+Index(
+    "ix_resume_embeddings_embedding_hnsw", ResumeEmbedding.embedding,
+    postgresql_using="hnsw", postgresql_ops={"embedding": "vector_cosine_ops"},
+).ddl_if(dialect="postgresql")
+
+
+class LLMResponseCacheEntry(Base):
+    """
+    LLM 응답 캐시 (모델명 + temperature + 프롬프트 버전 + 렌더링된 프롬프트 해시 기준)
+    """
+    __tablename__ = "llm_response_cache"
+
+    key: Mapped[str] = mapped_column(String(64), primary_key=True, comment="sha256(모델명 | temperature | 프롬프트 버전 | 응답 형식 | 메시지)")
+    model_name: Mapped[str] = mapped_column(String, nullable=False)
+    temperature: Mapped[float] = mapped_column(Float, nullable=False)
+    prompt_version: Mapped[str] = mapped_column(String, nullable=False, comment="호출 지점의 프롬프트 이름@버전")
+    content: Mapped[str] = mapped_column(Text, nullable=False, comment="LLM 응답 텍스트")
+    hit_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    last_accessed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), index=True, nullable=False)
+
+    def __repr__(self):
+        return f"<LLMResponseCacheEntry(key={self.key[:12]}, prompt={self.prompt_version}, hits={self.hit_count})>"
+
+
+class LLMRateLimitBucket(Base):
+    """
+    워커 프로세스가 함께 쓰는 LLM 요청 / 토큰 버킷 (llm_rate_limit_backend=postgres)
+
+    시각은 모든 워커가 같은 기준으로 리필을 계산하도록 epoch 초로 저장합니다.
+    """
+    __tablename__ = "llm_rate_limit_buckets"
+
+    name: Mapped[str] = mapped_column(String, primary_key=True, comment="버킷 이름 (API 키 / 조직 단위)")
+    requests: Mapped[float] = mapped_column(Float, nullable=False, comment="남은 요청 수")
+    tokens: Mapped[float] = mapped_column(Float, nullable=False, comment="남은 토큰 수 (실제 사용량 정산으로 음수 가능)")
+    rate_factor: Mapped[float] = mapped_column(Float, nullable=False, default=1.0, comment="AIMD 리필 배율 (429마다 절반, 성공마다 조금씩 회복)")
+    paused_until: Mapped[float] = mapped_column(Float, nullable=False, default=0.0, comment="429 Retry-After가 끝나는 시각 (epoch 초)")
+    updated_at: Mapped[float] = mapped_column(Float, nullable=False, comment="마지막 리필 시각 (epoch 초)")
+
+    def __repr__(self):
+        return f"<LLMRateLimitBucket(name={self.name}, requests={self.requests:.1f}, tokens={self.tokens:.0f}, factor={self.rate_factor:.2f})>"
+
+
+class UploadJob(Base):
+    """
+    이력서 업로드 백그라운드 작업 (extract → save → analyze)
+
+    단계별 중간 결과를 저장해 워커가 재시작되어도 마지막으로 끝난 단계 다음부터 이어서 처리합니다.
+    """
+    __tablename__ = "upload_jobs"
+
+    id: Mapped[str] = mapped_column(String, primary_key=True, comment="작업 ID (job-<uuid>)")
+    user_id: Mapped[str | None] = mapped_column(String, index=True, nullable=True)
+    session_id: Mapped[str] = mapped_column(String, nullable=False)
+    status: Mapped[str] = mapped_column(String, index=True, nullable=False, default="queued", comment="queued|running|succeeded|failed")
+    stage: Mapped[str] = mapped_column(String, nullable=False, default="queued", comment="queued|extract|save|analyze|done")
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    extraction: Mapped[dict | None] = mapped_column(JSON, nullable=True, comment="extract 단계 결과 (ResumeExtraction JSON)")
+    resume_id: Mapped[int | None] = mapped_column(ForeignKey("resumes.id", ondelete="SET NULL"), nullable=True, comment="save 단계 결과")
+    result: Mapped[dict | None] = mapped_column(JSON, nullable=True, comment="analyze 단계 결과 요약")
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    locked_until: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True, comment="실행 중인 워커의 lease 만료 시각")
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    files: Mapped[list["UploadJobFile"]] = relationship(
+        back_populates="job", cascade="all, delete-orphan", order_by="UploadJobFile.position"
+    )
+
+    def __repr__(self):
+        return f"<UploadJob(id={self.id}, status={self.status}, stage={self.stage})>"
+
+
+class UploadJobFile(Base):
+    """
+    업로드 작업의 원본 PDF (재시작 시 extract 단계를 다시 수행하기 위해 보관)
+    """
+    __tablename__ = "upload_job_files"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    job_id: Mapped[str] = mapped_column(ForeignKey("upload_jobs.id", ondelete="CASCADE"), index=True, nullable=False)
+    position: Mapped[int] = mapped_column(Integer, nullable=False)
+    filename: Mapped[str | None] = mapped_column(String, nullable=True)
+    content: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+
+    job: Mapped[UploadJob] = relationship(back_populates="files")
@@ -1,10 +1,21 @@
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from dotenv import load_dotenv
 from app.api.routes import upload, chat, knowledge, generate
 from app.core.config import setup_langsmith
-from app.database.config import init_db
+from app.core.llm import init_llm_pool, close_llm_pool, get_llm_pool
+from app.core.metrics import MetricsMiddleware, db_metrics, render_metrics
+from app.agents import init_resume_coach_graph, close_resume_coach_graph
+from app.services.pdf_extractor import init_pdf_extractor, close_pdf_extractor
+from app.services.embeddings import init_embedder
+from app.services.upload_jobs import init_upload_job_queue, close_upload_job_queue
+from app.database.config import init_db, close_db
+from app.services.extraction_cache import extraction_cache_stats
+from app.services.llm_cache import llm_cache_stats
+from app.services.resume_matcher import resume_index_cache
+from app.services.resume_cache import init_resume_cache, close_resume_cache, resume_cache_stats
 
 # 환경 변수 로드
 load_dotenv()
@@ -16,10 +27,28 @@ setup_langsmith()
 async def lifespan(app: FastAPI):
     # 🚀 앱 시작 시
     print("🚀 Initializing database...")
-    init_db()
+    await init_db()
+    print("🚀 Initializing resume cache...")
+    await init_resume_cache()
+    print("🚀 Initializing LLM client pool...")
+    init_llm_pool()
+    print("🚀 Initializing PDF extraction pool...")
+    init_pdf_extractor()
+    print("🚀 Loading embedding model...")
+    init_embedder()
+    print("🚀 Compiling resume coach graph...")
+    await init_resume_coach_graph()
+    print("🚀 Starting upload job workers...")
+    await init_upload_job_queue().start()
     yield
     # 🧹 앱 종료 시 (optional)
     print("🧹 Shutting down...")
+    await close_upload_job_queue()
+    await close_resume_coach_graph()
+    await close_llm_pool()
+    close_pdf_extractor()
+    await close_resume_cache()
+    await close_db()
 
 
 app = FastAPI(
@@ -39,6 +68,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 요청별 지연 / 상태 코드 / DB 쿼리 수 / 시간 / 행 수 계측
+app.add_middleware(MetricsMiddleware)
+
 # 라우터 등록
 app.include_router(upload.router, prefix="/api/upload", tags=["upload"])
 app.include_router(chat.router, prefix="/api/chat", tags=["chat"])
@@ -52,3 +84,29 @@ async def root():
 @app.get("/health")
 async def health_check():
     return {"status": "healthy"}
+
+@app.get("/stats/cache")
+async def cache_stats():
+    """프로세스 단위 캐시 적중률 / 채팅 턴당 DB 쿼리 수"""
+    return {
+        "resume_cache": resume_cache_stats.snapshot(),
+        "extraction_cache": extraction_cache_stats.snapshot(),
+        "llm_cache": llm_cache_stats.snapshot(),
+        "resume_index_cache": resume_index_cache.snapshot(),
+    }
+
+@app.get("/stats/db")
+async def db_stats():
+    """라우트 / 그래프 노드별 DB 쿼리 수, DB 시간, 반환 행 수, 같은 SQL 반복(N+1 의심) 호출 수"""
+    return db_metrics.snapshot()
+
+@app.get("/stats/llm")
+async def llm_stats():
+    """사용자별 실행 중 / 대기 중 LLM 호출 수와 할당량 기간 토큰 사용량 (워커 단위)"""
+    scheduler = get_llm_pool().scheduler
+    return scheduler.snapshot() if scheduler is not None else {"enabled": False}
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """라우트 / 그래프 노드 / 서비스 단계별 지연 히스토그램, LLM 토큰, 오류, DB 지표 (Prometheus 텍스트 형식)"""
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4; charset=utf-8")
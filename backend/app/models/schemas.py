@@ -1,4 +1,5 @@
 from pydantic import BaseModel, Field
+from pydantic.json_schema import SkipJsonSchema
 from typing import List, Optional
 from enum import Enum
 
@@ -81,6 +82,21 @@ class ResumeExtraction(BaseModel):
     education: List[Education] = Field(default_factory=list, description="학력 사항")
 
 
+# ========================================
+# 이력서 부분 업데이트 스키마
+# ========================================
+
+class ResumePatch(BaseModel):
+    """대화 답변으로 생성한 이력서 부분 업데이트 (바뀐 부분만 채움)"""
+    situation: Optional[str] = Field(default=None, description="새로 알게 된 문제 상황 (없으면 null)")
+    task: Optional[str] = Field(default=None, description="새로 알게 된 해결 과제 (없으면 null)")
+    role: Optional[str] = Field(default=None, description="새로 알게 된 역할 (없으면 null)")
+    add_actions: List[str] = Field(default_factory=list, description="추가할 행동")
+    add_results: List[str] = Field(default_factory=list, description="추가할 성과")
+    add_tech_stack: List[str] = Field(default_factory=list, description="프로젝트에 추가할 기술")
+    add_skills: List[Skill] = Field(default_factory=list, description="기술 스택 목록에 추가할 기술")
+
+
 # ========================================
 # 이력서 분석 결과 스키마
 # ========================================
@@ -91,6 +107,11 @@ class ImprovementQuestion(BaseModel):
     project_id: Optional[str] = Field(default=None, description="관련 프로젝트 ID (프로젝트 관련 질문인 경우)")
     question: str = Field(description="구체적인 질문 내용")
     purpose: str = Field(description="이 질문의 목적 (왜 필요한지)")
+    # 분석 응답 스키마(response_format)에는 넣지 않고, 분석 직후 별도 일괄 호출로 채움
+    phrasing: SkipJsonSchema[Optional[str]] = Field(
+        default=None,
+        description="채팅에서 그대로 보낼 대화형 질문 문구 (없으면 채팅 턴에서 생성)"
+    )
 
 
 class ResumeAnalysis(BaseModel):
@@ -99,3 +120,69 @@ class ResumeAnalysis(BaseModel):
     missing_areas: List[str] = Field(description="부족한 영역 목록 (예: STAR 기법 미흡, 정량적 성과 부족 등)")
     improvement_questions: List[ImprovementQuestion] = Field(description="보완을 위한 질문 리스트")
     completeness_score: float = Field(ge=0.0, le=1.0, description="전체 완성도 점수 (0.0 ~ 1.0)")
+
+
+class QuestionPhrasing(BaseModel):
+    """개선 질문 하나의 대화형 문구"""
+    index: int = Field(description="improvement_questions에서의 질문 위치 (0부터)")
+    message: str = Field(description="사용자에게 보낼 자연스러운 질문 메시지")
+
+
+class QuestionPhrasings(BaseModel):
+    """개선 질문 대화형 문구 일괄 생성 결과"""
+    phrasings: List[QuestionPhrasing] = Field(description="질문별 대화형 문구 리스트")
+
+
+# ========================================
+# JD 매칭 스키마
+# ========================================
+
+class ItemMatch(BaseModel):
+    """JD와 이력서 항목(프로젝트 / 기술 / 경력)의 유사도"""
+    kind: str = Field(description="항목 종류 (project | skill | career)")
+    key: str = Field(description="프로젝트 ID / 기술명 / career_<순번>")
+    label: str = Field(description="표시 이름")
+    score: float = Field(description="코사인 유사도 (-1.0 ~ 1.0)")
+
+
+class JDMatch(BaseModel):
+    """JD 하나에 대한 항목 종류별 상위 매칭 결과"""
+    fit_score: float = Field(default=0.0, description="JD 적합도 (종류별 상위 항목 평균 유사도의 가중 평균)")
+    projects: List[ItemMatch] = Field(default_factory=list, description="관련도 순 프로젝트")
+    skills: List[ItemMatch] = Field(default_factory=list, description="관련도 순 기술")
+    careers: List[ItemMatch] = Field(default_factory=list, description="관련도 순 경력")
+
+
+class GeneratedResume(BaseModel):
+    """JD 맞춤 이력서 생성 결과"""
+    resume_id: int = Field(description="원본 이력서 ID")
+    markdown: str = Field(description="생성된 이력서 (마크다운)")
+    matches: JDMatch = Field(description="생성 프롬프트에 넣은 항목과 JD 유사도")
+
+
+class JDPosting(BaseModel):
+    """배치 적합도 비교에 넣을 채용 공고"""
+    title: Optional[str] = Field(default=None, description="공고 제목 (예: 회사 / 포지션)")
+    jd_text: str = Field(description="채용 공고 텍스트")
+
+    def display_title(self) -> str:
+        if self.title and self.title.strip():
+            return self.title.strip()
+        first_line = next((line.strip() for line in self.jd_text.splitlines() if line.strip()), "")
+        return first_line[:80]
+
+
+class JDFit(BaseModel):
+    """배치 JD 적합도 리포트의 JD 하나"""
+    index: int = Field(description="요청의 JD 순번")
+    title: str = Field(description="JD 제목 (없으면 본문 첫 줄)")
+    rank: int = Field(description="적합도 순위 (1부터)")
+    matches: JDMatch = Field(description="항목 매칭 결과와 적합도")
+    markdown: Optional[str] = Field(default=None, description="생성된 이력서 (상위 M개만)")
+    error: Optional[str] = Field(default=None, description="생성 실패 사유")
+
+
+class BatchFitReport(BaseModel):
+    """이력서 하나와 JD 여러 개의 적합도 순위 + 상위 JD 맞춤 이력서"""
+    resume_id: int = Field(description="원본 이력서 ID")
+    fits: List[JDFit] = Field(description="적합도 순 JD 리스트")
@@ -2,5 +2,19 @@
 Repositories package
 """
 from app.repositories.resume_repository import ResumeRepository
+from app.repositories.resume_version_repository import ResumeVersionRepository
+from app.repositories.extraction_cache_repository import ExtractionCacheRepository
+from app.repositories.llm_response_cache_repository import LLMResponseCacheRepository
+from app.repositories.upload_job_repository import UploadJobRepository
+from app.repositories.llm_rate_limit_repository import LLMRateLimitRepository
+from app.repositories.resume_embedding_repository import ResumeEmbeddingRepository
 
-__all__ = ["ResumeRepository"]
+__all__ = [
+    "ResumeRepository",
+    "ResumeVersionRepository",
+    "ExtractionCacheRepository",
+    "LLMResponseCacheRepository",
+    "UploadJobRepository",
+    "LLMRateLimitRepository",
+    "ResumeEmbeddingRepository",
+]
@@ -0,0 +1,118 @@
+"""
+Extraction Cache Repository - 추출 결과 캐시 저장 로직
+"""
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.models import ExtractionCacheEntry
+
+
+class ExtractionCacheRepository:
+    """추출 결과 캐시 저장/조회 Repository"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get(self, key: str) -> Optional[ExtractionCacheEntry]:
+        """
+        캐시 키로 엔트리 조회
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            ExtractionCacheEntry or None
+        """
+        return await self.db.get(ExtractionCacheEntry, key)
+
+    async def touch(self, entry: ExtractionCacheEntry) -> None:
+        """
+        조회 시각/히트 수 갱신 (LRU 기준)
+
+        Args:
+            entry: 캐시 엔트리
+        """
+        entry.last_accessed_at = func.now()  # type: ignore[assignment]
+        entry.hit_count += 1
+        await self.db.commit()
+
+    async def upsert(self, key: str, model_name: str, prompt_version: str, data: dict) -> None:
+        """
+        캐시 엔트리 저장 (이미 있으면 덮어쓰기)
+
+        Args:
+            key: 캐시 키
+            model_name: 모델명
+            prompt_version: 프롬프트 버전
+            data: 검증된 ResumeExtraction dict
+        """
+        entry = await self.get(key)
+        if entry is None:
+            entry = ExtractionCacheEntry(
+                key=key,
+                model_name=model_name,
+                prompt_version=prompt_version,
+                data=data,
+                hit_count=0,
+            )
+            self.db.add(entry)
+        else:
+            entry.data = data
+            entry.last_accessed_at = func.now()  # type: ignore[assignment]
+
+        try:
+            await self.db.commit()
+        except IntegrityError:
+            # 동시에 같은 키가 저장된 경우 - 먼저 저장된 값을 유지
+            await self.db.rollback()
+
+    async def delete(self, key: str) -> None:
+        """
+        캐시 엔트리 삭제
+
+        Args:
+            key: 캐시 키
+        """
+        await self.db.execute(delete(ExtractionCacheEntry).where(ExtractionCacheEntry.key == key))
+        await self.db.commit()
+
+    async def delete_older_than(self, cutoff: datetime) -> int:
+        """
+        마지막 조회 시각이 cutoff 이전인 엔트리 삭제 (TTL)
+
+        Args:
+            cutoff: 기준 시각
+
+        Returns:
+            int: 삭제된 엔트리 수
+        """
+        result = await self.db.execute(
+            delete(ExtractionCacheEntry).where(ExtractionCacheEntry.last_accessed_at < cutoff)
+        )
+        await self.db.commit()
+        return result.rowcount or 0  # type: ignore[attr-defined]
+
+    async def evict_lru(self, max_entries: int) -> int:
+        """
+        가장 오래 조회되지 않은 엔트리부터 삭제해 max_entries개만 남김
+
+        Args:
+            max_entries: 유지할 최대 엔트리 수
+
+        Returns:
+            int: 삭제된 엔트리 수
+        """
+        keep = (
+            select(ExtractionCacheEntry.key)
+            .order_by(ExtractionCacheEntry.last_accessed_at.desc())
+            .limit(max_entries)
+        )
+        result = await self.db.execute(
+            delete(ExtractionCacheEntry).where(ExtractionCacheEntry.key.not_in(keep))
+        )
+        await self.db.commit()
+        return result.rowcount or 0  # type: ignore[attr-defined]
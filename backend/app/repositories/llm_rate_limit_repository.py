@@ -0,0 +1,52 @@
+"""
+LLM Rate Limit Repository - 워커 간 공유 LLM 요청 / 토큰 버킷 저장 로직
+"""
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.models import LLMRateLimitBucket
+
+
+class LLMRateLimitRepository:
+    """LLM 요청 / 토큰 버킷 조회 Repository"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def lock(self, name: str, requests: float, tokens: float, now: float) -> LLMRateLimitBucket:
+        """
+        버킷 행을 잠그고 조회 (없으면 가득 찬 버킷 생성)
+
+        트랜잭션이 끝날 때까지 다른 워커는 같은 버킷을 읽지 못하므로
+        리필 계산과 차감이 한 번에 이루어집니다. 호출자가 commit해야 잠금이 풀립니다.
+
+        Args:
+            name: 버킷 이름
+            requests: 새 버킷의 요청 수 (분당 요청 한도)
+            tokens: 새 버킷의 토큰 수 (분당 토큰 한도)
+            now: 현재 시각 (epoch 초)
+
+        Returns:
+            LLMRateLimitBucket: 잠긴 버킷
+        """
+        query = select(LLMRateLimitBucket).where(LLMRateLimitBucket.name == name).with_for_update()
+        bucket = await self.db.scalar(query)
+        if bucket is not None:
+            return bucket
+
+        self.db.add(LLMRateLimitBucket(
+            name=name,
+            requests=float(requests),
+            tokens=float(tokens),
+            rate_factor=1.0,
+            paused_until=0.0,
+            updated_at=now,
+        ))
+        try:
+            await self.db.flush()
+        except IntegrityError:
+            # 다른 워커가 먼저 생성 - 그 행을 잠그고 사용
+            await self.db.rollback()
+            return (await self.db.scalar(query))  # type: ignore[return-value]
+        return (await self.db.scalar(query))  # type: ignore[return-value]
@@ -0,0 +1,107 @@
+"""
+LLM Response Cache Repository - LLM 응답 캐시 저장 로직
+"""
+from typing import Optional
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.models import LLMResponseCacheEntry
+
+
+class LLMResponseCacheRepository:
+    """LLM 응답 캐시 저장/조회 Repository"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get(self, key: str) -> Optional[LLMResponseCacheEntry]:
+        """
+        캐시 키로 엔트리 조회
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            LLMResponseCacheEntry or None
+        """
+        return await self.db.get(LLMResponseCacheEntry, key)
+
+    async def touch(self, entry: LLMResponseCacheEntry) -> None:
+        """
+        조회 시각/히트 수 갱신 (LRU 기준)
+
+        Args:
+            entry: 캐시 엔트리
+        """
+        entry.last_accessed_at = func.now()  # type: ignore[assignment]
+        entry.hit_count += 1
+        await self.db.commit()
+
+    async def upsert(self, key: str, model_name: str, temperature: float, prompt_version: str, content: str) -> bool:
+        """
+        캐시 엔트리 저장 (이미 있으면 덮어쓰기)
+
+        Args:
+            key: 캐시 키
+            model_name: 모델명
+            temperature: 샘플링 온도
+            prompt_version: 프롬프트 이름@버전
+            content: LLM 응답 텍스트
+
+        Returns:
+            bool: 새 엔트리가 추가되었는지 여부
+        """
+        entry = await self.get(key)
+        inserted = entry is None
+        if entry is None:
+            self.db.add(LLMResponseCacheEntry(
+                key=key,
+                model_name=model_name,
+                temperature=temperature,
+                prompt_version=prompt_version,
+                content=content,
+                hit_count=0,
+            ))
+        else:
+            entry.content = content
+            entry.last_accessed_at = func.now()  # type: ignore[assignment]
+
+        try:
+            await self.db.commit()
+        except IntegrityError:
+            # 동시에 같은 키가 저장된 경우 - 먼저 저장된 값을 유지
+            await self.db.rollback()
+            return False
+        return inserted
+
+    async def count(self) -> int:
+        """
+        전체 엔트리 수
+
+        Returns:
+            int: 엔트리 수
+        """
+        return await self.db.scalar(select(func.count()).select_from(LLMResponseCacheEntry)) or 0
+
+    async def evict_lru(self, max_entries: int) -> int:
+        """
+        가장 오래 조회되지 않은 엔트리부터 삭제해 max_entries개만 남김
+
+        Args:
+            max_entries: 유지할 최대 엔트리 수
+
+        Returns:
+            int: 삭제된 엔트리 수
+        """
+        keep = (
+            select(LLMResponseCacheEntry.key)
+            .order_by(LLMResponseCacheEntry.last_accessed_at.desc())
+            .limit(max_entries)
+        )
+        result = await self.db.execute(
+            delete(LLMResponseCacheEntry).where(LLMResponseCacheEntry.key.not_in(keep))
+        )
+        await self.db.commit()
+        return result.rowcount or 0  # type: ignore[attr-defined]
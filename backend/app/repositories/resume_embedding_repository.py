@@ -0,0 +1,84 @@
+"""
+Resume Embedding Repository - 이력서 항목 임베딩 저장 / 유사도 검색 로직
+"""
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Float, delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.models import ResumeEmbedding
+
+
+class ResumeEmbeddingRepository:
+    """이력서 항목 임베딩 저장/조회 Repository"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def list_by_resume(self, resume_id: int) -> List[ResumeEmbedding]:
+        """
+        이력서의 모든 항목 임베딩 조회
+
+        Args:
+            resume_id: 이력서 ID
+
+        Returns:
+            List[ResumeEmbedding]: 항목 임베딩 리스트 (종류, 저장 순)
+        """
+        stmt = (
+            select(ResumeEmbedding)
+            .where(ResumeEmbedding.resume_id == resume_id)
+            .order_by(ResumeEmbedding.kind, ResumeEmbedding.id)
+        )
+        return list((await self.db.scalars(stmt)).all())
+
+    async def sync(
+        self,
+        resume_id: int,
+        user_id: Optional[str],
+        added: Iterable[ResumeEmbedding],
+        removed: Sequence[int],
+    ) -> None:
+        """
+        바뀐 항목만 반영 (삭제 / 내용이 바뀐 행 제거 후 새 임베딩 추가)
+
+        Args:
+            resume_id: 이력서 ID
+            user_id: 사용자 ID
+            added: 새로 임베딩한 항목
+            removed: 지울 행 ID (이력서에서 빠졌거나 내용이 바뀐 항목)
+        """
+        if removed:
+            await self.db.execute(delete(ResumeEmbedding).where(ResumeEmbedding.id.in_(removed)))
+            await self.db.flush()
+        for row in added:
+            row.resume_id = resume_id
+            row.user_id = user_id
+            self.db.add(row)
+        await self.db.commit()
+
+    async def search(
+        self,
+        embedding: Sequence[float],
+        kind: str,
+        limit: int = 10,
+        user_id: Optional[str] = None,
+    ) -> List[Tuple[ResumeEmbedding, float]]:
+        """
+        코사인 거리 기준 최근접 항목 검색 (Postgres HNSW 인덱스 사용)
+
+        Args:
+            embedding: 검색할 임베딩 (L2 정규화)
+            kind: 항목 종류 (project | skill | career)
+            limit: 최대 개수
+            user_id: 특정 사용자로 제한 (Optional)
+
+        Returns:
+            List[Tuple[ResumeEmbedding, float]]: (항목, 코사인 유사도) 리스트 (유사도 높은 순)
+        """
+        distance = ResumeEmbedding.embedding.op("<=>", return_type=Float)(list(embedding))
+        stmt = select(ResumeEmbedding, distance).where(ResumeEmbedding.kind == kind)
+        if user_id is not None:
+            stmt = stmt.where(ResumeEmbedding.user_id == user_id)
+        stmt = stmt.order_by(distance).limit(limit)
+        return [(row, 1.0 - float(dist)) for row, dist in (await self.db.execute(stmt)).all()]
@@ -1,19 +1,24 @@
 """
 Resume Repository - 데이터베이스 저장 로직
 """
-from sqlalchemy.orm import Session
-from typing import Optional
+from sqlalchemy import select, type_coerce
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, Optional
 from app.database.models import Resume
 from app.models.schemas import ResumeExtraction
+from app.repositories.resume_version_repository import ResumeVersionRepository
+from app.services.resume_cache import get_resume_cache
 
 
 class ResumeRepository:
     """이력서 저장/조회 Repository"""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
+        self.versions = ResumeVersionRepository(db)
 
-    def save(self, resume_data: ResumeExtraction, user_id: Optional[str] = None) -> Resume:
+    async def save(self, resume_data: ResumeExtraction, user_id: Optional[str] = None) -> Resume:
         """
         이력서 데이터를 데이터베이스에 저장
 
@@ -33,14 +38,19 @@ class ResumeRepository:
             data=resume_dict
         )
 
-        # 데이터베이스에 저장
+        # 데이터베이스에 저장 (버전 1 스냅샷과 같은 트랜잭션)
         self.db.add(db_resume)
-        self.db.commit()
-        self.db.refresh(db_resume)
+        await self.db.flush()
+        await self.versions.append(db_resume.id, None, resume_dict)
+        await self.db.commit()
+        await self.db.refresh(db_resume)
+
+        # 사용자의 최근 이력서가 바뀜
+        await get_resume_cache().invalidate(user_id)
 
         return db_resume
 
-    def get_by_id(self, resume_id: int) -> Optional[Resume]:
+    async def get_by_id(self, resume_id: int) -> Optional[Resume]:
         """
         ID로 이력서 조회
 
@@ -50,9 +60,9 @@ class ResumeRepository:
         Returns:
             Resume or None
         """
-        return self.db.query(Resume).filter(Resume.id == resume_id).first()
+        return await self.db.get(Resume, resume_id)
 
-    def get_by_user_id(self, user_id: str) -> list[Resume]:
+    async def get_by_user_id(self, user_id: str) -> list[Resume]:
         """
         사용자 ID로 이력서 목록 조회
 
@@ -62,44 +72,115 @@ class ResumeRepository:
         Returns:
             List[Resume]
         """
-        return self.db.query(Resume).filter(Resume.user_id == user_id).all()
+        result = await self.db.scalars(select(Resume).where(Resume.user_id == user_id))
+        return list(result.all())
     
-    def get_recent_resume_by_user_id(self, user_id: Optional[str] = None) -> Optional[Resume]:
+    async def get_recent_resume_by_user_id(self, user_id: Optional[str] = None) -> Optional[Resume]:
         """
-        사용자 ID로 이력서 목록 조회
+        사용자의 가장 최근 이력서 조회
+
+        (user_id, created_at DESC, id DESC) 인덱스를 한 번 탐색해 첫 행만 읽습니다.
 
         Args:
             user_id: 사용자 ID
 
+        Returns:
+            Resume or None
+        """
+        result = await self.db.scalars(
+            select(Resume)
+            .where(Resume.user_id == user_id)
+            .order_by(Resume.created_at.desc(), Resume.id.desc())
+            .limit(1)
+        )
+        return result.first()
+
+    async def search(
+        self,
+        skill: Optional[str] = None,
+        category: Optional[str] = None,
+        tech_stack: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0
+    ) -> list[Resume]:
+        """
+        기술 / 기술 카테고리 / 프로젝트 기술 스택 조건으로 이력서 검색 (최신순)
+
+        Postgres에서는 조건을 JSONB 포함 연산(data @> ...)으로 만들어 GIN 인덱스로 걸러내고,
+        그 외 DB(SQLite 테스트)에서는 같은 조건을 Python에서 확인합니다.
+
+        Args:
+            skill: 기술명 (skills[].name, 정규화된 이름과 정확히 일치)
+            category: 기술 카테고리 (skills[].category, skill과 함께 주면 같은 항목에서 일치)
+            tech_stack: 프로젝트 기술 스택 (projects[].tech_stack[])
+            limit: 최대 결과 수
+            offset: 건너뛸 결과 수
+
         Returns:
             List[Resume]
         """
-        return self.db.query(Resume).filter(Resume.user_id == user_id).order_by(Resume.created_at).first()
+        conditions = resume_search_conditions(skill=skill, category=category, tech_stack=tech_stack)
+        query = select(Resume).order_by(Resume.created_at.desc(), Resume.id.desc())
+
+        if self.db.get_bind().dialect.name == "postgresql":
+            for condition in conditions:
+                query = query.where(type_coerce(Resume.data, JSONB).contains(condition))
+            result = await self.db.scalars(query.limit(limit).offset(offset))
+            return list(result.all())
+
+        resumes = [
+            resume for resume in (await self.db.scalars(query)).all()
+            if all(json_contains(resume.data, condition) for condition in conditions)
+        ]
+        return resumes[offset:offset + limit]
+
+    async def update(self, resume_id: int, resume_data: Resume) -> Optional[Resume]:
+        """
+        이력서 변경 사항 저장 (analysis 등, data 변경은 update_data 사용)
+
+        Args:
+            resume_id: 이력서 ID
+            resume_data: 변경된 Resume (현재 세션에 로드된 객체)
+
+        Returns:
+            Resume or None
+        """
+        db_resume = await self.get_by_id(resume_id)
+        if not db_resume:
+            return None
+
+        await self.db.commit()
+        await get_resume_cache().invalidate(db_resume.user_id, updated=db_resume)
 
-    def update(self, resume_id: int, resume_data: Resume) -> Optional[Resume]:
+        return db_resume
+
+    async def update_data(self, resume_id: int, data: dict) -> Optional[Resume]:
         """
-        이력서 데이터 업데이트
+        이력서 데이터 업데이트 + 버전 기록
+
+        Resume.data(현재 버전)를 바꾸고, 직전 버전 대비 JSON Patch를 resume_versions에 같은 트랜잭션으로 추가합니다.
 
         Args:
             resume_id: 이력서 ID
-            resume_data: 업데이트할 ResumeExtraction 데이터
+            data: 새 ResumeExtraction dict
 
         Returns:
             Resume or None
         """
-        db_resume = self.get_by_id(resume_id)
+        db_resume = await self.get_by_id(resume_id)
         if not db_resume:
             return None
 
-        # 데이터 업데이트
-        db_resume = resume_data  # type: ignore
+        if await self.versions.append(db_resume.id, db_resume.data, data) is None:
+            return db_resume
 
-        self.db.commit()
-        self.db.refresh(db_resume)
+        db_resume.data = data
+        await self.db.commit()
+        await get_resume_cache().invalidate(db_resume.user_id, updated=db_resume)
 
         return db_resume
 
-    def delete(self, resume_id: int) -> bool:
+    async def delete(self, resume_id: int) -> bool:
         """
         이력서 삭제
 
@@ -109,11 +190,58 @@ class ResumeRepository:
         Returns:
             bool: 삭제 성공 여부
         """
-        db_resume = self.get_by_id(resume_id)
+        db_resume = await self.get_by_id(resume_id)
         if not db_resume:
             return False
 
-        self.db.delete(db_resume)
-        self.db.commit()
+        await self.db.delete(db_resume)
+        await self.db.commit()
+        await get_resume_cache().invalidate(db_resume.user_id)
 
         return True
+
+
+def resume_search_conditions(
+    skill: Optional[str] = None,
+    category: Optional[str] = None,
+    tech_stack: Optional[str] = None
+) -> list[dict]:
+    """
+    검색 조건을 Resume.data에 대한 JSON 포함 조건 목록으로 변환
+
+    Returns:
+        List[dict]: 예) [{"skills": [{"name": "Kafka"}]}, {"projects": [{"tech_stack": ["Kafka"]}]}]
+    """
+    conditions = []
+
+    skill_condition = {}
+    if skill:
+        skill_condition["name"] = skill
+    if category:
+        skill_condition["category"] = category
+    if skill_condition:
+        conditions.append({"skills": [skill_condition]})
+
+    if tech_stack:
+        conditions.append({"projects": [{"tech_stack": [tech_stack]}]})
+
+    return conditions
+
+
+def json_contains(document: Any, condition: Any) -> bool:
+    """
+    Postgres JSONB @> 연산과 같은 규칙의 포함 여부 확인
+
+    - 객체: condition의 모든 키가 document에 있고 값도 포함 관계
+    - 배열: condition의 각 원소를 포함하는 원소가 document 배열에 있음
+    - 그 외: 값이 같음
+    """
+    if isinstance(condition, dict):
+        return isinstance(document, dict) and all(
+            key in document and json_contains(document[key], value) for key, value in condition.items()
+        )
+    if isinstance(condition, list):
+        return isinstance(document, list) and all(
+            any(json_contains(item, value) for item in document) for value in condition
+        )
+    return document == condition
@@ -0,0 +1,137 @@
+"""
+Resume Version Repository - 이력서 변경 이력 (JSON Patch + 주기적 스냅샷) 저장/복원 로직
+"""
+from typing import Optional
+
+import jsonpatch
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.database.models import ResumeVersion
+
+
+class ResumeVersionRepository:
+    """
+    이력서 버전 저장/조회 Repository
+
+    - 변경마다 직전 버전 대비 RFC 6902 patch 한 행을 추가 (append-only)
+    - snapshot_interval 버전마다 전체 스냅샷을 함께 저장해 복원 시 적용할 patch 수를 제한
+    - append는 commit하지 않음 (ResumeRepository가 Resume.data 갱신과 같은 트랜잭션으로 commit)
+    """
+
+    def __init__(self, db: AsyncSession, snapshot_interval: Optional[int] = None):
+        self.db = db
+        self.snapshot_interval = max(snapshot_interval or settings.resume_snapshot_interval, 1)
+
+    async def head_version(self, resume_id: int) -> int:
+        """
+        마지막 버전 번호 조회
+
+        Args:
+            resume_id: 이력서 ID
+
+        Returns:
+            int: 마지막 버전 (이력이 없으면 0)
+        """
+        version = await self.db.scalar(
+            select(func.max(ResumeVersion.version)).where(ResumeVersion.resume_id == resume_id)
+        )
+        return version or 0
+
+    async def append(self, resume_id: int, previous: Optional[dict], current: dict) -> Optional[ResumeVersion]:
+        """
+        새 버전 추가 (세션에만 추가, commit은 호출자가 수행)
+
+        이력이 없는 기존 이력서는 previous를 버전 1 스냅샷으로 먼저 기록합니다.
+
+        Args:
+            resume_id: 이력서 ID
+            previous: 직전 데이터 (새 이력서면 None)
+            current: 새 데이터
+
+        Returns:
+            Optional[ResumeVersion]: 추가된 버전 (변경이 없으면 None)
+        """
+        head = await self.head_version(resume_id)
+
+        if head == 0 and previous is not None:
+            self.db.add(ResumeVersion(resume_id=resume_id, version=1, snapshot=previous))
+            head = 1
+
+        if head == 0:
+            entry = ResumeVersion(resume_id=resume_id, version=1, snapshot=current)
+        else:
+            patch = jsonpatch.make_patch(previous, current).patch
+            if not patch:
+                return None
+
+            version = head + 1
+            entry = ResumeVersion(
+                resume_id=resume_id,
+                version=version,
+                patch=patch,
+                snapshot=current if (version - 1) % self.snapshot_interval == 0 else None,
+            )
+
+        self.db.add(entry)
+        return entry
+
+    async def list_versions(self, resume_id: int) -> list[ResumeVersion]:
+        """
+        버전 목록 조회 (오래된 순)
+
+        Args:
+            resume_id: 이력서 ID
+
+        Returns:
+            List[ResumeVersion]
+        """
+        result = await self.db.scalars(
+            select(ResumeVersion).where(ResumeVersion.resume_id == resume_id).order_by(ResumeVersion.version)
+        )
+        return list(result.all())
+
+    async def get_data(self, resume_id: int, version: int) -> Optional[dict]:
+        """
+        특정 버전의 이력서 데이터 복원
+
+        version 이하의 가장 가까운 스냅샷에서 시작해 그 뒤 patch를 순서대로 적용합니다
+        (적용하는 patch는 최대 snapshot_interval - 1개).
+
+        Args:
+            resume_id: 이력서 ID
+            version: 복원할 버전
+
+        Returns:
+            Optional[dict]: 해당 버전 데이터 (없는 버전이면 None)
+        """
+        base = await self.db.scalar(
+            select(ResumeVersion)
+            .where(
+                ResumeVersion.resume_id == resume_id,
+                ResumeVersion.version <= version,
+                ResumeVersion.snapshot.is_not(None),
+            )
+            .order_by(ResumeVersion.version.desc())
+            .limit(1)
+        )
+        if base is None:
+            return None
+
+        patches = (await self.db.scalars(
+            select(ResumeVersion)
+            .where(
+                ResumeVersion.resume_id == resume_id,
+                ResumeVersion.version > base.version,
+                ResumeVersion.version <= version,
+            )
+            .order_by(ResumeVersion.version)
+        )).all()
+        if base.version + len(patches) != version:
+            return None
+
+        data = base.snapshot
+        for entry in patches:
+            data = jsonpatch.apply_patch(data, entry.patch)
+        return data
@@ -0,0 +1,179 @@
+"""
+Upload Job Repository - 업로드 작업 상태 저장 로직
+"""
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Tuple
+
+from sqlalchemy import or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.models import UploadJob, UploadJobFile
+
+
+class UploadJobRepository:
+    """업로드 작업 저장/조회 Repository"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def create(
+        self,
+        job_id: str,
+        session_id: str,
+        files: List[Tuple[Optional[str], bytes]],
+        user_id: Optional[str] = None
+    ) -> UploadJob:
+        """
+        업로드 작업과 원본 PDF 저장
+
+        Args:
+            job_id: 작업 ID
+            session_id: 세션 ID
+            files: (파일명, PDF bytes) 리스트
+            user_id: 사용자 ID (Optional)
+
+        Returns:
+            UploadJob: 저장된 작업
+        """
+        job = UploadJob(
+            id=job_id,
+            user_id=user_id,
+            session_id=session_id,
+            status="queued",
+            stage="queued",
+            attempts=0,
+            files=[
+                UploadJobFile(position=idx, filename=filename, content=content)
+                for idx, (filename, content) in enumerate(files)
+            ],
+        )
+
+        self.db.add(job)
+        await self.db.commit()
+        await self.db.refresh(job)
+
+        return job
+
+    async def get(self, job_id: str) -> Optional[UploadJob]:
+        """
+        ID로 작업 조회
+
+        Args:
+            job_id: 작업 ID
+
+        Returns:
+            UploadJob or None
+        """
+        return await self.db.get(UploadJob, job_id)
+
+    async def get_file_contents(self, job_id: str) -> List[bytes]:
+        """
+        작업의 원본 PDF bytes 조회 (업로드 순서)
+
+        Args:
+            job_id: 작업 ID
+
+        Returns:
+            List[bytes]: PDF bytes 리스트
+        """
+        stmt = (
+            select(UploadJobFile.content)
+            .where(UploadJobFile.job_id == job_id)
+            .order_by(UploadJobFile.position)
+        )
+        return list((await self.db.scalars(stmt)).all())
+
+    async def claim(self, job_id: str, lease_seconds: int) -> bool:
+        """
+        작업 실행 권한 획득 (대기 중이거나 lease가 만료된 작업만)
+
+        여러 워커 프로세스가 같은 작업을 동시에 처리하지 않도록 조건부 UPDATE로 처리합니다.
+
+        Args:
+            job_id: 작업 ID
+            lease_seconds: lease 유지 시간 (초)
+
+        Returns:
+            bool: 획득 성공 여부
+        """
+        now = datetime.now(timezone.utc)
+        result = await self.db.execute(
+            update(UploadJob)
+            .where(
+                UploadJob.id == job_id,
+                or_(
+                    UploadJob.status == "queued",
+                    (UploadJob.status == "running") & (UploadJob.locked_until < now),
+                ),
+            )
+            .values(
+                status="running",
+                attempts=UploadJob.attempts + 1,
+                locked_until=now + timedelta(seconds=lease_seconds),
+            )
+        )
+        await self.db.commit()
+        return (result.rowcount or 0) > 0  # type: ignore[attr-defined]
+
+    async def save_progress(self, job: UploadJob, lease_seconds: int, **fields) -> UploadJob:
+        """
+        단계 진행 상황 저장 및 lease 연장
+
+        Args:
+            job: 업로드 작업
+            lease_seconds: lease 유지 시간 (초)
+            **fields: 갱신할 컬럼 값
+
+        Returns:
+            UploadJob: 갱신된 작업
+        """
+        for key, value in fields.items():
+            setattr(job, key, value)
+        job.locked_until = datetime.now(timezone.utc) + timedelta(seconds=lease_seconds)
+
+        await self.db.commit()
+        await self.db.refresh(job)
+
+        return job
+
+    async def finish(self, job: UploadJob, status: str, **fields) -> UploadJob:
+        """
+        작업 종료 처리 (succeeded / failed)
+
+        Args:
+            job: 업로드 작업
+            status: 최종 상태
+            **fields: 갱신할 컬럼 값
+
+        Returns:
+            UploadJob: 갱신된 작업
+        """
+        for key, value in fields.items():
+            setattr(job, key, value)
+        job.status = status
+        job.locked_until = None
+
+        await self.db.commit()
+        await self.db.refresh(job)
+
+        return job
+
+    async def list_recoverable(self) -> List[Tuple[str, Optional[str]]]:
+        """
+        다시 실행해야 할 작업 목록 (대기 중 + lease가 만료된 실행 중 작업)
+
+        Returns:
+            List[Tuple[str, Optional[str]]]: (작업 ID, 사용자 ID) 리스트 (생성 순)
+        """
+        now = datetime.now(timezone.utc)
+        stmt = (
+            select(UploadJob.id, UploadJob.user_id)
+            .where(
+                or_(
+                    UploadJob.status == "queued",
+                    (UploadJob.status == "running") & (UploadJob.locked_until < now),
+                )
+            )
+            .order_by(UploadJob.created_at)
+        )
+        return [(job_id, user_id) for job_id, user_id in (await self.db.execute(stmt)).all()]
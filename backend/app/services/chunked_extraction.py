@@ -0,0 +1,249 @@
+"""
+Chunked Extraction - 긴 이력서/다중 파일용 map-reduce 추출 (분할 → 청크별 추출 → 결정적 병합)
+"""
+import asyncio
+import re
+import unicodedata
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, TypeVar
+
+from langchain.messages import SystemMessage
+from langchain_core.documents import Document
+
+from app.core.prompts import SIMPLE_EXTRACTION_PROMPT
+from app.core.structured_output import StructuredEventCallback, agenerate_structured
+from app.services.llm_cache import CachePolicy
+from app.models.schemas import (
+    Career,
+    Education,
+    PersonInfo,
+    ProjectInfo,
+    ResumeExtraction,
+    Skill,
+    STARCompleteness,
+)
+
+T = TypeVar("T")
+
+
+def normalize_key(value: Optional[str]) -> str:
+    """
+    중복 판별용 정규화 키 (유니코드 NFKC, 소문자, 공백/구두점 제거)
+
+    Args:
+        value: 원본 문자열
+
+    Returns:
+        str: 정규화된 키
+    """
+    if not value:
+        return ""
+    value = unicodedata.normalize("NFKC", value).casefold()
+    return re.sub(r"[\s\W_]+", "", value)
+
+
+def split_documents(documents: List[Document], max_chars: int) -> List[str]:
+    """
+    페이지 Document들을 max_chars 이하의 섹션 텍스트로 분할
+
+    연속된 페이지를 순서대로 묶고, 한 페이지가 max_chars보다 길면 빈 줄(문단) 단위로 나눕니다.
+
+    Args:
+        documents: 페이지별 Document 리스트
+        max_chars: 청크 최대 길이 (문자 수)
+
+    Returns:
+        List[str]: 청크 텍스트 리스트 (원래 순서 유지)
+    """
+    sections: List[str] = []
+    for doc in documents:
+        text = doc.page_content.strip()
+        if not text:
+            continue
+        if len(text) <= max_chars:
+            sections.append(text)
+            continue
+
+        # 긴 페이지는 문단 → 줄 → 고정 길이 순으로 나눔
+        for paragraph in re.split(r"\n\s*\n", text):
+            paragraph = paragraph.strip()
+            while len(paragraph) > max_chars:
+                cut = paragraph.rfind("\n", 0, max_chars)
+                cut = cut if cut > 0 else max_chars
+                sections.append(paragraph[:cut].strip())
+                paragraph = paragraph[cut:].strip()
+            if paragraph:
+                sections.append(paragraph)
+
+    chunks: List[str] = []
+    current: List[str] = []
+    current_len = 0
+    for section in sections:
+        if current and current_len + len(section) + 2 > max_chars:
+            chunks.append("\n\n".join(current))
+            current, current_len = [], 0
+        current.append(section)
+        current_len += len(section) + 2
+
+    if current:
+        chunks.append("\n\n".join(current))
+
+    return chunks
+
+
+def _dedupe(items: Iterable[T], key: Callable[[T], Tuple], merge: Callable[[T, T], T]) -> List[T]:
+    merged: Dict[Tuple, T] = {}
+    for item in items:
+        item_key = key(item)
+        merged[item_key] = merge(merged[item_key], item) if item_key in merged else item
+    return list(merged.values())
+
+
+def _union(first: List[str], second: List[str]) -> List[str]:
+    seen = {normalize_key(value) for value in first}
+    result = list(first)
+    for value in second:
+        if normalize_key(value) not in seen:
+            seen.add(normalize_key(value))
+            result.append(value)
+    return result
+
+
+def _merge_person(persons: List[PersonInfo]) -> PersonInfo:
+    merged = persons[0].model_copy()
+    for person in persons[1:]:
+        merged.name = merged.name or person.name
+        merged.email = merged.email or person.email
+        merged.phone = merged.phone or person.phone
+        merged.title = merged.title or person.title
+        merged.years_of_experience = max(merged.years_of_experience, person.years_of_experience)
+    return merged
+
+
+def _merge_project(first: ProjectInfo, second: ProjectInfo) -> ProjectInfo:
+    situation = first.situation or second.situation
+    task = first.task or second.task
+    actions = _union(first.actions, second.actions)
+    results = _union(first.results, second.results)
+
+    return first.model_copy(update={
+        "company": first.company or second.company,
+        "role": first.role or second.role,
+        "situation": situation,
+        "task": task,
+        "actions": actions,
+        "results": results,
+        "tech_stack": _union(first.tech_stack, second.tech_stack),
+        "is_complete": STARCompleteness(
+            situation=bool(situation),
+            task=bool(task),
+            actions=bool(actions),
+            results=bool(results),
+            score=0.25 * sum(map(bool, [situation, task, actions, results])),
+        ),
+    })
+
+
+def merge_extractions(partials: List[ResumeExtraction]) -> ResumeExtraction:
+    """
+    청크별 추출 결과를 하나의 ResumeExtraction으로 결정적으로 병합
+
+    - person: 먼저 나온 값 우선, years_of_experience는 최댓값
+    - skills: 정규화한 기술명 기준 중복 제거
+    - projects: 정규화한 (프로젝트명, 회사명) 기준으로 합치고 STAR 완성도 재계산, proj_xxx ID 재부여
+    - career / education: 정규화한 주요 필드 기준 중복 제거
+
+    Args:
+        partials: 청크 순서대로 정렬된 추출 결과 리스트
+
+    Returns:
+        ResumeExtraction: 병합된 추출 결과
+    """
+    if not partials:
+        raise ValueError("병합할 추출 결과가 없습니다.")
+
+    skills = _dedupe(
+        (skill for partial in partials for skill in partial.skills),
+        key=lambda skill: (normalize_key(skill.name),),
+        merge=lambda first, _: first,
+    )
+
+    projects = _dedupe(
+        (project for partial in partials for project in partial.projects),
+        key=lambda project: (normalize_key(project.name), normalize_key(project.company)),
+        merge=_merge_project,
+    )
+    projects = [
+        project.model_copy(update={"id": f"proj_{idx:03d}"})
+        for idx, project in enumerate(projects, start=1)
+    ]
+
+    career = _dedupe(
+        (career for partial in partials for career in partial.career),
+        key=lambda career: (normalize_key(career.company), normalize_key(career.position)),
+        merge=lambda first, second: Career(
+            company=first.company,
+            position=first.position,
+            duration=first.duration or second.duration,
+            description=first.description or second.description,
+        ),
+    )
+
+    education = _dedupe(
+        (education for partial in partials for education in partial.education),
+        key=lambda education: (
+            normalize_key(education.institution),
+            normalize_key(education.degree),
+            normalize_key(education.major),
+        ),
+        merge=lambda first, second: Education(
+            institution=first.institution,
+            degree=first.degree,
+            major=first.major,
+            duration=first.duration or second.duration,
+            gpa=first.gpa if first.gpa is not None else second.gpa,
+        ),
+    )
+
+    return ResumeExtraction(
+        person=_merge_person([partial.person for partial in partials]),
+        skills=[Skill.model_validate(skill.model_dump()) for skill in skills],
+        projects=projects,
+        career=career,
+        education=education,
+    )
+
+
+async def extract_chunked(
+    llm,
+    chunks: List[str],
+    max_concurrency: int = 4,
+    on_event: Optional[StructuredEventCallback] = None,
+) -> ResumeExtraction:
+    """
+    청크별로 SIMPLE_EXTRACTION_PROMPT 추출을 동시에 실행한 뒤 병합 (map-reduce)
+
+    Args:
+        llm: ChatModelPool
+        chunks: split_documents로 나눈 청크 텍스트 리스트
+        max_concurrency: 동시에 실행할 청크 추출 수
+        on_event: 청크 추출이 끝날 때마다 {"type": "chunk", "index", "total"} 이벤트를 받는 콜백
+
+    Returns:
+        ResumeExtraction: 병합된 추출 결과
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def extract(index: int, chunk: str) -> ResumeExtraction:
+        async with semaphore:
+            conversations = [SystemMessage(content=SIMPLE_EXTRACTION_PROMPT.format(resume_text=chunk))]
+            partial = await agenerate_structured(
+                llm, conversations, ResumeExtraction, temperature=0.3, cache=CachePolicy.NEVER
+            )
+
+        if on_event is not None:
+            on_event({"type": "chunk", "index": index, "total": len(chunks)})
+        return partial
+
+    # gather는 입력 순서대로 결과를 돌려주므로 완료 순서와 무관하게 병합 결과가 같음
+    partials = await asyncio.gather(*(extract(index, chunk) for index, chunk in enumerate(chunks)))
+    return merge_extractions(list(partials))
@@ -0,0 +1,165 @@
+"""
+Embeddings - 이력서 항목 / JD 텍스트 로컬 임베딩 (외부 API 호출 없음)
+"""
+import asyncio
+import functools
+import hashlib
+import re
+import unicodedata
+from typing import List, Optional, Protocol, Sequence
+
+import numpy as np
+
+from app.core.config import settings
+
+# 영문 / 숫자 단어 (C++, C#, Node.js 같은 기술명 유지)와 한글 단어를 따로 분리 ("PyTorch로" → "pytorch", "로")
+TOKEN_PATTERN = re.compile(r"[0-9a-z][0-9a-z+#.]*|[가-힣]+")
+
+# 특성 종류별 가중치 (단어 > 단어 bigram > 글자 trigram)
+WORD_WEIGHT = 1.0
+BIGRAM_WEIGHT = 0.5
+CHAR_WEIGHT = 0.3
+
+
+class Embedder(Protocol):
+    """
+    텍스트 임베딩 모델
+
+    embed는 (텍스트 수 × dimensions) float32 행렬을 돌려주며 각 행은 L2 정규화되어 있습니다.
+    """
+
+    model_name: str
+    dimensions: int
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray: ...
+
+
+@functools.lru_cache(maxsize=200_000)
+def _hash_feature(feature: str) -> int:
+    # 프로세스 / 실행마다 같은 값이 나오도록 Python hash() 대신 blake2b 사용
+    return int.from_bytes(hashlib.blake2b(feature.encode(), digest_size=8).digest(), "little")
+
+
+def _features(text: str) -> List[tuple]:
+    words = [word.rstrip(".") for word in TOKEN_PATTERN.findall(unicodedata.normalize("NFKC", text).lower())]
+    words = [word for word in words if word]
+    features = [(f"w:{word}", WORD_WEIGHT) for word in words]
+    features += [(f"b:{first} {second}", BIGRAM_WEIGHT) for first, second in zip(words, words[1:])]
+    for word in words:
+        # 한국어 조사 / 어미 변화에도 겹치도록 글자 trigram 추가 ("추천시스템을" ↔ "추천시스템")
+        padded = f"<{word}>"
+        features += [(f"c:{padded[idx:idx + 3]}", CHAR_WEIGHT) for idx in range(len(padded) - 2)]
+    return features
+
+
+class HashingEmbedder:
+    """
+    특성 해싱 임베딩 (단어 / 단어 bigram / 글자 trigram → 고정 차원, 부호 해싱)
+
+    모델 다운로드 없이 결정적으로 동작하며, 기술명과 도메인 용어가 겹치는 정도를 잘 반영합니다.
+    의미 유사도가 더 필요하면 EMBEDDING_MODEL에 sentence-transformers 모델명을 지정하세요.
+    """
+
+    model_name = "hashing"
+
+    def __init__(self, dimensions: Optional[int] = None):
+        self.dimensions = dimensions or settings.embedding_dimensions
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        rows: List[int] = []
+        hashes: List[int] = []
+        weights: List[float] = []
+        for row, text in enumerate(texts):
+            for feature, weight in _features(text):
+                rows.append(row)
+                hashes.append(_hash_feature(feature))
+                weights.append(weight)
+
+        matrix = np.zeros((len(texts), self.dimensions), dtype=np.float32)
+        if hashes:
+            hashed = np.array(hashes, dtype=np.uint64)
+            columns = (hashed % np.uint64(self.dimensions)).astype(np.int64)
+            signs = np.where((hashed >> np.uint64(63)) == 1, 1.0, -1.0)
+            np.add.at(matrix, (np.array(rows), columns), signs * np.array(weights))
+        # 자주 나온 특성이 점수를 독점하지 않도록 sublinear 스케일 후 정규화
+        matrix = np.sign(matrix) * np.log1p(np.abs(matrix))
+        return _normalize(matrix)
+
+
+class SentenceTransformerEmbedder:
+    """
+    sentence-transformers 로컬 모델 임베딩 (선택 설치: uv pip install sentence-transformers)
+    """
+
+    def __init__(self, model_name: str):
+        try:
+            from sentence_transformers import SentenceTransformer
+        except ImportError as e:
+            raise RuntimeError(
+                f"EMBEDDING_MODEL={model_name}을(를) 쓰려면 sentence-transformers 패키지가 필요합니다."
+            ) from e
+
+        self.model_name = model_name
+        self._model = SentenceTransformer(model_name)
+        self.dimensions = self._model.get_sentence_embedding_dimension()
+        if self.dimensions != settings.embedding_dimensions:
+            raise RuntimeError(
+                f"{model_name}의 차원({self.dimensions})이 EMBEDDING_DIMENSIONS({settings.embedding_dimensions})와 다릅니다."
+            )
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        if not texts:
+            return np.zeros((0, self.dimensions), dtype=np.float32)
+        vectors = self._model.encode(list(texts), normalize_embeddings=True, convert_to_numpy=True)
+        return np.asarray(vectors, dtype=np.float32)
+
+
+def _normalize(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return (matrix / np.where(norms == 0, 1.0, norms)).astype(np.float32)
+
+
+async def aembed(embedder: Embedder, texts: Sequence[str]) -> np.ndarray:
+    """
+    이벤트 루프를 막지 않도록 스레드에서 임베딩 계산
+
+    Args:
+        embedder: 임베딩 모델
+        texts: 임베딩할 텍스트 리스트
+
+    Returns:
+        np.ndarray: (텍스트 수 × dimensions) 정규화된 행렬
+    """
+    if not texts:
+        return np.zeros((0, embedder.dimensions), dtype=np.float32)
+    return await asyncio.to_thread(embedder.embed, list(texts))
+
+
+# 프로세스 전역 임베딩 모델 (lifespan에서 생성)
+_embedder: Optional[Embedder] = None
+
+
+def init_embedder() -> Embedder:
+    """
+    전역 임베딩 모델 생성 (앱 시작 시 호출, sentence-transformers 모델은 이때 로드)
+
+    Returns:
+        Embedder: 생성된 모델
+    """
+    global _embedder
+    if _embedder is None:
+        if settings.embedding_model == "hashing":
+            _embedder = HashingEmbedder()
+        else:
+            _embedder = SentenceTransformerEmbedder(settings.embedding_model)
+    return _embedder
+
+
+def get_embedder() -> Embedder:
+    """
+    전역 임베딩 모델 조회 (lifespan 밖에서 호출되면 지연 생성)
+
+    Returns:
+        Embedder: 전역 모델
+    """
+    return init_embedder()
@@ -0,0 +1,172 @@
+"""
+Extraction Cache - 이력서 추출 결과 영속 캐시
+"""
+import hashlib
+import re
+import unicodedata
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.schemas import ResumeExtraction
+from app.repositories import ExtractionCacheRepository
+
+
+class ExtractionCacheStats:
+    """
+    프로세스 단위 캐시 카운터
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def snapshot(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": round(self.hit_ratio, 4),
+        }
+
+
+# 프로세스 전역 카운터
+extraction_cache_stats = ExtractionCacheStats()
+
+
+def normalize_resume_text(text: str) -> str:
+    """
+    캐시 키 계산용 텍스트 정규화
+    (유니코드 NFC, 공백 압축, 앞뒤 공백 제거)
+
+    Args:
+        text: PDF에서 추출한 원문 텍스트
+
+    Returns:
+        str: 정규화된 텍스트
+    """
+    text = unicodedata.normalize("NFC", text)
+    return re.sub(r"\s+", " ", text).strip()
+
+
+class ExtractionCache:
+    """
+    정규화된 추출 텍스트 + 프롬프트 버전 + 모델명 해시를 키로
+    검증된 ResumeExtraction을 저장하는 영속 캐시
+
+    - TTL: 마지막 조회 후 ttl_seconds가 지나면 만료
+    - LRU: 엔트리가 max_entries를 넘으면 가장 오래 조회되지 않은 것부터 삭제
+    """
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        max_entries: Optional[int] = None,
+        ttl_seconds: Optional[int] = None,
+        stats: Optional[ExtractionCacheStats] = None,
+    ):
+        """
+        초기화
+
+        Args:
+            db: SQLAlchemy 세션
+            max_entries: 최대 엔트리 수 (기본값: settings.extraction_cache_max_entries)
+            ttl_seconds: 만료 시간 (기본값: settings.extraction_cache_ttl_seconds)
+            stats: 카운터 (기본값: 프로세스 전역 카운터)
+        """
+        self.repo = ExtractionCacheRepository(db)
+        self.max_entries = max_entries or settings.extraction_cache_max_entries
+        self.ttl_seconds = ttl_seconds or settings.extraction_cache_ttl_seconds
+        self.stats = stats or extraction_cache_stats
+
+    @staticmethod
+    def make_key(resume_text: str, prompt_version: str, model_name: str) -> str:
+        """
+        캐시 키 생성
+
+        Args:
+            resume_text: PDF에서 추출한 텍스트
+            prompt_version: 추출 프롬프트 버전
+            model_name: 모델명
+
+        Returns:
+            str: sha256 hex digest
+        """
+        payload = "\x1f".join([normalize_resume_text(resume_text), prompt_version, model_name])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def get(self, key: str) -> Optional[ResumeExtraction]:
+        """
+        캐시 조회 (만료되었거나 현재 스키마로 검증되지 않으면 miss)
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            ResumeExtraction or None
+        """
+        entry = await self.repo.get(key)
+
+        if entry is None:
+            self.stats.misses += 1
+            return None
+
+        if self._is_expired(entry.last_accessed_at):
+            await self.repo.delete(key)
+            self.stats.misses += 1
+            self.stats.evictions += 1
+            return None
+
+        try:
+            resume_data = ResumeExtraction.model_validate(entry.data)
+        except ValidationError:
+            # 스키마가 바뀌어 더 이상 유효하지 않은 엔트리
+            await self.repo.delete(key)
+            self.stats.misses += 1
+            return None
+
+        await self.repo.touch(entry)
+        self.stats.hits += 1
+        return resume_data
+
+    async def put(self, key: str, resume_data: ResumeExtraction, prompt_version: str, model_name: str) -> None:
+        """
+        캐시 저장 후 만료/초과 엔트리 정리
+
+        Args:
+            key: 캐시 키
+            resume_data: 검증된 ResumeExtraction
+            prompt_version: 추출 프롬프트 버전
+            model_name: 모델명
+        """
+        await self.repo.upsert(key, model_name, prompt_version, resume_data.model_dump(mode="json"))
+        await self.evict()
+
+    async def evict(self) -> int:
+        """
+        만료 엔트리와 LRU 초과분 삭제
+
+        Returns:
+            int: 삭제된 엔트리 수
+        """
+        removed = await self.repo.delete_older_than(self._cutoff())
+        removed += await self.repo.evict_lru(self.max_entries)
+        self.stats.evictions += removed
+        return removed
+
+    def _cutoff(self) -> datetime:
+        return datetime.now(timezone.utc) - timedelta(seconds=self.ttl_seconds)
+
+    def _is_expired(self, last_accessed_at: datetime) -> bool:
+        if last_accessed_at.tzinfo is None:
+            last_accessed_at = last_accessed_at.replace(tzinfo=timezone.utc)
+        return last_accessed_at < self._cutoff()
@@ -0,0 +1,58 @@
+"""
+Generated Resume Store - 생성된 맞춤 이력서 임시 보관 (미리보기 / 다운로드용 프로세스 내 LRU + TTL)
+"""
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from app.core.config import settings
+
+
+class GeneratedResumeStore:
+    """
+    job_id → 생성 결과를 보관하는 프로세스 내 LRU + TTL 저장소
+
+    - 생성 직후 미리보기 / 다운로드하는 용도이므로 ttl_seconds가 지난 결과는 조회 시 버림
+    - 엔트리가 max_entries를 넘으면 가장 오래 조회되지 않은 것부터 삭제
+    """
+
+    def __init__(self, max_entries: Optional[int] = None, ttl_seconds: Optional[float] = None):
+        """
+        초기화
+
+        Args:
+            max_entries: 최대 엔트리 수 (기본값: settings.generated_resume_max_entries)
+            ttl_seconds: 보관 시간 (기본값: settings.generated_resume_ttl_seconds)
+        """
+        self.max_entries = max_entries or settings.generated_resume_max_entries
+        self.ttl_seconds = ttl_seconds or settings.generated_resume_ttl_seconds
+        self._entries: "OrderedDict[str, tuple[float, dict]]" = OrderedDict()
+        self.evictions = 0
+
+    def get(self, job_id: str) -> Optional[dict]:
+        entry = self._entries.get(job_id)
+        if entry is None:
+            return None
+        expires_at, generated = entry
+        if expires_at <= time.monotonic():
+            del self._entries[job_id]
+            return None
+        self._entries.move_to_end(job_id)
+        return generated
+
+    def put(self, job_id: str, generated: dict):
+        self._entries[job_id] = (time.monotonic() + self.ttl_seconds, generated)
+        self._entries.move_to_end(job_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# 프로세스 전역 저장소
+generated_resumes = GeneratedResumeStore()
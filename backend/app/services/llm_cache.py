@@ -0,0 +1,183 @@
+"""
+LLM Response Cache - 같은 프롬프트에 대한 LLM 응답 영속 캐시 (ChatModelPool 호출 지점별 정책)
+"""
+import hashlib
+import json
+from enum import Enum
+from typing import Any, Optional, Sequence
+
+from langchain_core.messages import BaseMessage
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.database.config import SessionLocal
+from app.repositories import LLMResponseCacheRepository
+
+
+class CachePolicy(str, Enum):
+    """호출 지점별 응답 캐시 정책"""
+    TEMPERATURE_ZERO = "temperature_zero"  # temperature 0 호출만 재사용 (분석, 맞춤 이력서처럼 결정적인 출력)
+    NEVER = "never"  # 캐시하지 않음 (답변마다 다른 업데이트, 별도 캐시가 있는 추출)
+
+
+class LLMCacheStats:
+    """
+    프로세스 단위 캐시 카운터
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.bypassed = 0
+        self.evictions = 0
+        self.errors = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def snapshot(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "bypassed": self.bypassed,
+            "evictions": self.evictions,
+            "errors": self.errors,
+            "hit_ratio": round(self.hit_ratio, 4),
+        }
+
+
+# 프로세스 전역 카운터
+llm_cache_stats = LLMCacheStats()
+
+
+class LLMResponseCache:
+    """
+    (모델명, temperature, 프롬프트 버전, 응답 형식, 렌더링된 메시지) 해시를 키로 LLM 응답 텍스트를 저장하는 영속 캐시
+
+    - 요청 세션과 별개로 session_factory에서 짧은 세션을 열어 조회/저장 (그래프의 병렬 노드에서 호출해도 안전)
+    - LRU: 엔트리가 max_entries를 넘으면 가장 오래 조회되지 않은 것부터 삭제
+    - 캐시 오류는 LLM 호출을 실패시키지 않음 (miss로 처리)
+    """
+
+    def __init__(
+        self,
+        session_factory: Optional[async_sessionmaker[AsyncSession]] = None,
+        max_entries: Optional[int] = None,
+        stats: Optional[LLMCacheStats] = None,
+    ):
+        """
+        초기화
+
+        Args:
+            session_factory: 세션 팩토리 (기본값: 앱 SessionLocal)
+            max_entries: 최대 엔트리 수 (기본값: settings.llm_cache_max_entries)
+            stats: 카운터 (기본값: 프로세스 전역 카운터)
+        """
+        self.session_factory = session_factory or SessionLocal
+        self.max_entries = max_entries or settings.llm_cache_max_entries
+        self.stats = stats or llm_cache_stats
+
+    def key_for(
+        self,
+        policy: CachePolicy,
+        model_name: str,
+        temperature: float,
+        prompt_version: Optional[str],
+        messages: Sequence[BaseMessage],
+        response_format: Optional[Any] = None,
+    ) -> Optional[str]:
+        """
+        정책상 캐시 대상이면 캐시 키 생성
+
+        Args:
+            policy: 호출 지점의 캐시 정책
+            model_name: 모델명
+            temperature: 샘플링 온도
+            prompt_version: 프롬프트 이름@버전 (없으면 캐시하지 않음)
+            messages: 렌더링된 메시지 리스트
+            response_format: structured output 스키마
+
+        Returns:
+            Optional[str]: sha256 hex digest (캐시 대상이 아니면 None)
+        """
+        if policy == CachePolicy.NEVER or prompt_version is None:
+            return None
+        if policy == CachePolicy.TEMPERATURE_ZERO and temperature != 0:
+            self.stats.bypassed += 1
+            return None
+        return self.make_key(model_name, temperature, prompt_version, messages, response_format)
+
+    @staticmethod
+    def make_key(
+        model_name: str,
+        temperature: float,
+        prompt_version: str,
+        messages: Sequence[BaseMessage],
+        response_format: Optional[Any] = None,
+    ) -> str:
+        """
+        캐시 키 생성
+
+        Returns:
+            str: sha256 hex digest
+        """
+        rendered = json.dumps(
+            [[message.type, message.content] for message in messages], ensure_ascii=False, sort_keys=True
+        )
+        schema = getattr(response_format, "__name__", "") if response_format is not None else ""
+        payload = "\x1f".join([model_name, repr(float(temperature)), prompt_version, schema, rendered])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def get(self, key: str) -> Optional[str]:
+        """
+        캐시 조회 (hit이면 LRU 기준 시각 갱신)
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            Optional[str]: 저장된 응답 텍스트
+        """
+        try:
+            async with self.session_factory() as db:
+                repo = LLMResponseCacheRepository(db)
+                entry = await repo.get(key)
+                if entry is None:
+                    self.stats.misses += 1
+                    return None
+                content = entry.content
+                await repo.touch(entry)
+        except Exception as e:
+            print(f"⚠️ LLM cache lookup failed: {e}")
+            self.stats.errors += 1
+            self.stats.misses += 1
+            return None
+
+        self.stats.hits += 1
+        return content
+
+    async def put(self, key: str, model_name: str, temperature: float, prompt_version: str, content: str) -> None:
+        """
+        응답 저장 후 최대 엔트리 수를 넘으면 LRU 정리
+
+        Args:
+            key: 캐시 키
+            model_name: 모델명
+            temperature: 샘플링 온도
+            prompt_version: 프롬프트 이름@버전
+            content: LLM 응답 텍스트
+        """
+        if not content:
+            return
+
+        try:
+            async with self.session_factory() as db:
+                repo = LLMResponseCacheRepository(db)
+                inserted = await repo.upsert(key, model_name, temperature, prompt_version, content)
+                if inserted and await repo.count() > self.max_entries:
+                    self.stats.evictions += await repo.evict_lru(self.max_entries)
+        except Exception as e:
+            print(f"⚠️ LLM cache store failed: {e}")
+            self.stats.errors += 1
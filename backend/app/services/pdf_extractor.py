@@ -0,0 +1,155 @@
+"""
+PDF Text Extractor - 메모리 기반 병렬 PDF 텍스트 추출
+"""
+import asyncio
+import io
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
+from langchain_core.documents import Document
+from pypdf import PdfReader
+
+from app.core.config import settings
+
+# (page_content, metadata) - 프로세스 간 전달을 위해 Document 대신 기본 타입 사용
+ParsedPage = Tuple[str, dict]
+
+
+def parse_pdf_bytes(pdf_content: bytes, source_pdf_index: int) -> List[ParsedPage]:
+    """
+    PDF bytes를 페이지 단위로 파싱 (임시 파일 없이 메모리에서 처리)
+
+    프로세스 풀에서 실행되므로 모듈 최상위 함수로 유지합니다.
+
+    Args:
+        pdf_content: PDF 파일 bytes
+        source_pdf_index: 업로드된 PDF 순서
+
+    Returns:
+        List[ParsedPage]: 페이지별 (텍스트, 메타데이터)
+    """
+    reader = PdfReader(io.BytesIO(pdf_content))
+    total_pages = len(reader.pages)
+    page_labels = reader.page_labels
+
+    pages: List[ParsedPage] = []
+    for page_number, page in enumerate(reader.pages):
+        pages.append((
+            page.extract_text() or "",
+            {
+                "source": f"upload://{source_pdf_index}",
+                "page": page_number,
+                "page_label": page_labels[page_number] if page_number < len(page_labels) else str(page_number + 1),
+                "total_pages": total_pages,
+                "source_pdf_index": source_pdf_index,
+            },
+        ))
+
+    return pages
+
+
+def extract_documents(pdf_contents: List[bytes]) -> List[Document]:
+    """
+    PDF bytes 리스트를 현재 프로세스에서 순차 파싱 (스크립트/테스트용)
+
+    Args:
+        pdf_contents: PDF 파일들의 bytes 리스트
+
+    Returns:
+        List[Document]: 페이지별 Document 리스트
+    """
+    return [
+        Document(page_content=text, metadata=metadata)
+        for idx, pdf_content in enumerate(pdf_contents)
+        for text, metadata in parse_pdf_bytes(pdf_content, idx)
+    ]
+
+
+class PdfTextExtractor:
+    """
+    업로드된 PDF들을 제한된 크기의 프로세스 풀에 나눠 파싱하는 추출 엔진
+
+    CPU 작업인 PDF 파싱이 이벤트 루프를 막지 않도록 하고,
+    여러 파일은 동시에 처리합니다.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, executor: Optional[Executor] = None):
+        """
+        초기화
+
+        Args:
+            max_workers: 프로세스 풀 크기 (기본값: settings.pdf_extraction_max_workers)
+            executor: 외부에서 주입할 Executor (지정 시 max_workers 무시, 종료는 호출자 책임)
+        """
+        self._owns_executor = executor is None
+        self._executor = executor or ProcessPoolExecutor(
+            max_workers=max_workers or settings.pdf_extraction_max_workers
+        )
+
+    async def extract(self, pdf_contents: List[bytes]) -> List[Document]:
+        """
+        PDF bytes 리스트에서 텍스트 추출 (파일 단위 병렬 처리, 입력 순서 유지)
+
+        Args:
+            pdf_contents: PDF 파일들의 bytes 리스트
+
+        Returns:
+            List[Document]: source_pdf_index 메타데이터가 포함된 페이지별 Document 리스트
+        """
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(*[
+            loop.run_in_executor(self._executor, parse_pdf_bytes, pdf_content, idx)
+            for idx, pdf_content in enumerate(pdf_contents)
+        ])
+
+        return [
+            Document(page_content=text, metadata=metadata)
+            for pages in results
+            for text, metadata in pages
+        ]
+
+    def shutdown(self):
+        """
+        프로세스 풀 종료
+        """
+        if self._owns_executor:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+
+
+# 프로세스 전역 추출 엔진 (lifespan에서 생성/정리)
+_pdf_extractor: Optional[PdfTextExtractor] = None
+
+
+def init_pdf_extractor() -> PdfTextExtractor:
+    """
+    전역 PDF 추출 엔진 생성 (앱 시작 시 호출)
+
+    Returns:
+        PdfTextExtractor: 생성된 엔진
+    """
+    global _pdf_extractor
+    if _pdf_extractor is None:
+        _pdf_extractor = PdfTextExtractor()
+    return _pdf_extractor
+
+
+def close_pdf_extractor():
+    """
+    전역 PDF 추출 엔진 정리 (앱 종료 시 호출)
+    """
+    global _pdf_extractor
+    if _pdf_extractor is not None:
+        _pdf_extractor.shutdown()
+        _pdf_extractor = None
+
+
+def get_pdf_extractor() -> PdfTextExtractor:
+    """
+    전역 PDF 추출 엔진 조회 (FastAPI Dependency)
+
+    lifespan 밖(스크립트, 테스트)에서 호출되면 엔진을 지연 생성합니다.
+
+    Returns:
+        PdfTextExtractor: 전역 엔진
+    """
+    return init_pdf_extractor()
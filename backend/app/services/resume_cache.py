@@ -0,0 +1,402 @@
+"""
+Resume Cache - 채팅 턴마다 읽는 사용자별 최근 이력서(data / analysis) 프로세스 내 캐시
+"""
+import asyncio
+import copy
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Awaitable, Callable, Optional, Protocol
+
+from psycopg import AsyncConnection
+
+from app.core.config import settings
+from app.database.config import DATABASE_URL
+from app.database.models import Resume
+
+
+@dataclass
+class CachedResume:
+    """캐시에 저장되는 최근 이력서 (ORM 객체 대신 세션과 무관한 값만 보관)"""
+    resume_id: int
+    user_id: Optional[str]
+    data: dict
+    analysis: Optional[dict]
+    updated_at: datetime
+
+    @classmethod
+    def from_model(cls, resume: Resume) -> "CachedResume":
+        return cls(
+            resume_id=resume.id,
+            user_id=resume.user_id,
+            data=copy.deepcopy(resume.data),
+            analysis=copy.deepcopy(resume.analysis),
+            updated_at=resume.updated_at,
+        )
+
+    def copy(self) -> "CachedResume":
+        # 호출자가 dict를 수정해도 캐시 엔트리는 바뀌지 않도록 복사본 반환
+        return CachedResume(
+            resume_id=self.resume_id,
+            user_id=self.user_id,
+            data=copy.deepcopy(self.data),
+            analysis=copy.deepcopy(self.analysis),
+            updated_at=self.updated_at,
+        )
+
+
+class ResumeCacheStats:
+    """
+    프로세스 단위 캐시 / 채팅 턴 DB 왕복 카운터
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.channel_errors = 0
+        self.turns = 0
+        self.turn_queries = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def record_turn(self, queries: int):
+        """채팅 한 턴에서 실행된 DB 쿼리 수 기록"""
+        self.turns += 1
+        self.turn_queries += queries
+
+    def snapshot(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "channel_errors": self.channel_errors,
+            "hit_ratio": round(self.hit_ratio, 4),
+            "turns": self.turns,
+            "db_queries_per_turn": round(self.turn_queries / self.turns, 2) if self.turns else 0.0,
+        }
+
+
+# 프로세스 전역 카운터
+resume_cache_stats = ResumeCacheStats()
+
+
+class InvalidationChannel(Protocol):
+    """
+    워커 프로세스 간 캐시 무효화 채널
+
+    publish한 user_id는 다른 프로세스의 start(on_invalidate) 콜백으로 전달되고,
+    알림을 놓쳤을 수 있으면(수신 연결 재접속) on_reset으로 전체 엔트리를 버리게 합니다.
+    """
+
+    async def start(self, on_invalidate: Callable[[str], None], on_reset: Callable[[], None]) -> None: ...
+
+    async def publish(self, user_id: str) -> None: ...
+
+    async def close(self) -> None: ...
+
+
+class LocalInvalidationChannel:
+    """단일 프로세스용 채널 (다른 프로세스로 전달하지 않음)"""
+
+    async def start(self, on_invalidate: Callable[[str], None], on_reset: Callable[[], None]) -> None:
+        return None
+
+    async def publish(self, user_id: str) -> None:
+        return None
+
+    async def close(self) -> None:
+        return None
+
+
+class PostgresInvalidationChannel:
+    """
+    Postgres LISTEN/NOTIFY 채널
+
+    전용 커넥션 하나로 LISTEN하고, 발행은 별도 커넥션에서 pg_notify로 보냅니다.
+    payload는 "<프로세스 ID>:<user_id>"이며 자기 자신이 보낸 알림은 무시합니다.
+
+    LISTEN 연결이 끊기면 오류를 기록하고 지수 백오프로 다시 연결합니다.
+    끊긴 동안의 알림은 받을 수 없으므로 재연결 후 on_reset으로 로컬 엔트리를 모두 버립니다.
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        channel: str = "resume_cache",
+        stats: Optional[ResumeCacheStats] = None,
+        reconnect_delay: float = 1.0,
+        max_reconnect_delay: float = 30.0,
+    ):
+        self.dsn = dsn
+        self.channel = channel
+        self.origin = uuid.uuid4().hex[:12]
+        self.stats = stats or resume_cache_stats
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self._listen_conn: Optional[AsyncConnection] = None
+        self._publish_conn: Optional[AsyncConnection] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self, on_invalidate: Callable[[str], None], on_reset: Callable[[], None]) -> None:
+        self._publish_conn = await AsyncConnection.connect(self.dsn, autocommit=True)
+        await self._connect_listener()
+        self._task = asyncio.create_task(self._listen(on_invalidate, on_reset))
+
+    async def _connect_listener(self):
+        self._listen_conn = await AsyncConnection.connect(self.dsn, autocommit=True)
+        await self._listen_conn.execute(f'LISTEN "{self.channel}"')
+
+    async def _listen(self, on_invalidate: Callable[[str], None], on_reset: Callable[[], None]):
+        delay = self.reconnect_delay
+        while True:
+            try:
+                if self._listen_conn is None:
+                    await self._connect_listener()
+                    # 끊긴 동안 놓친 알림이 있을 수 있으므로 로컬 엔트리 전체 무효화
+                    on_reset()
+                    print("✅ Resume cache invalidation listener reconnected")
+                delay = self.reconnect_delay
+
+                assert self._listen_conn is not None
+                async for notify in self._listen_conn.notifies():
+                    origin, _, user_id = notify.payload.partition(":")
+                    if origin != self.origin:
+                        on_invalidate(user_id)
+                raise ConnectionError("LISTEN connection closed")
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # 재연결 전까지 다른 워커의 변경은 TTL 만료 후에야 반영됨
+                self.stats.channel_errors += 1
+                print(f"⚠️ Resume cache invalidation listener failed, reconnecting in {delay:.1f}s: {e}")
+                if self._listen_conn is not None:
+                    try:
+                        await self._listen_conn.close()
+                    except Exception:
+                        pass
+                    self._listen_conn = None
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.max_reconnect_delay)
+
+    async def publish(self, user_id: str) -> None:
+        if self._publish_conn is None:
+            return
+        try:
+            await self._publish_conn.execute(
+                "SELECT pg_notify(%s, %s)", (self.channel, f"{self.origin}:{user_id}")
+            )
+        except Exception as e:
+            # 발행 실패 시 다른 워커는 TTL 만료까지 이전 데이터를 볼 수 있음
+            print(f"⚠️ Resume cache invalidation publish failed: {e}")
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, Exception):
+                pass
+        for conn in (self._listen_conn, self._publish_conn):
+            if conn is not None:
+                await conn.close()
+        self._task = self._listen_conn = self._publish_conn = None
+
+
+class ResumeCache:
+    """
+    user_id별 최근 이력서 read-through 캐시 (LRU + TTL)
+
+    - 키는 user_id만 사용 (로드 시점의 updated_at은 값으로만 보관하고 조회 때 DB와 비교하지 않음)
+    - 따라서 최신성은 무효화로만 보장: 이력서 저장/수정/삭제 시 invalidate(user_id)로 로컬 엔트리를 지우고 채널로 다른 워커에 전파
+    - TTL은 다른 워커의 무효화 알림을 놓쳤을 때의 최대 지연 시간 (채널 재연결 시에는 전체 엔트리를 버림)
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+        channel: Optional[InvalidationChannel] = None,
+        stats: Optional[ResumeCacheStats] = None,
+        enabled: Optional[bool] = None,
+    ):
+        """
+        초기화
+
+        Args:
+            max_entries: 최대 엔트리 수 (기본값: settings.resume_cache_max_entries)
+            ttl_seconds: 엔트리 유지 시간 (기본값: settings.resume_cache_ttl_seconds)
+            channel: 워커 간 무효화 채널 (기본값: 로컬 전용)
+            stats: 카운터 (기본값: 프로세스 전역 카운터)
+            enabled: 캐시 사용 여부 (기본값: settings.resume_cache_enabled)
+        """
+        self.max_entries = max_entries or settings.resume_cache_max_entries
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else settings.resume_cache_ttl_seconds
+        self.channel = channel or LocalInvalidationChannel()
+        self.stats = stats or resume_cache_stats
+        self.enabled = settings.resume_cache_enabled if enabled is None else enabled
+        self._entries: "OrderedDict[str, tuple[float, CachedResume]]" = OrderedDict()
+
+        # 무효화 시각(논리 시계): 로드 중에 무효화된 사용자의 이전 데이터를 저장하지 않기 위한 기록
+        # 최근 max_entries명만 보관하고, 밀려난 기록의 최대 시각은 _invalidation_floor로 대신 비교
+        self._clock = 0
+        self._invalidated: "OrderedDict[str, int]" = OrderedDict()
+        self._invalidation_floor = 0
+
+    async def get_or_load(
+        self,
+        user_id: str,
+        loader: Callable[[], Awaitable[Optional[Resume]]]
+    ) -> Optional[CachedResume]:
+        """
+        캐시 조회, miss면 loader로 DB에서 읽어 저장
+
+        Args:
+            user_id: 사용자 ID
+            loader: 최근 이력서를 읽는 함수 (예: ResumeRepository.get_recent_resume_by_user_id)
+
+        Returns:
+            Optional[CachedResume]: 최근 이력서 복사본 (없으면 None)
+        """
+        entry = self._entries.get(user_id) if self.enabled else None
+        if entry is not None:
+            expires_at, cached = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(user_id)
+                self.stats.hits += 1
+                return cached.copy()
+            del self._entries[user_id]
+            self.stats.evictions += 1
+
+        self.stats.misses += 1
+        started_at = self._clock
+        resume = await loader()
+        if resume is None:
+            return None
+
+        cached = CachedResume.from_model(resume)
+        # 로드하는 동안 무효화되었으면 이전 데이터일 수 있으므로 저장하지 않음
+        if self.enabled and self._invalidated.get(user_id, self._invalidation_floor) <= started_at:
+            self._store(user_id, cached)
+        return cached.copy()
+
+    def _store(self, user_id: str, cached: CachedResume):
+        self._entries[user_id] = (time.monotonic() + self.ttl_seconds, cached)
+        self._entries.move_to_end(user_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def discard(self, user_id: str) -> Optional[CachedResume]:
+        """
+        로컬 엔트리 삭제 (다른 워커의 무효화 알림 수신 시 호출)
+
+        Args:
+            user_id: 사용자 ID
+
+        Returns:
+            Optional[CachedResume]: 삭제된 엔트리
+        """
+        self._clock += 1
+        self._invalidated[user_id] = self._clock
+        self._invalidated.move_to_end(user_id)
+        if len(self._invalidated) > self.max_entries:
+            _, self._invalidation_floor = self._invalidated.popitem(last=False)
+
+        entry = self._entries.pop(user_id, None)
+        if entry is None:
+            return None
+        self.stats.invalidations += 1
+        return entry[1]
+
+    async def invalidate(self, user_id: Optional[str], updated: Optional[Resume] = None):
+        """
+        이력서 변경 후 로컬 엔트리 갱신 + 다른 워커로 무효화 전파
+
+        updated가 캐시에 있던 이력서와 같은 행이면 commit된 새 값으로 바로 교체(write-through)해
+        같은 워커의 다음 채팅 턴이 DB를 다시 읽지 않도록 합니다.
+
+        Args:
+            user_id: 변경된 이력서의 사용자 ID
+            updated: commit 후 refresh된 Resume (수정한 경우)
+        """
+        if user_id is None:
+            return
+
+        previous = self.discard(user_id)
+        if self.enabled and updated is not None and previous is not None and previous.resume_id == updated.id:
+            self._store(user_id, CachedResume.from_model(updated))
+
+        await self.channel.publish(user_id)
+
+    def discard_all(self):
+        """
+        로컬 엔트리 전체 삭제 (무효화 알림을 놓쳤을 수 있을 때 호출)
+        """
+        self._clock += 1
+        self._invalidated.clear()
+        self._invalidation_floor = self._clock
+        self.stats.invalidations += len(self._entries)
+        self._entries.clear()
+
+    async def start(self):
+        await self.channel.start(self.discard, self.discard_all)
+
+    async def close(self):
+        await self.channel.close()
+        self._entries.clear()
+
+
+# 프로세스 전역 캐시 (lifespan에서 생성/정리)
+_resume_cache: Optional[ResumeCache] = None
+
+
+async def init_resume_cache() -> ResumeCache:
+    """
+    전역 이력서 캐시 생성 및 무효화 채널 시작 (앱 시작 시 호출)
+
+    Returns:
+        ResumeCache: 전역 캐시
+    """
+    global _resume_cache
+    if _resume_cache is None:
+        channel: InvalidationChannel = LocalInvalidationChannel()
+        if settings.resume_cache_invalidation == "postgres":
+            channel = PostgresInvalidationChannel(DATABASE_URL)
+
+        _resume_cache = ResumeCache(channel=channel)
+        await _resume_cache.start()
+    return _resume_cache
+
+
+async def close_resume_cache():
+    """
+    전역 이력서 캐시 정리 (앱 종료 시 호출)
+    """
+    global _resume_cache
+    if _resume_cache is not None:
+        await _resume_cache.close()
+        _resume_cache = None
+
+
+def get_resume_cache() -> ResumeCache:
+    """
+    전역 이력서 캐시 조회
+
+    lifespan 밖(스크립트, 테스트)에서 호출되면 로컬 채널 캐시를 지연 생성합니다.
+
+    Returns:
+        ResumeCache: 전역 캐시
+    """
+    global _resume_cache
+    if _resume_cache is None:
+        _resume_cache = ResumeCache()
+    return _resume_cache
@@ -0,0 +1,372 @@
+"""
+Resume Matcher - 이력서 항목 임베딩 인덱스 + JD 대비 NumPy 행렬 스코어링
+"""
+import hashlib
+import json
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.database.models import Resume, ResumeEmbedding
+from app.models.schemas import ItemMatch, JDMatch
+from app.repositories import ResumeEmbeddingRepository
+from app.services.embeddings import Embedder, aembed, get_embedder
+
+ITEM_KINDS = ("project", "skill", "career")
+
+# JD 적합도 = 종류별 상위 항목 평균 유사도의 가중 평균 (항목이 없는 종류는 제외하고 다시 정규화)
+FIT_WEIGHTS = {"project": 0.6, "skill": 0.3, "career": 0.1}
+
+
+@dataclass
+class ResumeItem:
+    """임베딩 대상 이력서 항목"""
+    kind: str
+    key: str
+    label: str
+    content: str
+
+
+def resume_items(data: dict) -> List[ResumeItem]:
+    """
+    Resume.data(ResumeExtraction JSON)에서 프로젝트 / 기술 / 경력 항목 추출
+
+    Args:
+        data: 이력서 데이터
+
+    Returns:
+        List[ResumeItem]: 항목 리스트 (같은 종류 / 키는 처음 것만)
+    """
+    items: List[ResumeItem] = []
+    for project in data.get("projects") or []:
+        parts = [
+            project.get("name"), project.get("role"), project.get("company"),
+            project.get("situation"), project.get("task"),
+            *(project.get("actions") or []), *(project.get("results") or []),
+            " ".join(project.get("tech_stack") or []),
+        ]
+        items.append(ResumeItem(
+            "project", str(project.get("id") or project.get("name")), project.get("name") or "",
+            "\n".join(str(part) for part in parts if part),
+        ))
+    for skill in data.get("skills") or []:
+        name = skill.get("name") or ""
+        items.append(ResumeItem("skill", name, name, f"{name} ({skill.get('category', '')})"))
+    for idx, career in enumerate(data.get("career") or []):
+        parts = [career.get("company"), career.get("position"), career.get("description")]
+        items.append(ResumeItem(
+            "career", f"career_{idx}", f"{career.get('company', '')} {career.get('position', '')}".strip(),
+            "\n".join(str(part) for part in parts if part),
+        ))
+
+    seen = set()
+    unique = []
+    for item in items:
+        if item.key and (item.kind, item.key) not in seen:
+            seen.add((item.kind, item.key))
+            unique.append(item)
+    return unique
+
+
+def content_hash(model_name: str, content: str) -> str:
+    return hashlib.sha256(f"{model_name}|{content}".encode()).hexdigest()
+
+
+def cosine_scores(item_vectors: np.ndarray, query_vectors: np.ndarray) -> np.ndarray:
+    """
+    (쿼리 수 × 항목 수) 유사도 행렬 - 두 행렬 모두 L2 정규화되어 있으므로 행렬곱 한 번이 코사인 유사도
+
+    Args:
+        item_vectors: (항목 수 × 차원) 이력서 항목 임베딩
+        query_vectors: (쿼리 수 × 차원) JD 임베딩
+
+    Returns:
+        np.ndarray: 유사도 행렬
+    """
+    return query_vectors @ item_vectors.T
+
+
+def top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    점수의 마지막 축에서 상위 k개 위치 (점수 높은 순, 전체 정렬 없이 argpartition)
+
+    Args:
+        scores: (항목 수,) 또는 (쿼리 수 × 항목 수) 점수
+        k: 선택할 개수 (항목 수보다 크면 전체)
+
+    Returns:
+        np.ndarray: (..., min(k, 항목 수)) 위치
+    """
+    count = scores.shape[-1]
+    if k <= 0 or count == 0:
+        return np.zeros(scores.shape[:-1] + (0,), dtype=np.int64)
+    if k < count:
+        candidates = np.argpartition(-scores, k - 1, axis=-1)[..., :k]
+    else:
+        candidates = np.broadcast_to(np.arange(count), scores.shape)
+    order = np.argsort(-np.take_along_axis(scores, candidates, axis=-1), axis=-1, kind="stable")
+    return np.take_along_axis(candidates, order, axis=-1)
+
+
+@dataclass
+class ResumeIndex:
+    """한 이력서의 항목 임베딩 행렬 (항목 순서는 items와 같음)"""
+    resume_id: int
+    items: List[ResumeItem]
+    matrix: np.ndarray  # (항목 수 × 차원)
+
+    def kind_mask(self, kind: str) -> np.ndarray:
+        return np.array([item.kind == kind for item in self.items], dtype=bool)
+
+    def match(self, query_vector: np.ndarray, top_k: Dict[str, int]) -> JDMatch:
+        """
+        JD 임베딩 하나에 대해 종류별 상위 항목 선택
+
+        Args:
+            query_vector: (차원,) JD 임베딩
+            top_k: 종류별 개수 ({"project": 3, "skill": 15, "career": 5})
+
+        Returns:
+            JDMatch: 종류별 상위 항목과 적합도
+        """
+        return self.match_many(query_vector[np.newaxis, :], top_k)[0]
+
+    def match_many(self, query_vectors: np.ndarray, top_k: Dict[str, int]) -> List[JDMatch]:
+        """
+        여러 JD를 한 번에 스코어링 (행렬곱 한 번 + 종류별 argpartition)
+
+        Args:
+            query_vectors: (JD 수 × 차원) JD 임베딩
+            top_k: 종류별 개수
+
+        Returns:
+            List[JDMatch]: JD 순서대로 종류별 상위 항목과 적합도
+        """
+        scores = cosine_scores(self.matrix, query_vectors)
+        fit = np.zeros(len(query_vectors))
+        total_weight = 0.0
+        ranked: Dict[str, List[List[ItemMatch]]] = {}
+        for kind in ITEM_KINDS:
+            positions = np.flatnonzero(self.kind_mask(kind))
+            kind_scores = scores[:, positions]
+            # 적합도는 표시 개수와 무관하게 설정된 top-k(경력은 전체) 평균으로 계산
+            best = top_k_indices(kind_scores, top_k.get(kind, 0))
+            if positions.size:
+                fit_k = top_k_indices(kind_scores, top_k.get(kind) or positions.size)
+                fit += FIT_WEIGHTS[kind] * np.take_along_axis(kind_scores, fit_k, axis=1).mean(axis=1)
+                total_weight += FIT_WEIGHTS[kind]
+            ranked[kind] = [
+                [
+                    ItemMatch(
+                        kind=kind, key=self.items[positions[idx]].key, label=self.items[positions[idx]].label,
+                        score=round(float(row_scores[idx]), 4),
+                    )
+                    for idx in row
+                ]
+                for row, row_scores in zip(best, kind_scores)
+            ]
+        if total_weight:
+            fit /= total_weight
+
+        return [
+            JDMatch(
+                fit_score=round(float(fit[row]), 4),
+                projects=ranked["project"][row], skills=ranked["skill"][row], careers=ranked["career"][row],
+            )
+            for row in range(len(query_vectors))
+        ]
+
+
+class ResumeIndexCache:
+    """
+    프로세스 내 ResumeIndex LRU 캐시
+
+    키에 이력서 데이터 지문과 임베딩 모델이 포함되므로 이력서가 바뀌면 자연히 miss가 되고,
+    같은 이력서로 JD를 여러 번 매칭할 때는 저장된 임베딩 조회 / 행렬 구성을 건너뜁니다.
+    """
+
+    def __init__(self, max_entries: Optional[int] = None):
+        """
+        초기화
+
+        Args:
+            max_entries: 최대 엔트리 수 (기본값: settings.resume_index_cache_max_entries)
+        """
+        self.max_entries = max_entries or settings.resume_index_cache_max_entries
+        self._entries: "OrderedDict[tuple, ResumeIndex]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def key(resume: Resume, embedder: Embedder) -> tuple:
+        fingerprint = hashlib.sha256(
+            json.dumps(resume.data, sort_keys=True, ensure_ascii=False, default=str).encode()
+        ).hexdigest()
+        return resume.id, embedder.model_name, embedder.dimensions, fingerprint
+
+    def get(self, key: tuple) -> Optional[ResumeIndex]:
+        index = self._entries.get(key)
+        if index is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return index
+
+    def put(self, key: tuple, index: ResumeIndex):
+        self._entries[key] = index
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        self._entries.clear()
+
+    def snapshot(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+        }
+
+
+# 프로세스 전역 ResumeIndex 캐시
+resume_index_cache = ResumeIndexCache()
+
+
+class ResumeMatcher:
+    """
+    이력서 항목 임베딩 인덱스 관리 + JD 매칭
+
+    - 항목별 임베딩은 resume_embeddings에 저장되며, 내용 해시가 바뀐 항목만 다시 임베딩합니다.
+    - JD 매칭은 사용자의 모든 항목 임베딩 행렬과 JD 임베딩의 행렬곱 한 번으로 점수를 계산합니다.
+    """
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        embedder: Optional[Embedder] = None,
+        cache: Optional[ResumeIndexCache] = None
+    ):
+        """
+        초기화
+
+        Args:
+            db: SQLAlchemy 세션
+            embedder: 임베딩 모델 (기본값: 전역 모델)
+            cache: ResumeIndex 캐시 (기본값: 프로세스 전역 캐시)
+        """
+        self.repo = ResumeEmbeddingRepository(db)
+        self.embedder = embedder or get_embedder()
+        self.cache = cache or resume_index_cache
+
+    async def index_resume(self, resume: Resume) -> ResumeIndex:
+        """
+        이력서 항목 임베딩을 최신 내용으로 맞춘 뒤 행렬로 반환
+
+        Args:
+            resume: 이력서
+
+        Returns:
+            ResumeIndex: 항목 임베딩 행렬
+        """
+        cache_key = self.cache.key(resume, self.embedder)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        items = resume_items(resume.data)
+        stored = {(row.kind, row.item_key): row for row in await self.repo.list_by_resume(resume.id)}
+
+        vectors: Dict[Tuple[str, str], np.ndarray] = {}
+        stale: List[ResumeItem] = []
+        removed: List[int] = []
+        for item in items:
+            row = stored.pop((item.kind, item.key), None)
+            if row is not None and row.content_hash == content_hash(self.embedder.model_name, item.content):
+                vectors[(item.kind, item.key)] = np.asarray(row.embedding, dtype=np.float32)
+                continue
+            stale.append(item)
+            if row is not None:
+                removed.append(row.id)
+        removed.extend(row.id for row in stored.values())
+
+        if stale or removed:
+            embedded = await aembed(self.embedder, [item.content for item in stale])
+            added = []
+            for item, vector in zip(stale, embedded):
+                vectors[(item.kind, item.key)] = vector
+                added.append(ResumeEmbedding(
+                    kind=item.kind,
+                    item_key=item.key,
+                    content=item.content,
+                    content_hash=content_hash(self.embedder.model_name, item.content),
+                    embedding=vector.tolist(),
+                ))
+            await self.repo.sync(resume.id, resume.user_id, added, removed)
+            print(f"🧭 Resume {resume.id} embeddings: {len(added)} embedded, {len(removed)} removed, {len(items) - len(added)} reused")
+
+        matrix = (
+            np.stack([vectors[(item.kind, item.key)] for item in items])
+            if items else np.zeros((0, self.embedder.dimensions), dtype=np.float32)
+        )
+        index = ResumeIndex(resume_id=resume.id, items=items, matrix=matrix)
+        self.cache.put(cache_key, index)
+        return index
+
+    async def match(
+        self,
+        resume: Resume,
+        jd_text: str,
+        top_k_projects: Optional[int] = None,
+        top_k_skills: Optional[int] = None,
+    ) -> JDMatch:
+        """
+        JD와 관련도가 높은 프로젝트 / 기술 / 경력 선택
+
+        Args:
+            resume: 이력서
+            jd_text: 채용 공고 텍스트
+            top_k_projects: 선택할 프로젝트 수 (기본값: settings.generate_top_k_projects)
+            top_k_skills: 선택할 기술 수 (기본값: settings.generate_top_k_skills)
+
+        Returns:
+            JDMatch: 종류별 상위 항목 (관련도 순)
+        """
+        return (await self.match_many(resume, [jd_text], top_k_projects, top_k_skills))[0]
+
+    async def match_many(
+        self,
+        resume: Resume,
+        jd_texts: Sequence[str],
+        top_k_projects: Optional[int] = None,
+        top_k_skills: Optional[int] = None,
+    ) -> List[JDMatch]:
+        """
+        여러 JD를 한 번에 임베딩하고 이력서 항목 행렬과 한 번에 스코어링
+
+        Args:
+            resume: 이력서
+            jd_texts: 채용 공고 텍스트 리스트
+            top_k_projects: JD별 선택할 프로젝트 수 (기본값: settings.generate_top_k_projects)
+            top_k_skills: JD별 선택할 기술 수 (기본값: settings.generate_top_k_skills)
+
+        Returns:
+            List[JDMatch]: JD 순서대로 종류별 상위 항목과 적합도
+        """
+        index = await self.index_resume(resume)
+        queries = await aembed(self.embedder, list(jd_texts))
+        return index.match_many(queries, {
+            "project": top_k_projects if top_k_projects is not None else settings.generate_top_k_projects,
+            "skill": top_k_skills if top_k_skills is not None else settings.generate_top_k_skills,
+            "career": len(index.items),  # 경력은 모두 유지하고 순서만 정렬
+        })
@@ -0,0 +1,107 @@
+"""
+Resume Patch - 질문 대상(프로젝트 / 기술 스택)만 LLM에 보내고 돌아온 패치를 로컬에서 적용
+"""
+import copy
+from typing import List, Optional
+
+from app.models.schemas import ResumeExtraction, ResumePatch
+from app.services.chunked_extraction import normalize_key
+
+# 프로젝트 없이 이 키워드가 들어간 카테고리의 질문은 기술 스택 섹션만 대상으로 함
+SKILL_CATEGORY_KEYWORDS = ("기술", "skill")
+
+
+def find_project(resume_data: dict, project_id: Optional[str]) -> Optional[dict]:
+    """
+    project_id에 해당하는 프로젝트 조회
+
+    Args:
+        resume_data: ResumeExtraction dict
+        project_id: 프로젝트 ID (예: proj_001)
+
+    Returns:
+        Optional[dict]: 프로젝트 dict (없으면 None)
+    """
+    if not project_id:
+        return None
+    return next((p for p in resume_data.get("projects", []) if p.get("id") == project_id), None)
+
+
+def select_patch_target(resume_data: dict, question: dict) -> Optional[dict]:
+    """
+    질문이 다루는 이력서 부분 선택
+
+    Args:
+        resume_data: ResumeExtraction dict
+        question: ImprovementQuestion dict
+
+    Returns:
+        Optional[dict]: LLM에 보낼 대상 데이터 (범위를 좁힐 수 없으면 None → 전체 문서 업데이트)
+    """
+    skills = [skill["name"] for skill in resume_data.get("skills", [])]
+
+    project = find_project(resume_data, question.get("project_id"))
+    if project is not None:
+        return {"project": project, "skills": skills}
+
+    category = question.get("category", "").casefold()
+    if any(keyword in category for keyword in SKILL_CATEGORY_KEYWORDS):
+        return {"skills": skills}
+
+    return None
+
+
+def _append_new(values: List[str], additions: List[str]) -> List[str]:
+    seen = {normalize_key(value) for value in values}
+    for value in additions:
+        if value and normalize_key(value) not in seen:
+            seen.add(normalize_key(value))
+            values.append(value)
+    return values
+
+
+def apply_resume_patch(resume_data: dict, patch: ResumePatch, project_id: Optional[str] = None) -> dict:
+    """
+    패치를 이력서에 적용 (원본은 변경하지 않음)
+
+    - situation / task / role: 값이 있으면 교체
+    - add_*: 정규화 키 기준으로 없는 항목만 추가
+    - 대상 프로젝트의 STAR 완성도(is_complete)를 재계산
+
+    Args:
+        resume_data: ResumeExtraction dict
+        patch: LLM이 생성한 패치
+        project_id: 패치 대상 프로젝트 ID (None이면 기술 스택만 적용)
+
+    Returns:
+        dict: 스키마 검증을 통과한 업데이트된 ResumeExtraction dict
+    """
+    updated = copy.deepcopy(resume_data)
+
+    project = find_project(updated, project_id)
+    if project is not None:
+        for field in ("situation", "task", "role"):
+            value = getattr(patch, field)
+            if value:
+                project[field] = value
+
+        project["actions"] = _append_new(project.get("actions", []), patch.add_actions)
+        project["results"] = _append_new(project.get("results", []), patch.add_results)
+        project["tech_stack"] = _append_new(project.get("tech_stack", []), patch.add_tech_stack)
+
+        star = [bool(project.get(field)) for field in ("situation", "task", "actions", "results")]
+        project["is_complete"] = {
+            "situation": star[0],
+            "task": star[1],
+            "actions": star[2],
+            "results": star[3],
+            "score": 0.25 * sum(star),
+        }
+
+    known_skills = {normalize_key(skill["name"]) for skill in updated.get("skills", [])}
+    for skill in patch.add_skills:
+        if normalize_key(skill.name) not in known_skills:
+            known_skills.add(normalize_key(skill.name))
+            updated.setdefault("skills", []).append(skill.model_dump(mode="json"))
+
+    return ResumeExtraction.model_validate(updated).model_dump(mode="json")
@@ -0,0 +1,319 @@
+"""
+Upload Job Queue - 이력서 업로드 백그라운드 파이프라인 (extract → save → analyze)
+"""
+import asyncio
+import uuid
+from collections import defaultdict
+from typing import AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.fair_share import UserQuotaExceeded, UserRoundRobinQueue, llm_user
+from app.core.llm import ChatModelPool, get_llm_pool
+from app.core.rate_limit import LLMRateLimitExceeded, Priority, llm_priority
+from app.database.config import SessionLocal
+from app.database.models import UploadJob
+from app.models.schemas import ResumeExtraction
+from app.repositories import UploadJobRepository
+from app.services.pdf_extractor import PdfTextExtractor, get_pdf_extractor
+from app.services.resume_matcher import ResumeMatcher
+from app.services.user_resume_service import UserResumeService
+
+TERMINAL_STATUSES = {"succeeded", "failed"}
+
+
+def job_snapshot(job: UploadJob) -> dict:
+    """
+    작업 상태 응답 dict
+
+    Args:
+        job: 업로드 작업
+
+    Returns:
+        dict: 상태 정보
+    """
+    return {
+        "job_id": job.id,
+        "session_id": job.session_id,
+        "user_id": job.user_id,
+        "status": job.status,
+        "stage": job.stage,
+        "attempts": job.attempts,
+        "result": job.result,
+        "error": job.error,
+        "updated_at": job.updated_at.isoformat() if job.updated_at else None,
+    }
+
+
+class UploadJobQueue:
+    """
+    제한된 수의 워커가 업로드 작업을 순서대로 처리하는 큐
+
+    - 작업 상태와 단계별 중간 결과는 DB(upload_jobs)에 저장됩니다.
+    - 워커는 lease를 잡고 실행하며, 프로세스가 재시작되면 대기 중이거나
+      lease가 만료된 작업을 다시 큐에 넣어 마지막으로 끝난 단계 다음부터 이어갑니다.
+    - 대기 작업은 사용자별로 번갈아 꺼내므로 한 사용자가 연달아 올린 작업이 다른 사용자의 작업을 막지 않습니다.
+      LLM 토큰 할당량을 다 쓴 사용자의 작업은 실패 처리하지 않고 할당량 기간이 끝난 뒤 다시 큐에 넣습니다.
+    - 같은 프로세스의 구독자에게는 단계 전환 이벤트와, 스트리밍 파싱으로 먼저 완성된
+      필드(overall_summary, improvement_questions[0] 등)를 "partial" 이벤트로 바로 전달합니다.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession] = SessionLocal,
+        llm: Optional[ChatModelPool] = None,
+        pdf_extractor: Optional[PdfTextExtractor] = None,
+        workers: Optional[int] = None,
+        lease_seconds: Optional[int] = None,
+        max_attempts: Optional[int] = None,
+    ):
+        """
+        초기화
+
+        Args:
+            session_factory: 워커가 사용할 DB 세션 팩토리
+            llm: 공유 Chat Model 풀 (기본값: 전역 풀)
+            pdf_extractor: PDF 추출 엔진 (기본값: 전역 엔진)
+            workers: 동시 처리 워커 수 (기본값: settings.upload_job_workers)
+            lease_seconds: 작업 lease 시간 (기본값: settings.upload_job_lease_seconds)
+            max_attempts: 최대 실행 시도 횟수 (기본값: settings.upload_job_max_attempts)
+        """
+        self.session_factory = session_factory
+        self.llm = llm or get_llm_pool()
+        self.pdf_extractor = pdf_extractor or get_pdf_extractor()
+        self.workers = workers or settings.upload_job_workers
+        self.lease_seconds = lease_seconds or settings.upload_job_lease_seconds
+        self.max_attempts = max_attempts or settings.upload_job_max_attempts
+
+        self._queue: UserRoundRobinQueue[str] = UserRoundRobinQueue()
+        self._tasks: List[asyncio.Task] = []
+        self._subscribers: Dict[str, List[asyncio.Queue]] = defaultdict(list)
+
+    async def start(self):
+        """
+        워커 실행 및 미완료 작업 복구
+        """
+        async with self.session_factory() as db:
+            recoverable = await UploadJobRepository(db).list_recoverable()
+
+        for job_id, user_id in recoverable:
+            self._queue.put_nowait(user_id, job_id)
+        if recoverable:
+            print(f"♻️  Recovered {len(recoverable)} upload job(s)")
+
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def stop(self):
+        """
+        워커 종료 (실행 중이던 작업은 lease 만료 후 다음 시작 시 복구됨)
+        """
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def submit(
+        self,
+        db: AsyncSession,
+        files: List[Tuple[Optional[str], bytes]],
+        user_id: Optional[str] = None,
+        session_id: Optional[str] = None
+    ) -> UploadJob:
+        """
+        업로드 작업 등록 후 큐에 추가
+
+        Args:
+            db: SQLAlchemy 세션
+            files: (파일명, PDF bytes) 리스트
+            user_id: 사용자 ID (Optional)
+            session_id: 세션 ID (없으면 생성)
+
+        Returns:
+            UploadJob: 등록된 작업
+        """
+        job = await UploadJobRepository(db).create(
+            job_id=f"job-{uuid.uuid4()}",
+            session_id=session_id or f"session-{uuid.uuid4()}",
+            files=files,
+            user_id=user_id,
+        )
+        self._queue.put_nowait(job.user_id, job.id)
+        return job
+
+    async def events(self, job_id: str, poll_interval: float = 2.0) -> AsyncIterator[dict]:
+        """
+        작업 상태 이벤트 스트림 (현재 상태 → 단계 전환 … → 종료 상태)
+
+        다른 워커 프로세스에서 실행 중인 작업도 poll_interval마다 DB를 다시 읽어 전달합니다.
+
+        Args:
+            job_id: 작업 ID
+            poll_interval: 이벤트가 없을 때 DB 재조회 간격 (초)
+
+        Yields:
+            dict: {"event": 이벤트 종류, "data": 상태 정보}
+        """
+        subscriber: asyncio.Queue = asyncio.Queue()
+        self._subscribers[job_id].append(subscriber)
+
+        try:
+            last = await self._load_snapshot(job_id)
+            if last is None:
+                return
+            yield {"event": "status", "data": last}
+
+            while last["status"] not in TERMINAL_STATUSES:
+                try:
+                    event = await asyncio.wait_for(subscriber.get(), timeout=poll_interval)
+                except asyncio.TimeoutError:
+                    snapshot = await self._load_snapshot(job_id)
+                    if snapshot is None or snapshot == last:
+                        continue
+                    event = {"event": "status", "data": snapshot}
+
+                if event["event"] == "status":
+                    last = event["data"]
+                yield event
+        finally:
+            self._subscribers[job_id].remove(subscriber)
+            if not self._subscribers[job_id]:
+                del self._subscribers[job_id]
+
+    async def _load_snapshot(self, job_id: str) -> Optional[dict]:
+        async with self.session_factory() as db:
+            job = await UploadJobRepository(db).get(job_id)
+            return job_snapshot(job) if job else None
+
+    def _publish(self, job_id: str, event: str, data: dict):
+        for subscriber in self._subscribers.get(job_id, []):
+            subscriber.put_nowait({"event": event, "data": data})
+
+    async def _worker(self):
+        while True:
+            user_id, job_id = await self._queue.get()
+            try:
+                # 추출 / 분석 LLM 호출은 채팅 턴보다 뒤에 Rate Limit 버킷을 받고, 사용자 할당량에 집계됨
+                with llm_priority(Priority.BACKGROUND), llm_user(user_id):
+                    await self._run(job_id)
+            except Exception as e:
+                print(f"⚠️ Upload job {job_id} crashed: {e}")
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job_id: str):
+        async with self.session_factory() as db:
+            repo = UploadJobRepository(db)
+
+            # 다른 워커가 이미 처리 중이면 건너뜀
+            if not await repo.claim(job_id, self.lease_seconds):
+                return
+
+            job = await repo.get(job_id)
+            if job is None:
+                return
+
+            if job.attempts > self.max_attempts:
+                job = await repo.finish(job, "failed", error="최대 재시도 횟수를 초과했습니다.")
+                self._publish(job.id, "status", job_snapshot(job))
+                return
+
+            service = UserResumeService(db, llm=self.llm, pdf_extractor=self.pdf_extractor)
+
+            try:
+                # 1. extract: PDF 파싱 + 구조화 추출
+                if job.extraction is None:
+                    job = await self._advance(repo, job, stage="extract")
+                    documents = await service.extract_text_from_pdfs(await repo.get_file_contents(job.id))
+                    resume_data = await service.create_resume_knowledge_base(
+                        documents,
+                        on_event=lambda event: self._publish(job_id, "partial", {"stage": "extract", **event}),
+                    )
+                    job = await repo.save_progress(job, self.lease_seconds, extraction=resume_data.model_dump(mode="json"))
+
+                # 2. save: 이력서 저장
+                if job.resume_id is None:
+                    job = await self._advance(repo, job, stage="save")
+                    saved_resume = await service.save_resume_knowledge_base(
+                        ResumeExtraction.model_validate(job.extraction), job.user_id
+                    )
+                    job = await repo.save_progress(job, self.lease_seconds, resume_id=saved_resume.id)
+
+                    # JD 매칭용 항목 임베딩 미리 계산 (실패해도 생성 시점에 다시 계산)
+                    try:
+                        await ResumeMatcher(db).index_resume(saved_resume)
+                    except Exception as e:
+                        await db.rollback()
+                        job = await repo.get(job_id)  # rollback으로 만료된 속성 다시 로드
+                        print(f"⚠️ Resume embedding index failed: {e}")
+
+                # 3. analyze: 개선 질문 생성
+                if job.result is None:
+                    job = await self._advance(repo, job, stage="analyze")
+                    analysis = await service.analyze_resume(
+                        user_id=job.user_id,
+                        resume_id=job.resume_id,
+                        on_event=lambda event: self._publish(job_id, "partial", {"stage": "analyze", **event}),
+                    )
+                    job = await repo.save_progress(job, self.lease_seconds, result={
+                        "resume_id": job.resume_id,
+                        "first_question": analysis.overall_summary,
+                        "question_count": len(analysis.improvement_questions),
+                    })
+
+                job = await repo.finish(job, "succeeded", stage="done", error=None)
+
+            except (UserQuotaExceeded, LLMRateLimitExceeded) as e:
+                # 실패 대신 할당량 기간 / rate limit 대기가 끝난 뒤 같은 단계부터 재시도 (시도 횟수는 늘리지 않음)
+                await db.rollback()
+                job = await repo.get(job_id)  # rollback으로 만료된 속성 다시 로드
+                job = await repo.finish(job, "queued", attempts=job.attempts - 1, error=str(e))
+                asyncio.get_running_loop().call_later(e.retry_after, self._queue.put_nowait, job.user_id, job.id)
+
+            except Exception as e:
+                await db.rollback()
+                job = await repo.finish(job, "failed", error=str(e))
+
+            self._publish(job.id, "status", job_snapshot(job))
+
+    async def _advance(self, repo: UploadJobRepository, job: UploadJob, stage: str) -> UploadJob:
+        job = await repo.save_progress(job, self.lease_seconds, stage=stage)
+        self._publish(job.id, "status", job_snapshot(job))
+        return job
+
+
+# 프로세스 전역 큐 (lifespan에서 생성/정리)
+_upload_job_queue: Optional[UploadJobQueue] = None
+
+
+def init_upload_job_queue() -> UploadJobQueue:
+    """
+    전역 업로드 작업 큐 생성 (앱 시작 시 호출, 워커 실행은 start())
+
+    Returns:
+        UploadJobQueue: 생성된 큐
+    """
+    global _upload_job_queue
+    if _upload_job_queue is None:
+        _upload_job_queue = UploadJobQueue()
+    return _upload_job_queue
+
+
+async def close_upload_job_queue():
+    """
+    전역 업로드 작업 큐 정리 (앱 종료 시 호출)
+    """
+    global _upload_job_queue
+    if _upload_job_queue is not None:
+        await _upload_job_queue.stop()
+        _upload_job_queue = None
+
+
+def get_upload_job_queue() -> UploadJobQueue:
+    """
+    전역 업로드 작업 큐 조회 (FastAPI Dependency)
+
+    Returns:
+        UploadJobQueue: 전역 큐
+    """
+    return init_upload_job_queue()
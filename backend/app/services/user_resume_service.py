@@ -1,17 +1,42 @@
-import tempfile
-import os
+import asyncio
 import json
 
-from typing import List, Optional
-from sqlalchemy.orm import Session
-from langchain_community.document_loaders import PyPDFLoader
+from typing import List, Optional, Sequence
+from sqlalchemy.ext.asyncio import AsyncSession
 from langchain_core.documents import Document
-from langchain.chat_models import init_chat_model
 from langchain.messages import SystemMessage
-from app.core.prompts import SIMPLE_EXTRACTION_PROMPT, RESUME_ANALYSIS_PROMPT
-from app.models.schemas import ResumeExtraction, ResumeAnalysis
+from app.core.llm import ChatModelPool, get_llm_pool
+from app.core.structured_output import StructuredEventCallback, agenerate_structured
+from app.core.config import settings
+from app.core.metrics import observe_stage
+from app.core.fair_share import UserQuotaExceeded, llm_user_scope
+from app.core.rate_limit import LLMRateLimitExceeded
+from app.core.prompts import (
+    SIMPLE_EXTRACTION_PROMPT,
+    SIMPLE_EXTRACTION_PROMPT_VERSION,
+    RESUME_ANALYSIS_PROMPT,
+    RESUME_ANALYSIS_PROMPT_VERSION,
+    QUESTION_PHRASING_PROMPT,
+    RESUME_GENERATION_PROMPT,
+    RESUME_GENERATION_PROMPT_VERSION
+)
+from app.models.schemas import (
+    ResumeExtraction,
+    ResumeAnalysis,
+    QuestionPhrasings,
+    GeneratedResume,
+    JDMatch,
+    JDPosting,
+    JDFit,
+    BatchFitReport
+)
 from app.repositories import ResumeRepository
 from app.database.models import Resume
+from app.services.chunked_extraction import extract_chunked, split_documents
+from app.services.extraction_cache import ExtractionCache
+from app.services.llm_cache import CachePolicy
+from app.services.pdf_extractor import PdfTextExtractor, get_pdf_extractor
+from app.services.resume_matcher import ResumeMatcher
 
 
 class UserResumeService:
@@ -19,16 +44,28 @@ class UserResumeService:
     사용자 이력서 관련 서비스
     """
 
-    def __init__(self, db: Session):
+    def __init__(
+        self,
+        db: AsyncSession,
+        llm: Optional[ChatModelPool] = None,
+        pdf_extractor: Optional[PdfTextExtractor] = None
+    ):
         """
         초기화
 
         Args:
             db: SQLAlchemy 세션
+            llm: 공유 Chat Model 풀 (기본값: 전역 풀)
+            pdf_extractor: PDF 추출 엔진 (기본값: 전역 엔진)
         """
         self.db = db
         self.resume_repo = ResumeRepository(db)
+        self.llm = llm or get_llm_pool()
+        self.pdf_extractor = pdf_extractor or get_pdf_extractor()
+        self.extraction_cache = ExtractionCache(db) if settings.extraction_cache_enabled else None
         
+    @observe_stage("create_user_resume")
+    @llm_user_scope
     async def create_user_resume(self, pdf_contents: List[bytes], user_id: Optional[str] = None) -> bool:
         """
         사용자 이력서 생성 및 저장
@@ -51,6 +88,7 @@ class UserResumeService:
         
         return True
     
+    @observe_stage("save_resume")
     async def save_resume_knowledge_base(
         self,
         resume_data: ResumeExtraction,
@@ -67,18 +105,24 @@ class UserResumeService:
             Resume: 저장된 Resume 객체
         """
         try:
-            saved_resume = self.resume_repo.save(resume_data, user_id)
+            saved_resume = await self.resume_repo.save(resume_data, user_id)
             print(f"✅ Resume saved to database with ID: {saved_resume.id}")
             return saved_resume
         except Exception as e:
             raise ValueError(f"이력서 저장 실패: {str(e)}")
     
-    async def create_resume_knowledge_base(self, documents: List[Document]) -> ResumeExtraction:
+    @observe_stage("extract_resume")
+    async def create_resume_knowledge_base(
+        self,
+        documents: List[Document],
+        on_event: Optional[StructuredEventCallback] = None
+    ) -> ResumeExtraction:
         """
         이력서 문서들로 지식 베이스 생성
 
         Args:
             documents: 이력서에서 추출한 Document 리스트
+            on_event: 스트리밍 중 필드/원소가 완성될 때마다 호출되는 콜백 (Optional)
 
         Returns:
             ResumeExtraction: 구조화된 이력서 정보
@@ -88,43 +132,61 @@ class UserResumeService:
             # JSON 구조를 써서 결과를 가져올 수 있도록 하는데, 요구사항으로 원하는 DATA 구조를 같이 제공함.
 
             contents = "\n\n".join([doc.page_content for doc in documents])
-            model = init_chat_model("gpt-4o-mini", temperature=0.3)
 
-            system_prompt = SIMPLE_EXTRACTION_PROMPT.format(
-                resume_text=contents
+            # 긴 이력서/다중 파일은 섹션 단위로 나눠 병렬 추출 후 병합 (map-reduce)
+            chunks = split_documents(documents, settings.extraction_chunk_chars)
+            chunked = settings.extraction_mode == "chunked" or (
+                settings.extraction_mode == "auto" and len(chunks) > 1
             )
-            conversations = [
-                SystemMessage(content=system_prompt),
-            ]
-
-            response = model.invoke(conversations)
-
-            # JSON 문자열을 Pydantic 객체로 변환
-            json_content = response.content
-            print(f"LLM Response Content:\n{json_content}")
-
-            # 타입 체크: 문자열이 아니면 에러
-            if not isinstance(json_content, str):
-                raise ValueError(f"LLM 응답이 문자열이 아닙니다: {type(json_content)}")
-
-            # JSON 문자열에서 마크다운 코드블록 제거 (```json ... ``` 형식)
-            if json_content.startswith("```"):
-                json_content = json_content.split("```")[1]
-                if json_content.startswith("json"):
-                    json_content = json_content[4:].strip()
-
-            # JSON 파싱 후 Pydantic 객체 생성
-            resume_data = ResumeExtraction.model_validate_json(json_content)
+            prompt_version = SIMPLE_EXTRACTION_PROMPT_VERSION
+            if chunked:
+                prompt_version = f"{SIMPLE_EXTRACTION_PROMPT_VERSION}+chunked{settings.extraction_chunk_chars}"
+
+            # 같은 텍스트 + 프롬프트 버전 + 모델이면 캐시된 추출 결과 재사용 (LLM 호출 생략)
+            cache_key = None
+            if self.extraction_cache is not None:
+                cache_key = ExtractionCache.make_key(contents, prompt_version, self.llm.model_name)
+                cached = await self.extraction_cache.get(cache_key)
+                if cached is not None:
+                    print(f"⚡ Extraction cache hit: {cache_key[:12]}")
+                    return cached
+
+            if chunked:
+                print(f"🧩 Chunked extraction: {len(chunks)} chunk(s)")
+                resume_data = await extract_chunked(
+                    self.llm, chunks, max_concurrency=settings.extraction_chunk_concurrency, on_event=on_event
+                )
+            else:
+                system_prompt = SIMPLE_EXTRACTION_PROMPT.format(
+                    resume_text=contents
+                )
+                conversations = [
+                    SystemMessage(content=system_prompt),
+                ]
+
+                # 네이티브 structured output 스트리밍으로 JSON을 점진적으로 파싱 후 Pydantic 객체 생성
+                # 추출 결과는 ExtractionCache(정규화 텍스트 기준)가 따로 캐시
+                resume_data = await agenerate_structured(
+                    self.llm, conversations, ResumeExtraction, temperature=0.3, on_event=on_event,
+                    cache=CachePolicy.NEVER
+                )
+
+            if cache_key is not None and self.extraction_cache is not None:
+                await self.extraction_cache.put(cache_key, resume_data, prompt_version, self.llm.model_name)
 
             print("📝 Extracted Resume Data:", resume_data)
 
             return resume_data
 
+        except (UserQuotaExceeded, LLMRateLimitExceeded):
+            # 할당량 / rate limit은 호출자가 재시도 시점을 정하도록 그대로 전달
+            raise
         except Exception as e:
             raise ValueError(f"이력서 지식 베이스 생성 실패: {str(e)}")
         
         
 
+    @observe_stage("extract_pdf_text")
     async def extract_text_from_pdfs(self, pdf_contents: List[bytes]) -> List[Document]:
         """
         PDF 파일(들)에서 텍스트 추출 및 병합
@@ -140,31 +202,8 @@ class UserResumeService:
             if not pdf_contents:
                 raise ValueError("PDF 파일이 없습니다.")
 
-            all_documents = []
-
-            for idx, pdf_content in enumerate(pdf_contents):
-                # bytes를 임시 파일로 저장 (PyPDFLoader는 파일 경로만 받음)
-                with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp_file:
-                    tmp_file.write(pdf_content)
-                    tmp_file_path = tmp_file.name
-
-                try:
-                    # PyPDFLoader로 PDF 로드
-                    loader = PyPDFLoader(tmp_file_path)
-                    documents = loader.load()
-
-                    # 각 문서에 메타데이터 추가 (어떤 PDF에서 왔는지)
-                    for doc in documents:
-                        doc.metadata['source_pdf_index'] = idx
-
-                    all_documents.extend(documents)
-
-                finally:
-                    # 임시 파일 삭제
-                    if os.path.exists(tmp_file_path):
-                        os.unlink(tmp_file_path)
-
-            return all_documents
+            # 임시 파일 없이 bytes에서 바로 파싱 (파일별로 프로세스 풀에서 병렬 처리)
+            return await self.pdf_extractor.extract(pdf_contents)
 
         except Exception as e:
             raise ValueError(f"PDF 텍스트 추출 실패: {str(e)}")
@@ -181,25 +220,38 @@ class UserResumeService:
             Document 객체 리스트
         """
         try:
-            loader = PyPDFLoader(file_path)
-            documents = loader.load()
-            return documents
+            with open(file_path, "rb") as f:
+                pdf_content = f.read()
+            return await self.pdf_extractor.extract([pdf_content])
         except Exception as e:
             raise ValueError(f"이력서 로드 실패: {str(e)}")
 
-    async def analyze_resume(self, user_id: Optional[str] = None) -> ResumeAnalysis:
+    @observe_stage("analyze_resume")
+    @llm_user_scope
+    async def analyze_resume(
+        self,
+        user_id: Optional[str] = None,
+        resume_id: Optional[int] = None,
+        on_event: Optional[StructuredEventCallback] = None
+    ) -> ResumeAnalysis:
         """
         사용자 이력서 분석 후 개선 질문 리스트 반환
 
         Args:
             user_id: 사용자 ID (Optional)
+            resume_id: 분석할 이력서 ID (지정하지 않으면 사용자의 최근 이력서)
+            on_event: 스트리밍 중 필드/원소가 완성될 때마다 호출되는 콜백
+                (overall_summary, improvement_questions[0] 등을 생성 완료 전에 전달)
 
         Returns:
             ResumeAnalysis: 분석 결과 (요약, 부족한 영역, 개선 질문 리스트)
         """
         try:
-            # 1. 최근 이력서 데이터 가져오기
-            recent_resume = self.resume_repo.get_recent_resume_by_user_id(user_id)
+            # 1. 이력서 데이터 가져오기
+            if resume_id is not None:
+                recent_resume = await self.resume_repo.get_by_id(resume_id)
+            else:
+                recent_resume = await self.resume_repo.get_recent_resume_by_user_id(user_id)
 
             if not recent_resume:
                 raise ValueError(f"사용자 ID {user_id}의 이력서를 찾을 수 없습니다.")
@@ -208,8 +260,6 @@ class UserResumeService:
             resume_json = json.dumps(recent_resume.data, ensure_ascii=False, indent=2)
 
             # 3. LLM으로 분석
-            model = init_chat_model("gpt-4o-mini", temperature=0.3)
-
             system_prompt = RESUME_ANALYSIS_PROMPT.format(
                 resume_data=resume_json
             )
@@ -217,33 +267,201 @@ class UserResumeService:
                 SystemMessage(content=system_prompt),
             ]
 
-            response = model.invoke(conversations)
-
-            # 4. JSON 파싱
-            json_content = response.content
-            print(f"LLM Analysis Response:\n{json_content}")
-
-            # 타입 체크
-            if not isinstance(json_content, str):
-                raise ValueError(f"LLM 응답이 문자열이 아닙니다: {type(json_content)}")
-
-            # 마크다운 코드블록 제거
-            if json_content.startswith("```"):
-                json_content = json_content.split("```")[1]
-                if json_content.startswith("json"):
-                    json_content = json_content[4:].strip()
+            # 4. 스트리밍 JSON 파싱 후 Pydantic 객체 생성
+            # temperature 0으로 결정적으로 생성해 이력서가 바뀌지 않았으면 이전 분석 응답 재사용 (on_event는 캐시된 응답으로도 발생)
+            analysis_result = await agenerate_structured(
+                self.llm, conversations, ResumeAnalysis, temperature=0, on_event=on_event,
+                cache=CachePolicy.TEMPERATURE_ZERO, prompt_version=RESUME_ANALYSIS_PROMPT_VERSION
+            )
 
-            # Pydantic 객체 생성
-            analysis_result = ResumeAnalysis.model_validate_json(json_content)
+            # 5. 채팅에서 보낼 질문 문구를 한 번에 미리 생성 (실패해도 채팅 턴에서 생성하므로 분석은 유지)
+            if settings.question_phrasing_enabled:
+                try:
+                    await self.phrase_questions(analysis_result)
+                except Exception as e:
+                    print(f"⚠️ Question phrasing failed, chat will phrase questions live: {e}")
 
             resume_analysis = analysis_result.model_dump()
             recent_resume.analysis = resume_analysis
             
-            self.resume_repo.update(resume_id=recent_resume.id, resume_data=recent_resume)
+            await self.resume_repo.update(resume_id=recent_resume.id, resume_data=recent_resume)
 
             print("📊 Resume Analysis Result:", analysis_result)
 
             return analysis_result
 
+        except (UserQuotaExceeded, LLMRateLimitExceeded):
+            # 할당량 / rate limit은 호출자가 재시도 시점을 정하도록 그대로 전달
+            raise
         except Exception as e:
-            raise ValueError(f"이력서 분석 실패: {str(e)}")
\ No newline at end of file
+            raise ValueError(f"이력서 분석 실패: {str(e)}")
+
+    @observe_stage("phrase_questions")
+    async def phrase_questions(self, analysis: ResumeAnalysis) -> int:
+        """
+        개선 질문들의 대화형 문구를 LLM 한 번 호출로 생성해 각 질문의 phrasing에 채움
+
+        채팅 턴(generate_response)은 phrasing이 있는 질문을 LLM 호출 없이 바로 보냅니다.
+
+        Args:
+            analysis: 분석 결과 (improvement_questions[].phrasing이 채워짐)
+
+        Returns:
+            int: 문구가 채워진 질문 수
+        """
+        questions = analysis.improvement_questions
+        if not questions:
+            return 0
+
+        payload = [
+            {"index": idx, "category": q.category, "question": q.question, "purpose": q.purpose}
+            for idx, q in enumerate(questions)
+        ]
+        system_prompt = QUESTION_PHRASING_PROMPT.format(
+            questions=json.dumps(payload, ensure_ascii=False, indent=2)
+        )
+        # 문구는 매번 다르게 샘플링하므로 캐시하지 않음 (temperature 0.7)
+        result = await agenerate_structured(
+            self.llm, [SystemMessage(content=system_prompt)], QuestionPhrasings, temperature=0.7,
+            cache=CachePolicy.NEVER
+        )
+
+        # 범위를 벗어난 index나 빈 문구는 버림 (해당 질문은 채팅 턴에서 생성)
+        phrased = 0
+        for item in result.phrasings:
+            message = item.message.strip()
+            if 0 <= item.index < len(questions) and message and questions[item.index].phrasing is None:
+                questions[item.index].phrasing = message
+                phrased += 1
+
+        print(f"💬 Question phrasings precomputed: {phrased}/{len(questions)}")
+        return phrased
+
+    @observe_stage("generate_resume")
+    @llm_user_scope
+    async def generate_resume(
+        self,
+        user_id: Optional[str],
+        jd_text: str,
+        top_k: Optional[int] = None
+    ) -> GeneratedResume:
+        """
+        JD 맞춤 이력서 생성
+
+        사용자의 모든 프로젝트 / 기술 / 경력 임베딩을 JD 임베딩과 한 번에 비교해
+        관련도가 높은 top-k 프로젝트만 생성 프롬프트에 넣습니다.
+
+        Args:
+            user_id: 사용자 ID
+            jd_text: 채용 공고 텍스트
+            top_k: 프롬프트에 넣을 프로젝트 수 (기본값: settings.generate_top_k_projects)
+
+        Returns:
+            GeneratedResume: 생성된 마크다운과 선택된 항목
+        """
+        if not jd_text.strip():
+            raise ValueError("JD 텍스트가 비어 있습니다.")
+
+        resume = await self.resume_repo.get_recent_resume_by_user_id(user_id)
+        if not resume:
+            raise ValueError(f"사용자 ID {user_id}의 이력서를 찾을 수 없습니다.")
+
+        matches = await ResumeMatcher(self.db).match(resume, jd_text, top_k_projects=top_k)
+        markdown = await self.write_tailored_resume(resume, jd_text, matches)
+        return GeneratedResume(resume_id=resume.id, markdown=markdown, matches=matches)
+
+    @observe_stage("generate_resume_batch")
+    @llm_user_scope
+    async def generate_resume_batch(
+        self,
+        user_id: Optional[str],
+        postings: Sequence[JDPosting],
+        top_m: Optional[int] = None,
+        top_k: Optional[int] = None
+    ) -> BatchFitReport:
+        """
+        JD 여러 개에 대한 적합도 순위 + 상위 M개 JD 맞춤 이력서 생성
+
+        이력서 항목 행렬은 한 번만 준비(캐시)하고, 모든 JD를 한 번에 임베딩해 행렬곱 한 번으로 스코어링합니다.
+        LLM 생성은 적합도 상위 M개만 동시 실행 수 제한(settings.generate_batch_concurrency) 안에서 실행하며,
+        한 JD의 생성이 실패해도 나머지 결과는 그대로 반환합니다 (실패 사유는 error).
+        단, 할당량 / rate limit 초과는 호출자가 재시도 시점을 정하도록 그대로 전달합니다.
+
+        Args:
+            user_id: 사용자 ID
+            postings: 채용 공고 리스트
+            top_m: 이력서까지 생성할 상위 JD 수, 0이면 순위만 (기본값: settings.generate_batch_top_m)
+            top_k: JD별 프롬프트에 넣을 프로젝트 수 (기본값: settings.generate_top_k_projects)
+
+        Returns:
+            BatchFitReport: 적합도 순 JD 리스트 (상위 M개는 markdown 포함)
+        """
+        if not postings:
+            raise ValueError("JD가 비어 있습니다.")
+        if len(postings) > settings.generate_batch_max_jds:
+            raise ValueError(f"JD는 한 번에 최대 {settings.generate_batch_max_jds}개까지 비교할 수 있습니다.")
+        if any(not posting.jd_text.strip() for posting in postings):
+            raise ValueError("JD 텍스트가 비어 있습니다.")
+
+        resume = await self.resume_repo.get_recent_resume_by_user_id(user_id)
+        if not resume:
+            raise ValueError(f"사용자 ID {user_id}의 이력서를 찾을 수 없습니다.")
+
+        matches = await ResumeMatcher(self.db).match_many(
+            resume, [posting.jd_text for posting in postings], top_k_projects=top_k
+        )
+        order = sorted(range(len(postings)), key=lambda idx: -matches[idx].fit_score)
+        fits = [
+            JDFit(index=idx, title=postings[idx].display_title(), rank=rank, matches=matches[idx])
+            for rank, idx in enumerate(order, start=1)
+        ]
+
+        top_m = settings.generate_batch_top_m if top_m is None else top_m
+        semaphore = asyncio.Semaphore(settings.generate_batch_concurrency)
+
+        async def generate(fit: JDFit):
+            async with semaphore:
+                try:
+                    fit.markdown = await self.write_tailored_resume(resume, postings[fit.index].jd_text, fit.matches)
+                except (UserQuotaExceeded, LLMRateLimitExceeded):
+                    raise
+                except Exception as e:
+                    fit.error = str(e)
+
+        await asyncio.gather(*(generate(fit) for fit in fits[:top_m]))
+        print(f"📊 Batch tailoring: {len(fits)} JDs ranked, {min(top_m, len(fits))} generated")
+        return BatchFitReport(resume_id=resume.id, fits=fits)
+
+    async def write_tailored_resume(self, resume: Resume, jd_text: str, matches: JDMatch) -> str:
+        """
+        선택된 항목만으로 JD 맞춤 이력서 마크다운 생성 (LLM 호출)
+
+        Args:
+            resume: 원본 이력서
+            jd_text: 채용 공고 텍스트
+            matches: JD 관련도 순 항목
+
+        Returns:
+            str: 이력서 마크다운
+        """
+        data = resume.data
+        projects = {str(project.get("id") or project.get("name")): project for project in data.get("projects") or []}
+        careers = data.get("career") or []
+
+        def dump(value) -> str:
+            return json.dumps(value, ensure_ascii=False, indent=2)
+
+        system_prompt = RESUME_GENERATION_PROMPT.format(
+            jd_text=jd_text.strip(),
+            person=dump(data.get("person") or {}),
+            projects=dump([projects[match.key] for match in matches.projects if match.key in projects]),
+            skills=", ".join(match.label for match in matches.skills),
+            careers=dump([careers[int(match.key.removeprefix("career_"))] for match in matches.careers]),
+            education=dump(data.get("education") or []),
+        )
+        # 같은 이력서 + JD면 같은 이력서가 나오도록 temperature 0으로 생성해 응답 재사용
+        response = await self.llm.ainvoke(
+            [SystemMessage(content=system_prompt)], temperature=0,
+            cache=CachePolicy.TEMPERATURE_ZERO, prompt_version=RESUME_GENERATION_PROMPT_VERSION
+        )
+        return str(response.content).strip()
@@ -0,0 +1,3 @@
+"""
+Performance benchmarks (로컬 stub LLM 서버 기반)
+"""
@@ -0,0 +1,101 @@
+"""
+JD 여러 개 맞춤 이력서 벤치마크 (JD마다 generate_resume 호출 vs generate_resume_batch 한 번)
+
+LLM은 호출마다 고정 지연(--latency) 후 마크다운을 돌려주는 가짜 풀, 이력서는 in-memory SQLite에 둡니다.
+
+    before: JD마다 UserResumeService.generate_resume() 순차 호출
+            (JD마다 이력서 항목 행렬 준비 + JD 임베딩 + LLM 생성, ResumeIndex 캐시 없음)
+    after:  UserResumeService.generate_resume_batch() 한 번
+            (항목 행렬 1회 + JD 일괄 임베딩 + 행렬곱 1회, 상위 --top-m개만 동시 생성)
+
+실행:
+    uv run python -m benchmarks.bench_batch_generate --jds 30 --top-m 3 --latency 0.5
+"""
+import argparse
+import asyncio
+import os
+import time
+
+os.environ.setdefault("OPENAI_API_KEY", "stub-key")
+
+from langchain_core.messages import AIMessage  # noqa: E402
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+
+from app.database.models import Base, Resume  # noqa: E402
+from app.models.schemas import JDPosting  # noqa: E402
+from app.services.resume_cache import close_resume_cache  # noqa: E402
+from app.services.resume_matcher import resume_index_cache  # noqa: E402
+from app.services.user_resume_service import UserResumeService  # noqa: E402
+from benchmarks.bench_jd_matching import _jds, _resume_data  # noqa: E402
+
+
+class LatencyChatModelPool:
+    """호출마다 고정 지연 후 고정 마크다운을 돌려주는 가짜 풀"""
+
+    model_name = "latency"
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.calls = 0
+
+    async def ainvoke(self, messages, temperature=0.3, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(self.latency)
+        return AIMessage(content="# 벤치마크\n\n## 프로젝트\n- ...")
+
+
+async def run(args):
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with session_factory() as db:
+        db.add(Resume(user_id="bench", data=_resume_data(args.projects)))
+        await db.commit()
+    postings = [JDPosting(jd_text=jd_text) for jd_text in _jds(args.jds)]
+
+    llm = LatencyChatModelPool(args.latency)
+    async with session_factory() as db:
+        service = UserResumeService(db, llm=llm)  # type: ignore[arg-type]
+        started = time.perf_counter()
+        for posting in postings:
+            resume_index_cache.clear()
+            await service.generate_resume("bench", posting.jd_text)
+        elapsed = time.perf_counter() - started
+    print(f"before  total={elapsed:7.2f}s  llm_calls={llm.calls}")
+
+    resume_index_cache.clear()
+    llm = LatencyChatModelPool(args.latency)
+    async with session_factory() as db:
+        service = UserResumeService(db, llm=llm)  # type: ignore[arg-type]
+        started = time.perf_counter()
+        await service.generate_resume_batch("bench", postings, top_m=0)
+        ranking = time.perf_counter() - started
+
+        started = time.perf_counter()
+        report = await service.generate_resume_batch("bench", postings, top_m=args.top_m)
+        elapsed = time.perf_counter() - started
+    print(
+        f"after   total={elapsed:7.2f}s  llm_calls={llm.calls}  "
+        f"ranking_only={ranking * 1000:.1f}ms (first call, index build included)"
+    )
+    print("top:", ", ".join(f"#{fit.rank} jd{fit.index} ({fit.matches.fit_score:.3f})" for fit in report.fits[:args.top_m]))
+
+    await close_resume_cache()
+    await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="JD 여러 개 맞춤 이력서 벤치마크 (배치 적합도 비교)")
+    parser.add_argument("--jds", type=int, default=30, help="비교할 JD 수")
+    parser.add_argument("--top-m", type=int, default=3, help="이력서까지 생성할 상위 JD 수")
+    parser.add_argument("--projects", type=int, default=40, help="이력서 프로젝트 수")
+    parser.add_argument("--latency", type=float, default=0.5, help="LLM 호출당 지연 (초)")
+    args = parser.parse_args()
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+동시 채팅 처리량 벤치마크 (per-call init_chat_model + invoke vs 공유 ChatModelPool + ainvoke)
+
+로컬 Stub LLM 서버를 별도 프로세스로 띄우고, 동시 요청 N개를 처리하는 데 걸린 시간을 측정합니다.
+
+실행:
+    # 노드 수준 비교 (Stub 서버 자동 실행)
+    uv run python -m benchmarks.bench_chat_concurrency --concurrency 50 --latency 0.5
+
+    # 실행 중인 API 서버의 /api/chat/message 대상
+    # (서버는 OPENAI_BASE_URL=http://127.0.0.1:9000/v1 로 Stub 서버를 바라보도록 실행)
+    uv run python -m benchmarks.bench_chat_concurrency --mode http --url http://localhost:8000 --user-id 1
+"""
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import time
+import uuid
+
+import httpx
+
+os.environ.setdefault("OPENAI_API_KEY", "stub-key")
+
+from langchain.chat_models import init_chat_model  # noqa: E402
+from langchain.messages import SystemMessage  # noqa: E402
+
+from app.agents.prompts import QUESTION_RESPONSE_PROMPT  # noqa: E402
+from app.core.llm import ChatModelPool  # noqa: E402
+
+QUESTION = {
+    "category": "STAR-결과",
+    "question": "RAG 시스템 도입 후 측정 가능한 성과가 있었나요?",
+    "purpose": "프로젝트의 임팩트를 정량적으로 표현하기 위함",
+}
+
+
+def _messages():
+    return [SystemMessage(content=QUESTION_RESPONSE_PROMPT.format(**QUESTION))]
+
+
+async def legacy_call(base_url: str) -> str:
+    """기존 방식: 호출마다 모델 생성 + 동기 invoke (이벤트 루프 블로킹)"""
+    model = init_chat_model("gpt-4o-mini", temperature=0.7, base_url=base_url)
+    response = model.invoke(_messages())
+    return response.content  # type: ignore[return-value]
+
+
+async def pooled_call(pool: ChatModelPool) -> str:
+    """개선 방식: 공유 풀 + ainvoke"""
+    response = await pool.ainvoke(_messages(), temperature=0.7)
+    return response.content  # type: ignore[return-value]
+
+
+async def _measure(label: str, factory, concurrency: int, rounds: int) -> dict:
+    timings = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        await asyncio.gather(*[factory() for _ in range(concurrency)])
+        timings.append(time.perf_counter() - started)
+
+    best = min(timings)
+    result = {
+        "label": label,
+        "concurrency": concurrency,
+        "best_wall_s": round(best, 3),
+        "throughput_rps": round(concurrency / best, 2),
+    }
+    print(f"{label:<10} concurrency={concurrency:<4} wall={best:.3f}s throughput={result['throughput_rps']} req/s")
+    return result
+
+
+async def run_nodes(args):
+    port = args.stub_port
+    base_url = f"http://127.0.0.1:{port}/v1"
+    stub = subprocess.Popen(
+        [sys.executable, "-m", "benchmarks.stub_llm_server", "--port", str(port), "--latency", str(args.latency)],
+    )
+    try:
+        async with httpx.AsyncClient() as client:
+            for _ in range(50):
+                try:
+                    await client.post(f"{base_url}/chat/completions", json={"messages": []})
+                    break
+                except httpx.TransportError:
+                    await asyncio.sleep(0.1)
+
+        pool = ChatModelPool(base_url=base_url)
+        await pooled_call(pool)  # 커넥션 워밍업
+
+        await _measure("legacy", lambda: legacy_call(base_url), args.concurrency, args.rounds)
+        await _measure("pool", lambda: pooled_call(pool), args.concurrency, args.rounds)
+
+        await pool.aclose()
+    finally:
+        stub.terminate()
+        stub.wait()
+
+
+async def run_http(args):
+    async with httpx.AsyncClient(base_url=args.url, timeout=None) as client:
+
+        async def send():
+            response = await client.post(
+                "/api/chat/message",
+                json={"session_id": f"bench-{uuid.uuid4()}", "user_id": args.user_id, "message": "성과는 응답 시간 30% 단축입니다."},
+            )
+            response.raise_for_status()
+
+        await _measure("http", send, args.concurrency, args.rounds)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="동시 채팅 처리량 벤치마크")
+    parser.add_argument("--mode", choices=["nodes", "http"], default="nodes")
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--latency", type=float, default=0.5, help="Stub LLM 응답 지연 (초)")
+    parser.add_argument("--stub-port", type=int, default=9000)
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--user-id", default="1")
+    args = parser.parse_args()
+
+    if args.mode == "nodes":
+        asyncio.run(run_nodes(args))
+    else:
+        asyncio.run(run_http(args))
+
+
+if __name__ == "__main__":
+    main()
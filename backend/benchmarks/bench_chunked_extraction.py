@@ -0,0 +1,131 @@
+"""
+이력서 추출 벤치마크 (단일 프롬프트 vs 청크 map-reduce)
+
+tests/fixtures/data 의 PDF들을 --copies 만큼 반복해 긴 다중 파일 이력서를 만들고,
+SIMPLE_EXTRACTION_PROMPT 한 번 호출과 청크별 병렬 추출 + 병합의 지연 시간과 토큰 사용량을 비교합니다.
+토큰 수는 stub 서버의 /stats (문자 수 / 4 근사)에서 읽습니다.
+
+Stub은 모든 청크에 전체 추출 결과를 돌려주므로 청크 모드의 completion 토큰은 실제보다 크게 잡힙니다.
+
+실행:
+    uv run python -m benchmarks.bench_chunked_extraction --copies 8 --chunk-chars 12000 --prefill-latency-per-1k 0.2
+"""
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+os.environ.setdefault("OPENAI_API_KEY", "stub-key")
+
+from langchain.messages import SystemMessage  # noqa: E402
+
+from app.core.llm import ChatModelPool  # noqa: E402
+from app.core.prompts import SIMPLE_EXTRACTION_PROMPT  # noqa: E402
+from app.core.structured_output import agenerate_structured  # noqa: E402
+from app.models.schemas import ResumeExtraction  # noqa: E402
+from app.services.chunked_extraction import extract_chunked, split_documents  # noqa: E402
+from app.services.pdf_extractor import extract_documents  # noqa: E402
+
+FIXTURES_DIR = Path(__file__).resolve().parent.parent / "tests" / "fixtures" / "data"
+FIXTURE_NAMES = ["TEST_RESUME.pdf", "TEST_CAREER.pdf"]
+
+
+async def _measure(client: httpx.AsyncClient, name: str, run) -> dict:
+    await client.delete("/stats")
+    started = time.perf_counter()
+    error = None
+    projects = None
+
+    try:
+        result = await run()
+        projects = len(result.projects)
+    except Exception as e:
+        error = str(e).splitlines()[0][:80]
+
+    elapsed = time.perf_counter() - started
+    stats = (await client.get("/stats")).json()
+
+    result = {
+        "mode": name,
+        "latency_ms": round(elapsed * 1000, 1),
+        "requests": stats["requests"],
+        "prompt_tokens": stats["prompt_tokens"],
+        "completion_tokens": stats["completion_tokens"],
+        "projects": projects,
+        "error": error,
+    }
+    print(
+        f"{name:<8} latency={result['latency_ms']:9.1f}ms  requests={result['requests']:3d}  "
+        f"prompt_tokens={result['prompt_tokens']:7d}  completion_tokens={result['completion_tokens']:6d}  "
+        + (f"projects={projects}" if error is None else f"error={error}")
+    )
+    return result
+
+
+async def run(args):
+    base_url = f"http://127.0.0.1:{args.stub_port}"
+    command = [
+        sys.executable, "-m", "benchmarks.stub_llm_server",
+        "--port", str(args.stub_port),
+        "--latency", str(args.latency),
+        "--chunk-latency", str(args.chunk_latency),
+        "--prefill-latency-per-1k", str(args.prefill_latency_per_1k),
+    ]
+    if args.context_limit:
+        command += ["--context-limit", str(args.context_limit)]
+    stub = subprocess.Popen(command)
+
+    pdfs = [(FIXTURES_DIR / name).read_bytes() for name in FIXTURE_NAMES] * args.copies
+    documents = extract_documents(pdfs)
+    contents = "\n\n".join(doc.page_content for doc in documents)
+    chunks = split_documents(documents, args.chunk_chars)
+    print(f"{len(pdfs)} PDF(s), {len(documents)} page(s), {len(contents)} chars → {len(chunks)} chunk(s)")
+
+    try:
+        async with httpx.AsyncClient(base_url=base_url) as client:
+            for _ in range(50):
+                try:
+                    await client.get("/stats")
+                    break
+                except httpx.TransportError:
+                    await asyncio.sleep(0.1)
+
+            pool = ChatModelPool(base_url=f"{base_url}/v1")
+
+            async def single():
+                messages = [SystemMessage(content=SIMPLE_EXTRACTION_PROMPT.format(resume_text=contents))]
+                return await agenerate_structured(pool, messages, ResumeExtraction)
+
+            async def chunked():
+                return await extract_chunked(pool, chunks, max_concurrency=args.concurrency)
+
+            await _measure(client, "single", single)
+            await _measure(client, "chunked", chunked)
+            await pool.aclose()
+    finally:
+        stub.terminate()
+        stub.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="단일 프롬프트 vs 청크 map-reduce 추출 벤치마크")
+    parser.add_argument("--copies", type=int, default=8, help="fixture PDF 반복 횟수")
+    parser.add_argument("--chunk-chars", type=int, default=12000)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.3, help="Stub 첫 응답 지연 (초)")
+    parser.add_argument("--chunk-latency", type=float, default=0.005, help="Stub 스트리밍 조각 사이 지연 (초)")
+    parser.add_argument("--prefill-latency-per-1k", type=float, default=0.2, help="Stub 프롬프트 1k 토큰당 지연 (초)")
+    parser.add_argument("--context-limit", type=int, default=None, help="Stub 프롬프트 토큰 한도")
+    parser.add_argument("--stub-port", type=int, default=9000)
+    args = parser.parse_args()
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
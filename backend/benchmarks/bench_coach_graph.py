@@ -0,0 +1,121 @@
+"""
+코칭 그래프 턴당 오버헤드 벤치마크 (매 턴 컴파일 + 새 커넥션 vs 시작 시 한 번 컴파일 + 커넥션 풀)
+
+LLM 호출은 즉시 응답하는 가짜 풀로 대체하고, 이력서 데이터는 in-memory SQLite에 두어
+그래프 생성/컴파일과 체크포인터 커넥션 비용만 측정합니다. 체크포인트는 DATABASE_URL의 Postgres에 저장됩니다.
+
+    before: 턴마다 StateGraph 생성 + compile + AsyncPostgresSaver.from_conn_string (새 커넥션)
+            (기존 코드는 동기 PostgresSaver의 with 블록이 ainvoke 전에 닫혀 그대로는 실행되지 않으므로,
+             동작하도록 고친 같은 구조를 측정합니다)
+    after:  init_resume_coach_graph()로 한 번 컴파일한 그래프 + psycopg_pool 커넥션 풀
+
+실행 (docker-compose의 Postgres 사용):
+    uv run python -m benchmarks.bench_coach_graph --turns 50 --concurrency 10
+"""
+import argparse
+import asyncio
+import copy
+import json
+import os
+import statistics
+import time
+import uuid
+
+os.environ.setdefault("OPENAI_API_KEY", "stub-key")
+
+from langchain_core.messages import AIMessage  # noqa: E402
+from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver  # noqa: E402
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+
+from app.agents.graph import (  # noqa: E402
+    close_resume_coach_graph,
+    create_resume_coach_graph,
+    init_resume_coach_graph,
+    run_resume_coach,
+)
+from app.database.config import DATABASE_URL  # noqa: E402
+from app.database.models import Base, Resume  # noqa: E402
+from benchmarks.fixtures import CANNED_ANALYSIS, CANNED_EXTRACTION, CHAT_REPLY  # noqa: E402
+
+
+class InstantChatModelPool:
+    """LLM 지연 없이 준비된 응답을 돌려주는 가짜 풀"""
+
+    model_name = "instant"
+
+    async def ainvoke(self, messages, temperature=0.3, **kwargs):
+        return AIMessage(content=CHAT_REPLY)
+
+    async def astream(self, messages, temperature=0.3, **kwargs):
+        yield json.dumps(CANNED_EXTRACTION, ensure_ascii=False)
+
+
+async def _legacy_turn(session_id: str, db, llm) -> dict:
+    async with AsyncPostgresSaver.from_conn_string(DATABASE_URL) as checkpointer:
+        graph = create_resume_coach_graph(checkpointer)
+        return await run_resume_coach(session_id, "1", "답변", db, llm=llm, graph=graph)
+
+
+async def _pooled_turn(session_id: str, db, llm) -> dict:
+    return await run_resume_coach(session_id, "1", "답변", db, llm=llm)
+
+
+async def _measure(name: str, turn, db, llm, turns: int, concurrency: int) -> dict:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def one():
+        async with semaphore:
+            started = time.perf_counter()
+            await turn(f"bench-{uuid.uuid4()}", db, llm)
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(turns)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    result = {
+        "mode": name,
+        "p50_ms": round(statistics.median(latencies) * 1000, 1),
+        "p95_ms": round(latencies[int(len(latencies) * 0.95) - 1] * 1000, 1),
+        "turns_per_sec": round(turns / elapsed, 1),
+    }
+    print(
+        f"{name:<7} p50={result['p50_ms']:7.1f}ms  p95={result['p95_ms']:7.1f}ms  "
+        f"throughput={result['turns_per_sec']:6.1f} turns/s"
+    )
+    return result
+
+
+async def run(args):
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    llm = InstantChatModelPool()
+
+    async with async_sessionmaker(engine, expire_on_commit=False)() as db:
+        db.add(Resume(user_id="1", data=copy.deepcopy(CANNED_EXTRACTION), analysis=CANNED_ANALYSIS))
+        await db.commit()
+
+        # 체크포인트 테이블 생성 + 풀 워밍업
+        await init_resume_coach_graph()
+
+        await _measure("before", _legacy_turn, db, llm, args.turns, args.concurrency)
+        await _measure("after", _pooled_turn, db, llm, args.turns, args.concurrency)
+
+        await close_resume_coach_graph()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="코칭 그래프 턴당 오버헤드 벤치마크")
+    parser.add_argument("--turns", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, default=10)
+    args = parser.parse_args()
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
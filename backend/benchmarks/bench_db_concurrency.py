@@ -0,0 +1,126 @@
+"""
+동시 DB 요청 벤치마크 (이벤트 루프에서 동기 Session 호출 vs AsyncSession)
+
+요청마다 `SELECT pg_sleep(delay)`(느린 쿼리 대용) + 최근 이력서 조회를 실행하고,
+동시 요청 N개의 처리 시간과 그동안의 이벤트 루프 지연(lag)을 측정합니다.
+
+    before: async 핸들러 안에서 동기 create_engine + Session 호출 (쿼리 동안 이벤트 루프 블로킹)
+    after:  create_async_engine(psycopg3) + AsyncSession + 비동기 ResumeRepository
+
+실행 (docker-compose의 Postgres 사용, SQL 로그는 끄고 측정):
+    DB_ECHO=false uv run python -m benchmarks.bench_db_concurrency --concurrency 20 --delay 0.05
+"""
+import argparse
+import asyncio
+import os
+import time
+
+os.environ.setdefault("OPENAI_API_KEY", "stub-key")
+
+from sqlalchemy import create_engine, select, text  # noqa: E402
+from sqlalchemy.orm import Session, sessionmaker  # noqa: E402
+
+from app.core.config import settings  # noqa: E402
+from app.database.config import ASYNC_DATABASE_URL, SessionLocal, close_db, init_db  # noqa: E402
+from app.database.models import Resume  # noqa: E402
+from app.repositories.resume_repository import ResumeRepository  # noqa: E402
+from benchmarks.fixtures import CANNED_EXTRACTION  # noqa: E402
+
+USER_ID = "bench-db-concurrency"
+
+
+async def _legacy_request(factory: sessionmaker, delay: float):
+    """기존 방식: async 핸들러에서 동기 Session 직접 호출"""
+    with factory() as db:
+        db.execute(text("SELECT pg_sleep(:delay)"), {"delay": delay})
+        db.scalars(
+            select(Resume).where(Resume.user_id == USER_ID).order_by(Resume.created_at).limit(1)
+        ).first()
+
+
+async def _async_request(delay: float):
+    """개선 방식: AsyncSession + 비동기 Repository"""
+    async with SessionLocal() as db:
+        await db.execute(text("SELECT pg_sleep(:delay)"), {"delay": delay})
+        await ResumeRepository(db).get_recent_resume_by_user_id(USER_ID)
+
+
+async def _measure(label: str, request, concurrency: int, rounds: int) -> dict:
+    walls = []
+    max_lag = 0.0
+
+    for _ in range(rounds):
+        stop = asyncio.Event()
+
+        async def ticker():
+            # 10ms마다 깨어나며 예정 시각보다 늦게 깨어난 만큼을 이벤트 루프 지연으로 기록
+            nonlocal max_lag
+            while not stop.is_set():
+                expected = time.perf_counter() + 0.01
+                await asyncio.sleep(0.01)
+                max_lag = max(max_lag, time.perf_counter() - expected)
+
+        ticker_task = asyncio.create_task(ticker())
+        await asyncio.sleep(0)
+
+        started = time.perf_counter()
+        await asyncio.gather(*[request() for _ in range(concurrency)])
+        walls.append(time.perf_counter() - started)
+
+        stop.set()
+        await ticker_task
+
+    best = min(walls)
+    result = {
+        "label": label,
+        "concurrency": concurrency,
+        "best_wall_s": round(best, 3),
+        "throughput_rps": round(concurrency / best, 1),
+        "max_loop_lag_ms": round(max_lag * 1000, 1),
+    }
+    print(
+        f"{label:<7} concurrency={concurrency:<4} wall={best:.3f}s "
+        f"throughput={result['throughput_rps']:7.1f} req/s  max_loop_lag={result['max_loop_lag_ms']:7.1f}ms"
+    )
+    return result
+
+
+async def run(args):
+    await init_db()
+    async with SessionLocal() as db:
+        if await ResumeRepository(db).get_recent_resume_by_user_id(USER_ID) is None:
+            db.add(Resume(user_id=USER_ID, data=CANNED_EXTRACTION))
+            await db.commit()
+
+    # 기존 코드와 같은 동기 엔진 (풀 크기는 비동기 엔진과 동일하게 맞춤)
+    legacy_engine = create_engine(
+        ASYNC_DATABASE_URL,
+        pool_pre_ping=True,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+    )
+    legacy_factory = sessionmaker(bind=legacy_engine, class_=Session)
+
+    # 커넥션 워밍업
+    await asyncio.gather(*[_legacy_request(legacy_factory, 0) for _ in range(args.concurrency)])
+    await asyncio.gather(*[_async_request(0) for _ in range(args.concurrency)])
+
+    await _measure("before", lambda: _legacy_request(legacy_factory, args.delay), args.concurrency, args.rounds)
+    await _measure("after", lambda: _async_request(args.delay), args.concurrency, args.rounds)
+
+    legacy_engine.dispose()
+    await close_db()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="동시 DB 요청 벤치마크 (동기 Session vs AsyncSession)")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--delay", type=float, default=0.05, help="요청당 pg_sleep 시간 (초)")
+    args = parser.parse_args()
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""
+JD ↔ 프로젝트 매칭 벤치마크 (요청마다 항목별 임베딩 + Python 루프 vs 저장된 항목 임베딩 + 행렬곱 한 번)
+
+이력서는 in-memory SQLite에 두고, 프로젝트 수(--projects)가 많은 사용자 이력서에 대해
+JD(--jds)마다 상위 프로젝트를 고르는 시간을 측정합니다.
+
+    before: 요청마다 프로젝트를 하나씩 임베딩하고 JD와 내적 → 전체 정렬
+    after:  ResumeMatcher.index_resume()로 저장 / 재사용한 항목 행렬 × JD 벡터 → argpartition
+            (저장된 임베딩 로드를 뺀 스코어링 시간, 프로젝트 하나만 바뀐 뒤 다시 인덱싱하는 시간도 함께 표시)
+
+실행:
+    uv run python -m benchmarks.bench_jd_matching --projects 200 --jds 50
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import time
+
+os.environ.setdefault("OPENAI_API_KEY", "stub-key")
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+
+from app.database.models import Base, Resume  # noqa: E402
+from app.services.embeddings import HashingEmbedder  # noqa: E402
+from app.services.resume_matcher import ResumeMatcher, resume_items  # noqa: E402
+
+DOMAINS = [
+    ("추천 시스템", ["Python", "PyTorch", "Spark"], "개인화 추천 모델 학습과 A/B 테스트"),
+    ("결제 플랫폼", ["Java", "Spring", "MySQL"], "결제 승인 API와 정산 배치 개발"),
+    ("실시간 스트리밍", ["Kafka", "Flink", "Redis"], "이벤트 스트림 기반 실시간 집계"),
+    ("검색 엔진", ["Elasticsearch", "Go"], "형태소 분석과 랭킹 튜닝"),
+    ("모바일 앱", ["Kotlin", "Swift"], "앱 출시와 크래시율 개선"),
+    ("데이터 웨어하우스", ["Airflow", "BigQuery", "dbt"], "ETL 파이프라인과 데이터 마트 구축"),
+    ("인프라 자동화", ["Kubernetes", "Terraform", "AWS"], "클러스터 운영과 배포 파이프라인 자동화"),
+    ("프론트엔드", ["React", "TypeScript"], "디자인 시스템과 웹 성능 최적화"),
+]
+
+
+def _resume_data(projects: int) -> dict:
+    return {
+        "person": {"name": "벤치마크", "title": "Software Engineer", "years_of_experience": 10},
+        "skills": [{"name": tech, "category": "tool"} for _, stack, _ in DOMAINS for tech in stack],
+        "career": [{"company": f"회사 {idx}", "position": "Engineer", "description": DOMAINS[idx][2]} for idx in range(4)],
+        "projects": [
+            {
+                "id": f"proj_{idx:04d}",
+                "name": f"{DOMAINS[idx % len(DOMAINS)][0]} 프로젝트 {idx}",
+                "tech_stack": DOMAINS[idx % len(DOMAINS)][1],
+                "actions": [f"{DOMAINS[idx % len(DOMAINS)][2]} ({idx}차)"],
+                "results": [f"처리량 {idx % 50 + 10}% 향상"],
+            }
+            for idx in range(projects)
+        ],
+    }
+
+
+def _jds(count: int) -> list:
+    return [
+        f"{name} 엔지니어 채용. {', '.join(stack)} 경험자. {summary} 업무 담당 ({idx})"
+        for idx, (name, stack, summary) in ((idx, DOMAINS[idx % len(DOMAINS)]) for idx in range(count))
+    ]
+
+
+def _match_loop(embedder: HashingEmbedder, resume: Resume, jd_text: str, top_k: int) -> list:
+    query = embedder.embed([jd_text])[0]
+    scored = []
+    for item in resume_items(resume.data):
+        if item.kind != "project":
+            continue
+        vector = embedder.embed([item.content])[0]
+        scored.append((float(sum(a * b for a, b in zip(vector, query))), item.key))
+    return [key for _, key in sorted(scored, reverse=True)[:top_k]]
+
+
+def _report(label: str, latencies: list):
+    print(
+        f"{label:<7} p50={statistics.median(latencies) * 1000:8.2f}ms  "
+        f"max={max(latencies) * 1000:8.2f}ms  total={sum(latencies):6.2f}s"
+    )
+
+
+async def run(args):
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    embedder = HashingEmbedder()
+    jds = _jds(args.jds)
+
+    async with session_factory() as db:
+        resume = Resume(user_id="bench", data=_resume_data(args.projects))
+        db.add(resume)
+        await db.commit()
+
+        before = []
+        expected = []
+        for jd_text in jds:
+            started = time.perf_counter()
+            expected.append(_match_loop(embedder, resume, jd_text, args.top_k))
+            before.append(time.perf_counter() - started)
+        _report("before", before)
+
+        matcher = ResumeMatcher(db, embedder=embedder)
+        started = time.perf_counter()
+        await matcher.index_resume(resume)
+        print(f"initial index: {(time.perf_counter() - started) * 1000:.1f}ms ({len(resume_items(resume.data))} items)")
+
+        after = []
+        agree = 0
+        for jd_text, keys in zip(jds, expected):
+            started = time.perf_counter()
+            matches = await matcher.match(resume, jd_text, top_k_projects=args.top_k)
+            after.append(time.perf_counter() - started)
+            agree += {match.key for match in matches.projects} == set(keys)
+        _report("after", after)
+        print(f"same top-{args.top_k} projects: {agree}/{len(jds)}")
+
+        # after에서 저장된 임베딩 로드를 뺀 스코어링(행렬곱 + argpartition)만
+        index = await matcher.index_resume(resume)
+        queries = embedder.embed(jds)
+        scoring = []
+        for query in queries:
+            started = time.perf_counter()
+            index.match(query, {"project": args.top_k})
+            scoring.append(time.perf_counter() - started)
+        _report("scoring", scoring)
+
+        data = dict(resume.data)
+        data["projects"] = [*data["projects"][:-1], {**data["projects"][-1], "name": "변경된 프로젝트"}]
+        resume.data = data
+        await db.commit()
+        started = time.perf_counter()
+        await matcher.index_resume(resume)
+        print(f"reindex after 1 project edit: {(time.perf_counter() - started) * 1000:.1f}ms")
+
+    await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="JD ↔ 프로젝트 매칭 벤치마크")
+    parser.add_argument("--projects", type=int, default=200, help="이력서 프로젝트 수")
+    parser.add_argument("--jds", type=int, default=50, help="매칭할 JD 수")
+    parser.add_argument("--top-k", type=int, default=3, help="JD당 선택할 프로젝트 수")
+    args = parser.parse_args()
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+최근 이력서 조회 벤치마크 (user_id 단일 인덱스 + 정렬 vs (user_id, created_at DESC, id DESC) 복합 인덱스)
+
+별도 스키마(bench_latest_resume)에 resumes 테이블을 만들고 기본 100만 행을 넣은 뒤,
+이력 개수가 다른 사용자(10 / 1천 / 1만 / 10만 건)의 최근 이력서 조회 지연 시간을 측정합니다.
+
+    before: user_id 단일 인덱스 + ORDER BY created_at (기존 쿼리, 가장 오래된 행을 반환하던 버그 포함)
+    after:  복합 인덱스 + ResumeRepository.get_recent_resume_by_user_id (인덱스 한 번 탐색)
+
+실행 (docker-compose의 Postgres 사용, SQL 로그는 끄고 측정):
+    DB_ECHO=false uv run python -m benchmarks.bench_latest_resume --rows 1000000 --queries 200
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import time
+
+os.environ.setdefault("OPENAI_API_KEY", "stub-key")
+
+from sqlalchemy import select, text  # noqa: E402
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine  # noqa: E402
+
+from app.database.config import ASYNC_DATABASE_URL  # noqa: E402
+from app.database.models import Base, Resume  # noqa: E402
+from app.repositories.resume_repository import ResumeRepository  # noqa: E402
+
+SCHEMA = "bench_latest_resume"
+HISTORY_SIZES = [10, 1_000, 10_000, 100_000]
+
+
+async def _seed(conn, rows: int):
+    await conn.execute(text("DROP TABLE IF EXISTS resumes CASCADE"))
+    await conn.run_sync(Base.metadata.create_all, tables=[Resume.__table__])
+    await conn.execute(text("DROP INDEX ix_resumes_user_id_created_at"))
+
+    # 이력이 긴 사용자 (heavy-<건수>)
+    for size in HISTORY_SIZES:
+        await conn.execute(text("""
+            INSERT INTO resumes (user_id, data, created_at, updated_at)
+            SELECT :user_id, json_build_object('version', g), now() - g * interval '1 minute', now()
+            FROM generate_series(1, :size) AS g
+        """), {"user_id": f"heavy-{size}", "size": size})
+
+    # 나머지는 사용자당 평균 10건
+    rest = rows - sum(HISTORY_SIZES)
+    await conn.execute(text("""
+        INSERT INTO resumes (user_id, data, created_at, updated_at)
+        SELECT 'user-' || (g % :users), json_build_object('version', g), now() - g * interval '1 second', now()
+        FROM generate_series(1, :rest) AS g
+    """), {"users": max(rest // 10, 1), "rest": rest})
+
+    # 기존 스키마: user_id 단일 인덱스
+    await conn.execute(text("CREATE INDEX ix_resumes_user_id ON resumes (user_id)"))
+    await conn.execute(text("ANALYZE resumes"))
+
+
+async def _time(query, queries: int) -> float:
+    latencies = []
+    for _ in range(queries):
+        started = time.perf_counter()
+        await query()
+        latencies.append(time.perf_counter() - started)
+    return statistics.median(latencies) * 1000
+
+
+async def _measure(label: str, session_factory, query, queries: int) -> dict:
+    result = {"label": label}
+    async with session_factory() as db:
+        for size in HISTORY_SIZES:
+            user_id = f"heavy-{size}"
+            await query(db, user_id)  # 워밍업
+            result[size] = round(await _time(lambda: query(db, user_id), queries), 3)
+
+    print(f"{label:<7} " + "  ".join(f"history={size:<6} p50={result[size]:8.3f}ms" for size in HISTORY_SIZES))
+    return result
+
+
+async def _legacy_query(db, user_id: str):
+    # 기존 ResumeRepository.get_recent_resume_by_user_id 쿼리
+    result = await db.scalars(select(Resume).where(Resume.user_id == user_id).order_by(Resume.created_at).limit(1))
+    return result.first()
+
+
+async def _repository_query(db, user_id: str):
+    return await ResumeRepository(db).get_recent_resume_by_user_id(user_id)
+
+
+async def run(args):
+    engine = create_async_engine(ASYNC_DATABASE_URL, connect_args={"options": f"-csearch_path={SCHEMA}"})
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with engine.begin() as conn:
+        await conn.execute(text(f"CREATE SCHEMA IF NOT EXISTS {SCHEMA}"))
+    async with engine.begin() as conn:
+        started = time.perf_counter()
+        await _seed(conn, args.rows)
+        print(f"seeded {args.rows:,} rows in {time.perf_counter() - started:.1f}s")
+
+    await _measure("before", session_factory, _legacy_query, args.queries)
+
+    # init_db와 같은 방식으로 모델의 복합 인덱스 생성
+    async with engine.begin() as conn:
+        for index in Resume.__table__.indexes:
+            await conn.run_sync(index.create, checkfirst=True)
+        await conn.execute(text("DROP INDEX ix_resumes_user_id"))
+        await conn.execute(text("ANALYZE resumes"))
+
+    await _measure("after", session_factory, _repository_query, args.queries)
+
+    if not args.keep:
+        async with engine.begin() as conn:
+            await conn.execute(text(f"DROP SCHEMA {SCHEMA} CASCADE"))
+    await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="최근 이력서 조회 벤치마크 (단일 인덱스 vs 복합 인덱스)")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--queries", type=int, default=200, help="사용자별 반복 조회 횟수")
+    parser.add_argument("--keep", action="store_true", help="측정 후 벤치마크 스키마를 지우지 않음")
+    args = parser.parse_args()
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+LLM 응답 캐시 벤치마크 (캐시 없음 vs 호출 지점별 정책의 영속 응답 캐시)
+
+stub 서버를 쓰는 ChatModelPool로 반복되는 두 가지 호출을 실행하고, 실제 LLM 요청 수와 호출당 지연을 비교합니다.
+캐시는 별도 스키마(bench_llm_cache)의 Postgres 테이블에 저장합니다.
+
+    completion: completion_node (완료 사유 3가지를 번갈아 사용, temperature 0.7 샘플링이므로 CachePolicy.NEVER로 매번 호출)
+    analysis:   바뀌지 않은 이력서 재분석 (temperature 0 분석만 재사용, 0.7인 질문 문구 일괄 생성은 매번 호출)
+
+    before: ChatModelPool(response_cache=None)
+    after:  ChatModelPool(response_cache=LLMResponseCache(...))
+
+실행 (docker-compose의 Postgres 사용, SQL 로그는 끄고 측정):
+    DB_ECHO=false uv run python -m benchmarks.bench_llm_cache --calls 30 --latency 0.3
+"""
+import argparse
+import asyncio
+import copy
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+import httpx
+
+os.environ.setdefault("OPENAI_API_KEY", "stub-key")
+
+from sqlalchemy import text  # noqa: E402
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine  # noqa: E402
+
+from app.agents.nodes import completion_node  # noqa: E402
+from app.core.llm import ChatModelPool  # noqa: E402
+from app.database.config import ASYNC_DATABASE_URL  # noqa: E402
+from app.database.models import Base, LLMResponseCacheEntry, Resume, ResumeVersion  # noqa: E402
+from app.services.llm_cache import LLMCacheStats, LLMResponseCache  # noqa: E402
+from app.services.resume_cache import close_resume_cache  # noqa: E402
+from app.services.user_resume_service import UserResumeService  # noqa: E402
+from benchmarks.fixtures import CANNED_EXTRACTION  # noqa: E402
+
+SCHEMA = "bench_llm_cache"
+TABLES = [Resume.__table__, ResumeVersion.__table__, LLMResponseCacheEntry.__table__]
+
+# completion_node의 완료 사유를 결정하는 상태 (5개 완료 / 질문 없음 / 모든 질문 완료)
+COMPLETION_STATES = [
+    {"answered_count": 5, "improvement_questions": [{}] * 5},
+    {"answered_count": 0, "improvement_questions": []},
+    {"answered_count": 3, "improvement_questions": [{}] * 3},
+]
+
+
+async def _requests(client: httpx.AsyncClient) -> int:
+    return (await client.get("/stats")).json()["requests"]
+
+
+async def _measure(label: str, client, pool: ChatModelPool, session_factory, calls: int) -> dict:
+    await client.delete("/stats")
+    await close_resume_cache()
+
+    completion = []
+    for idx in range(calls):
+        started = time.perf_counter()
+        await completion_node(COMPLETION_STATES[idx % len(COMPLETION_STATES)], config={}, llm=pool)  # type: ignore[arg-type]
+        completion.append(time.perf_counter() - started)
+    completion_requests = await _requests(client)
+
+    analysis = []
+    async with session_factory() as db:
+        db.add(Resume(user_id="bench", data=copy.deepcopy(CANNED_EXTRACTION)))
+        await db.commit()
+        # PDF는 읽지 않으므로 프로세스 풀을 만드는 전역 추출 엔진 대신 더미 전달
+        service = UserResumeService(db, llm=pool, pdf_extractor=object())  # type: ignore[arg-type]
+        for _ in range(max(calls // 3, 1)):
+            started = time.perf_counter()
+            await service.analyze_resume(user_id="bench")
+            analysis.append(time.perf_counter() - started)
+    analysis_requests = await _requests(client) - completion_requests
+
+    result = {
+        "mode": label,
+        "completion_calls": len(completion),
+        "completion_llm_requests": completion_requests,
+        "completion_ms_median": round(statistics.median(completion) * 1000, 1),
+        "analysis_calls": len(analysis),
+        "analysis_llm_requests": analysis_requests,
+        "analysis_ms_median": round(statistics.median(analysis) * 1000, 1),
+    }
+    print(
+        f"{label:<7} completion: {len(completion)} calls → {completion_requests:3d} LLM requests, "
+        f"p50={result['completion_ms_median']:7.1f}ms | "
+        f"analysis: {len(analysis)} calls → {analysis_requests:3d} LLM requests, p50={result['analysis_ms_median']:7.1f}ms"
+    )
+    return result
+
+
+async def run(args):
+    engine = create_async_engine(ASYNC_DATABASE_URL, connect_args={"options": f"-csearch_path={SCHEMA}"})
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with engine.begin() as conn:
+        await conn.execute(text(f"CREATE SCHEMA IF NOT EXISTS {SCHEMA}"))
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all, tables=TABLES)
+        await conn.run_sync(Base.metadata.create_all, tables=TABLES)
+
+    base_url = f"http://127.0.0.1:{args.stub_port}"
+    stub = subprocess.Popen([
+        sys.executable, "-m", "benchmarks.stub_llm_server",
+        "--port", str(args.stub_port),
+        "--latency", str(args.latency),
+        "--chunk-latency", str(args.chunk_latency),
+    ])
+    try:
+        async with httpx.AsyncClient(base_url=base_url) as client:
+            for _ in range(50):
+                try:
+                    await client.get("/stats")
+                    break
+                except httpx.TransportError:
+                    await asyncio.sleep(0.1)
+
+            pool = ChatModelPool(base_url=f"{base_url}/v1")
+            await _measure("before", client, pool, session_factory, args.calls)
+            await pool.aclose()
+
+            stats = LLMCacheStats()
+            cache = LLMResponseCache(session_factory, stats=stats)
+            pool = ChatModelPool(base_url=f"{base_url}/v1", response_cache=cache)
+            await _measure("after", client, pool, session_factory, args.calls)
+            await pool.aclose()
+            print(f"cache: {stats.snapshot()}")
+    finally:
+        stub.terminate()
+        stub.wait()
+        await close_resume_cache()
+        if not args.keep:
+            async with engine.begin() as conn:
+                await conn.execute(text(f"DROP SCHEMA {SCHEMA} CASCADE"))
+        await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="LLM 응답 캐시 벤치마크")
+    parser.add_argument("--calls", type=int, default=30, help="completion_node 호출 수 (재분석은 1/3)")
+    parser.add_argument("--latency", type=float, default=0.3, help="Stub 첫 응답 지연 (초)")
+    parser.add_argument("--chunk-latency", type=float, default=0.005, help="Stub 스트리밍 조각 사이 지연 (초)")
+    parser.add_argument("--stub-port", type=int, default=9000)
+    parser.add_argument("--keep", action="store_true", help="측정 후 벤치마크 스키마를 지우지 않음")
+    args = parser.parse_args()
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+PDF 텍스트 추출 벤치마크 (임시 파일 + PyPDFLoader 순차 처리 vs 메모리 기반 프로세스 풀)
+
+tests/fixtures/data 의 TEST_RESUME.pdf / TEST_CAREER.pdf 를 사용합니다.
+처리 시간과 함께, 추출 중 이벤트 루프가 얼마나 막혔는지(최대 지연)를 측정합니다.
+
+실행:
+    uv run python -m benchmarks.bench_pdf_extraction --copies 4 --workers 4
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+os.environ.setdefault("OPENAI_API_KEY", "stub-key")
+
+from langchain_community.document_loaders import PyPDFLoader  # noqa: E402
+from langchain_core.documents import Document  # noqa: E402
+
+from app.services.pdf_extractor import PdfTextExtractor  # noqa: E402
+
+FIXTURES_DIR = Path(__file__).resolve().parent.parent / "tests" / "fixtures" / "data"
+FIXTURE_NAMES = ["TEST_RESUME.pdf", "TEST_CAREER.pdf"]
+
+
+async def legacy_extract(pdf_contents: List[bytes]) -> List[Document]:
+    """기존 방식: 임시 파일 저장 후 PyPDFLoader로 순차 파싱 (이벤트 루프에서 실행)"""
+    all_documents = []
+    for idx, pdf_content in enumerate(pdf_contents):
+        with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp_file:
+            tmp_file.write(pdf_content)
+            tmp_file_path = tmp_file.name
+        try:
+            documents = PyPDFLoader(tmp_file_path).load()
+            for doc in documents:
+                doc.metadata["source_pdf_index"] = idx
+            all_documents.extend(documents)
+        finally:
+            os.unlink(tmp_file_path)
+    return all_documents
+
+
+async def _max_loop_lag(stop: asyncio.Event, interval: float = 0.005) -> float:
+    """이벤트 루프 지연 측정용 ticker"""
+    worst = 0.0
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        worst = max(worst, time.perf_counter() - started - interval)
+    return worst
+
+
+async def _measure(label: str, extract, pdf_contents: List[bytes], rounds: int):
+    timings, lags, pages = [], [], 0
+    for _ in range(rounds):
+        stop = asyncio.Event()
+        ticker = asyncio.create_task(_max_loop_lag(stop))
+        await asyncio.sleep(0)
+
+        started = time.perf_counter()
+        documents = await extract(pdf_contents)
+        timings.append(time.perf_counter() - started)
+
+        stop.set()
+        lags.append(await ticker)
+        pages = len(documents)
+
+    print(
+        f"{label:<8} files={len(pdf_contents):<3} pages={pages:<4} "
+        f"best={min(timings) * 1000:8.1f}ms  max_loop_lag={max(lags) * 1000:8.1f}ms"
+    )
+
+
+async def run(args):
+    missing = [name for name in FIXTURE_NAMES if not (FIXTURES_DIR / name).exists()]
+    if missing:
+        raise SystemExit(f"fixture PDF가 없습니다: {', '.join(missing)} ({FIXTURES_DIR})")
+
+    fixtures = [(FIXTURES_DIR / name).read_bytes() for name in FIXTURE_NAMES]
+    pdf_contents = fixtures * args.copies
+
+    extractor = PdfTextExtractor(max_workers=args.workers)
+    await extractor.extract(fixtures)  # 워커 프로세스 워밍업
+
+    try:
+        await _measure("legacy", legacy_extract, pdf_contents, args.rounds)
+        await _measure("engine", extractor.extract, pdf_contents, args.rounds)
+    finally:
+        extractor.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PDF 텍스트 추출 벤치마크")
+    parser.add_argument("--copies", type=int, default=1, help="fixture 묶음 반복 횟수 (파일 수 = 2 x copies)")
+    parser.add_argument("--workers", type=int, default=4, help="프로세스 풀 크기")
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
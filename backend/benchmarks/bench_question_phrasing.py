@@ -0,0 +1,125 @@
+"""
+채팅 턴 응답 지연 벤치마크 (매 턴 질문 문구 LLM 생성 vs 분석 직후 일괄 생성한 문구 사용)
+
+LLM은 호출마다 고정 지연(--latency) 후 준비된 응답을 돌려주는 가짜 풀, 이력서는 in-memory SQLite,
+체크포인트는 InMemorySaver에 둡니다. 한 세션에서 모든 개선 질문에 답하는 동안의 턴별 응답 시간과 LLM 호출 수를 측정합니다.
+
+    before: 분석 결과에 phrasing 없음 → generate_response가 턴마다 LLM 호출
+    after:  UserResumeService.phrase_questions()로 한 번에 생성 (이 호출 1회는 분석 단계 비용으로 따로 표시)
+
+실행:
+    uv run python -m benchmarks.bench_question_phrasing --latency 0.8
+"""
+import argparse
+import asyncio
+import copy
+import json
+import os
+import statistics
+import time
+import uuid
+
+os.environ.setdefault("OPENAI_API_KEY", "stub-key")
+
+from langchain_core.messages import AIMessage  # noqa: E402
+from langgraph.checkpoint.memory import InMemorySaver  # noqa: E402
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+
+from app.agents.graph import create_resume_coach_graph, run_resume_coach  # noqa: E402
+from app.database.models import Base, Resume  # noqa: E402
+from app.models.schemas import ResumeAnalysis  # noqa: E402
+from app.services.resume_cache import close_resume_cache  # noqa: E402
+from app.services.user_resume_service import UserResumeService  # noqa: E402
+from benchmarks.fixtures import CANNED_ANALYSIS, CANNED_EXTRACTION, CANNED_PATCH, CHAT_REPLY  # noqa: E402
+
+
+class LatencyChatModelPool:
+    """호출마다 고정 지연 후 프롬프트 종류에 맞는 응답을 돌려주는 가짜 풀"""
+
+    model_name = "latency"
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.calls = 0
+
+    async def ainvoke(self, messages, temperature=0.3, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(self.latency)
+        return AIMessage(content=CHAT_REPLY)
+
+    async def astream(self, messages, temperature=0.3, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(self.latency)
+        if "자연스러운 메시지" in messages[0].content:
+            questions = CANNED_ANALYSIS["improvement_questions"]
+            yield json.dumps({"phrasings": [{"index": i, "message": CHAT_REPLY} for i in range(len(questions))]})
+        else:
+            yield json.dumps(CANNED_PATCH, ensure_ascii=False)
+
+
+async def _run_session(label: str, session_factory, analysis: dict, latency: float) -> dict:
+    await close_resume_cache()
+    async with session_factory() as db:
+        db.add(Resume(user_id="1", data=copy.deepcopy(CANNED_EXTRACTION), analysis=analysis))
+        await db.commit()
+
+    graph = create_resume_coach_graph(InMemorySaver())
+    llm = LatencyChatModelPool(latency)
+    session_id = f"bench-{uuid.uuid4()}"
+    latencies = []
+
+    # 첫 턴(답변 없음) + 질문 수만큼 답변
+    answers = [""] + [f"답변 {idx}" for idx in range(len(analysis["improvement_questions"]))]
+    for answer in answers:
+        async with session_factory() as db:
+            started = time.perf_counter()
+            await run_resume_coach(session_id, "1", answer, db, llm=llm, graph=graph)  # type: ignore[arg-type]
+            latencies.append(time.perf_counter() - started)
+
+    result = {
+        "mode": label,
+        "turns": len(latencies),
+        "first_turn_ms": round(latencies[0] * 1000, 1),
+        "answer_turn_ms_median": round(statistics.median(latencies[1:-1] or latencies[1:]) * 1000, 1),
+        "chat_llm_calls": llm.calls,
+    }
+    print(
+        f"{label:<7} first_turn={result['first_turn_ms']:7.1f}ms  "
+        f"answer_turn_p50={result['answer_turn_ms_median']:7.1f}ms  chat_llm_calls={llm.calls}"
+    )
+    return result
+
+
+async def run(args):
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    await _run_session("before", session_factory, CANNED_ANALYSIS, args.latency)
+
+    # 분석 직후 단계: 질문 문구 일괄 생성 (LLM 1회)
+    llm = LatencyChatModelPool(args.latency)
+    analysis = ResumeAnalysis.model_validate(CANNED_ANALYSIS)
+    async with session_factory() as db:
+        started = time.perf_counter()
+        await UserResumeService(db, llm=llm).phrase_questions(analysis)  # type: ignore[arg-type]
+        print(f"analysis-time phrasing: {(time.perf_counter() - started) * 1000:.1f}ms (LLM calls={llm.calls})")
+
+    await _run_session("after", session_factory, analysis.model_dump(), args.latency)
+
+    await close_resume_cache()
+    await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="채팅 턴 응답 지연 벤치마크 (질문 문구 사전 생성)")
+    parser.add_argument("--latency", type=float, default=0.8, help="LLM 호출당 지연 (초)")
+    args = parser.parse_args()
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
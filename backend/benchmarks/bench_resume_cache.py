@@ -0,0 +1,163 @@
+"""
+채팅 턴당 DB 왕복 벤치마크 (매 턴 Postgres에서 최근 이력서 로드 vs 프로세스 내 이력서 캐시)
+
+LLM은 즉시 응답하는 가짜 풀, 체크포인트는 InMemorySaver로 두고 이력서 읽기/쓰기만 Postgres에서 수행합니다.
+한 사용자가 여러 코칭 세션(세션당 첫 턴 + 답변 3턴)을 진행하며, 턴마다 새 DB 세션(요청 단위)을 사용합니다.
+마지막으로 PostgresInvalidationChannel을 쓰는 두 캐시(워커 2개 가정) 사이의 무효화 전파 지연을 측정합니다.
+
+    before: RESUME_CACHE_ENABLED=false (load_resume이 매 턴 DB 조회)
+    after:  RESUME_CACHE_ENABLED=true  (read-through + update_data write-through)
+
+실행 (docker-compose의 Postgres 사용, SQL 로그는 끄고 측정):
+    DB_ECHO=false uv run python -m benchmarks.bench_resume_cache --sessions 25
+"""
+import argparse
+import asyncio
+import copy
+import json
+import os
+import statistics
+import time
+import uuid
+
+os.environ.setdefault("OPENAI_API_KEY", "stub-key")
+
+from langchain_core.messages import AIMessage  # noqa: E402
+from langgraph.checkpoint.memory import InMemorySaver  # noqa: E402
+from sqlalchemy import text  # noqa: E402
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine  # noqa: E402
+
+from app.agents.graph import create_resume_coach_graph, run_resume_coach  # noqa: E402
+from app.database.config import ASYNC_DATABASE_URL, DATABASE_URL  # noqa: E402
+from app.database.models import Base, Resume, ResumeVersion  # noqa: E402
+from app.services.resume_cache import (  # noqa: E402
+    PostgresInvalidationChannel,
+    ResumeCache,
+    ResumeCacheStats,
+    close_resume_cache,
+    get_resume_cache,
+    resume_cache_stats,
+)
+from benchmarks.fixtures import CANNED_ANALYSIS, CANNED_EXTRACTION, CANNED_PATCH, CHAT_REPLY  # noqa: E402
+
+SCHEMA = "bench_resume_cache"
+USER_ID = "bench-cache"
+ANSWERS = ["", "결제 실패율이 줄었습니다.", "Kafka 파티션을 다시 설계했습니다.", "추천 클릭률이 올랐습니다."]
+
+
+class InstantChatModelPool:
+    """LLM 지연 없이 준비된 응답을 돌려주는 가짜 풀 (패치마다 다른 성과를 추가)"""
+
+    model_name = "instant"
+
+    async def ainvoke(self, messages, temperature=0.3, **kwargs):
+        return AIMessage(content=CHAT_REPLY)
+
+    async def astream(self, messages, temperature=0.3, **kwargs):
+        patch = {**CANNED_PATCH, "add_results": [f"성과 {uuid.uuid4().hex[:8]}"]}
+        yield json.dumps(patch, ensure_ascii=False)
+
+
+async def _run_turns(label: str, session_factory, sessions: int, enabled: bool) -> dict:
+    await close_resume_cache()
+    cache = get_resume_cache()
+    cache.enabled = enabled
+    stats_before = resume_cache_stats.snapshot()
+    turns_before, queries_before = resume_cache_stats.turns, resume_cache_stats.turn_queries
+
+    graph = create_resume_coach_graph(InMemorySaver())
+    llm = InstantChatModelPool()
+    latencies = []
+
+    for _ in range(sessions):
+        session_id = f"bench-{uuid.uuid4()}"
+        for answer in ANSWERS:
+            async with session_factory() as db:
+                started = time.perf_counter()
+                await run_resume_coach(session_id, USER_ID, answer, db, llm=llm, graph=graph)  # type: ignore[arg-type]
+                latencies.append(time.perf_counter() - started)
+
+    turns = resume_cache_stats.turns - turns_before
+    queries = resume_cache_stats.turn_queries - queries_before
+    hits = resume_cache_stats.hits - stats_before["hits"]
+    misses = resume_cache_stats.misses - stats_before["misses"]
+    result = {
+        "mode": label,
+        "turns": turns,
+        "db_queries_per_turn": round(queries / turns, 2),
+        "hit_ratio": round(hits / (hits + misses), 3) if hits + misses else 0.0,
+        "turn_ms_median": round(statistics.median(latencies) * 1000, 2),
+    }
+    print(
+        f"{label:<7} turns={turns:<4} db_queries/turn={result['db_queries_per_turn']:5.2f}  "
+        f"hit_ratio={result['hit_ratio']:.3f}  turn={result['turn_ms_median']:6.2f}ms"
+    )
+    return result
+
+
+async def _measure_propagation(rounds: int) -> dict:
+    """워커 A에서 무효화 → 워커 B의 엔트리가 지워질 때까지 걸린 시간"""
+    worker_a = ResumeCache(channel=PostgresInvalidationChannel(DATABASE_URL), stats=ResumeCacheStats())
+    worker_b = ResumeCache(channel=PostgresInvalidationChannel(DATABASE_URL), stats=ResumeCacheStats())
+    await worker_a.start()
+    await worker_b.start()
+
+    resume = Resume(id=1, user_id=USER_ID, data=CANNED_EXTRACTION, analysis=None)
+    resume.updated_at = None  # type: ignore[assignment]
+
+    async def loader():
+        return resume
+
+    delays = []
+    for _ in range(rounds):
+        await worker_b.get_or_load(USER_ID, loader)
+        started = time.perf_counter()
+        await worker_a.invalidate(USER_ID)
+        while USER_ID in worker_b._entries:
+            await asyncio.sleep(0.0005)
+        delays.append(time.perf_counter() - started)
+
+    await worker_a.close()
+    await worker_b.close()
+
+    result = {"propagation_ms_median": round(statistics.median(delays) * 1000, 2)}
+    print(f"LISTEN/NOTIFY invalidation propagation p50={result['propagation_ms_median']:.2f}ms")
+    return result
+
+
+async def run(args):
+    engine = create_async_engine(ASYNC_DATABASE_URL, connect_args={"options": f"-csearch_path={SCHEMA}"})
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with engine.begin() as conn:
+        await conn.execute(text(f"CREATE SCHEMA IF NOT EXISTS {SCHEMA}"))
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all, tables=[ResumeVersion.__table__, Resume.__table__])
+        await conn.run_sync(Base.metadata.create_all, tables=[Resume.__table__, ResumeVersion.__table__])
+    async with session_factory() as db:
+        db.add(Resume(user_id=USER_ID, data=copy.deepcopy(CANNED_EXTRACTION), analysis=CANNED_ANALYSIS))
+        await db.commit()
+
+    await _run_turns("before", session_factory, args.sessions, enabled=False)
+    await _run_turns("after", session_factory, args.sessions, enabled=True)
+    await _measure_propagation(args.rounds)
+
+    await close_resume_cache()
+    if not args.keep:
+        async with engine.begin() as conn:
+            await conn.execute(text(f"DROP SCHEMA {SCHEMA} CASCADE"))
+    await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="채팅 턴당 DB 왕복 벤치마크 (이력서 캐시)")
+    parser.add_argument("--sessions", type=int, default=25, help="코칭 세션 수 (세션당 4턴)")
+    parser.add_argument("--rounds", type=int, default=50, help="무효화 전파 측정 횟수")
+    parser.add_argument("--keep", action="store_true", help="측정 후 벤치마크 스키마를 지우지 않음")
+    args = parser.parse_args()
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+이력서 기술/기술 스택 검색 벤치마크 (전체 로드 후 Python 필터 vs JSONB @> + GIN jsonb_path_ops 인덱스)
+
+별도 스키마(bench_resume_search)에 resumes 테이블을 만들고 기본 10만 행을 넣은 뒤 검색 지연 시간을 비교합니다.
+각 행은 픽스처 이력서를 바탕으로 기술 하나(Tech-<0..999>)를 바꿔 넣고, 1% 행에만 Kafka가 있습니다.
+
+    before: 모든 이력서 JSON을 읽어 Python에서 조건 확인 (JSON 컬럼에서 가능한 유일한 방법)
+    after:  ResumeRepository.search (조건을 data @> ...로 Postgres에 전달, GIN 인덱스 사용)
+
+실행 (docker-compose의 Postgres 사용, SQL 로그는 끄고 측정):
+    DB_ECHO=false uv run python -m benchmarks.bench_resume_search --rows 100000
+"""
+import argparse
+import asyncio
+import copy
+import json
+import os
+import statistics
+import time
+
+os.environ.setdefault("OPENAI_API_KEY", "stub-key")
+
+from sqlalchemy import select, text  # noqa: E402
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine  # noqa: E402
+
+from app.database.config import ASYNC_DATABASE_URL  # noqa: E402
+from app.database.models import Base, Resume  # noqa: E402
+from app.repositories.resume_repository import ResumeRepository, json_contains, resume_search_conditions  # noqa: E402
+from benchmarks.fixtures import CANNED_EXTRACTION  # noqa: E402
+
+SCHEMA = "bench_resume_search"
+
+# (라벨, 검색 조건) - 선택도가 다른 조건들
+SEARCHES = [
+    ("skill=Kafka (1%)", {"skill": "Kafka"}),
+    ("tech_stack=Tech-7 (0.1%)", {"tech_stack": "Tech-7"}),
+    ("skill=Kafka+category=tool", {"skill": "Kafka", "category": "tool"}),
+    ("category=cloud (100%)", {"category": "cloud"}),
+]
+
+
+def _base_resume() -> dict:
+    base = copy.deepcopy(CANNED_EXTRACTION)
+    base["skills"] = [skill for skill in base["skills"] if skill["name"] != "Kafka"]
+    for project in base["projects"]:
+        project["tech_stack"] = [tech for tech in project["tech_stack"] if tech != "Kafka"]
+    return base
+
+
+async def _seed(conn, rows: int):
+    await conn.execute(text("DROP TABLE IF EXISTS resumes CASCADE"))
+    await conn.run_sync(Base.metadata.create_all, tables=[Resume.__table__])
+    await conn.execute(text("""
+        INSERT INTO resumes (user_id, data, created_at, updated_at)
+        SELECT
+            'user-' || g,
+            jsonb_set(
+                jsonb_set(
+                    CAST(:base AS jsonb), '{skills}',
+                    CAST(:base AS jsonb) -> 'skills'
+                        || jsonb_build_array(jsonb_build_object('name', 'Tech-' || (g % 1000), 'category', 'tool'))
+                        || CASE WHEN g % 100 = 0 THEN '[{"name": "Kafka", "category": "tool"}]'::jsonb ELSE '[]'::jsonb END
+                ),
+                '{projects,0,tech_stack}',
+                CAST(:base AS jsonb) #> '{projects,0,tech_stack}'
+                    || jsonb_build_array('Tech-' || (g % 1000))
+                    || CASE WHEN g % 100 = 0 THEN '["Kafka"]'::jsonb ELSE '[]'::jsonb END
+            ),
+            now() - g * interval '1 second',
+            now()
+        FROM generate_series(1, :rows) AS g
+    """), {"base": json.dumps(_base_resume(), ensure_ascii=False), "rows": rows})
+    await conn.execute(text("ANALYZE resumes"))
+
+
+async def _scan_search(db, limit: int, **filters) -> list:
+    """기존 방식: 전체 이력서를 읽어 Python에서 확인"""
+    conditions = resume_search_conditions(**filters)
+    resumes = (await db.scalars(select(Resume).order_by(Resume.created_at.desc(), Resume.id.desc()))).all()
+    matched = [resume for resume in resumes if all(json_contains(resume.data, c) for c in conditions)]
+    return matched[:limit]
+
+
+async def _measure(label: str, session_factory, search, queries: int, limit: int) -> dict:
+    result = {"label": label}
+    async with session_factory() as db:
+        for name, filters in SEARCHES:
+            matched = await search(db, limit, **filters)  # 워밍업
+            latencies = []
+            for _ in range(queries):
+                db.expunge_all()
+                started = time.perf_counter()
+                await search(db, limit, **filters)
+                latencies.append(time.perf_counter() - started)
+            result[name] = {"p50_ms": round(statistics.median(latencies) * 1000, 2), "matched": len(matched)}
+            print(f"{label:<7} {name:<28} p50={result[name]['p50_ms']:10.2f}ms  results={len(matched)}")
+    return result
+
+
+async def run(args):
+    engine = create_async_engine(ASYNC_DATABASE_URL, connect_args={"options": f"-csearch_path={SCHEMA}"})
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with engine.begin() as conn:
+        await conn.execute(text(f"CREATE SCHEMA IF NOT EXISTS {SCHEMA}"))
+    async with engine.begin() as conn:
+        started = time.perf_counter()
+        await _seed(conn, args.rows)
+        print(f"seeded {args.rows:,} rows in {time.perf_counter() - started:.1f}s")
+
+    await _measure("before", session_factory, _scan_search, args.scan_queries, args.limit)
+    await _measure(
+        "after", session_factory,
+        lambda db, limit, **filters: ResumeRepository(db).search(limit=limit, **filters),
+        args.queries, args.limit,
+    )
+
+    if not args.keep:
+        async with engine.begin() as conn:
+            await conn.execute(text(f"DROP SCHEMA {SCHEMA} CASCADE"))
+    await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="이력서 검색 벤치마크 (전체 로드 vs JSONB GIN 인덱스)")
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--limit", type=int, default=20, help="검색 결과 최대 수")
+    parser.add_argument("--queries", type=int, default=50, help="조건별 반복 조회 횟수 (after)")
+    parser.add_argument("--scan-queries", type=int, default=1, help="조건별 반복 조회 횟수 (before, 느림)")
+    parser.add_argument("--keep", action="store_true", help="측정 후 벤치마크 스키마를 지우지 않음")
+    args = parser.parse_args()
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
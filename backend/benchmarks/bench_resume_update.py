@@ -0,0 +1,120 @@
+"""
+대화 턴별 이력서 업데이트 벤치마크 (전체 이력서 재생성 vs 프로젝트 단위 패치)
+
+update_resume_node를 in-memory SQLite와 stub 서버로 실행해 턴당 지연 시간과 토큰 사용량을 비교합니다.
+토큰 수는 stub 서버의 /stats (문자 수 / 4 근사)에서 읽습니다.
+
+실행:
+    uv run python -m benchmarks.bench_resume_update --turns 5 --latency 0.3 --chunk-latency 0.005
+"""
+import argparse
+import asyncio
+import copy
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+import httpx
+
+os.environ.setdefault("OPENAI_API_KEY", "stub-key")
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+
+from app.agents.nodes import update_resume_node  # noqa: E402
+from app.core.config import settings  # noqa: E402
+from app.core.llm import ChatModelPool  # noqa: E402
+from app.database.models import Base, Resume  # noqa: E402
+from benchmarks.fixtures import CANNED_EXTRACTION  # noqa: E402
+
+QUESTION = {
+    "category": "STAR-결과",
+    "project_id": "proj_002",
+    "question": "주문 이벤트 파이프라인 도입 후 측정 가능한 성과가 있었나요?",
+    "purpose": "프로젝트의 임팩트를 정량적으로 표현하기 위함",
+}
+ANSWER = "피크 시간 결제 실패율이 3%에서 0.2%로 줄었고, Kafka 파티션을 다시 설계했습니다."
+
+
+async def _measure(client: httpx.AsyncClient, pool: ChatModelPool, mode: str, turns: int) -> dict:
+    settings.resume_update_mode = mode
+
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    latencies = []
+
+    async with async_sessionmaker(engine, expire_on_commit=False)() as db:
+        db.add(Resume(user_id="1", data=copy.deepcopy(CANNED_EXTRACTION)))
+        await db.commit()
+
+        await client.delete("/stats")
+        for _ in range(turns):
+            state = {
+                "user_id": "1",
+                "user_answer": ANSWER,
+                "answered_question": QUESTION,
+                "current_resume_data": copy.deepcopy(CANNED_EXTRACTION),
+                "answered_count": 0,
+                "current_question_index": 0,
+            }
+            started = time.perf_counter()
+            await update_resume_node(state, db, llm=pool)  # type: ignore[arg-type]
+            latencies.append(time.perf_counter() - started)
+        stats = (await client.get("/stats")).json()
+
+    result = {
+        "mode": mode,
+        "turn_ms_median": round(statistics.median(latencies) * 1000, 1),
+        "prompt_tokens_per_turn": stats["prompt_tokens"] // turns,
+        "completion_tokens_per_turn": stats["completion_tokens"] // turns,
+    }
+    print(
+        f"{mode:<6} turn={result['turn_ms_median']:8.1f}ms  "
+        f"prompt_tokens/turn={result['prompt_tokens_per_turn']:6d}  "
+        f"completion_tokens/turn={result['completion_tokens_per_turn']:6d}"
+    )
+    return result
+
+
+async def run(args):
+    base_url = f"http://127.0.0.1:{args.stub_port}"
+    stub = subprocess.Popen([
+        sys.executable, "-m", "benchmarks.stub_llm_server",
+        "--port", str(args.stub_port),
+        "--latency", str(args.latency),
+        "--chunk-latency", str(args.chunk_latency),
+    ])
+    try:
+        async with httpx.AsyncClient(base_url=base_url) as client:
+            for _ in range(50):
+                try:
+                    await client.get("/stats")
+                    break
+                except httpx.TransportError:
+                    await asyncio.sleep(0.1)
+
+            pool = ChatModelPool(base_url=f"{base_url}/v1")
+            await _measure(client, pool, "full", args.turns)
+            await _measure(client, pool, "patch", args.turns)
+            await pool.aclose()
+    finally:
+        stub.terminate()
+        stub.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="전체 재생성 vs 프로젝트 단위 패치 업데이트 벤치마크")
+    parser.add_argument("--turns", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=0.3, help="Stub 첫 응답 지연 (초)")
+    parser.add_argument("--chunk-latency", type=float, default=0.005, help="Stub 스트리밍 조각 사이 지연 (초)")
+    parser.add_argument("--stub-port", type=int, default=9000)
+    args = parser.parse_args()
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""
+이력서 버전 기록 쓰기 증폭 벤치마크 (제자리 덮어쓰기 vs 매 버전 전체 복사 vs JSON Patch + 주기적 스냅샷)
+
+별도 스키마(bench_resume_versions)에서 코칭 답변처럼 프로젝트 하나에 성과 한 줄을 추가하는 턴을 반복하고,
+턴당 WAL 기록량(pg_current_wal_insert_lsn 차이), 테이블 크기 증가량, 특정 버전 복원 지연 시간을 측정합니다.
+
+    overwrite:  기존 방식 - Resume.data를 제자리에서 덮어씀 (이력 없음)
+    full-copy:  매 버전 전체 스냅샷 (snapshot_interval=1)
+    patch:      ResumeRepository.update_data - RFC 6902 patch + N 버전마다 스냅샷 (현재 버전은 Resume.data)
+
+실행 (docker-compose의 Postgres 사용, SQL 로그는 끄고 측정):
+    DB_ECHO=false uv run python -m benchmarks.bench_resume_versions --turns 200 --projects 12
+"""
+import argparse
+import asyncio
+import copy
+import os
+import random
+import statistics
+import time
+
+os.environ.setdefault("OPENAI_API_KEY", "stub-key")
+
+from sqlalchemy import text  # noqa: E402
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine  # noqa: E402
+
+from app.core.config import settings  # noqa: E402
+from app.database.config import ASYNC_DATABASE_URL  # noqa: E402
+from app.database.models import Base, Resume, ResumeVersion  # noqa: E402
+from app.models.schemas import ResumeExtraction  # noqa: E402
+from app.repositories import ResumeRepository, ResumeVersionRepository  # noqa: E402
+from benchmarks.fixtures import CANNED_EXTRACTION  # noqa: E402
+
+SCHEMA = "bench_resume_versions"
+
+
+def _resume(projects: int) -> dict:
+    """픽스처 프로젝트를 복제해 큰 이력서 생성"""
+    resume = copy.deepcopy(CANNED_EXTRACTION)
+    base = resume["projects"]
+    resume["projects"] = []
+    for idx in range(projects):
+        project = copy.deepcopy(base[idx % len(base)])
+        project["id"] = f"proj_{idx + 1:03d}"
+        resume["projects"].append(project)
+    return resume
+
+
+async def _wal_lsn(db) -> str:
+    return await db.scalar(text("SELECT pg_current_wal_insert_lsn()"))
+
+
+async def _wal_bytes(db, start: str) -> int:
+    return int(await db.scalar(text("SELECT pg_wal_lsn_diff(pg_current_wal_insert_lsn(), :start)"), {"start": start}))
+
+
+async def _relation_bytes(db) -> int:
+    return int(await db.scalar(text(
+        "SELECT pg_total_relation_size('resumes') + pg_total_relation_size('resume_versions')"
+    )))
+
+
+async def _overwrite(db, resume_id: int, data: dict):
+    resume = await db.get(Resume, resume_id)
+    resume.data = data
+    await db.commit()
+
+
+async def _run_mode(label: str, session_factory, args, snapshot_interval: int | None) -> dict:
+    settings.resume_snapshot_interval = snapshot_interval or 1
+    rng = random.Random(0)
+
+    async with session_factory() as db:
+        await db.execute(text("TRUNCATE resumes, resume_versions RESTART IDENTITY CASCADE"))
+        await db.commit()
+
+        initial = _resume(args.projects)
+        resume = await ResumeRepository(db).save(ResumeExtraction.model_validate(initial), user_id="bench")
+        data = resume.data
+        size_before = await _relation_bytes(db)
+        wal_start = await _wal_lsn(db)
+
+        latencies = []
+        for turn in range(args.turns):
+            data = copy.deepcopy(data)
+            project = rng.choice(data["projects"])
+            project["results"].append(f"턴 {turn}: 처리 시간 {rng.randint(10, 90)}% 단축")
+
+            started = time.perf_counter()
+            if snapshot_interval is None:
+                await _overwrite(db, resume.id, data)
+            else:
+                await ResumeRepository(db).update_data(resume.id, data)
+            latencies.append(time.perf_counter() - started)
+
+        wal_per_turn = await _wal_bytes(db, wal_start) / args.turns
+        size_growth = await _relation_bytes(db) - size_before
+
+        restore_ms = None
+        if snapshot_interval is not None:
+            versions = ResumeVersionRepository(db, snapshot_interval=snapshot_interval)
+            restore = []
+            for _ in range(50):
+                version = rng.randint(1, args.turns + 1)
+                started = time.perf_counter()
+                await versions.get_data(resume.id, version)
+                restore.append(time.perf_counter() - started)
+            restore_ms = round(statistics.median(restore) * 1000, 2)
+            count = await db.scalar(text("SELECT count(*) FROM resume_versions"))
+            assert count == args.turns + 1
+
+    result = {
+        "mode": label,
+        "document_bytes": len(ResumeExtraction.model_validate(data).model_dump_json()),
+        "turn_ms_median": round(statistics.median(latencies) * 1000, 2),
+        "wal_bytes_per_turn": round(wal_per_turn),
+        "table_growth_bytes": size_growth,
+        "restore_ms_median": restore_ms,
+    }
+    print(
+        f"{label:<10} doc={result['document_bytes']:6d}B  turn={result['turn_ms_median']:6.2f}ms  "
+        f"wal/turn={result['wal_bytes_per_turn']:7d}B  table_growth={size_growth / 1024:8.1f}KiB  "
+        f"restore={restore_ms if restore_ms is not None else '-'}ms"
+    )
+    return result
+
+
+async def run(args):
+    engine = create_async_engine(ASYNC_DATABASE_URL, connect_args={"options": f"-csearch_path={SCHEMA}"})
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with engine.begin() as conn:
+        await conn.execute(text(f"CREATE SCHEMA IF NOT EXISTS {SCHEMA}"))
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, tables=[Resume.__table__, ResumeVersion.__table__])
+
+    await _run_mode("overwrite", session_factory, args, None)
+    await _run_mode("full-copy", session_factory, args, 1)
+    await _run_mode("patch", session_factory, args, args.snapshot_interval)
+
+    if not args.keep:
+        async with engine.begin() as conn:
+            await conn.execute(text(f"DROP SCHEMA {SCHEMA} CASCADE"))
+    await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="이력서 버전 기록 쓰기 증폭 벤치마크")
+    parser.add_argument("--turns", type=int, default=200)
+    parser.add_argument("--projects", type=int, default=12, help="이력서 프로젝트 수 (문서 크기)")
+    parser.add_argument("--snapshot-interval", type=int, default=10)
+    parser.add_argument("--keep", action="store_true", help="측정 후 벤치마크 스키마를 지우지 않음")
+    args = parser.parse_args()
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Structured output 스트리밍 파싱 벤치마크 (일괄 파싱 vs 스트리밍 점진 파싱)
+
+분석 프롬프트(RESUME_ANALYSIS_PROMPT)에 대해 overall_summary / 첫 개선 질문이
+호출자에게 전달되기까지의 시간과 전체 완료 시간을 비교합니다.
+
+실행:
+    uv run python -m benchmarks.bench_structured_streaming --latency 0.3 --chunk-latency 0.01
+"""
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+
+import httpx
+
+os.environ.setdefault("OPENAI_API_KEY", "stub-key")
+
+from langchain.messages import SystemMessage  # noqa: E402
+
+from app.core.llm import ChatModelPool  # noqa: E402
+from app.core.prompts import RESUME_ANALYSIS_PROMPT  # noqa: E402
+from app.core.structured_output import agenerate_structured  # noqa: E402
+from app.models.schemas import ResumeAnalysis  # noqa: E402
+from benchmarks.fixtures import CANNED_EXTRACTION  # noqa: E402
+
+
+async def _measure(pool: ChatModelPool, stream: bool, rounds: int) -> dict:
+    messages = [SystemMessage(content=RESUME_ANALYSIS_PROMPT.format(
+        resume_data=json.dumps(CANNED_EXTRACTION, ensure_ascii=False, indent=2)
+    ))]
+    first_summary, first_question, total = [], [], []
+
+    for _ in range(rounds):
+        marks: dict = {}
+        started = time.perf_counter()
+
+        def on_event(event: dict):
+            elapsed = time.perf_counter() - started
+            if event["field"] == "overall_summary":
+                marks.setdefault("summary", elapsed)
+            if event["type"] == "item" and event["field"] == "improvement_questions":
+                marks.setdefault("question", elapsed)
+
+        await agenerate_structured(pool, messages, ResumeAnalysis, on_event=on_event, stream=stream)
+        elapsed = time.perf_counter() - started
+
+        total.append(elapsed)
+        # 일괄 모드에서는 응답 전체가 끝나야 필드를 사용할 수 있음
+        first_summary.append(marks.get("summary", elapsed))
+        first_question.append(marks.get("question", elapsed))
+
+    result = {
+        "mode": "stream" if stream else "batch",
+        "overall_summary_ms": round(min(first_summary) * 1000, 1),
+        "first_question_ms": round(min(first_question) * 1000, 1),
+        "total_ms": round(min(total) * 1000, 1),
+    }
+    print(
+        f"{result['mode']:<7} overall_summary={result['overall_summary_ms']:8.1f}ms  "
+        f"first_question={result['first_question_ms']:8.1f}ms  total={result['total_ms']:8.1f}ms"
+    )
+    return result
+
+
+async def run(args):
+    base_url = f"http://127.0.0.1:{args.stub_port}/v1"
+    stub = subprocess.Popen([
+        sys.executable, "-m", "benchmarks.stub_llm_server",
+        "--port", str(args.stub_port),
+        "--latency", str(args.latency),
+        "--chunk-latency", str(args.chunk_latency),
+    ])
+    try:
+        async with httpx.AsyncClient() as client:
+            for _ in range(50):
+                try:
+                    await client.post(f"{base_url}/chat/completions", json={"messages": []})
+                    break
+                except httpx.TransportError:
+                    await asyncio.sleep(0.1)
+
+        pool = ChatModelPool(base_url=base_url)
+        await _measure(pool, stream=False, rounds=args.rounds)
+        await _measure(pool, stream=True, rounds=args.rounds)
+        await pool.aclose()
+    finally:
+        stub.terminate()
+        stub.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Structured output 스트리밍 파싱 벤치마크")
+    parser.add_argument("--latency", type=float, default=0.3, help="Stub 첫 응답 지연 (초)")
+    parser.add_argument("--chunk-latency", type=float, default=0.01, help="Stub 스트리밍 조각 사이 지연 (초)")
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--stub-port", type=int, default=9000)
+    args = parser.parse_args()
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
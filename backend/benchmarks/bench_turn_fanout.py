@@ -0,0 +1,139 @@
+"""
+코칭 턴 지연 벤치마크 (이력서 업데이트 → 응답 생성 순차 실행 vs 같은 단계에서 병렬 실행)
+
+LLM은 호출 종류별로 지연을 주입한 가짜 풀(이력서 업데이트: astream, 응답 생성: ainvoke),
+이력서는 in-memory SQLite, 체크포인트는 InMemorySaver에 둡니다.
+같은 노드로 두 가지 그래프를 만들어 답변 턴의 지연 시간을 비교합니다.
+
+    before: load_resume → select_question → update_resume → generate_response | completion (두 LLM 호출의 합)
+    after:  create_resume_coach_graph() - select_question 이후 update_resume ∥ generate_response | completion (둘 중 긴 쪽)
+
+실행:
+    uv run python -m benchmarks.bench_turn_fanout --sessions 10 --update-latency 1.2 --reply-latency 0.6
+"""
+import argparse
+import asyncio
+import copy
+import json
+import os
+import statistics
+import time
+import uuid
+
+os.environ.setdefault("OPENAI_API_KEY", "stub-key")
+
+from langchain_core.messages import AIMessage  # noqa: E402
+from langgraph.checkpoint.memory import InMemorySaver  # noqa: E402
+from langgraph.graph import END, START, StateGraph  # noqa: E402
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+
+from app.agents.graph import _bind_context, create_resume_coach_graph, run_resume_coach  # noqa: E402
+from app.agents.nodes import (  # noqa: E402
+    completion_node,
+    generate_response_node,
+    load_resume_node,
+    select_question_node,
+    update_resume_node,
+)
+from app.agents.state import ResumeCoachState  # noqa: E402
+from app.database.models import Base, Resume  # noqa: E402
+from app.services.resume_cache import close_resume_cache  # noqa: E402
+from benchmarks.fixtures import CANNED_ANALYSIS, CANNED_EXTRACTION, CANNED_PATCH, CHAT_REPLY  # noqa: E402
+
+
+class DelayedChatModelPool:
+    """호출 종류별로 지연을 주입한 가짜 풀"""
+
+    model_name = "delayed"
+
+    def __init__(self, update_latency: float, reply_latency: float):
+        self.update_latency = update_latency
+        self.reply_latency = reply_latency
+
+    async def ainvoke(self, messages, temperature=0.3, **kwargs):
+        await asyncio.sleep(self.reply_latency)
+        return AIMessage(content=CHAT_REPLY)
+
+    async def astream(self, messages, temperature=0.3, **kwargs):
+        await asyncio.sleep(self.update_latency)
+        yield json.dumps(CANNED_PATCH, ensure_ascii=False)
+
+
+def _sequential_graph():
+    """병렬화 이전 순서: 이력서 업데이트가 끝난 뒤 응답 생성"""
+    builder = StateGraph(ResumeCoachState)
+    builder.add_node("load_resume", _bind_context(load_resume_node, db=True))
+    builder.add_node("select_question", select_question_node)
+    builder.add_node("update_resume", _bind_context(update_resume_node, db=True, llm=True))
+    builder.add_node("generate_response", _bind_context(generate_response_node, llm=True, pass_config=True))
+    builder.add_node("completion", _bind_context(completion_node, llm=True, pass_config=True))
+
+    builder.add_edge(START, "load_resume")
+    builder.add_edge("load_resume", "select_question")
+    builder.add_edge("select_question", "update_resume")
+    builder.add_conditional_edges(
+        "update_resume",
+        lambda state: "completion" if state["is_completed"] else "generate_response",
+        ["generate_response", "completion"],
+    )
+    builder.add_edge("generate_response", END)
+    builder.add_edge("completion", END)
+    return builder.compile(checkpointer=InMemorySaver())
+
+
+async def _measure(label: str, graph, session_factory, llm, sessions: int) -> dict:
+    await close_resume_cache()
+    questions = len(CANNED_ANALYSIS["improvement_questions"])
+    latencies = []
+
+    for _ in range(sessions):
+        session_id = f"bench-{uuid.uuid4()}"
+        async with session_factory() as db:
+            await run_resume_coach(session_id, "1", "", db, llm=llm, graph=graph)
+        for idx in range(questions):
+            async with session_factory() as db:
+                started = time.perf_counter()
+                await run_resume_coach(session_id, "1", f"답변 {idx}", db, llm=llm, graph=graph)
+                latencies.append(time.perf_counter() - started)
+
+    latencies.sort()
+    result = {
+        "mode": label,
+        "answer_turns": len(latencies),
+        "p50_ms": round(statistics.median(latencies) * 1000, 1),
+        "p95_ms": round(latencies[int(len(latencies) * 0.95) - 1] * 1000, 1),
+    }
+    print(f"{label:<7} answer_turns={len(latencies):<4} p50={result['p50_ms']:7.1f}ms  p95={result['p95_ms']:7.1f}ms")
+    return result
+
+
+async def run(args):
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with session_factory() as db:
+        db.add(Resume(user_id="1", data=copy.deepcopy(CANNED_EXTRACTION), analysis=CANNED_ANALYSIS))
+        await db.commit()
+
+    llm = DelayedChatModelPool(args.update_latency, args.reply_latency)
+    await _measure("before", _sequential_graph(), session_factory, llm, args.sessions)
+    await _measure("after", create_resume_coach_graph(InMemorySaver()), session_factory, llm, args.sessions)
+
+    await close_resume_cache()
+    await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="코칭 턴 지연 벤치마크 (업데이트 / 응답 생성 병렬화)")
+    parser.add_argument("--sessions", type=int, default=10)
+    parser.add_argument("--update-latency", type=float, default=1.2, help="이력서 업데이트 LLM 지연 (초)")
+    parser.add_argument("--reply-latency", type=float, default=0.6, help="응답 생성 LLM 지연 (초)")
+    args = parser.parse_args()
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+프로세스 내 가짜 Chat Model (결정적 준비된 응답 + 설정 가능한 지연)
+
+stub_llm_server와 같은 준비된 응답(benchmarks/fixtures.py)을 HTTP 없이 돌려줍니다.
+ChatModelPool.get만 바꾸므로 응답 캐시, 구조화 출력 파싱, 노드별 토큰 지표 경로는 실제와 같습니다.
+"""
+import asyncio
+import time
+from typing import Any, AsyncIterator, Iterator, List, Optional
+
+from langchain_core.callbacks import AsyncCallbackManagerForLLMRun, CallbackManagerForLLMRun
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+
+from app.core.llm import ChatModelPool
+from app.services.llm_cache import LLMResponseCache
+from benchmarks.fixtures import canned_reply
+
+
+class CannedChatModel(BaseChatModel):
+    """
+    프롬프트 종류에 맞는 준비된 응답을 고정 지연 후 돌려주는 Chat Model
+
+    토큰 사용량은 stub_llm_server와 같이 문자 수 / 4로 계산합니다.
+    """
+
+    latency: float = 0.0  # 첫 응답까지의 지연 (초)
+    chunk_latency: float = 0.0  # 스트리밍 조각 사이 지연 (초)
+    chunk_size: int = 32  # 스트리밍 조각 크기 (문자 수)
+
+    @property
+    def _llm_type(self) -> str:
+        return "canned"
+
+    def _reply(self, messages: List[BaseMessage]) -> str:
+        return canned_reply([{"content": message.content} for message in messages])
+
+    @staticmethod
+    def _usage(messages: List[BaseMessage], content: str) -> dict:
+        input_tokens = sum(len(str(message.content)) for message in messages) // 4
+        output_tokens = len(content) // 4
+        return {"input_tokens": input_tokens, "output_tokens": output_tokens, "total_tokens": input_tokens + output_tokens}
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        time.sleep(self.latency)
+        content = self._reply(messages)
+        message = AIMessage(content=content, usage_metadata=self._usage(messages, content))  # type: ignore[arg-type]
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        await asyncio.sleep(self.latency)
+        content = self._reply(messages)
+        message = AIMessage(content=content, usage_metadata=self._usage(messages, content))  # type: ignore[arg-type]
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _stream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> Iterator[ChatGenerationChunk]:
+        raise NotImplementedError("CannedChatModel은 비동기 스트리밍만 지원합니다.")
+
+    async def _astream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        await asyncio.sleep(self.latency)
+        content = self._reply(messages)
+        for start in range(0, len(content), self.chunk_size):
+            if self.chunk_latency:
+                await asyncio.sleep(self.chunk_latency)
+            piece = content[start:start + self.chunk_size]
+            chunk = ChatGenerationChunk(message=AIMessageChunk(content=piece))
+            if run_manager:
+                await run_manager.on_llm_new_token(piece, chunk=chunk)
+            yield chunk
+        # 마지막 조각에 토큰 사용량 (OpenAI stream_options.include_usage와 같은 형태)
+        yield ChatGenerationChunk(message=AIMessageChunk(content="", usage_metadata=self._usage(messages, content)))  # type: ignore[arg-type]
+
+
+class FakeChatModelPool(ChatModelPool):
+    """CannedChatModel을 돌려주는 ChatModelPool (LLM 요청 수 집계)"""
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        chunk_latency: float = 0.0,
+        response_cache: Optional[LLMResponseCache] = None,
+    ):
+        """
+        초기화
+
+        Args:
+            latency: 첫 응답까지의 지연 (초)
+            chunk_latency: 스트리밍 조각 사이 지연 (초)
+            response_cache: LLM 응답 캐시 (기본값: 없음 - 매번 모델 호출)
+        """
+        super().__init__(model_name="canned", response_cache=response_cache)
+        self.model = CannedChatModel(latency=latency, chunk_latency=chunk_latency)
+        self.calls = 0
+
+    def get(self, temperature: float = 0.3, model_name: Optional[str] = None) -> BaseChatModel:
+        self.calls += 1
+        return self.model
@@ -0,0 +1,124 @@
+"""
+벤치마크용 준비된 LLM 응답 (ResumeExtraction / ResumeAnalysis JSON)
+"""
+import json
+from typing import List
+
+CANNED_EXTRACTION = {
+    "person": {
+        "name": "홍길동",
+        "email": "gildong@example.com",
+        "phone": None,
+        "title": "Backend Engineer",
+        "years_of_experience": 5,
+    },
+    "skills": [
+        {"name": "Python", "category": "language"},
+        {"name": "FastAPI", "category": "framework"},
+        {"name": "PostgreSQL", "category": "database"},
+        {"name": "Kafka", "category": "tool"},
+        {"name": "AWS", "category": "cloud"},
+    ],
+    "projects": [
+        {
+            "id": f"proj_{idx:03d}",
+            "name": name,
+            "company": "예시 주식회사",
+            "period": "2022.01 - 2023.06",
+            "role": "Backend Lead",
+            "situation": "고객 응대에 하루 평균 4시간 소요" if idx == 1 else None,
+            "task": "응대 시간 단축" if idx == 1 else None,
+            "actions": ["RAG 기반 검색 시스템 구축", "FastAPI 비동기 API 설계"],
+            "results": ["응대 시간 60% 감소 (4시간 → 1.6시간)"] if idx == 1 else [],
+            "tech_stack": ["Python", "FastAPI", "PostgreSQL", "Kafka"],
+            "is_complete": {
+                "situation": idx == 1,
+                "task": idx == 1,
+                "actions": True,
+                "results": idx == 1,
+                "score": 1.0 if idx == 1 else 0.25,
+            },
+        }
+        for idx, name in enumerate(["RAG 고객 응대 시스템", "주문 이벤트 파이프라인", "사내 데이터 플랫폼"], start=1)
+    ],
+    "career": [
+        {"company": "예시 주식회사", "position": "Backend Engineer", "duration": "2020.03 - 현재", "description": None},
+    ],
+    "education": [
+        {"institution": "한국대학교", "degree": "학사", "major": "컴퓨터공학", "duration": "2014.03 - 2020.02", "gpa": 3.8},
+    ],
+}
+
+CANNED_ANALYSIS = {
+    "overall_summary": "기술 스택은 명확하나, 두 프로젝트의 STAR 기법이 미흡합니다. 배경과 정량적 성과를 보완하면 임팩트가 분명해집니다.",
+    "missing_areas": [
+        "STAR 기법: Situation(문제 상황) 누락",
+        "STAR 기법: Results(성과) 누락",
+        "정량적 성과 부재",
+    ],
+    "improvement_questions": [
+        {
+            "category": "STAR-상황",
+            "project_id": "proj_002",
+            "question": "주문 이벤트 파이프라인을 구축하게 된 계기는 무엇이었나요?",
+            "purpose": "프로젝트의 배경과 필요성을 명확히 하기 위함",
+        },
+        {
+            "category": "STAR-결과",
+            "project_id": "proj_002",
+            "question": "파이프라인 도입 후 처리량이나 지연 시간이 얼마나 개선되었나요?",
+            "purpose": "프로젝트의 임팩트를 정량적으로 표현하기 위함",
+        },
+        {
+            "category": "STAR-결과",
+            "project_id": "proj_003",
+            "question": "사내 데이터 플랫폼을 통해 절감된 시간이나 비용이 있었나요?",
+            "purpose": "프로젝트의 임팩트를 정량적으로 표현하기 위함",
+        },
+    ],
+    "completeness_score": 0.5,
+}
+
+CHAT_REPLY = "좋습니다! 다음 질문으로 넘어가 볼게요. 해당 프로젝트에서 측정 가능한 성과가 있었나요?"
+
+
+CANNED_PATCH = {
+    "situation": "주문 이벤트 처리 지연으로 피크 시간 결제 실패율 3% 발생",
+    "task": None,
+    "role": None,
+    "add_actions": ["Kafka 파티션 재설계로 컨슈머 병렬도 확대"],
+    "add_results": ["결제 실패율 3% → 0.2%"],
+    "add_tech_stack": [],
+    "add_skills": [],
+}
+
+
+CANNED_PHRASINGS = {
+    "phrasings": [
+        {"index": idx, "message": f"좋아요! {question['question']}"}
+        for idx, question in enumerate(CANNED_ANALYSIS["improvement_questions"])
+    ]
+}
+
+
+def canned_reply(messages: List[dict]) -> str:
+    """
+    프롬프트 종류에 맞는 준비된 응답 선택
+
+    Args:
+        messages: OpenAI 형식 메시지 리스트
+
+    Returns:
+        str: 응답 본문
+    """
+    prompt = "\n".join(str(message.get("content", "")) for message in messages)
+
+    if "이력서 패치 전문가" in prompt:
+        return json.dumps(CANNED_PATCH, ensure_ascii=False)
+    if "이력서를 JSON으로 변환하는 전문가" in prompt or "이력서 업데이트 전문가" in prompt:
+        return json.dumps(CANNED_EXTRACTION, ensure_ascii=False)
+    if "자연스러운 메시지로 바꾸세요" in prompt:
+        return json.dumps(CANNED_PHRASINGS, ensure_ascii=False)
+    if "이력서 컨설턴트" in prompt:
+        return json.dumps(CANNED_ANALYSIS, ensure_ascii=False)
+    return CHAT_REPLY
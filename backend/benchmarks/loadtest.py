@@ -0,0 +1,390 @@
+"""
+HTTP 부하 테스트 (uvicorn N 워커의 app.main:app + 로컬 Postgres + OpenAI 호환 Stub 서버)
+
+가상 사용자마다 실제 클라이언트와 같은 세션을 반복합니다:
+    POST /api/upload/resume → GET /api/upload/jobs/{job_id}/events (작업 완료까지 SSE)
+    → POST /api/chat/message 첫 턴 → 답변 턴 … (is_completed까지)
+
+엔드포인트별 p50 / p95 / p99 지연, 처리량(req/s), 오류율과 업로드 작업 완료 시간(upload_job)을 보고합니다.
+--ramp로 동시 사용자 수를 단계별로 늘리면 처리량이 더 이상 늘지 않는 지점(knee)을 찾습니다.
+Stub 서버의 지연 분포 / 포화 모드(--llm-capacity)로 LLM 제공자의 용량 한계를 모사할 수 있습니다.
+
+업로드 PDF는 모두 같으므로 실제 사용자처럼 매번 추출 / 분석하도록 추출 캐시와 LLM 응답 캐시는 끄고 실행합니다.
+
+실행 (docker-compose의 Postgres 사용):
+    uv run python -m benchmarks.loadtest --users 200 --duration 60 --workers 4
+    uv run python -m benchmarks.loadtest --ramp 10,25,50,100,200 --duration 30 --llm-capacity 64 --output reports/load.json
+    uv run python -m benchmarks.loadtest --app-url http://staging:8000 --users 50   # 이미 떠 있는 서버 대상
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import httpx
+
+os.environ.setdefault("OPENAI_API_KEY", "stub-key")
+
+from benchmarks.fixtures import CANNED_ANALYSIS  # noqa: E402
+from benchmarks.stub_llm_server import LATENCY_DISTRIBUTIONS  # noqa: E402
+
+DEFAULT_PDF = Path(__file__).resolve().parent.parent / "tests" / "fixtures" / "data" / "TEST_RESUME.pdf"
+
+# 처리량 증가가 이 비율보다 작아지면 포화(knee)로 판단
+KNEE_GAIN = 0.10
+
+
+class EndpointStats:
+    """엔드포인트 하나의 지연 / 오류 수집"""
+
+    def __init__(self):
+        self.latencies: List[float] = []
+        self.errors: Counter = Counter()
+
+    def summary(self, elapsed: float) -> dict:
+        total = len(self.latencies) + sum(self.errors.values())
+        ordered = sorted(self.latencies)
+
+        def percentile(p: float) -> Optional[float]:
+            if not ordered:
+                return None
+            return round(ordered[min(len(ordered) - 1, math.ceil(len(ordered) * p) - 1)] * 1000, 1)
+
+        return {
+            "requests": total,
+            "errors": sum(self.errors.values()),
+            "error_rate": round(sum(self.errors.values()) / total, 4) if total else 0.0,
+            "error_kinds": dict(self.errors),
+            "throughput_rps": round(len(ordered) / elapsed, 2) if elapsed else 0.0,
+            "p50_ms": round(statistics.median(ordered) * 1000, 1) if ordered else None,
+            "p95_ms": percentile(0.95),
+            "p99_ms": percentile(0.99),
+            "max_ms": round(ordered[-1] * 1000, 1) if ordered else None,
+        }
+
+
+class LoadStats:
+    """엔드포인트별 통계 + 완료된 세션 수"""
+
+    def __init__(self):
+        self.endpoints: Dict[str, EndpointStats] = {}
+        self.sessions = 0
+        self.failed_sessions = 0
+
+    def ok(self, endpoint: str, seconds: float):
+        self.endpoints.setdefault(endpoint, EndpointStats()).latencies.append(seconds)
+
+    def error(self, endpoint: str, kind: str):
+        self.endpoints.setdefault(endpoint, EndpointStats()).errors[kind] += 1
+
+
+class SessionFailed(Exception):
+    """세션을 더 진행할 수 없는 오류 (이미 기록됨)"""
+
+
+async def _request(client: httpx.AsyncClient, stats: LoadStats, endpoint: str, method: str, url: str, **kwargs) -> dict:
+    started = time.perf_counter()
+    try:
+        response = await client.request(method, url, **kwargs)
+    except httpx.HTTPError as e:
+        stats.error(endpoint, type(e).__name__)
+        raise SessionFailed() from e
+    if response.status_code >= 400:
+        stats.error(endpoint, str(response.status_code))
+        raise SessionFailed()
+    stats.ok(endpoint, time.perf_counter() - started)
+    return response.json()
+
+
+async def _wait_for_job(client: httpx.AsyncClient, stats: LoadStats, job_id: str, submitted: float):
+    # 프론트엔드처럼 SSE로 종료 상태까지 대기 (다른 워커가 처리 중이어도 DB 재조회로 전달됨)
+    status = None
+    try:
+        async with client.stream("GET", f"/api/upload/jobs/{job_id}/events") as response:
+            if response.status_code >= 400:
+                stats.error("upload_job", str(response.status_code))
+                raise SessionFailed()
+            async for line in response.aiter_lines():
+                if line.startswith("data: "):
+                    status = json.loads(line[6:]).get("status", status)
+    except httpx.HTTPError as e:
+        stats.error("upload_job", type(e).__name__)
+        raise SessionFailed() from e
+
+    if status != "succeeded":
+        stats.error("upload_job", f"job_{status}")
+        raise SessionFailed()
+    stats.ok("upload_job", time.perf_counter() - submitted)
+
+
+async def run_session(client: httpx.AsyncClient, stats: LoadStats, pdf: bytes, user_id: str, think_time: float):
+    """
+    가상 사용자 세션 한 번 (업로드 → 작업 완료 → 대화 완료까지)
+
+    Args:
+        client: 앱 HTTP 클라이언트
+        stats: 결과 수집
+        pdf: 업로드할 PDF bytes
+        user_id: 가상 사용자 ID
+        think_time: 답변 사이 대기 (초)
+    """
+    submitted = time.perf_counter()
+    job = await _request(
+        client, stats, "POST /api/upload/resume", "POST", "/api/upload/resume",
+        files=[("files", ("resume.pdf", pdf, "application/pdf"))], data={"user_id": user_id},
+    )
+    await _wait_for_job(client, stats, job["job_id"], submitted)
+
+    message = ""
+    for turn in range(len(CANNED_ANALYSIS["improvement_questions"]) + 2):
+        result = await _request(
+            client, stats, "POST /api/chat/message", "POST", "/api/chat/message",
+            json={"session_id": job["session_id"], "user_id": user_id, "message": message},
+        )
+        if result["is_completed"]:
+            return
+        if think_time:
+            await asyncio.sleep(think_time)
+        message = f"답변 {turn}: 주문 처리량을 3배 늘리고 장애를 월 4회에서 0회로 줄였습니다."
+
+
+async def run_step(client: httpx.AsyncClient, stub: Optional[httpx.AsyncClient], users: int, args, pdf: bytes) -> dict:
+    """
+    동시 사용자 users명이 duration 동안 세션을 반복 (closed loop)
+
+    Returns:
+        dict: 단계 결과 (엔드포인트별 요약, 세션 처리량, Stub 서버 통계)
+    """
+    stats = LoadStats()
+    if stub is not None:
+        await stub.delete("/stats")
+    deadline = time.perf_counter() + args.duration
+
+    async def virtual_user():
+        while time.perf_counter() < deadline:
+            try:
+                await run_session(client, stats, pdf, f"load-{uuid.uuid4().hex[:12]}", args.think_time)
+                stats.sessions += 1
+            except SessionFailed:
+                stats.failed_sessions += 1
+                await asyncio.sleep(args.think_time or 0.1)
+
+    started = time.perf_counter()
+    # 동시에 몰리지 않도록 ramp_up 동안 사용자를 나눠서 시작
+    await asyncio.gather(*[
+        _delayed(virtual_user(), args.ramp_up * idx / users) for idx in range(users)
+    ])
+    elapsed = time.perf_counter() - started
+
+    endpoints = {name: endpoint.summary(elapsed) for name, endpoint in sorted(stats.endpoints.items())}
+    return {
+        "users": users,
+        "elapsed_s": round(elapsed, 2),
+        "sessions": stats.sessions,
+        "failed_sessions": stats.failed_sessions,
+        "sessions_per_s": round(stats.sessions / elapsed, 3) if elapsed else 0.0,
+        "requests_per_s": round(sum(len(e.latencies) for e in stats.endpoints.values()) / elapsed, 2) if elapsed else 0.0,
+        "endpoints": endpoints,
+        "llm_stub": (await stub.get("/stats")).json() if stub is not None else None,
+    }
+
+
+async def _delayed(coro, delay: float):
+    await asyncio.sleep(delay)
+    await coro
+
+
+def find_knee(steps: List[dict]) -> Optional[int]:
+    """
+    처리량(세션/s)이 이전 단계보다 KNEE_GAIN 미만으로 늘어난 첫 단계의 직전 사용자 수
+
+    Args:
+        steps: 사용자 수 오름차순 단계 결과
+
+    Returns:
+        Optional[int]: knee 사용자 수 (끝까지 처리량이 늘면 None)
+    """
+    for previous, current in zip(steps, steps[1:]):
+        if current["sessions_per_s"] < previous["sessions_per_s"] * (1 + KNEE_GAIN):
+            return previous["users"]
+    return None
+
+
+def print_step(step: dict):
+    print(
+        f"\n👥 users={step['users']:<4} sessions={step['sessions']:<5} failed={step['failed_sessions']:<4} "
+        f"sessions/s={step['sessions_per_s']:<7} req/s={step['requests_per_s']}"
+    )
+    for name, result in step["endpoints"].items():
+        print(
+            f"  {name:<28} n={result['requests']:<6} rps={result['throughput_rps']:<7} "
+            f"p50={result['p50_ms']}ms p95={result['p95_ms']}ms p99={result['p99_ms']}ms "
+            f"errors={result['error_rate']:.2%} {result['error_kinds'] or ''}"
+        )
+    if step["llm_stub"]:
+        llm = step["llm_stub"]
+        print(
+            f"  {'llm stub':<28} requests={llm['requests']} max_in_flight={llm.get('max_in_flight')} "
+            f"queued={llm.get('queued')} rejected={llm.get('rejected')}"
+        )
+
+
+def _start_stub(args) -> subprocess.Popen:
+    command = [
+        sys.executable, "-m", "benchmarks.stub_llm_server",
+        "--port", str(args.stub_port),
+        "--latency", str(args.llm_latency),
+        "--latency-dist", args.llm_latency_dist,
+        "--latency-spread", str(args.llm_latency_spread),
+        "--chunk-latency", str(args.llm_chunk_latency),
+        "--overflow", args.llm_overflow,
+    ]
+    if args.llm_capacity:
+        command += ["--capacity", str(args.llm_capacity)]
+    if args.seed is not None:
+        command += ["--seed", str(args.seed)]
+    return subprocess.Popen(command)
+
+
+def _app_env(args) -> dict:
+    env = {
+        **os.environ,
+        "OPENAI_BASE_URL": f"http://127.0.0.1:{args.stub_port}/v1",
+        "DB_ECHO": "false",
+        "EXTRACTION_CACHE_ENABLED": "false",
+        "LLM_CACHE_ENABLED": "false",
+    }
+    if args.workers > 1:
+        # 워커 간 이력서 캐시 무효화 전파 + LLM Rate Limit 버킷 공유
+        env["RESUME_CACHE_INVALIDATION"] = "postgres"
+        env["LLM_RATE_LIMIT_BACKEND"] = "postgres"
+    return env
+
+
+async def _prepare_database():
+    # 워커들이 동시에 테이블 / 체크포인트 스키마를 만들다 충돌하지 않도록 미리 한 번 생성
+    from app.agents import close_resume_coach_graph, init_resume_coach_graph
+    from app.database.config import close_db, init_db
+
+    await init_db()
+    await init_resume_coach_graph()
+    await close_resume_coach_graph()
+    await close_db()
+
+
+async def _wait_ready(client: httpx.AsyncClient, path: str, timeout: float = 60.0):
+    deadline = time.perf_counter() + timeout
+    while True:
+        try:
+            if (await client.get(path)).status_code < 500:
+                return
+        except httpx.TransportError:
+            pass
+        if time.perf_counter() > deadline:
+            raise RuntimeError(f"{client.base_url}{path} 응답 없음")
+        await asyncio.sleep(0.2)
+
+
+async def run(args) -> dict:
+    pdf = args.pdf.read_bytes()
+    steps_users = [int(users) for users in args.ramp.split(",")] if args.ramp else [args.users]
+    processes: List[subprocess.Popen] = []
+    app_url = args.app_url or f"http://127.0.0.1:{args.port}"
+
+    try:
+        stub = None
+        if not args.app_url:
+            processes.append(_start_stub(args))
+            await _prepare_database()
+            processes.append(subprocess.Popen(
+                [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(args.port),
+                 "--workers", str(args.workers), "--log-level", "warning", "--no-access-log"],
+                env=_app_env(args),
+            ))
+            stub = httpx.AsyncClient(base_url=f"http://127.0.0.1:{args.stub_port}")
+            await _wait_ready(stub, "/stats")
+
+        limits = httpx.Limits(max_connections=max(steps_users) * 2, max_keepalive_connections=max(steps_users) * 2)
+        async with httpx.AsyncClient(base_url=app_url, limits=limits, timeout=args.timeout) as client:
+            await _wait_ready(client, "/health")
+            steps = []
+            for users in steps_users:
+                step = await run_step(client, stub, users, args, pdf)
+                print_step(step)
+                steps.append(step)
+
+        if stub is not None:
+            await stub.aclose()
+    finally:
+        for process in reversed(processes):
+            process.terminate()
+            process.wait()
+
+    knee = find_knee(steps) if len(steps) > 1 else None
+    if len(steps) > 1:
+        print(f"\n📈 knee: {f'~{knee} users' if knee else '처리량이 마지막 단계까지 증가 (더 높은 --ramp 필요)'}")
+
+    return {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "app_url": app_url,
+        },
+        "config": {
+            "workers": args.workers if not args.app_url else None,
+            "duration_s": args.duration,
+            "ramp_up_s": args.ramp_up,
+            "think_time_s": args.think_time,
+            "llm_latency": args.llm_latency,
+            "llm_latency_dist": args.llm_latency_dist,
+            "llm_latency_spread": args.llm_latency_spread,
+            "llm_chunk_latency": args.llm_chunk_latency,
+            "llm_capacity": args.llm_capacity,
+            "llm_overflow": args.llm_overflow,
+        },
+        "steps": steps,
+        "knee_users": knee,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTTP 부하 테스트 (업로드 → 다중 턴 채팅 세션)")
+    parser.add_argument("--users", type=int, default=50, help="동시 가상 사용자 수")
+    parser.add_argument("--ramp", help="단계별 동시 사용자 수 (예: 10,25,50,100,200 - knee 탐색)")
+    parser.add_argument("--duration", type=float, default=60.0, help="단계별 실행 시간 (초)")
+    parser.add_argument("--ramp-up", type=float, default=5.0, help="단계 시작 시 사용자를 나눠 시작하는 시간 (초)")
+    parser.add_argument("--think-time", type=float, default=0.0, help="채팅 답변 사이 대기 (초)")
+    parser.add_argument("--timeout", type=float, default=120.0, help="HTTP 요청 타임아웃 (초)")
+    parser.add_argument("--pdf", type=Path, default=DEFAULT_PDF, help="업로드할 PDF")
+    parser.add_argument("--workers", type=int, default=4, help="uvicorn 워커 수")
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument("--app-url", help="이미 실행 중인 앱 주소 (지정하면 앱 / Stub 서버를 띄우지 않음)")
+    parser.add_argument("--stub-port", type=int, default=9000)
+    parser.add_argument("--llm-latency", type=float, default=0.8, help="Stub 평균 첫 응답 지연 (초)")
+    parser.add_argument("--llm-latency-dist", choices=LATENCY_DISTRIBUTIONS, default="lognormal")
+    parser.add_argument("--llm-latency-spread", type=float, default=0.4)
+    parser.add_argument("--llm-chunk-latency", type=float, default=0.002, help="Stub 스트리밍 조각 사이 지연 (초)")
+    parser.add_argument("--llm-capacity", type=int, default=None, help="Stub 동시 생성 한도 (포화 모드)")
+    parser.add_argument("--llm-overflow", choices=["queue", "reject"], default="queue")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--output", type=Path, help="JSON 리포트 저장 경로")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, ensure_ascii=False, indent=2) + "\n")
+        print(f"\n💾 report saved: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
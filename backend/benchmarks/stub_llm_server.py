@@ -0,0 +1,264 @@
+"""
+OpenAI 호환 Stub LLM 서버
+
+실제 OpenAI 대신 고정 지연 후 프롬프트 종류에 맞는 준비된 응답(benchmarks/fixtures.py)을 돌려주는 로컬 서버입니다.
+stream=true 요청에는 SSE로 응답을 조각내어 보냅니다.
+벤치마크에서 OPENAI_BASE_URL=http://127.0.0.1:<port>/v1 로 지정해 사용합니다.
+
+지연은 고정값 외에 분포(uniform / normal / lognormal / exponential)로 뽑을 수 있고,
+--capacity를 주면 동시에 생성하는 요청 수를 제한하는 포화 모드로 동작합니다
+(queue: 남는 요청은 대기 → 부하가 용량을 넘으면 지연이 급격히 늘어남, reject: 즉시 429 rate_limit_exceeded).
+
+실행:
+    uv run python -m benchmarks.stub_llm_server --port 9000 --latency 0.5 --chunk-latency 0.01
+    uv run python -m benchmarks.stub_llm_server --latency 0.8 --latency-dist lognormal --latency-spread 0.5 --capacity 32
+"""
+import argparse
+import asyncio
+import json
+import math
+import random
+import time
+import uuid
+from typing import Optional
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from benchmarks.fixtures import canned_reply
+
+LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "normal", "lognormal", "exponential")
+
+
+def sample_latency(rng: random.Random, dist: str, mean: float, spread: float) -> float:
+    """
+    응답 지연 샘플링
+
+    Args:
+        rng: 난수 생성기 (seed 고정 시 재현 가능)
+        dist: fixed | uniform (mean ± spread) | normal (표준편차 spread) |
+              lognormal (평균 mean, 로그 표준편차 spread - 긴 꼬리) | exponential (평균 mean)
+        mean: 평균 지연 (초)
+        spread: 분포 폭
+
+    Returns:
+        float: 지연 (초, 0 이상)
+    """
+    if dist == "uniform":
+        value = rng.uniform(mean - spread, mean + spread)
+    elif dist == "normal":
+        value = rng.gauss(mean, spread)
+    elif dist == "lognormal" and mean > 0:
+        value = rng.lognormvariate(math.log(mean) - spread ** 2 / 2, spread)
+    elif dist == "exponential" and mean > 0:
+        value = rng.expovariate(1 / mean)
+    else:
+        value = mean
+    return max(value, 0.0)
+
+
+def create_stub_app(
+    latency: float = 0.5,
+    chunk_latency: float = 0.0,
+    chunk_size: int = 8,
+    reply: Optional[str] = None,
+    prefill_latency_per_1k: float = 0.0,
+    context_limit: Optional[int] = None,
+    latency_dist: str = "fixed",
+    latency_spread: float = 0.0,
+    capacity: Optional[int] = None,
+    overflow: str = "queue",
+    seed: Optional[int] = None,
+) -> FastAPI:
+    """
+    Stub 서버 앱 생성
+
+    Args:
+        latency: 첫 응답까지의 지연 (초)
+        chunk_latency: 스트리밍 조각 사이 지연 (초)
+        chunk_size: 스트리밍 조각 크기 (문자 수)
+        reply: 고정 응답 (None이면 프롬프트 종류별 준비된 응답)
+        prefill_latency_per_1k: 프롬프트 1k 토큰당 추가 지연 (초, 긴 입력 처리 비용 모사)
+        context_limit: 프롬프트 토큰 한도 (넘으면 context_length_exceeded 400 응답)
+        latency_dist: 첫 응답 지연 분포 (LATENCY_DISTRIBUTIONS, latency가 평균)
+        latency_spread: 분포 폭 (sample_latency 참고)
+        capacity: 동시에 생성하는 최대 요청 수 (None이면 무제한)
+        overflow: 용량 초과 요청 처리 - queue (대기) | reject (429 응답)
+        seed: 지연 샘플링 seed
+
+    Returns:
+        FastAPI: /v1/chat/completions, /stats 를 제공하는 앱
+    """
+    app = FastAPI(title="Stub LLM")
+    rng = random.Random(seed)
+    slots = asyncio.Semaphore(capacity) if capacity else None
+    counters = ("requests", "prompt_tokens", "completion_tokens", "rejected", "queued", "queue_wait_s", "max_in_flight")
+    stats = {**{name: 0 for name in counters}, "in_flight": 0}
+
+    @app.get("/stats")
+    async def get_stats():
+        return stats
+
+    @app.delete("/stats")
+    async def reset_stats():
+        # 진행 중인 요청 수(in_flight)는 현재 값이므로 유지
+        stats.update({name: 0 for name in counters})
+        return stats
+
+    async def acquire_slot() -> bool:
+        # 포화 모드: 빈 슬롯이 없으면 대기(queue)하거나 거절(reject)
+        if slots is None:
+            return True
+        if slots.locked():
+            if overflow == "reject":
+                stats["rejected"] += 1
+                return False
+            stats["queued"] += 1
+        started = time.perf_counter()
+        await slots.acquire()
+        stats["queue_wait_s"] += time.perf_counter() - started
+        return True
+
+    def enter():
+        stats["in_flight"] += 1
+        stats["max_in_flight"] = max(stats["max_in_flight"], stats["in_flight"])
+
+    def leave():
+        stats["in_flight"] -= 1
+        if slots is not None:
+            slots.release()
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        messages = body.get("messages", [])
+        content = reply if reply is not None else canned_reply(messages)
+        completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+        model = body.get("model", "stub")
+
+        prompt_tokens = sum(len(str(m.get("content", ""))) for m in messages) // 4
+        completion_tokens = len(content) // 4
+        usage = {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        }
+
+        if context_limit is not None and prompt_tokens > context_limit:
+            return JSONResponse(status_code=400, content={"error": {
+                "message": f"This model's maximum context length is {context_limit} tokens.",
+                "type": "invalid_request_error",
+                "code": "context_length_exceeded",
+            }})
+
+        if not await acquire_slot():
+            return JSONResponse(status_code=429, headers={"retry-after": "1"}, content={"error": {
+                "message": "Rate limit reached for requests.",
+                "type": "requests",
+                "code": "rate_limit_exceeded",
+            }})
+
+        stats["requests"] += 1
+        stats["prompt_tokens"] += prompt_tokens
+        stats["completion_tokens"] += completion_tokens
+        enter()
+
+        try:
+            await asyncio.sleep(
+                sample_latency(rng, latency_dist, latency, latency_spread) + prefill_latency_per_1k * prompt_tokens / 1000
+            )
+        except BaseException:
+            leave()
+            raise
+
+        if body.get("stream"):
+            include_usage = bool((body.get("stream_options") or {}).get("include_usage"))
+
+            def chunk(delta: dict, finish_reason=None, chunk_usage=None, choices=True) -> str:
+                payload = {
+                    "id": completion_id,
+                    "object": "chat.completion.chunk",
+                    "created": int(time.time()),
+                    "model": model,
+                    "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}] if choices else [],
+                }
+                if chunk_usage is not None:
+                    payload["usage"] = chunk_usage
+                return f"data: {json.dumps(payload, ensure_ascii=False)}\n\n"
+
+            async def event_stream():
+                # 스트림을 다 보낼 때까지 슬롯 유지
+                try:
+                    yield chunk({"role": "assistant", "content": ""})
+                    for start in range(0, len(content), chunk_size):
+                        if chunk_latency:
+                            await asyncio.sleep(chunk_latency)
+                        yield chunk({"content": content[start:start + chunk_size]})
+                    yield chunk({}, finish_reason="stop")
+                    if include_usage:
+                        yield chunk({}, chunk_usage=usage, choices=False)
+                    yield "data: [DONE]\n\n"
+                finally:
+                    leave()
+
+            return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+        # 비스트리밍 응답도 같은 생성 시간을 기다린 뒤 한 번에 반환
+        try:
+            if chunk_latency:
+                await asyncio.sleep(chunk_latency * -(-len(content) // chunk_size))
+        finally:
+            leave()
+
+        return {
+            "id": completion_id,
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": content},
+                    "finish_reason": "stop",
+                }
+            ],
+            "usage": usage,
+        }
+
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OpenAI 호환 Stub LLM 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9000)
+    parser.add_argument("--latency", type=float, default=0.5, help="첫 응답까지의 지연 (초)")
+    parser.add_argument("--chunk-latency", type=float, default=0.0, help="스트리밍 조각 사이 지연 (초)")
+    parser.add_argument("--chunk-size", type=int, default=8, help="스트리밍 조각 크기 (문자 수)")
+    parser.add_argument("--prefill-latency-per-1k", type=float, default=0.0, help="프롬프트 1k 토큰당 추가 지연 (초)")
+    parser.add_argument("--context-limit", type=int, default=None, help="프롬프트 토큰 한도")
+    parser.add_argument("--latency-dist", choices=LATENCY_DISTRIBUTIONS, default="fixed", help="첫 응답 지연 분포")
+    parser.add_argument("--latency-spread", type=float, default=0.0, help="지연 분포 폭 (uniform ±, normal 표준편차, lognormal 로그 표준편차)")
+    parser.add_argument("--capacity", type=int, default=None, help="동시에 생성하는 최대 요청 수 (포화 모드)")
+    parser.add_argument("--overflow", choices=["queue", "reject"], default="queue", help="용량 초과 요청 처리")
+    parser.add_argument("--seed", type=int, default=None, help="지연 샘플링 seed")
+    args = parser.parse_args()
+
+    app = create_stub_app(
+        latency=args.latency,
+        chunk_latency=args.chunk_latency,
+        chunk_size=args.chunk_size,
+        prefill_latency_per_1k=args.prefill_latency_per_1k,
+        context_limit=args.context_limit,
+        latency_dist=args.latency_dist,
+        latency_spread=args.latency_spread,
+        capacity=args.capacity,
+        overflow=args.overflow,
+        seed=args.seed,
+    )
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
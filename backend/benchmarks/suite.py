@@ -0,0 +1,346 @@
+"""
+오프라인 벤치마크 스위트 (OpenAI 비용 / 별도 서버 없이 이력서 파이프라인 전체 측정)
+
+LLM은 프로세스 내 가짜 모델(benchmarks/fake_llm.py - 준비된 ResumeExtraction / ResumeAnalysis JSON + 고정 지연),
+DB는 in-memory SQLite(--postgres면 별도 스키마의 Postgres), 체크포인트는 InMemorySaver를 사용합니다.
+LLM 응답 캐시와 추출 캐시는 끄고 매번 같은 작업량을 측정합니다.
+
+    pdf_extraction          PdfTextExtractor (프로세스 풀) - TEST_RESUME.pdf + TEST_CAREER.pdf
+    validate_extraction     parse_structured_output(ResumeExtraction) (1회 기준)
+    validate_analysis       parse_structured_output(ResumeAnalysis) (1회 기준)
+    stream_parse_analysis   StreamingJsonParser(ResumeAnalysis) 32자 조각 (1회 기준)
+    repo_*                  ResumeRepository save / get_recent_resume_by_user_id / update_data / search
+    upload_pipeline         UserResumeService.create_user_resume (PDF 추출 → LLM 추출 → 저장)
+    analyze_resume          UserResumeService.analyze_resume (분석 + 질문 문구 생성)
+    graph_first_turn        run_resume_coach 첫 턴
+    graph_answer_turn       run_resume_coach 답변 턴
+
+결과는 JSON 리포트(--output)로 저장하고, --compare로 이전 릴리스 리포트와 비교합니다.
+지연 외에 호출당 LLM 요청 수 / DB 쿼리 수도 기록하므로 작업량 변화도 비교할 수 있습니다.
+
+실행:
+    uv run python -m benchmarks.suite --output reports/suite.json
+    uv run python -m benchmarks.suite --output reports/new.json --compare reports/old.json --max-regression 20
+    DB_ECHO=false uv run python -m benchmarks.suite --postgres --output reports/suite-pg.json
+"""
+import argparse
+import asyncio
+import contextlib
+import copy
+import io
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional
+
+os.environ.setdefault("OPENAI_API_KEY", "stub-key")
+
+from langgraph.checkpoint.memory import InMemorySaver  # noqa: E402
+from sqlalchemy import text  # noqa: E402
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+
+from app.agents.graph import create_resume_coach_graph, run_resume_coach  # noqa: E402
+from app.core.config import settings  # noqa: E402
+from app.core.structured_output import StreamingJsonParser, parse_structured_output  # noqa: E402
+from app.database.config import ASYNC_DATABASE_URL, track_queries  # noqa: E402
+from app.database.models import Base, Resume  # noqa: E402
+from app.models.schemas import ResumeAnalysis, ResumeExtraction  # noqa: E402
+from app.repositories import ResumeRepository  # noqa: E402
+from app.services.pdf_extractor import PdfTextExtractor  # noqa: E402
+from app.services.resume_cache import close_resume_cache  # noqa: E402
+from app.services.user_resume_service import UserResumeService  # noqa: E402
+from benchmarks.fake_llm import FakeChatModelPool  # noqa: E402
+from benchmarks.fixtures import CANNED_ANALYSIS, CANNED_EXTRACTION  # noqa: E402
+
+REPORT_VERSION = 1
+SCHEMA = "bench_suite"
+PDF_DIR = Path(__file__).resolve().parent.parent / "tests" / "fixtures" / "data"
+
+# 파싱 / 검증처럼 1회가 매우 짧은 작업은 이 횟수를 묶어 한 샘플로 측정
+MICRO_BATCH = 100
+
+
+class Recorder:
+    """벤치마크별 샘플(초)과 호출당 LLM 요청 / DB 쿼리 수 수집"""
+
+    def __init__(self, llm: Optional[FakeChatModelPool] = None):
+        self.llm = llm
+        self.samples: Dict[str, List[float]] = {}
+        self.llm_calls: Dict[str, int] = {}
+        self.db_queries: Dict[str, int] = {}
+
+    async def measure(self, name: str, func: Callable[[], Awaitable], batch: int = 1):
+        calls_before = self.llm.calls if self.llm else 0
+        with track_queries() as queries:
+            started = time.perf_counter()
+            for _ in range(batch):
+                await func()
+            elapsed = time.perf_counter() - started
+        self.samples.setdefault(name, []).append(elapsed / batch)
+        self.llm_calls[name] = self.llm_calls.get(name, 0) + (self.llm.calls - calls_before if self.llm else 0)
+        self.db_queries[name] = self.db_queries.get(name, 0) + queries.count
+
+    def results(self) -> Dict[str, dict]:
+        return {
+            name: summarize(samples, llm_calls=self.llm_calls[name], db_queries=self.db_queries[name])
+            for name, samples in self.samples.items()
+        }
+
+
+def summarize(samples: List[float], llm_calls: int = 0, db_queries: int = 0) -> dict:
+    """
+    샘플 요약 (ms, 호출당 LLM 요청 / DB 쿼리 수)
+
+    Args:
+        samples: 측정값 (초)
+        llm_calls: 전체 LLM 요청 수
+        db_queries: 전체 DB 쿼리 수
+
+    Returns:
+        dict: 리포트의 벤치마크 항목
+    """
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, math.ceil(len(ordered) * 0.95) - 1)]
+    return {
+        "iterations": len(ordered),
+        "p50_ms": round(statistics.median(ordered) * 1000, 3),
+        "p95_ms": round(p95 * 1000, 3),
+        "mean_ms": round(statistics.fmean(ordered) * 1000, 3),
+        "min_ms": round(ordered[0] * 1000, 3),
+        "max_ms": round(ordered[-1] * 1000, 3),
+        "llm_calls_per_op": round(llm_calls / len(ordered), 2),
+        "db_queries_per_op": round(db_queries / len(ordered), 2),
+    }
+
+
+async def bench_pdf_extraction(recorder: Recorder, extractor: PdfTextExtractor, pdfs: List[bytes], iterations: int):
+    await extractor.extract(pdfs)  # 프로세스 풀 워커 기동
+    for _ in range(iterations):
+        await recorder.measure("pdf_extraction", lambda: extractor.extract(pdfs))
+
+
+async def bench_json_validation(recorder: Recorder, iterations: int):
+    extraction = json.dumps(CANNED_EXTRACTION, ensure_ascii=False)
+    analysis = json.dumps(CANNED_ANALYSIS, ensure_ascii=False)
+    chunks = [analysis[start:start + 32] for start in range(0, len(analysis), 32)]
+
+    async def validate_extraction():
+        parse_structured_output(extraction, ResumeExtraction)
+
+    async def validate_analysis():
+        parse_structured_output(analysis, ResumeAnalysis)
+
+    async def stream_parse_analysis():
+        parser = StreamingJsonParser(ResumeAnalysis)
+        for chunk in chunks:
+            parser.feed(chunk)
+        parser.finish()
+
+    for _ in range(iterations):
+        await recorder.measure("validate_extraction", validate_extraction, batch=MICRO_BATCH)
+        await recorder.measure("validate_analysis", validate_analysis, batch=MICRO_BATCH)
+        await recorder.measure("stream_parse_analysis", stream_parse_analysis, batch=MICRO_BATCH)
+
+
+async def bench_repository(recorder: Recorder, session_factory, iterations: int, rows: int):
+    extraction = ResumeExtraction.model_validate(CANNED_EXTRACTION)
+    async with session_factory() as db:
+        db.add_all([Resume(user_id=f"seed-{idx}", data=copy.deepcopy(CANNED_EXTRACTION)) for idx in range(rows)])
+        await db.commit()
+
+    for idx in range(iterations):
+        user_id = f"repo-{idx}"
+        async with session_factory() as db:
+            repo = ResumeRepository(db)
+            await recorder.measure("repo_save", lambda: repo.save(extraction, user_id))
+            await recorder.measure("repo_get_recent", lambda: repo.get_recent_resume_by_user_id(user_id))
+
+            resume = await repo.get_recent_resume_by_user_id(user_id)
+            data = copy.deepcopy(resume.data)
+            data["projects"][1]["results"] = [f"처리량 {idx + 2}배 향상"]
+            await recorder.measure("repo_update_data", lambda: repo.update_data(resume.id, data))
+            await recorder.measure("repo_search", lambda: repo.search(skill="Python", limit=20))
+
+
+async def bench_pipeline(recorder: Recorder, session_factory, llm, extractor, pdfs: List[bytes], iterations: int):
+    for _ in range(iterations):
+        user_id = f"pipeline-{uuid.uuid4()}"
+        async with session_factory() as db:
+            service = UserResumeService(db, llm=llm, pdf_extractor=extractor)
+            await recorder.measure("upload_pipeline", lambda: service.create_user_resume(pdfs, user_id))
+            await recorder.measure("analyze_resume", lambda: service.analyze_resume(user_id=user_id))
+
+
+async def bench_graph(recorder: Recorder, session_factory, llm, iterations: int):
+    graph = create_resume_coach_graph(InMemorySaver())
+    questions = len(CANNED_ANALYSIS["improvement_questions"])
+
+    for _ in range(iterations):
+        user_id = f"graph-{uuid.uuid4()}"
+        session_id = f"bench-{uuid.uuid4()}"
+        async with session_factory() as db:
+            db.add(Resume(user_id=user_id, data=copy.deepcopy(CANNED_EXTRACTION), analysis=copy.deepcopy(CANNED_ANALYSIS)))
+            await db.commit()
+
+        async with session_factory() as db:
+            await recorder.measure("graph_first_turn", lambda: run_resume_coach(session_id, user_id, "", db, llm=llm, graph=graph))
+        for idx in range(questions):
+            async with session_factory() as db:
+                await recorder.measure(
+                    "graph_answer_turn",
+                    lambda: run_resume_coach(session_id, user_id, f"답변 {idx}", db, llm=llm, graph=graph),
+                )
+
+
+def compare(current: dict, baseline: dict, max_regression: Optional[float]) -> List[str]:
+    """
+    이전 리포트와 p50 / 호출당 작업량 비교 출력
+
+    Args:
+        current: 이번 리포트
+        baseline: 비교 대상 리포트
+        max_regression: p50 증가 허용치 (%, 넘으면 회귀로 판단)
+
+    Returns:
+        List[str]: 허용치를 넘게 느려진 벤치마크 이름
+    """
+    regressions = []
+    base_commit = baseline.get("meta", {}).get("git_commit")
+    print(f"\n📊 compare with {base_commit or 'baseline'} (p50, LLM 요청 / DB 쿼리 수는 호출당)")
+    for name, result in current["results"].items():
+        before = baseline.get("results", {}).get(name)
+        if before is None:
+            print(f"  {name:<24} new")
+            continue
+
+        change = (result["p50_ms"] - before["p50_ms"]) / before["p50_ms"] * 100 if before["p50_ms"] else 0.0
+        work = [
+            f"{key.removesuffix('_per_op')} {before[key]} → {result[key]}"
+            for key in ("llm_calls_per_op", "db_queries_per_op")
+            if before.get(key) != result[key]
+        ]
+        regressed = max_regression is not None and change > max_regression
+        if regressed:
+            regressions.append(name)
+        print(
+            f"  {name:<24} {before['p50_ms']:10.3f}ms → {result['p50_ms']:10.3f}ms ({change:+6.1f}%)"
+            f"{'  ' + ', '.join(work) if work else ''}{'  ⚠️ regression' if regressed else ''}"
+        )
+    return regressions
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run(args) -> dict:
+    # 매 반복 같은 작업량을 측정하도록 캐시 비활성화 (LLM 응답 캐시는 FakeChatModelPool 기본값으로 꺼짐)
+    settings.extraction_cache_enabled = False
+
+    if args.postgres:
+        engine = create_async_engine(ASYNC_DATABASE_URL, connect_args={"options": f"-csearch_path={SCHEMA}"})
+        async with engine.begin() as conn:
+            await conn.execute(text(f"CREATE SCHEMA IF NOT EXISTS {SCHEMA}"))
+    else:
+        engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    pdfs = [(PDF_DIR / name).read_bytes() for name in ("TEST_RESUME.pdf", "TEST_CAREER.pdf")]
+    llm = FakeChatModelPool(latency=args.latency, chunk_latency=args.chunk_latency)
+    extractor = PdfTextExtractor(max_workers=args.pdf_workers)
+    recorder = Recorder(llm)
+
+    # 서비스 / 노드의 진행 로그는 측정 출력과 섞이지 않도록 숨김
+    quiet = contextlib.nullcontext() if args.verbose else contextlib.redirect_stdout(io.StringIO())
+    started = time.perf_counter()
+    try:
+        with quiet:
+            await bench_pdf_extraction(recorder, extractor, pdfs, args.iterations)
+            await bench_json_validation(recorder, args.iterations)
+            await bench_repository(recorder, session_factory, args.iterations, args.rows)
+            await bench_pipeline(recorder, session_factory, llm, extractor, pdfs, args.iterations)
+            await bench_graph(recorder, session_factory, llm, args.iterations)
+    finally:
+        extractor.shutdown()
+        await llm.aclose()
+        await close_resume_cache()
+        if args.postgres:
+            async with engine.begin() as conn:
+                await conn.execute(text(f"DROP SCHEMA {SCHEMA} CASCADE"))
+        await engine.dispose()
+
+    return {
+        "version": REPORT_VERSION,
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "git_commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "database": "postgresql" if args.postgres else "sqlite",
+            "duration_s": round(time.perf_counter() - started, 2),
+        },
+        "config": {
+            "iterations": args.iterations,
+            "latency": args.latency,
+            "chunk_latency": args.chunk_latency,
+            "rows": args.rows,
+            "pdf_workers": args.pdf_workers,
+            "micro_batch": MICRO_BATCH,
+        },
+        "results": recorder.results(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="오프라인 벤치마크 스위트 (가짜 LLM, JSON 리포트)")
+    parser.add_argument("--iterations", type=int, default=20, help="벤치마크별 반복 횟수 (그래프는 세션 수)")
+    parser.add_argument("--latency", type=float, default=0.05, help="가짜 LLM 첫 응답 지연 (초)")
+    parser.add_argument("--chunk-latency", type=float, default=0.0, help="가짜 LLM 스트리밍 조각 사이 지연 (초)")
+    parser.add_argument("--rows", type=int, default=200, help="저장소 벤치마크 전에 넣어 둘 이력서 수")
+    parser.add_argument("--pdf-workers", type=int, default=2)
+    parser.add_argument("--postgres", action="store_true", help="SQLite 대신 DATABASE_URL의 Postgres (별도 스키마) 사용")
+    parser.add_argument("--output", type=Path, help="JSON 리포트 저장 경로")
+    parser.add_argument("--compare", type=Path, help="비교할 이전 JSON 리포트")
+    parser.add_argument("--max-regression", type=float, help="p50 증가 허용치 (%%, 넘으면 종료 코드 1)")
+    parser.add_argument("--verbose", action="store_true", help="서비스 / 노드 로그 출력")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+
+    for name, result in report["results"].items():
+        print(
+            f"{name:<24} p50={result['p50_ms']:10.3f}ms  p95={result['p95_ms']:10.3f}ms  "
+            f"llm/op={result['llm_calls_per_op']:<5} db/op={result['db_queries_per_op']}"
+        )
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, ensure_ascii=False, indent=2) + "\n")
+        print(f"\n💾 report saved: {args.output}")
+
+    if args.compare:
+        regressions = compare(report, json.loads(args.compare.read_text()), args.max_regression)
+        if regressions:
+            print(f"\n❌ p50 regression over {args.max_regression}%: {', '.join(regressions)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,10 +2,16 @@
 pytest fixtures for tests
 """
 import pytest
+import pytest_asyncio
 from pathlib import Path
-from typing import List
+from typing import AsyncIterator, List
 from langchain_core.documents import Document
-from app.services.user_resume_service import user_resume_service
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+from app.database.models import Base
+from app.services.resume_cache import close_resume_cache
+from app.services.resume_matcher import resume_index_cache
+from app.services.pdf_extractor import extract_documents
 
 
 @pytest.fixture(scope="session")
@@ -47,16 +53,41 @@ def career_pdf_bytes(test_career_path: Path) -> bytes:
 @pytest.fixture(scope="session")
 def resume_documents(resume_pdf_bytes: bytes) -> List[Document]:
     """TEST_RESUME.pdf에서 추출한 Document 리스트 (캐시됨)"""
-    return user_resume_service.extract_text_from_pdfs([resume_pdf_bytes])
+    return extract_documents([resume_pdf_bytes])
 
 
 @pytest.fixture(scope="session")
 def career_documents(career_pdf_bytes: bytes) -> List[Document]:
     """TEST_CAREER.pdf에서 추출한 Document 리스트 (캐시됨)"""
-    return user_resume_service.extract_text_from_pdfs([career_pdf_bytes])
+    return extract_documents([career_pdf_bytes])
 
 
 @pytest.fixture(scope="session")
 def all_documents(resume_pdf_bytes: bytes, career_pdf_bytes: bytes) -> List[Document]:
     """모든 PDF에서 추출한 Document 리스트 (캐시됨)"""
-    return user_resume_service.extract_text_from_pdfs([resume_pdf_bytes, career_pdf_bytes])
+    return extract_documents([resume_pdf_bytes, career_pdf_bytes])
+
+
+@pytest_asyncio.fixture
+async def session_factory() -> AsyncIterator[async_sessionmaker[AsyncSession]]:
+    """in-memory SQLite 비동기 세션 팩토리 (커넥션 공유)"""
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def db(session_factory) -> AsyncIterator[AsyncSession]:
+    """in-memory SQLite 비동기 세션"""
+    async with session_factory() as session:
+        yield session
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def reset_resume_cache() -> AsyncIterator[None]:
+    """테스트마다 DB가 새로 만들어지므로 전역 이력서 / 이력서 임베딩 행렬 캐시도 비움"""
+    yield
+    await close_resume_cache()
+    resume_index_cache.clear()
@@ -0,0 +1,229 @@
+"""
+코칭 대화 스트리밍 테스트 (pytest 형식)
+"""
+import asyncio
+import json
+
+import httpx
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI
+from langchain_core.language_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+from langgraph.checkpoint.memory import InMemorySaver
+from app.agents import astream_resume_coach, create_resume_coach_graph, get_resume_coach_graph, run_resume_coach
+from app.api.routes import chat
+from app.core.llm import get_llm_pool
+from app.core.rate_limit import LLMRateLimitExceeded
+from app.database import get_db
+from app.database.models import Resume
+from app.models.schemas import ResumeExtraction
+
+RESUME = {
+    "person": {"name": "홍길동", "title": "Backend Engineer", "years_of_experience": 3},
+    "skills": [{"name": "Python", "category": "language"}],
+    "projects": [],
+}
+ANALYSIS = {
+    "overall_summary": "성과 보완이 필요합니다.",
+    "missing_areas": [],
+    "improvement_questions": [
+        {"category": "경력", "project_id": None, "question": "담당 업무는?", "purpose": "역할 파악"}
+    ],
+    "completeness_score": 0.5,
+}
+
+
+class FakeStreamingPool:
+    """토큰 단위 콜백을 발생시키는 가짜 Chat Model을 사용하는 풀"""
+
+    model_name = "fake-model"
+    scheduler = None
+
+    async def ainvoke(self, messages, temperature=0.3, config=None, **kwargs):
+        model = GenericFakeChatModel(messages=iter([AIMessage(content="좋아요! 담당 업무를 알려주세요.")]))
+        return await model.ainvoke(messages, config=config)
+
+    async def astream(self, messages, temperature=0.3, **kwargs):
+        yield json.dumps(RESUME, ensure_ascii=False)
+
+
+class ConcurrencyProbePool(FakeStreamingPool):
+    """동시에 진행 중인 LLM 호출 수의 최댓값을 기록하는 풀"""
+
+    def __init__(self):
+        self.active = 0
+        self.max_active = 0
+
+    async def _enter(self):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.05)
+        self.active -= 1
+
+    async def ainvoke(self, messages, temperature=0.3, config=None, **kwargs):
+        await self._enter()
+        return await super().ainvoke(messages, temperature=temperature, config=config, **kwargs)
+
+    async def astream(self, messages, temperature=0.3, **kwargs):
+        await self._enter()
+        async for chunk in super().astream(messages, temperature=temperature, **kwargs):
+            yield chunk
+
+
+@pytest.fixture
+def graph():
+    return create_resume_coach_graph(InMemorySaver())
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def resume(db) -> Resume:
+    resume = Resume(user_id="1", data=RESUME, analysis=ANALYSIS)
+    db.add(resume)
+    await db.commit()
+    return resume
+
+
+@pytest.mark.asyncio
+async def test_stream_emits_nodes_tokens_and_final_result(db, graph):
+    events = [
+        event async for event in astream_resume_coach(
+            session_id="session-1", user_id="1", user_answer="", db=db,
+            llm=FakeStreamingPool(), graph=graph  # type: ignore[arg-type]
+        )
+    ]
+
+    nodes = [e["data"]["node"] for e in events if e["event"] == "node"]
+    tokens = [e["data"] for e in events if e["event"] == "token"]
+
+    assert nodes == ["load_resume", "select_question", "generate_response"]
+    assert len(tokens) > 1
+    assert {token["node"] for token in tokens} == {"generate_response"}
+    assert "".join(token["content"] for token in tokens) == "좋아요! 담당 업무를 알려주세요."
+    assert events[-1] == {
+        "event": "done",
+        "data": {
+            "response": "좋아요! 담당 업무를 알려주세요.",
+            "is_completed": False,
+            "answered_count": 0,
+            "current_question_index": 0,
+        },
+    }
+
+
+@pytest.mark.asyncio
+async def test_progress_persists_across_turns(db, graph):
+    llm = FakeStreamingPool()
+
+    async def turn(answer: str) -> dict:
+        return await run_resume_coach(
+            session_id="session-2", user_id="1", user_answer=answer, db=db, llm=llm, graph=graph  # type: ignore[arg-type]
+        )
+
+    first = await turn("")
+    second = await turn("백엔드 API 개발을 담당했습니다.")
+
+    assert (first["answered_count"], first["is_completed"]) == (0, False)
+    assert (second["answered_count"], second["current_question_index"]) == (1, 1)
+    assert second["is_completed"] is True
+
+
+@pytest.mark.asyncio
+async def test_resume_update_runs_alongside_reply(db, graph, resume):
+    """답변 턴에서 이력서 업데이트와 완료 메시지 생성이 동시에 실행되고 둘 다 반영됨"""
+    llm = ConcurrencyProbePool()
+    await run_resume_coach("session-4", "1", "", db, llm=llm, graph=graph)  # type: ignore[arg-type]
+    llm.max_active = 0
+
+    events = [
+        event async for event in astream_resume_coach(
+            session_id="session-4", user_id="1", user_answer="백엔드 API 개발을 담당했습니다.", db=db,
+            llm=llm, graph=graph  # type: ignore[arg-type]
+        )
+    ]
+
+    nodes = [e["data"]["node"] for e in events if e["event"] == "node"]
+    assert nodes[:2] == ["load_resume", "select_question"]
+    assert set(nodes[2:]) == {"update_resume", "completion"}
+    assert llm.max_active == 2
+    assert events[-1]["data"]["response"] == "좋아요! 담당 업무를 알려주세요."
+
+    snapshot = await graph.aget_state({"configurable": {"thread_id": "session-4"}})
+    assert snapshot.values["current_resume_data"] == ResumeExtraction.model_validate(RESUME).model_dump(mode="json")
+    assert snapshot.values["is_completed"] is True
+
+
+class FailingPool:
+    """호출되면 실패하는 풀 (LLM 호출이 없어야 하는 경우 확인용)"""
+
+    model_name = "fake-model"
+
+    async def ainvoke(self, messages, temperature=0.3, config=None, **kwargs):
+        raise AssertionError("LLM should not be called")
+
+
+@pytest.mark.asyncio
+async def test_precomputed_phrasing_skips_llm(db, graph, resume):
+    """분석 때 미리 만든 질문 문구가 있으면 LLM 없이 한 번에 토큰으로 전달"""
+    phrasing = "좋아요! 어떤 업무를 담당하셨는지 알려주세요."
+    analysis = {**ANALYSIS, "improvement_questions": [{**ANALYSIS["improvement_questions"][0], "phrasing": phrasing}]}
+    resume.analysis = analysis
+    await db.commit()
+
+    events = [
+        event async for event in astream_resume_coach(
+            session_id="session-3", user_id="1", user_answer="", db=db,
+            llm=FailingPool(), graph=graph  # type: ignore[arg-type]
+        )
+    ]
+
+    tokens = [e["data"] for e in events if e["event"] == "token"]
+    assert tokens == [{"node": "generate_response", "content": phrasing}]
+    assert events[-1]["data"]["response"] == phrasing
+
+
+class RateLimitedPool(FakeStreamingPool):
+    """응답 생성 호출이 rate limit 재시도를 넘긴 것처럼 실패하는 풀"""
+
+    async def ainvoke(self, messages, temperature=0.3, config=None, **kwargs):
+        raise LLMRateLimitExceeded(2.5)
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_turn_returns_503_and_can_be_retried(db, graph, resume):
+    """응답 생성이 rate limit에 걸리면 503 + Retry-After, 같은 답변으로 재시도해도 질문을 건너뛰지 않음"""
+    questions = ANALYSIS["improvement_questions"] * 2
+    resume.analysis = {**ANALYSIS, "improvement_questions": questions}
+    await db.commit()
+
+    app = FastAPI()
+    app.include_router(chat.router, prefix="/api/chat")
+    app.dependency_overrides[get_db] = lambda: db
+    app.dependency_overrides[get_resume_coach_graph] = lambda: graph
+    pool = RateLimitedPool()
+    app.dependency_overrides[get_llm_pool] = lambda: pool
+
+    message = {"session_id": "session-5", "user_id": "1", "message": ""}
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        # 첫 턴이 실패하면 체크포인트가 남지 않음
+        first = await client.post("/api/chat/message", json=message)
+        assert first.status_code == 503 and first.headers["retry-after"] == "3"
+        assert not (await graph.aget_state({"configurable": {"thread_id": "session-5"}})).values
+
+        pool = FakeStreamingPool()
+        assert (await client.post("/api/chat/message", json=message)).status_code == 200
+
+        pool = RateLimitedPool()
+        answer = {**message, "message": "백엔드 API 개발을 담당했습니다."}
+        limited = await client.post("/api/chat/message", json=answer)
+        snapshot = await graph.aget_state({"configurable": {"thread_id": "session-5"}})
+
+        pool = FakeStreamingPool()
+        retried = await client.post("/api/chat/message", json=answer)
+
+    assert limited.status_code == 503 and limited.headers["retry-after"] == "3"
+    assert (snapshot.values["current_question_index"], snapshot.values["answered_count"]) == (0, 0)
+    assert snapshot.next == ()
+    assert retried.status_code == 200
+    assert (retried.json()["answered_count"], retried.json()["current_question_index"]) == (1, 1)
+    assert retried.json()["is_completed"] is False
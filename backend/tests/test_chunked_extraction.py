@@ -0,0 +1,121 @@
+"""
+Chunked extraction (map-reduce) 테스트 (pytest 형식)
+"""
+import asyncio
+import json
+
+from langchain_core.documents import Document
+
+from app.models.schemas import ResumeExtraction
+from app.services.chunked_extraction import extract_chunked, merge_extractions, split_documents
+
+
+def _project(project_id, name, company=None, situation=None, results=None, tech_stack=None):
+    return {
+        "id": project_id,
+        "name": name,
+        "company": company,
+        "period": "2023.01 - 2023.12",
+        "situation": situation,
+        "actions": ["API 설계"],
+        "results": results or [],
+        "tech_stack": tech_stack or [],
+        "is_complete": {"situation": False, "task": False, "actions": True, "results": False, "score": 0.25},
+    }
+
+
+def _extraction(projects, skills, career=None, name=None, years=0):
+    return ResumeExtraction.model_validate({
+        "person": {"name": name, "title": None, "years_of_experience": years},
+        "skills": [{"name": skill, "category": "language"} for skill in skills],
+        "projects": projects,
+        "career": career or [],
+    })
+
+
+class TestSplitDocuments:
+    """split_documents 테스트"""
+
+    def test_groups_pages_up_to_limit(self):
+        docs = [Document(page_content="a" * 40) for _ in range(5)]
+
+        chunks = split_documents(docs, max_chars=100)
+
+        assert len(chunks) == 3
+        assert all(len(chunk) <= 100 for chunk in chunks)
+
+    def test_splits_long_page_by_paragraph(self):
+        page = "\n\n".join(["b" * 60, "c" * 60, "d" * 250])
+
+        chunks = split_documents([Document(page_content=page)], max_chars=100)
+
+        assert all(len(chunk) <= 100 for chunk in chunks)
+        assert "".join(chunks).replace("\n", "") == page.replace("\n", "")
+
+
+class TestMergeExtractions:
+    """merge_extractions 테스트"""
+
+    def test_dedupes_and_reassigns_project_ids(self):
+        first = _extraction(
+            [_project("proj_001", "결제 시스템", "A사", situation="트래픽 급증"),
+             _project("proj_002", "추천 API", "B사")],
+            ["Python", "Kafka"],
+            career=[{"company": "A사", "position": "Backend", "duration": "2022-2023"}],
+            name="홍길동",
+        )
+        second = _extraction(
+            [_project("proj_001", "결제  시스템", "a사", results=["지연 40% 감소"], tech_stack=["Kafka"]),
+             _project("proj_002", "검색 개선", "C사")],
+            ["python", "Redis"],
+            career=[{"company": "A 사", "position": "backend", "duration": "2022-2023", "description": "결제"}],
+            years=5,
+        )
+
+        merged = merge_extractions([first, second])
+
+        assert [p.name for p in merged.projects] == ["결제 시스템", "추천 API", "검색 개선"]
+        assert [p.id for p in merged.projects] == ["proj_001", "proj_002", "proj_003"]
+        assert [s.name for s in merged.skills] == ["Python", "Kafka", "Redis"]
+        assert len(merged.career) == 1
+        assert merged.career[0].description == "결제"
+        assert merged.person.name == "홍길동"
+        assert merged.person.years_of_experience == 5
+
+        payment = merged.projects[0]
+        assert payment.situation == "트래픽 급증"
+        assert payment.results == ["지연 40% 감소"]
+        assert payment.is_complete.score == 0.75
+
+    def test_merge_is_deterministic(self):
+        partials = [
+            _extraction([_project("proj_001", f"프로젝트 {i}")], ["Python"]) for i in range(4)
+        ]
+
+        assert merge_extractions(partials) == merge_extractions(list(partials))
+
+
+class FakeChunkPool:
+    """청크 순서와 반대로 응답이 끝나는 가짜 풀"""
+
+    def __init__(self, total):
+        self.total = total
+
+    async def astream(self, messages, temperature=0.3, **kwargs):
+        prompt = messages[0].content
+        index = int(prompt.split("CHUNK-")[1][0])
+        await asyncio.sleep(0.01 * (self.total - index))
+        extraction = _extraction([_project("proj_001", f"프로젝트 {index}")], ["Python"])
+        yield json.dumps(extraction.model_dump(mode="json"), ensure_ascii=False)
+
+
+def test_extract_chunked_keeps_chunk_order():
+    chunks = [f"CHUNK-{i}" for i in range(3)]
+    events = []
+
+    merged = asyncio.run(
+        extract_chunked(FakeChunkPool(len(chunks)), chunks, max_concurrency=3, on_event=events.append)
+    )
+
+    assert [p.name for p in merged.projects] == ["프로젝트 0", "프로젝트 1", "프로젝트 2"]
+    assert sorted(event["index"] for event in events) == [0, 1, 2]
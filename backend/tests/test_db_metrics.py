@@ -0,0 +1,68 @@
+"""
+요청 / 노드 단위 DB 계측 테스트 (pytest 형식)
+"""
+import httpx
+import pytest
+from fastapi import APIRouter, FastAPI
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.core.metrics import MetricsMiddleware, DBMetrics, db_metrics
+from app.database.config import track_queries
+from app.database.models import Resume
+
+
+@pytest.mark.asyncio
+async def test_nested_scopes_and_repeated_queries(db):
+    """안쪽 집계의 쿼리는 바깥 집계에도 기록되고, 같은 SQL 반복은 N+1 의심으로 표시"""
+    db.add_all([Resume(user_id=f"user-{idx}", data={}) for idx in range(3)])
+    await db.commit()
+
+    with track_queries() as outer:
+        await db.scalars(select(Resume))
+        with track_queries() as inner:
+            for idx in range(5):
+                await db.scalar(select(Resume).where(Resume.user_id == f"user-{idx}"))
+
+    assert (inner.count, outer.count) == (5, 6)
+    assert outer.duration >= inner.duration > 0
+    assert len(inner.repeated(threshold=5)) == 1 and inner.repeated(threshold=6) == []
+
+    metrics = DBMetrics()
+    metrics.record("node", "load_resume", inner)
+    metrics.record("node", "load_resume", outer)
+    snapshot = metrics.snapshot()["nodes"]["load_resume"]
+    assert (snapshot["calls"], snapshot["queries"], snapshot["max_queries"]) == (2, 11, 6)
+    assert snapshot["repeated_query_calls"] == 2
+
+
+@pytest.mark.asyncio
+async def test_request_metrics_and_debug_headers(session_factory, monkeypatch):
+    """요청은 (prefix를 포함한) 라우트 템플릿 단위로 집계되고 debug 모드에서만 X-DB-* 헤더 추가"""
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+    router = APIRouter()
+
+    @router.get("/resumes/{user_id}")
+    async def read(user_id: str):
+        async with session_factory() as db:
+            db.add(Resume(user_id=user_id, data={}))
+            await db.commit()
+            await db.scalar(select(Resume).where(Resume.user_id == user_id))
+        return {}
+
+    app.include_router(router, prefix="/api")
+    db_metrics.reset()
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/api/resumes/a")
+        assert "x-db-query-count" not in response.headers
+
+        monkeypatch.setattr(settings, "debug", True)
+        response = await client.get("/api/resumes/b")
+
+    assert int(response.headers["x-db-query-count"]) >= 2
+    assert int(response.headers["x-db-rows"]) >= 1  # INSERT 행 수
+    assert float(response.headers["x-db-time-ms"]) > 0
+    request = db_metrics.snapshot()["requests"]["GET /api/resumes/{user_id}"]
+    assert request["calls"] == 2 and request["queries"] >= 4
+    db_metrics.reset()
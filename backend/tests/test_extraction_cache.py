@@ -0,0 +1,63 @@
+"""
+ExtractionCache 테스트 (pytest 형식)
+"""
+import pytest
+from sqlalchemy import func, select
+
+from app.database.models import ExtractionCacheEntry
+from app.models.schemas import ResumeExtraction
+from app.services.extraction_cache import ExtractionCache, ExtractionCacheStats
+
+
+@pytest.fixture
+def resume_data() -> ResumeExtraction:
+    return ResumeExtraction.model_validate({
+        "person": {"name": "홍길동", "title": "Backend Engineer", "years_of_experience": 3},
+        "skills": [{"name": "Python", "category": "language"}],
+        "projects": [],
+    })
+
+
+class TestCacheKey:
+    """캐시 키 생성 테스트"""
+
+    def test_whitespace_is_normalized(self):
+        """공백 차이만 있는 텍스트는 같은 키"""
+        key1 = ExtractionCache.make_key("홍길동\n\nBackend   Engineer ", "v1", "gpt-4o-mini")
+        key2 = ExtractionCache.make_key("홍길동 Backend Engineer", "v1", "gpt-4o-mini")
+        assert key1 == key2
+
+    def test_prompt_version_and_model_change_key(self):
+        """프롬프트 버전이나 모델이 다르면 다른 키"""
+        base = ExtractionCache.make_key("text", "v1", "gpt-4o-mini")
+        assert base != ExtractionCache.make_key("text", "v2", "gpt-4o-mini")
+        assert base != ExtractionCache.make_key("text", "v1", "gpt-4o")
+
+
+class TestExtractionCache:
+    """캐시 조회/저장/정리 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_miss_then_hit(self, db, resume_data: ResumeExtraction):
+        """저장 전에는 miss, 저장 후에는 같은 ResumeExtraction을 반환"""
+        cache = ExtractionCache(db, max_entries=10, ttl_seconds=3600, stats=ExtractionCacheStats())
+        key = ExtractionCache.make_key("text", "v1", "gpt-4o-mini")
+
+        assert await cache.get(key) is None
+        await cache.put(key, resume_data, "v1", "gpt-4o-mini")
+        assert await cache.get(key) == resume_data
+
+        assert cache.stats.snapshot()["hits"] == 1
+        assert cache.stats.snapshot()["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self, db, resume_data: ResumeExtraction):
+        """max_entries를 넘으면 엔트리 수가 제한됨"""
+        cache = ExtractionCache(db, max_entries=2, ttl_seconds=3600, stats=ExtractionCacheStats())
+
+        for idx in range(4):
+            key = ExtractionCache.make_key(f"text-{idx}", "v1", "gpt-4o-mini")
+            await cache.put(key, resume_data, "v1", "gpt-4o-mini")
+
+        assert await db.scalar(select(func.count()).select_from(ExtractionCacheEntry)) == 2
+        assert cache.stats.evictions == 2
@@ -0,0 +1,96 @@
+"""
+사용자별 LLM Fair Share Scheduler 테스트 (pytest 형식)
+"""
+import asyncio
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from langchain_core.messages import HumanMessage
+
+from app.agents import get_resume_coach_graph
+from app.api.routes import chat
+from app.core.fair_share import FairShareScheduler, UserQuotaExceeded, UserRoundRobinQueue, llm_user
+from app.core.llm import ChatModelPool, get_llm_pool
+from app.database import get_db
+
+MESSAGES = [HumanMessage(content="질문" * 200)]
+
+
+async def _call(scheduler: FairShareScheduler, user: str, order: list, hold: float = 0.01):
+    with llm_user(user):
+        async with scheduler.slot(MESSAGES):
+            order.append(user)
+            await asyncio.sleep(hold)
+
+
+@pytest.mark.asyncio
+async def test_other_users_are_not_queued_behind_a_burst():
+    scheduler = FairShareScheduler(max_concurrency=1, token_quota=0, completion_tokens=100)
+    order: list = []
+
+    burst = [asyncio.create_task(_call(scheduler, "heavy", order)) for _ in range(5)]
+    await asyncio.sleep(0)
+    light = asyncio.create_task(_call(scheduler, "light", order))
+    await asyncio.gather(*burst, light)
+
+    # 첫 호출이 슬롯을 잡고 있는 동안 도착한 light는 heavy의 남은 4개보다 먼저 실행
+    assert order[:2] == ["heavy", "light"]
+
+
+@pytest.mark.asyncio
+async def test_weight_and_per_user_concurrency_cap():
+    scheduler = FairShareScheduler(
+        max_concurrency=4, user_max_concurrency=2, token_quota=0, weights={"premium": 3.0}, completion_tokens=100
+    )
+    peak = {"heavy": 0}
+
+    async def tracked():
+        with llm_user("heavy"):
+            async with scheduler.slot(MESSAGES):
+                peak["heavy"] = max(peak["heavy"], scheduler.snapshot()["users"]["heavy"]["in_flight"])
+                await asyncio.sleep(0.01)
+
+    await asyncio.gather(*[tracked() for _ in range(6)])
+
+    assert peak["heavy"] == 2
+    assert scheduler.weight("premium") == 3.0 and scheduler.weight("someone") == 1.0
+
+
+@pytest.mark.asyncio
+async def test_token_quota_and_round_robin_queue():
+    scheduler = FairShareScheduler(token_quota=100, quota_window=60)
+    with llm_user("user-1"):
+        scheduler.record({"input_tokens": 90, "output_tokens": 20, "total_tokens": 110})
+
+    with pytest.raises(UserQuotaExceeded) as exc_info:
+        scheduler.check_quota("user-1")
+    assert 0 < exc_info.value.retry_after <= 60
+    scheduler.check_quota("user-2")
+
+    queue: UserRoundRobinQueue[str] = UserRoundRobinQueue()
+    for item in ("a1", "a2", "a3"):
+        queue.put_nowait("a", item)
+    queue.put_nowait("b", "b1")
+    items = [(await queue.get())[1] for _ in range(4)]
+    assert items == ["a1", "b1", "a2", "a3"]
+
+
+@pytest.mark.asyncio
+async def test_chat_returns_429_with_retry_after_when_quota_exceeded():
+    pool = ChatModelPool(model_name="fake-model", scheduler=FairShareScheduler(token_quota=100, quota_window=60))
+    with llm_user("user-1"):
+        pool.scheduler.record({"total_tokens": 500})
+
+    app = FastAPI()
+    app.include_router(chat.router, prefix="/api/chat")
+    app.dependency_overrides[get_llm_pool] = lambda: pool
+    app.dependency_overrides[get_db] = lambda: None
+    app.dependency_overrides[get_resume_coach_graph] = lambda: None
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post("/api/chat/message", json={"session_id": "s", "user_id": "user-1", "message": ""})
+
+    assert response.status_code == 429
+    assert 0 < int(response.headers["retry-after"]) <= 60
+    await pool.aclose()
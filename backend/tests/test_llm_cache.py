@@ -0,0 +1,92 @@
+"""
+LLM 응답 캐시 테스트 (pytest 형식)
+"""
+import json
+
+import pytest
+import pytest_asyncio
+from langchain_core.language_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage, SystemMessage
+from sqlalchemy import func, select
+
+from app.core.llm import ChatModelPool
+from app.core.structured_output import agenerate_structured
+from app.database.models import LLMResponseCacheEntry
+from app.models.schemas import QuestionPhrasings
+from app.services.llm_cache import CachePolicy, LLMCacheStats, LLMResponseCache
+
+PROMPT = [SystemMessage(content="대화를 마무리하는 메시지를 작성하세요.")]
+
+
+class CountingPool(ChatModelPool):
+    """실제 모델 대신 준비된 응답을 순서대로 돌려주는 Chat Model을 쓰는 풀"""
+
+    def __init__(self, replies, response_cache):
+        super().__init__(model_name="fake-model", response_cache=response_cache)
+        self.replies = list(replies)
+        self.calls = 0
+
+    def get(self, temperature: float = 0.3, model_name=None):
+        self.calls += 1
+        return GenericFakeChatModel(messages=iter([AIMessage(content=self.replies.pop(0))]))
+
+
+@pytest_asyncio.fixture
+async def cache(session_factory) -> LLMResponseCache:
+    return LLMResponseCache(session_factory, max_entries=10, stats=LLMCacheStats())
+
+
+@pytest.mark.asyncio
+async def test_policies(cache):
+    """TEMPERATURE_ZERO는 temperature 0 호출만 재사용, NEVER는 항상 호출"""
+    pool = CountingPool([f"응답 {idx}" for idx in range(6)], cache)
+
+    first = await pool.ainvoke(PROMPT, temperature=0, cache=CachePolicy.TEMPERATURE_ZERO, prompt_version="done@v1")
+    again = await pool.ainvoke(PROMPT, temperature=0, cache=CachePolicy.TEMPERATURE_ZERO, prompt_version="done@v1")
+    assert (first.content, again.content, pool.calls) == ("응답 0", "응답 0", 1)
+
+    # 프롬프트 버전이 다르면 다른 키
+    await pool.ainvoke(PROMPT, temperature=0, cache=CachePolicy.TEMPERATURE_ZERO, prompt_version="done@v2")
+    assert pool.calls == 2
+
+    # 샘플링 호출은 저장도 재사용도 하지 않음
+    sampled = await pool.ainvoke(PROMPT, temperature=0.7, cache=CachePolicy.TEMPERATURE_ZERO, prompt_version="done@v1")
+    resampled = await pool.ainvoke(PROMPT, temperature=0.7, cache=CachePolicy.TEMPERATURE_ZERO, prompt_version="done@v1")
+    assert (sampled.content, resampled.content, pool.calls) == ("응답 2", "응답 3", 4)
+
+    await pool.ainvoke(PROMPT, temperature=0, cache=CachePolicy.NEVER, prompt_version="done@v1")
+    assert pool.calls == 5
+    assert cache.stats.snapshot()["bypassed"] == 2
+    await pool.aclose()
+
+
+@pytest.mark.asyncio
+async def test_structured_responses_are_cached_only_when_valid(cache):
+    """스트리밍 structured output은 검증을 통과한 응답만 저장"""
+    valid = json.dumps({"phrasings": [{"index": 0, "message": "좋아요!"}]}, ensure_ascii=False)
+    pool = CountingPool(['{}', valid, "unused"], cache)  # '{}': 끝까지 받았지만 필수 필드 누락
+
+    async def call():
+        return await agenerate_structured(
+            pool, PROMPT, QuestionPhrasings, temperature=0, stream=True,
+            cache=CachePolicy.TEMPERATURE_ZERO, prompt_version="phrasing@v1"
+        )
+
+    with pytest.raises(ValueError):
+        await call()
+    assert (await call()).phrasings[0].message == "좋아요!"
+    assert (await call()).phrasings[0].message == "좋아요!"
+    assert pool.calls == 2
+    await pool.aclose()
+
+
+@pytest.mark.asyncio
+async def test_lru_eviction(cache, db):
+    """max_entries를 넘으면 가장 오래 조회되지 않은 엔트리부터 삭제"""
+    cache.max_entries = 2
+    for idx in range(4):
+        key = LLMResponseCache.make_key("fake-model", 0.7, "done@v1", [SystemMessage(content=f"프롬프트 {idx}")])
+        await cache.put(key, "fake-model", 0.7, "done@v1", f"응답 {idx}")
+
+    assert await db.scalar(select(func.count()).select_from(LLMResponseCacheEntry)) == 2
+    assert cache.stats.evictions == 2
@@ -0,0 +1,97 @@
+"""
+노드 / 서비스 단계 지표와 Prometheus 텍스트 렌더링 테스트 (pytest 형식)
+"""
+import pytest
+from langchain_core.language_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+from langgraph.checkpoint.memory import InMemorySaver
+
+from app.agents import create_resume_coach_graph, run_resume_coach
+from app.core.llm import ChatModelPool
+from app.core.metrics import (
+    LLM_TOKENS,
+    NODE_DURATION,
+    NODE_ERRORS,
+    STAGE_ERRORS,
+    Histogram,
+    observe_stage,
+    render_metrics,
+    reset_metrics,
+)
+from app.database.models import Resume
+
+ANALYSIS = {
+    "overall_summary": "성과 보완이 필요합니다.",
+    "missing_areas": [],
+    "improvement_questions": [
+        {"category": "경력", "project_id": None, "question": "담당 업무는?", "purpose": "역할 파악"}
+    ],
+    "completeness_score": 0.5,
+}
+
+
+class UsagePool(ChatModelPool):
+    """토큰 사용량이 담긴 응답을 돌려주는 Chat Model을 쓰는 풀"""
+
+    def __init__(self):
+        super().__init__(model_name="fake-model")
+
+    def get(self, temperature: float = 0.3, model_name=None):
+        usage = {"input_tokens": 120, "output_tokens": 30, "total_tokens": 150}
+        return GenericFakeChatModel(messages=iter([AIMessage(content="담당 업무를 알려주세요.", usage_metadata=usage)]))
+
+
+@pytest.fixture(autouse=True)
+def clean_metrics():
+    reset_metrics()
+    yield
+    reset_metrics()
+
+
+def test_histogram_renders_cumulative_buckets():
+    histogram = Histogram("demo_seconds", "데모", ["node"], buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 5.0):
+        histogram.observe(value, node="a")
+
+    samples = [(name, labels.get("le"), value) for name, labels, value in histogram.samples()]
+    assert samples == [
+        ("demo_seconds_bucket", "0.1", 1),
+        ("demo_seconds_bucket", "1.0", 2),
+        ("demo_seconds_bucket", "+Inf", 3),
+        ("demo_seconds_sum", None, 5.55),
+        ("demo_seconds_count", None, 3),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_graph_nodes_record_latency_tokens_and_errors(db):
+    db.add(Resume(user_id="1", data={"person": {"name": "홍길동"}}, analysis=ANALYSIS))
+    await db.commit()
+    graph = create_resume_coach_graph(InMemorySaver())
+
+    await run_resume_coach("session-1", "1", "", db, llm=UsagePool(), graph=graph)
+    with pytest.raises(ValueError):
+        await run_resume_coach("session-2", "unknown", "", db, llm=UsagePool(), graph=graph)
+
+    assert NODE_DURATION.count(node="load_resume") == 2
+    assert NODE_ERRORS.get(node="load_resume") == 1
+    assert NODE_DURATION.count(node="select_question") == NODE_DURATION.count(node="generate_response") == 1
+    assert LLM_TOKENS.get(scope="generate_response", type="prompt") == 120
+    assert LLM_TOKENS.get(scope="generate_response", type="completion") == 30
+
+    body = render_metrics()
+    assert "# TYPE resume_coach_node_duration_seconds histogram" in body
+    assert 'resume_coach_node_errors_total{node="load_resume"} 1' in body
+    assert 'llm_tokens_total{scope="generate_response",type="prompt"} 120' in body
+    assert 'db_queries_total{kind="node",name="load_resume"}' in body
+
+
+@pytest.mark.asyncio
+async def test_service_stage_errors():
+    @observe_stage("analyze_resume")
+    async def analyze():
+        raise ValueError("이력서 분석 실패")
+
+    with pytest.raises(ValueError):
+        await analyze()
+    assert STAGE_ERRORS.get(stage="analyze_resume") == 1
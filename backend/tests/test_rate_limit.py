@@ -0,0 +1,116 @@
+"""
+LLM Rate Limiter 테스트 (pytest 형식)
+"""
+import asyncio
+
+import httpx
+import openai
+import pytest
+from langchain_core.language_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage, HumanMessage
+
+from app.core.llm import ChatModelPool
+from app.core.metrics import LLM_RATE_LIMIT_WAIT, LLM_RATE_LIMITED, reset_metrics
+from app.core.rate_limit import (
+    LLMRateLimiter,
+    LLMRateLimitExceeded,
+    LocalBucketStore,
+    PostgresBucketStore,
+    Priority,
+    llm_priority,
+)
+
+MESSAGES = [HumanMessage(content="질문")]
+
+
+def rate_limit_error(retry_after: str = "0") -> openai.RateLimitError:
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    response = httpx.Response(429, headers={"retry-after": retry_after}, request=request)
+    return openai.RateLimitError("rate limited", response=response, body=None)
+
+
+class FlakyModel(GenericFakeChatModel):
+    """처음 failures번은 429를 던지는 Chat Model"""
+
+    failures: int = 0
+
+    async def ainvoke(self, *args, **kwargs):
+        if self.failures:
+            self.failures -= 1
+            raise rate_limit_error()
+        return await super().ainvoke(*args, **kwargs)
+
+
+class FlakyPool(ChatModelPool):
+    def __init__(self, failures: int, rate_limiter: LLMRateLimiter):
+        super().__init__(model_name="fake-model", rate_limiter=rate_limiter)
+        usage = {"input_tokens": 10, "output_tokens": 5, "total_tokens": 15}
+        self.model = FlakyModel(messages=iter([AIMessage(content="답변", usage_metadata=usage)]), failures=failures)
+
+    def get(self, temperature: float = 0.3, model_name=None):
+        return self.model
+
+
+@pytest.fixture(autouse=True)
+def clean_metrics():
+    reset_metrics()
+    yield
+    reset_metrics()
+
+
+@pytest.mark.asyncio
+async def test_interactive_calls_overtake_waiting_background_calls():
+    store = LocalBucketStore(rpm=600, tpm=1_000_000)  # 0.1초마다 요청 1개
+    store.state.requests = 0
+    limiter = LLMRateLimiter(store, completion_tokens=0)
+    order = []
+
+    async def call(name: str, priority: Priority):
+        with llm_priority(priority):
+            await limiter.acquire(MESSAGES)
+        order.append(name)
+
+    background = [asyncio.create_task(call(f"background-{idx}", Priority.BACKGROUND)) for idx in range(2)]
+    await asyncio.sleep(0.01)
+    interactive = asyncio.create_task(call("interactive", Priority.INTERACTIVE))
+    await asyncio.gather(*background, interactive)
+
+    assert order == ["interactive", "background-0", "background-1"]
+    assert LLM_RATE_LIMIT_WAIT.count(priority="background") == 2
+
+
+@pytest.mark.asyncio
+async def test_429_halves_rate_and_retries_until_success():
+    limiter = LLMRateLimiter(LocalBucketStore(rpm=1000, tpm=100_000), completion_tokens=100)
+    pool = FlakyPool(failures=2, rate_limiter=limiter)
+
+    response = await pool.ainvoke(MESSAGES)
+
+    assert response.content == "답변"
+    assert LLM_RATE_LIMITED.get(scope="other") == 2
+    assert limiter.store.rate_factor == pytest.approx(0.25 + 0.01)
+    # 예약한 토큰(100 + 프롬프트)은 실제 사용량(15)으로 정산되어 대부분 돌려받음
+    assert limiter.store.state.tokens > 100_000 - 3 * 101
+
+
+@pytest.mark.asyncio
+async def test_429_beyond_max_retries_raises():
+    limiter = LLMRateLimiter(LocalBucketStore(rpm=1000, tpm=100_000))
+    pool = FlakyPool(failures=10, rate_limiter=limiter)
+
+    with pytest.raises(LLMRateLimitExceeded):
+        await pool.ainvoke(MESSAGES)
+
+
+@pytest.mark.asyncio
+async def test_postgres_store_shares_bucket_between_workers(session_factory):
+    workers = [PostgresBucketStore(rpm=3, tpm=100_000, session_factory=session_factory) for _ in range(2)]
+
+    waits = [await workers[idx % 2].consume(10) for idx in range(4)]
+
+    assert waits[:3] == [0.0, 0.0, 0.0]
+    assert waits[3] > 0  # 두 워커가 분당 3개 한도를 함께 소진
+
+    await workers[0].rate_limited(5.0)
+    assert await workers[1].consume(10) >= 4.0
+    assert workers[1].rate_factor == 0.5
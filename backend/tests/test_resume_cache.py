@@ -0,0 +1,154 @@
+"""
+ResumeCache 테스트 (pytest 형식)
+"""
+import asyncio
+import copy
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from app.database.models import Resume
+from app.models.schemas import ResumeExtraction
+from app.repositories import ResumeRepository
+from app.services import resume_cache
+from app.services.resume_cache import (
+    CachedResume,
+    PostgresInvalidationChannel,
+    ResumeCache,
+    ResumeCacheStats,
+    get_resume_cache,
+)
+
+RESUME = {
+    "person": {"name": "홍길동", "title": "Backend Engineer", "years_of_experience": 3},
+    "skills": [{"name": "Python", "category": "language"}],
+    "projects": [],
+}
+
+
+class CountingLoader:
+    def __init__(self, repo: ResumeRepository, user_id: str):
+        self.repo = repo
+        self.user_id = user_id
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        return await self.repo.get_recent_resume_by_user_id(self.user_id)
+
+
+@pytest.mark.asyncio
+async def test_read_through_and_ttl(db):
+    """두 번째 조회는 DB를 읽지 않고, TTL이 지나면 다시 읽음"""
+    repo = ResumeRepository(db)
+    await repo.save(ResumeExtraction.model_validate(RESUME), user_id="1")
+    loader = CountingLoader(repo, "1")
+
+    cache = ResumeCache(ttl_seconds=60, stats=ResumeCacheStats())
+    first = await cache.get_or_load("1", loader)
+    first.data["person"]["name"] = "수정됨"  # 반환값을 바꿔도 캐시는 그대로
+    second = await cache.get_or_load("1", loader)
+
+    assert loader.calls == 1
+    assert second.data["person"]["name"] == "홍길동"
+    assert cache.stats.snapshot()["hit_ratio"] == 0.5
+
+    expired = ResumeCache(ttl_seconds=0, stats=ResumeCacheStats())
+    await expired.get_or_load("1", loader)
+    await expired.get_or_load("1", loader)
+    assert loader.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_repository_writes_refresh_or_invalidate(db):
+    """update_data는 캐시를 새 값으로 교체하고, 새 이력서 저장은 엔트리를 무효화"""
+    repo = ResumeRepository(db)
+    saved = await repo.save(ResumeExtraction.model_validate(RESUME), user_id="1")
+    cache = get_resume_cache()
+    loader = CountingLoader(repo, "1")
+    await cache.get_or_load("1", loader)
+
+    # 같은 이력서 수정: write-through (DB 재조회 없음)
+    updated = copy.deepcopy(saved.data)
+    updated["skills"].append({"name": "Kafka", "category": "tool"})
+    await repo.update_data(saved.id, updated)
+    assert (await cache.get_or_load("1", loader)).data == updated
+    assert loader.calls == 1
+
+    # 새 이력서 저장: 최근 이력서가 바뀌므로 다시 로드
+    newer = await repo.save(ResumeExtraction.model_validate(RESUME), user_id="1")
+    assert (await cache.get_or_load("1", loader)).resume_id == newer.id
+    assert loader.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_invalidation_during_load_is_not_cached(db):
+    """로드 중에 무효화되면 읽어 온 (이전) 데이터를 저장하지 않음"""
+    resume = Resume(user_id="1", data=RESUME)
+    db.add(resume)
+    await db.commit()
+    cache = ResumeCache(stats=ResumeCacheStats())
+
+    async def racing_loader():
+        await cache.invalidate("1")  # 로드하는 동안 다른 요청이 이력서를 수정
+        return resume
+
+    await cache.get_or_load("1", racing_loader)
+    loader = CountingLoader(ResumeRepository(db), "1")
+    await cache.get_or_load("1", loader)
+
+    assert loader.calls == 1
+
+
+class FakeListenConnection:
+    """준비된 알림을 보낸 뒤 끊기거나(fail) 계속 대기하는 psycopg 연결 대역"""
+
+    def __init__(self, payloads, fail):
+        self.payloads = payloads
+        self.fail = fail
+
+    async def execute(self, *args):
+        return None
+
+    async def notifies(self):
+        for payload in self.payloads:
+            yield SimpleNamespace(payload=payload)
+        if self.fail:
+            raise ConnectionError("server closed the connection")
+        await asyncio.Event().wait()
+
+    async def close(self):
+        return None
+
+
+@pytest.mark.asyncio
+async def test_postgres_channel_reconnects_and_resets_after_listen_failure(monkeypatch):
+    """LISTEN 연결이 끊기면 오류를 세고 다시 연결한 뒤, 놓친 알림 대신 로컬 엔트리를 모두 버림"""
+    connections = iter([
+        FakeListenConnection([], fail=False),  # publish 연결
+        FakeListenConnection(["other:user-1"], fail=True),
+        FakeListenConnection(["other:user-2"], fail=False),
+    ])
+
+    async def connect(*args, **kwargs):
+        return next(connections)
+
+    monkeypatch.setattr(resume_cache.AsyncConnection, "connect", connect)
+    stats = ResumeCacheStats()
+    channel = PostgresInvalidationChannel("postgresql://fake", stats=stats, reconnect_delay=0.01)
+    cache = ResumeCache(channel=channel, stats=stats, enabled=True)
+    for user_id in ("user-1", "user-2", "user-3"):
+        cache._store(user_id, CachedResume(1, user_id, copy.deepcopy(RESUME), None, datetime.now(timezone.utc)))
+
+    await cache.start()
+    for _ in range(100):
+        if stats.channel_errors and not cache._entries:
+            break
+        await asyncio.sleep(0.01)
+    await cache.close()
+
+    assert stats.channel_errors == 1
+    assert stats.snapshot()["channel_errors"] == 1
+    assert not cache._entries
+    assert stats.invalidations == 3  # user-1 알림 + 재연결 시 user-2, user-3 전체 무효화
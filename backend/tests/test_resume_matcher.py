@@ -0,0 +1,261 @@
+"""
+JD ↔ 이력서 항목 매칭 테스트 (pytest 형식)
+"""
+import asyncio
+import time
+
+import httpx
+import numpy as np
+import pytest
+from fastapi import FastAPI
+from langchain_core.messages import AIMessage
+
+from app.agents import get_resume_coach_graph
+from app.api.routes import generate
+from app.core.config import settings
+from app.core.llm import get_llm_pool
+from app.core.rate_limit import LLMRateLimitExceeded
+from app.database import get_db
+from app.database.models import Resume
+from app.repositories import ResumeEmbeddingRepository
+from app.services.embeddings import HashingEmbedder
+from app.services.generated_resumes import GeneratedResumeStore
+from app.services.resume_matcher import ResumeMatcher, top_k_indices
+
+DESIGN_JD = "프로덕트 디자이너 채용. Figma로 디자인 시스템과 React 컴포넌트 가이드를 관리합니다."
+BACKEND_JD = "실시간 데이터 엔지니어 채용. Kafka, Flink 스트림 파이프라인으로 실시간 피처를 계산합니다."
+JD_TEXT = "개인화 추천 시스템 ML 엔지니어 채용. Python, PyTorch로 추천 모델을 학습합니다. Kafka 실시간 피처 경험 우대."
+
+
+def _resume_data() -> dict:
+    return {
+        "person": {"name": "홍길동", "title": "ML Engineer", "years_of_experience": 5},
+        "skills": [
+            {"name": "PyTorch", "category": "framework"},
+            {"name": "Kafka", "category": "tool"},
+            {"name": "Figma", "category": "tool"},
+        ],
+        "career": [{"company": "테스트컴퍼니", "position": "ML Engineer", "description": "추천 모델 개발"}],
+        "projects": [
+            {"id": "proj_rec", "name": "개인화 추천 시스템", "tech_stack": ["Python", "PyTorch"],
+             "actions": ["추천 모델 학습 파이프라인 구축"], "results": ["클릭률 12% 향상"]},
+            {"id": "proj_feature", "name": "실시간 피처 파이프라인", "tech_stack": ["Kafka", "Flink"],
+             "actions": ["Kafka 스트림으로 실시간 피처 계산"]},
+            {"id": "proj_web", "name": "사내 디자인 시스템", "tech_stack": ["React", "Figma"],
+             "actions": ["컴포넌트 라이브러리 정리"]},
+        ],
+    }
+
+
+class CountingEmbedder(HashingEmbedder):
+    """임베딩한 텍스트 수를 세는 해싱 임베딩"""
+
+    def __init__(self):
+        super().__init__()
+        self.embedded = 0
+
+    def embed(self, texts):
+        self.embedded += len(texts)
+        return super().embed(texts)
+
+
+def test_hashing_embedder_and_top_k():
+    embedder = HashingEmbedder(dimensions=256)
+    vectors = embedder.embed(["Kafka 스트림 파이프라인", "Kafka 기반 스트리밍 파이프라인 구축", "UI 디자인"])
+
+    assert vectors.shape == (3, 256)
+    np.testing.assert_allclose(np.linalg.norm(vectors, axis=1), 1.0, rtol=1e-5)
+    assert np.array_equal(vectors, embedder.embed(["Kafka 스트림 파이프라인", "Kafka 기반 스트리밍 파이프라인 구축", "UI 디자인"]))
+    assert vectors[0] @ vectors[1] > vectors[0] @ vectors[2]
+
+    scores = np.array([0.1, 0.9, 0.5, 0.7])
+    assert top_k_indices(scores, 2).tolist() == [1, 3]
+    assert top_k_indices(scores, 10).tolist() == [1, 3, 2, 0]
+    assert top_k_indices(np.stack([scores, -scores]), 2).tolist() == [[1, 3], [0, 2]]
+
+
+@pytest.mark.asyncio
+async def test_match_ranks_projects_and_reembeds_only_changed_items(db):
+    resume = Resume(user_id="user-1", data=_resume_data())
+    db.add(resume)
+    await db.commit()
+
+    embedder = CountingEmbedder()
+    matcher = ResumeMatcher(db, embedder=embedder)
+    matches = await matcher.match(resume, JD_TEXT, top_k_projects=2, top_k_skills=2)
+
+    assert [match.key for match in matches.projects] == ["proj_rec", "proj_feature"]
+    assert {match.key for match in matches.skills} == {"PyTorch", "Kafka"}
+    assert len(matches.careers) == 1
+    assert embedder.embedded == 7 + 1  # 항목 7개 + JD
+
+    # 0은 기본값으로 바뀌지 않고 그대로 0개
+    none = await matcher.match(resume, JD_TEXT, top_k_projects=0, top_k_skills=0)
+    assert none.projects == [] and none.skills == []
+
+    # 프로젝트 하나만 바꾸면 그 항목만 다시 임베딩
+    data = _resume_data()
+    data["projects"][2]["name"] = "사내 디자인 시스템 v2"
+    resume.data = data
+    await db.commit()
+    embedder.embedded = 0
+    await matcher.index_resume(resume)
+
+    assert embedder.embedded == 1
+    assert len(await ResumeEmbeddingRepository(db).list_by_resume(resume.id)) == 7
+
+    # 같은 이력서로 JD 여러 개를 매칭하면 캐시된 항목 행렬에 JD만 한 번에 임베딩
+    embedder.embedded = 0
+    batch = await matcher.match_many(resume, [DESIGN_JD, JD_TEXT], top_k_projects=2, top_k_skills=2)
+
+    assert embedder.embedded == 2
+    assert matcher.cache.hits >= 1
+    assert batch[0].projects[0].key == "proj_web"
+    assert batch[1] == await matcher.match(resume, JD_TEXT, top_k_projects=2, top_k_skills=2)
+    assert batch[1].fit_score > batch[0].fit_score
+
+
+class FakeChatModelPool:
+    """프롬프트를 기록하고 고정 마크다운을 돌려주는 가짜 풀"""
+
+    model_name = "fake-model"
+
+    def __init__(self):
+        self.prompts = []
+
+    async def ainvoke(self, messages, temperature=0.3, **kwargs):
+        self.prompts.append(messages[0].content)
+        return AIMessage(content="# 홍길동\n\n## 프로젝트\n- 개인화 추천 시스템")
+
+
+class FakeGraph:
+    async def aget_state(self, config):
+        values = {"user_id": "user-1"} if config["configurable"]["thread_id"] == "session-1" else {}
+        return type("Snapshot", (), {"values": values})()
+
+
+@pytest.mark.asyncio
+async def test_generate_route_puts_top_k_projects_in_prompt(db):
+    db.add(Resume(user_id="user-1", data=_resume_data()))
+    await db.commit()
+    pool = FakeChatModelPool()
+
+    app = FastAPI()
+    app.include_router(generate.router, prefix="/api/generate")
+    app.dependency_overrides[get_db] = lambda: db
+    app.dependency_overrides[get_llm_pool] = lambda: pool
+    app.dependency_overrides[get_resume_coach_graph] = lambda: FakeGraph()
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post("/api/generate/", json={"session_id": "session-1", "jd_text": JD_TEXT, "top_k": 1})
+        missing = await client.post("/api/generate/", json={"session_id": "unknown", "jd_text": JD_TEXT})
+        body = response.json()
+        preview = await client.get(f"/api/generate/preview/{body['job_id']}")
+        download = await client.get(f"/api/generate/download/{body['job_id']}")
+
+    assert response.status_code == 200
+    assert [match["key"] for match in body["matches"]["projects"]] == ["proj_rec"]
+    assert "개인화 추천 시스템" in pool.prompts[0] and "사내 디자인 시스템" not in pool.prompts[0]
+    assert missing.status_code == 404
+    assert preview.json()["markdown"] == body["markdown"]
+    assert download.text == body["markdown"]
+
+
+class SlowChatModelPool(FakeChatModelPool):
+    """동시 실행 수를 기록하고 디자인 JD 생성은 실패하는 가짜 풀"""
+
+    def __init__(self):
+        super().__init__()
+        self.running = 0
+        self.peak = 0
+
+    async def ainvoke(self, messages, temperature=0.3, **kwargs):
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await asyncio.sleep(0.01)
+            if "프로덕트 디자이너" in messages[0].content:
+                raise RuntimeError("generation failed")
+            return await super().ainvoke(messages, temperature, **kwargs)
+        finally:
+            self.running -= 1
+
+
+@pytest.mark.asyncio
+async def test_batch_route_ranks_all_jds_and_generates_top_m_concurrently(db, monkeypatch):
+    monkeypatch.setattr(settings, "generate_batch_concurrency", 2)
+    db.add(Resume(user_id="user-1", data=_resume_data()))
+    await db.commit()
+    pool = SlowChatModelPool()
+
+    app = FastAPI()
+    app.include_router(generate.router, prefix="/api/generate")
+    app.dependency_overrides[get_db] = lambda: db
+    app.dependency_overrides[get_llm_pool] = lambda: pool
+    app.dependency_overrides[get_resume_coach_graph] = lambda: FakeGraph()
+
+    jds = [
+        {"title": "디자이너", "jd_text": DESIGN_JD},
+        {"jd_text": JD_TEXT},
+        {"title": "데이터 엔지니어", "jd_text": BACKEND_JD},
+    ]
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post("/api/generate/batch", json={"session_id": "session-1", "jds": jds, "top_m": 3})
+        results = response.json()["results"]
+        preview = await client.get(f"/api/generate/preview/{results[0]['job_id']}")
+        empty = await client.post("/api/generate/batch", json={"session_id": "session-1", "jds": []})
+
+    assert response.status_code == 200
+    assert [result["rank"] for result in results] == [1, 2, 3]
+    scores = [result["matches"]["fit_score"] for result in results]
+    assert scores == sorted(scores, reverse=True)
+    assert results[-1]["title"] == "디자이너"
+    assert next(result["title"] for result in results if result["index"] == 1) == JD_TEXT
+    assert results[-1]["job_id"] is None and results[-1]["error"] == "generation failed"
+    assert all(result["job_id"] for result in results[:2])
+    assert pool.peak == 2
+    assert preview.json()["markdown"].startswith("# 홍길동")
+    assert empty.status_code == 400
+
+
+def test_generated_resume_store_evicts_lru_and_expires(monkeypatch):
+    store = GeneratedResumeStore(max_entries=2, ttl_seconds=60)
+    store.put("job-1", {"markdown": "1"})
+    store.put("job-2", {"markdown": "2"})
+    assert store.get("job-1") == {"markdown": "1"}  # job-2가 가장 오래 조회되지 않은 엔트리가 됨
+
+    store.put("job-3", {"markdown": "3"})
+    assert store.get("job-2") is None
+    assert (len(store), store.evictions) == (2, 1)
+
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 61)
+    assert store.get("job-1") is None and store.get("job-3") is None
+    assert len(store) == 0
+
+
+class RateLimitedChatModelPool(FakeChatModelPool):
+    """생성 호출이 rate limit 재시도를 넘긴 것처럼 실패하는 가짜 풀"""
+
+    async def ainvoke(self, messages, temperature=0.3, **kwargs):
+        raise LLMRateLimitExceeded(2.5)
+
+
+@pytest.mark.asyncio
+async def test_batch_route_returns_503_when_generation_is_rate_limited(db):
+    """JD별 생성 실패와 달리 rate limit은 결과에 묻히지 않고 503 + Retry-After로 응답"""
+    db.add(Resume(user_id="user-1", data=_resume_data()))
+    await db.commit()
+
+    app = FastAPI()
+    app.include_router(generate.router, prefix="/api/generate")
+    app.dependency_overrides[get_db] = lambda: db
+    app.dependency_overrides[get_llm_pool] = lambda: RateLimitedChatModelPool()
+    app.dependency_overrides[get_resume_coach_graph] = lambda: FakeGraph()
+
+    jds = [{"jd_text": JD_TEXT}, {"jd_text": BACKEND_JD}]
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post("/api/generate/batch", json={"session_id": "session-1", "jds": jds, "top_m": 2})
+
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "3"
@@ -0,0 +1,127 @@
+"""
+프로젝트 단위 이력서 패치 테스트 (pytest 형식)
+"""
+import copy
+import json
+
+import pytest
+import pytest_asyncio
+
+from app.agents.nodes import update_resume_node
+from app.database.models import Resume
+from app.models.schemas import ResumePatch
+from app.services.resume_patch import apply_resume_patch, select_patch_target
+
+RESUME = {
+    "person": {"name": "홍길동", "title": "Backend Engineer", "years_of_experience": 3},
+    "skills": [{"name": "Python", "category": "language"}],
+    "projects": [
+        {
+            "id": f"proj_{idx:03d}",
+            "name": name,
+            "period": "2023.01 - 2023.12",
+            "actions": ["API 설계"],
+            "tech_stack": ["Python"],
+            "is_complete": {"situation": False, "task": False, "actions": True, "results": False, "score": 0.25},
+        }
+        for idx, name in enumerate(["결제 시스템", "추천 API"], start=1)
+    ],
+}
+QUESTION = {"category": "STAR-결과", "project_id": "proj_002", "question": "성과가 있었나요?", "purpose": "임팩트"}
+PATCH = {"situation": "추천 클릭률 정체", "add_results": ["클릭률 12% 향상"], "add_actions": ["api 설계"]}
+
+
+class TestApplyResumePatch:
+    """select_patch_target / apply_resume_patch 테스트"""
+
+    def test_target_is_scoped_to_project(self):
+        target = select_patch_target(RESUME, QUESTION)
+
+        assert target == {"project": RESUME["projects"][1], "skills": ["Python"]}
+
+    def test_skill_question_targets_skills_only(self):
+        target = select_patch_target(RESUME, {"category": "기술스택", "question": "다른 기술은?"})
+
+        assert target == {"skills": ["Python"]}
+
+    def test_unscoped_question_falls_back(self):
+        assert select_patch_target(RESUME, {"category": "경력", "project_id": "proj_999"}) is None
+
+    def test_apply_updates_only_target_project(self):
+        patch = ResumePatch.model_validate({**PATCH, "add_skills": [{"name": "python", "category": "language"},
+                                                                   {"name": "Redis", "category": "database"}]})
+
+        updated = apply_resume_patch(RESUME, patch, project_id="proj_002")
+
+        payment, recommend = updated["projects"]
+        assert payment == RESUME["projects"][0] | {"company": None, "role": None, "situation": None,
+                                                    "task": None, "results": []}
+        assert recommend["situation"] == "추천 클릭률 정체"
+        assert recommend["actions"] == ["API 설계"]
+        assert recommend["results"] == ["클릭률 12% 향상"]
+        assert recommend["is_complete"]["score"] == 0.75
+        assert [skill["name"] for skill in updated["skills"]] == ["Python", "Redis"]
+        assert RESUME["projects"][1]["actions"] == ["API 설계"]
+
+
+class FakeUpdatePool:
+    """패치 / 전체 업데이트 프롬프트를 구분해 응답하는 가짜 풀"""
+
+    model_name = "fake-model"
+
+    def __init__(self, patch_reply: str):
+        self.patch_reply = patch_reply
+        self.prompts = []
+
+    async def astream(self, messages, temperature=0.3, **kwargs):
+        prompt = messages[0].content
+        self.prompts.append(prompt)
+        if "이력서 패치 전문가" in prompt:
+            yield self.patch_reply
+        else:
+            full = copy.deepcopy(RESUME)
+            full["projects"][1]["results"] = ["전체 재생성 결과"]
+            yield json.dumps(full, ensure_ascii=False)
+
+
+@pytest_asyncio.fixture
+async def resume(db) -> Resume:
+    resume = Resume(user_id="1", data=RESUME)
+    db.add(resume)
+    await db.commit()
+    return resume
+
+
+def _state(resume_id: int) -> dict:
+    return {
+        "user_id": "1",
+        "resume_id": resume_id,
+        "user_answer": "클릭률이 12% 올랐어요",
+        "answered_question": QUESTION,
+        "current_resume_data": copy.deepcopy(RESUME),
+        "answered_count": 0,
+        "current_question_index": 0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_update_node_sends_only_target_project(db, resume):
+    llm = FakeUpdatePool(json.dumps(PATCH, ensure_ascii=False))
+
+    update = await update_resume_node(_state(resume.id), db, llm=llm)  # type: ignore[arg-type]
+
+    assert len(llm.prompts) == 1
+    assert "추천 API" in llm.prompts[0] and "결제 시스템" not in llm.prompts[0]
+    assert update["current_resume_data"]["projects"][1]["results"] == ["클릭률 12% 향상"]
+    await db.refresh(resume)
+    assert resume.data["projects"][1]["results"] == ["클릭률 12% 향상"]
+
+
+@pytest.mark.asyncio
+async def test_update_node_falls_back_to_full_update(db, resume):
+    llm = FakeUpdatePool('{"situation": 42}')
+
+    update = await update_resume_node(_state(resume.id), db, llm=llm)  # type: ignore[arg-type]
+
+    assert len(llm.prompts) == 2
+    assert update["current_resume_data"]["projects"][1]["results"] == ["전체 재생성 결과"]
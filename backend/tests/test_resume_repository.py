@@ -0,0 +1,59 @@
+"""
+ResumeRepository 테스트 (pytest 형식)
+"""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.database.models import Resume
+from app.repositories.resume_repository import ResumeRepository
+
+
+@pytest.mark.asyncio
+async def test_recent_resume_is_newest(db):
+    """가장 최근에 만든 이력서를 반환 (created_at이 같으면 나중에 저장된 행)"""
+    now = datetime.now(timezone.utc)
+    db.add_all([
+        Resume(user_id="1", data={"v": "old"}, created_at=now - timedelta(days=1)),
+        Resume(user_id="1", data={"v": "tie-1"}, created_at=now),
+        Resume(user_id="1", data={"v": "tie-2"}, created_at=now),
+        Resume(user_id="2", data={"v": "other"}, created_at=now + timedelta(days=1)),
+    ])
+    await db.commit()
+
+    recent = await ResumeRepository(db).get_recent_resume_by_user_id("1")
+
+    assert recent is not None
+    assert recent.data == {"v": "tie-2"}
+    assert await ResumeRepository(db).get_recent_resume_by_user_id("missing") is None
+
+
+def _resume_data(skills: list[tuple[str, str]], tech_stack: list[str]) -> dict:
+    return {
+        "person": {"name": "홍길동", "title": "Backend Engineer", "years_of_experience": 3},
+        "skills": [{"name": name, "category": category} for name, category in skills],
+        "projects": [{"id": "proj_001", "name": "주문 파이프라인", "tech_stack": tech_stack}],
+    }
+
+
+@pytest.mark.asyncio
+async def test_search_filters_skills_categories_and_tech_stack(db):
+    """기술/카테고리 조건은 같은 skills 항목에서, 기술 스택은 프로젝트에서 일치"""
+    db.add_all([
+        Resume(user_id="kafka", data=_resume_data([("Kafka", "tool"), ("Python", "language")], ["Kafka", "FastAPI"])),
+        Resume(user_id="postgres", data=_resume_data([("PostgreSQL", "database")], ["FastAPI"])),
+        Resume(user_id="mixed", data=_resume_data([("Kafka", "database")], [])),
+    ])
+    await db.commit()
+    repo = ResumeRepository(db)
+
+    async def users(**filters) -> set:
+        return {resume.user_id for resume in await repo.search(**filters)}
+
+    assert await users(skill="Kafka") == {"kafka", "mixed"}
+    assert await users(skill="Kafka", category="tool") == {"kafka"}
+    assert await users(category="database") == {"postgres", "mixed"}
+    assert await users(tech_stack="FastAPI") == {"kafka", "postgres"}
+    assert await users(skill="Kafka", tech_stack="Kafka") == {"kafka"}
+    assert await users(skill="Go") == set()
+
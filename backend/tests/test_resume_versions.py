@@ -0,0 +1,67 @@
+"""
+ResumeVersionRepository 테스트 (pytest 형식)
+"""
+import copy
+
+import pytest
+
+from app.core.config import settings
+from app.database.models import Resume
+from app.models.schemas import ResumeExtraction
+from app.repositories import ResumeRepository, ResumeVersionRepository
+
+RESUME = {
+    "person": {"name": "홍길동", "title": "Backend Engineer", "years_of_experience": 3},
+    "skills": [{"name": "Python", "category": "language"}],
+    "projects": [{
+        "id": "proj_001", "name": "추천 API", "period": "2023.01 - 2023.12",
+        "actions": ["FastAPI 서버 구축"], "results": [], "tech_stack": ["Python"],
+        "is_complete": {"situation": False, "task": False, "actions": True, "results": False, "score": 0.25},
+    }],
+}
+
+
+@pytest.mark.asyncio
+async def test_every_version_is_reconstructed(db, monkeypatch):
+    """patch와 3버전마다의 스냅샷으로 모든 버전을 복원하고, Resume.data는 항상 최신 버전"""
+    monkeypatch.setattr(settings, "resume_snapshot_interval", 3)
+    repo = ResumeRepository(db)
+    resume = await repo.save(ResumeExtraction.model_validate(RESUME), user_id="1")
+
+    expected = {1: resume.data}
+    data = resume.data
+    for version in range(2, 9):
+        data = copy.deepcopy(data)
+        data["projects"][0]["results"].append(f"성과 {version}")
+        await repo.update_data(resume.id, data)
+        expected[version] = data
+
+    # 변경이 없으면 버전을 만들지 않음
+    await repo.update_data(resume.id, copy.deepcopy(data))
+
+    versions = ResumeVersionRepository(db)
+    entries = await versions.list_versions(resume.id)
+    assert [entry.version for entry in entries] == list(range(1, 9))
+    assert [entry.version for entry in entries if entry.snapshot is not None] == [1, 4, 7]
+    assert all(entry.patch for entry in entries[1:])
+
+    for version, data in expected.items():
+        assert await versions.get_data(resume.id, version) == data
+    assert await versions.get_data(resume.id, 9) is None
+    assert (await repo.get_by_id(resume.id)).data == expected[8]
+
+
+@pytest.mark.asyncio
+async def test_resume_without_history_starts_from_current_data(db):
+    """버전 이력이 없던 기존 이력서는 첫 업데이트 때 기존 데이터를 버전 1로 기록"""
+    resume = Resume(user_id="1", data=RESUME)
+    db.add(resume)
+    await db.commit()
+
+    updated = copy.deepcopy(RESUME)
+    updated["skills"].append({"name": "Kafka", "category": "tool"})
+    await ResumeRepository(db).update_data(resume.id, updated)
+
+    versions = ResumeVersionRepository(db)
+    assert await versions.get_data(resume.id, 1) == RESUME
+    assert await versions.get_data(resume.id, 2) == updated
@@ -0,0 +1,84 @@
+"""
+StreamingJsonParser 테스트 (pytest 형식)
+"""
+import json
+
+import pytest
+
+from app.core.structured_output import MalformedOutputError, StreamingJsonParser, parse_structured_output
+from app.models.schemas import ResumeAnalysis
+
+ANALYSIS = {
+    "overall_summary": "STAR 기법 보완이 필요합니다. \"성과\"가 부족합니다.",
+    "missing_areas": ["정량적 성과 부재", "역할 불명확"],
+    "improvement_questions": [
+        {"category": "STAR-결과", "project_id": "proj_001", "question": "성과가 있었나요?", "purpose": "임팩트"},
+        {"category": "역할", "project_id": None, "question": "역할은 무엇이었나요?", "purpose": "기여도"},
+    ],
+    "completeness_score": 0.5,
+}
+
+
+def _feed_in_chunks(parser: StreamingJsonParser, text: str, size: int = 3) -> list:
+    events = []
+    for start in range(0, len(text), size):
+        events.extend(parser.feed(text[start:start + size]))
+    return events
+
+
+class TestStreamingJsonParser:
+    """스트리밍 JSON 파서 테스트"""
+
+    def test_events_arrive_before_completion(self):
+        """overall_summary와 첫 질문이 객체가 닫히기 전에 이벤트로 나옴"""
+        # Given: 마지막 필드 직전까지의 텍스트
+        text = json.dumps(ANALYSIS, ensure_ascii=False)
+        cut = text.index('"completeness_score"')
+        parser = StreamingJsonParser(ResumeAnalysis)
+
+        # When: 조각 단위로 전달
+        events = _feed_in_chunks(parser, text[:cut])
+
+        # Then: 완성된 필드/원소가 순서대로 나옴
+        assert not parser.finished
+        assert events[0] == {"type": "field", "field": "overall_summary", "value": ANALYSIS["overall_summary"]}
+        first_question = next(e for e in events if e["type"] == "item" and e["field"] == "improvement_questions")
+        assert first_question["index"] == 0
+        assert first_question["value"] == ANALYSIS["improvement_questions"][0]
+
+        # 나머지를 받으면 전체 결과가 검증됨
+        parser.feed(text[cut:])
+        assert parser.finish() == ResumeAnalysis.model_validate(ANALYSIS)
+
+    def test_fenced_output_is_accepted(self):
+        """```json 코드블록으로 감싼 응답도 처리"""
+        parser = StreamingJsonParser(ResumeAnalysis)
+        _feed_in_chunks(parser, "```json\n" + json.dumps(ANALYSIS, ensure_ascii=False) + "\n```")
+        assert parser.finish().completeness_score == 0.5
+
+    def test_malformed_prefix_fails_fast(self):
+        """JSON이 아닌 응답은 첫 조각에서 바로 실패"""
+        parser = StreamingJsonParser(ResumeAnalysis)
+        with pytest.raises(MalformedOutputError):
+            parser.feed("죄송하지만 ")
+
+    def test_malformed_tail_fails_fast(self):
+        """객체가 닫힌 뒤 이어지는 쓰레기 텍스트는 즉시 실패"""
+        parser = StreamingJsonParser(ResumeAnalysis)
+        parser.feed(json.dumps(ANALYSIS, ensure_ascii=False))
+        with pytest.raises(MalformedOutputError):
+            parser.feed(" 추가 설명입니다")
+
+    def test_invalid_field_fails_before_completion(self):
+        """스키마에 맞지 않는 필드는 해당 필드가 닫히는 순간 실패"""
+        parser = StreamingJsonParser(ResumeAnalysis)
+        with pytest.raises(MalformedOutputError):
+            parser.feed('{"overall_summary": "요약", "missing_areas": "목록이 아님", ')
+
+
+class TestParseStructuredOutput:
+    """일괄 파싱 테스트"""
+
+    def test_strips_markdown_fence(self):
+        content = "```json\n" + json.dumps(ANALYSIS, ensure_ascii=False) + "\n```"
+        assert parse_structured_output(content, ResumeAnalysis).missing_areas == ANALYSIS["missing_areas"]
@@ -0,0 +1,206 @@
+"""
+UploadJobQueue 테스트 (pytest 형식)
+"""
+import asyncio
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from langchain_core.messages import AIMessage
+
+from app.core.fair_share import UserQuotaExceeded
+from app.database.models import Resume, UploadJob
+from app.repositories import UploadJobRepository
+from app.services.resume_matcher import ResumeMatcher
+from app.services.upload_jobs import UploadJobQueue
+
+EXTRACTION = {
+    "person": {"name": "홍길동", "title": "Backend Engineer", "years_of_experience": 3},
+    "skills": [{"name": "Python", "category": "language"}],
+    "projects": [],
+}
+ANALYSIS = {
+    "overall_summary": "STAR 기법 보완이 필요합니다.",
+    "missing_areas": ["정량적 성과 부재"],
+    "improvement_questions": [
+        {"category": "STAR-결과", "project_id": None, "question": "성과가 있었나요?", "purpose": "임팩트"}
+    ],
+    "completeness_score": 0.5,
+}
+PHRASINGS = {"phrasings": [{"index": 0, "message": "좋아요! 프로젝트 성과가 있었다면 알려주세요."}]}
+
+
+class FakeChatModelPool:
+    """프롬프트 종류에 따라 준비된 JSON을 돌려주는 가짜 풀"""
+
+    model_name = "fake-model"
+
+    def __init__(self):
+        self.calls = []
+
+    def _reply(self, messages) -> str:
+        prompt = messages[0].content
+        if "자연스러운 메시지" in prompt:
+            kind, reply = "phrasing", PHRASINGS
+        elif "개선 질문" in prompt:
+            kind, reply = "analysis", ANALYSIS
+        else:
+            kind, reply = "extraction", EXTRACTION
+        self.calls.append(kind)
+        return json.dumps(reply, ensure_ascii=False)
+
+    async def ainvoke(self, messages, temperature=0.3, **kwargs):
+        return AIMessage(content=self._reply(messages))
+
+    async def astream(self, messages, temperature=0.3, **kwargs):
+        content = self._reply(messages)
+        for start in range(0, len(content), 16):
+            yield content[start:start + 16]
+
+
+class QuotaOnceChatModelPool(FakeChatModelPool):
+    """첫 추출 호출에서만 사용자 할당량 초과를 일으키는 가짜 풀"""
+
+    def __init__(self, retry_after: float):
+        super().__init__()
+        self.retry_after = retry_after
+        self.raised = False
+
+    async def astream(self, messages, temperature=0.3, **kwargs):
+        if not self.raised:
+            self.raised = True
+            raise UserQuotaExceeded("1", self.retry_after)
+        async for chunk in super().astream(messages, temperature, **kwargs):
+            yield chunk
+
+
+class FakePdfExtractor:
+    """PDF 파싱 없이 bytes를 그대로 텍스트로 돌려주는 가짜 추출 엔진"""
+
+    async def extract(self, pdf_contents):
+        from langchain_core.documents import Document
+        return [
+            Document(page_content=content.decode(), metadata={"source_pdf_index": idx})
+            for idx, content in enumerate(pdf_contents)
+        ]
+
+
+def _make_queue(session_factory, llm) -> UploadJobQueue:
+    return UploadJobQueue(
+        session_factory=session_factory,
+        llm=llm,  # type: ignore[arg-type]
+        pdf_extractor=FakePdfExtractor(),  # type: ignore[arg-type]
+        workers=1,
+        lease_seconds=60,
+    )
+
+
+async def _run_until_idle(queue: UploadJobQueue):
+    await queue.start()
+    await queue._queue.join()
+    await queue.stop()
+
+
+class TestUploadJobQueue:
+    """업로드 작업 파이프라인 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_job_runs_all_stages(self, session_factory):
+        """extract → save → analyze 를 거쳐 succeeded로 끝남"""
+        llm = FakeChatModelPool()
+        queue = _make_queue(session_factory, llm)
+
+        async with session_factory() as db:
+            job = await queue.submit(db, files=[("resume.pdf", b"resume text")], user_id="1")
+        await _run_until_idle(queue)
+
+        async with session_factory() as db:
+            job = await UploadJobRepository(db).get(job.id)
+            assert job is not None
+            assert job.status == "succeeded"
+            assert job.stage == "done"
+            assert job.result["first_question"] == ANALYSIS["overall_summary"]
+            analysis = (await db.get(Resume, job.resume_id)).analysis
+            assert analysis["improvement_questions"][0]["phrasing"] == PHRASINGS["phrasings"][0]["message"]
+
+        assert llm.calls == ["extraction", "analysis", "phrasing"]
+
+    @pytest.mark.asyncio
+    async def test_embedding_index_failure_does_not_fail_job(self, session_factory, monkeypatch):
+        """이력서 저장 후 항목 임베딩이 실패해도 분석까지 진행해 succeeded로 끝남"""
+        async def failing_index(self, resume):
+            raise RuntimeError("embedding failed")
+
+        monkeypatch.setattr(ResumeMatcher, "index_resume", failing_index)
+        llm = FakeChatModelPool()
+        queue = _make_queue(session_factory, llm)
+
+        async with session_factory() as db:
+            job = await queue.submit(db, files=[("resume.pdf", b"resume text")], user_id="1")
+        await _run_until_idle(queue)
+
+        async with session_factory() as db:
+            job = await UploadJobRepository(db).get(job.id)
+            assert (job.status, job.stage, job.error) == ("succeeded", "done", None)
+            assert job.resume_id is not None
+
+        assert llm.calls == ["extraction", "analysis", "phrasing"]
+
+    @pytest.mark.asyncio
+    async def test_restart_resumes_from_last_finished_stage(self, session_factory):
+        """lease가 만료된 실행 중 작업은 재시작 시 다음 단계부터 이어서 처리됨"""
+        llm = FakeChatModelPool()
+
+        # Given: extract 단계까지 끝난 뒤 워커가 죽은 작업
+        async with session_factory() as db:
+            job = await UploadJobRepository(db).create("job-1", "session-1", [("resume.pdf", b"resume text")], user_id="1")
+            job.status = "running"
+            job.stage = "save"
+            job.attempts = 1
+            job.extraction = EXTRACTION
+            job.locked_until = datetime.now(timezone.utc) - timedelta(seconds=1)
+            await db.commit()
+
+        # When: 새 워커 시작
+        await _run_until_idle(_make_queue(session_factory, llm))
+
+        # Then: 추출 LLM 호출 없이 완료
+        async with session_factory() as db:
+            job = await db.get(UploadJob, "job-1")
+            assert job is not None
+            assert job.status == "succeeded"
+            assert job.attempts == 2
+
+        assert llm.calls == ["analysis", "phrasing"]
+
+    @pytest.mark.asyncio
+    async def test_quota_exceeded_requeues_job_without_counting_attempt(self, session_factory):
+        """할당량 초과 시 failed가 아니라 queued로 돌아가고, retry_after 뒤 같은 단계부터 다시 실행됨"""
+        llm = QuotaOnceChatModelPool(retry_after=0.2)
+        queue = _make_queue(session_factory, llm)
+
+        # 시작 시 대기 중 작업으로 복구되어 큐에 한 번 들어감
+        async with session_factory() as db:
+            job = await UploadJobRepository(db).create("job-1", "session-1", [("resume.pdf", b"resume text")], user_id="1")
+        await queue.start()
+        await queue._queue.join()
+
+        # Then: 시도 횟수는 그대로, extract 단계에서 대기
+        async with session_factory() as db:
+            job = await UploadJobRepository(db).get(job.id)
+            assert job is not None
+            assert job.status == "queued"
+            assert job.stage == "extract"
+            assert job.attempts == 0
+        assert queue._queue.qsize() == 0
+
+        # When: retry_after가 지나면 다시 큐에 들어가 완료
+        await asyncio.sleep(0.3)
+        await queue._queue.join()
+        await queue.stop()
+
+        async with session_factory() as db:
+            job = await UploadJobRepository(db).get(job.id)
+            assert job.status == "succeeded"
+            assert job.attempts == 1
+        assert llm.calls == ["extraction", "analysis", "phrasing"]
@@ -1,9 +1,10 @@
 """
 UserResumeService 테스트 (pytest 형식)
 """
+import asyncio
 from typing import List
 from langchain_core.documents import Document
-from app.services.user_resume_service import user_resume_service
+from app.services.pdf_extractor import PdfTextExtractor, extract_documents
 
 
 class TestExtractTextFromPdfs:
@@ -12,8 +13,8 @@ class TestExtractTextFromPdfs:
     def test_extract_single_pdf(self, resume_pdf_bytes: bytes):
         """단일 PDF에서 텍스트 추출"""
         # Given: TEST_RESUME.pdf bytes
-        # When: extract_text_from_pdfs 호출
-        documents = user_resume_service.extract_text_from_pdfs([resume_pdf_bytes])
+        # When: extract_documents 호출
+        documents = extract_documents([resume_pdf_bytes])
 
         # Then: Document가 정상적으로 추출됨
         assert len(documents) > 0, "Document가 하나도 추출되지 않았습니다"
@@ -36,8 +37,8 @@ class TestExtractTextFromPdfs:
         # Given: 두 개의 다른 PDF bytes
         pdf_contents = [resume_pdf_bytes, career_pdf_bytes]
 
-        # When: extract_text_from_pdfs 호출
-        documents = user_resume_service.extract_text_from_pdfs(pdf_contents)
+        # When: extract_documents 호출
+        documents = extract_documents(pdf_contents)
 
         # Then: 모든 PDF에서 Document가 추출됨
         assert len(documents) > 0, "Document가 하나도 추출되지 않았습니다"
@@ -62,6 +63,30 @@ class TestExtractTextFromPdfs:
             print(f"\n📄 {pdf_name}: {len(docs_from_pdf)}개 Document, {chars_from_pdf:,}자")
 
 
+class TestPdfTextExtractor:
+    """프로세스 풀 기반 병렬 추출 엔진 테스트"""
+
+    def test_parallel_matches_serial(
+        self,
+        resume_pdf_bytes: bytes,
+        career_pdf_bytes: bytes,
+        all_documents: List[Document],
+    ):
+        """병렬 추출 결과가 순차 추출 결과와 같은 순서/내용/메타데이터를 가짐"""
+        # Given: 두 개의 PDF bytes, 2개 워커 프로세스 풀
+        extractor = PdfTextExtractor(max_workers=2)
+
+        try:
+            # When: 병렬 추출
+            documents = asyncio.run(extractor.extract([resume_pdf_bytes, career_pdf_bytes]))
+        finally:
+            extractor.shutdown()
+
+        # Then: 순차 추출과 동일
+        assert [doc.page_content for doc in documents] == [doc.page_content for doc in all_documents]
+        assert [doc.metadata for doc in documents] == [doc.metadata for doc in all_documents]
+
+
 class TestDocumentStructure:
     """Document 구조 검증 테스트"""
 
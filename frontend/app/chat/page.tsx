@@ -10,6 +10,34 @@ interface Message {
   content: string
 }
 
+// fetch 응답 본문에서 SSE 이벤트(event/data 쌍)를 순서대로 읽음
+async function* readServerSentEvents(body: ReadableStream<Uint8Array>) {
+  const reader = body.getReader()
+  const decoder = new TextDecoder()
+  let buffer = ''
+
+  while (true) {
+    const { done, value } = await reader.read()
+    if (done) break
+    buffer += decoder.decode(value, { stream: true })
+
+    let boundary = buffer.indexOf('\n\n')
+    while (boundary !== -1) {
+      const frame = buffer.slice(0, boundary)
+      buffer = buffer.slice(boundary + 2)
+      boundary = buffer.indexOf('\n\n')
+
+      let event = 'message'
+      let data = ''
+      for (const line of frame.split('\n')) {
+        if (line.startsWith('event: ')) event = line.slice(7)
+        else if (line.startsWith('data: ')) data += line.slice(6)
+      }
+      if (data) yield { event, payload: JSON.parse(data) }
+    }
+  }
+}
+
 export default function ChatPage() {
   const router = useRouter()
   const [messages, setMessages] = useState<Message[]>([])
@@ -62,7 +90,7 @@ export default function ChatPage() {
     setIsLoading(true)
 
     try {
-      const response = await fetch('http://localhost:8000/api/chat/message', {
+      const response = await fetch('http://localhost:8000/api/chat/message/stream', {
         method: 'POST',
         headers: { 'Content-Type': 'application/json' },
         body: JSON.stringify({
@@ -72,16 +100,42 @@ export default function ChatPage() {
         }),
       })
 
-      if (!response.ok) throw new Error('Failed to send message')
+      if (!response.ok || !response.body) throw new Error('Failed to send message')
+
+      // AI 응답 자리를 먼저 만들고 토큰이 올 때마다 이어 붙임
+      let streamed = false
+      const appendToReply = (text: string, replace = false) => {
+        setMessages((prev) => {
+          const last = prev[prev.length - 1]
+          const content = replace ? text : last.content + text
+          return [...prev.slice(0, -1), { ...last, content }]
+        })
+      }
+
+      let data: { response: string; is_completed: boolean } | null = null
+      for await (const { event, payload } of readServerSentEvents(response.body)) {
+        if (event === 'token') {
+          if (!streamed) {
+            streamed = true
+            setIsLoading(false)
+            setMessages((prev) => [...prev, { role: 'assistant', content: '' }])
+          }
+          appendToReply(payload.content)
+        } else if (event === 'done') {
+          data = payload
+        } else if (event === 'error') {
+          throw new Error(payload.detail)
+        }
+      }
 
-      const data = await response.json()
+      if (!data) throw new Error('Stream ended without a result')
 
-      // AI 응답 추가
-      const assistantMessage: Message = {
-        role: 'assistant',
-        content: data.response,
+      // 최종 응답으로 맞춤 (토큰이 오지 않았으면 새 메시지로 추가)
+      if (streamed) {
+        appendToReply(data.response, true)
+      } else {
+        setMessages((prev) => [...prev, { role: 'assistant', content: data!.response }])
       }
-      setMessages((prev) => [...prev, assistantMessage])
 
       // 질문이 완료되면 지식 베이스 페이지로 이동
       if (data.is_completed) {
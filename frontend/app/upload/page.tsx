@@ -4,6 +4,18 @@ import { useState } from 'react'
 import { useRouter } from 'next/navigation'
 import { UploadDropzone } from '@/components/upload/UploadDropzone'
 
+async function waitForJob(jobId: string) {
+  while (true) {
+    const response = await fetch(`http://localhost:8000/api/upload/jobs/${jobId}`)
+    if (!response.ok) throw new Error('Failed to fetch job status')
+
+    const job = await response.json()
+    if (job.status === 'succeeded' || job.status === 'failed') return job
+
+    await new Promise((resolve) => setTimeout(resolve, 1500))
+  }
+}
+
 export default function UploadPage() {
   const router = useRouter()
   const [isUploading, setIsUploading] = useState(false)
@@ -34,10 +46,15 @@ export default function UploadPage() {
       if (!response.ok) throw new Error('Upload failed')
 
       const data = await response.json()
+
+      // 백그라운드 분석이 끝날 때까지 작업 상태 확인
+      const job = await waitForJob(data.job_id)
+      if (job.status !== 'succeeded') throw new Error(job.error || 'Upload job failed')
+
       // 세션 ID, 사용자 ID, 첫 질문 저장
       localStorage.setItem('session_id', data.session_id)
       localStorage.setItem('user_id', data.user_id)
-      localStorage.setItem('first_question', data.first_question)
+      localStorage.setItem('first_question', job.result.first_question)
 
       // 채팅 페이지로 이동
       router.push('/chat')